@@ -0,0 +1,526 @@
+"""
+Execução em lote, sem interface gráfica, do cálculo completo de desempenho (decolagem, subida, cruzeiro, planeio,
+manobra e pouso) para vários casos.
+
+Não importa Qt nem matplotlib: os gráficos só são gerados pela interface gráfica.
+
+Uso:
+    python -m app.batch --cases casos.csv --output resultados.csv
+    python -m app.batch --cases casos.json --db app/db/aero.db --output resultados.parquet
+
+Cada caso é uma linha (CSV) ou um objeto (JSON) com os parâmetros em unidades SI (N, m, m/s), usando as mesmas chaves
+de aircraft_parameters e flight_parameters. As chaves terminadas em _TAKEOFF e _LANDING vão para 'takeoff_parameters' e
+'landing_parameters'. Um objeto JSON também pode trazer 'aircraft_parameters' e 'flight_parameters' já aninhados.
+Com --db, os parâmetros da aeronave de nome AIRCRAFT_NAME são lidos do banco; valores presentes no caso têm prioridade.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(current_dir)
+
+from functions.aero import Aero
+from functions.mission import Mission
+from functions.utils import get_logger, configure_logging
+from db.utils.repository import get_repository
+
+aero = Aero()
+logger = get_logger(log_name="BATCH")
+
+# Valores usados quando o caso não informa a grandeza
+DEFAULT_FLIGHT_PARAMETERS = {
+    "NUMBER_OF_PASSENGERS": 0,
+    "DISPATCHED_CARGO_WEIGHT": 0,
+    "CRUISE_VELOCITY": 0,
+    "GLIDING_VELOCITY": 0,
+}
+
+DEFAULT_TAKEOFF_PARAMETERS = {
+    "WIND_VELOCITY_TAKEOFF": 0,
+    "RUNWAY_SLOPE_TAKEOFF": 0,
+}
+
+DEFAULT_LANDING_PARAMETERS = {
+    "WIND_VELOCITY_LANDING": 0,
+    "RUNWAY_SLOPE_LANDING": 0,
+}
+
+AIRCRAFT_KEYS = ('AIRCRAFT_NAME', 'OEW', 'MTOW', 'MAXIMUM_FUEL_WEIGHT', 'MAXIMUM_PAYLOAD_WEIGHT', 'b', 'e', 'AR', 'TSFC',
+                 'T0', 'NE', 'CL_MAX', 'S', 'K', 'CD0', 'E_m')
+
+CASE_ID = "CASE_ID"
+ERROR = "ERROR"
+
+# Colunas de cada fase (atributos de Mission), na ordem em que são gravadas. Fases não calculadas em um caso ficam com
+# NaN, de modo que todos os casos têm as mesmas colunas.
+PHASE_COLUMNS = {
+    'takeoff': ('TAKEOFF_DISTANCE', 'TAKEOFF_GROUND_DISTANCE', 'TAKEOFF_ROTATION_DISTANCE',
+                'TAKEOFF_TRANSITION_DISTANCE', 'TAKEOFF_CLIMB_DISTANCE', 'TAKEOFF_TIME', 'TAKEOFF_GROUND_TIME',
+                'TAKEOFF_ROTATION_TIME', 'TAKEOFF_TRANSITION_TIME', 'TAKEOFF_CLIMB_TIME'),
+    'landing': ('LANDING_DISTANCE', 'LANDING_APPROACH_DISTANCE', 'LANDING_ROTATION_DISTANCE', 'LANDING_ROLL_DISTANCE',
+                'LANDING_FLARE_DISTANCE', 'LANDING_TIME', 'LANDING_APPROACH_TIME', 'LANDING_ROTATION_TIME',
+                'LANDING_ROLL_TIME', 'LANDING_FLARE_TIME'),
+    'climb': ('MAX_GAMMA_CLIMB', 'MAX_RATE_OF_CLIMB'),
+    'steepest_climb': ('STEEPEST_CLIMB_TIME', 'STEEPEST_CLIMB_DISTANCE', 'STEEPEST_CLIMB_FUEL_CONSUPTION'),
+    'fastest_climb': ('FASTEST_CLIMB_TIME', 'FASTEST_CLIMB_DISTANCE', 'FASTEST_CLIMB_FUEL_CONSUPTION',
+                      'FASTEST_CLIMB_FUEL_CONSUMED'),
+    'integrated_climb': ('INTEGRATED_CLIMB_TIME', 'INTEGRATED_CLIMB_DISTANCE', 'INTEGRATED_CLIMB_FUEL_CONSUMED',
+                         'INTEGRATED_CLIMB_VALID'),
+    'service_ceiling': ('SERVICE_CEILING', 'PERFORMANCE_CEILING', 'OPERATIONAL_CEILING'),
+    'cruise_velocity': ('CRUISE_VELOCITY', 'MINIMUM_DRAG'),
+    'cruise_range': ('RANGE_CONSTANT_HEIGHT_CL', 'MAX_RANGE_CONSTANT_HEIGHT_CL', 'LOITER_TIME',
+                     'RANGE_CONSTANT_VELOCITY_CL', 'MAX_RANGE_CONSTANT_VELOCITY_CL', 'RANGE_CONSTANT_HEIGHT_VELOCITY',
+                     'MAX_RANGE_CONSTANT_HEIGHT_VELOCITY'),
+    'cruise_endurance': ('ENDURANCE_CONSTANT_HEIGHT_CL', 'MAX_ENDURANCE_CONSTANT_HEIGHT_CL',
+                         'ENDURANCE_CONSTANT_VELOCITY_CL', 'MAX_ENDURANCE_CONSTANT_VELOCITY_CL',
+                         'ENDURANCE_CONSTANT_HEIGHT_VELOCITY', 'MAX_ENDURANCE_CONSTANT_HEIGHT_VELOCITY'),
+    'fastest_turn': ('VELOCITY_FASTEST_TURN', 'LOAD_FACTOR_FASTEST_TURN', 'EFICIENCY_FASTEST_TURN',
+                     'RADIUS_FASTEST_TURN', 'TURNING_RATE_FASTEST_TURN'),
+    'tighest_turn': ('VELOCITY_TIGHEST_TURN', 'LOAD_FACTOR_TIGHEST_TURN', 'EFICIENCY_TIGHEST_TURN',
+                     'RADIUS_TIGHEST_TURN', 'TURNING_RATE_TIGHEST_TURN'),
+    'stall_turn': ('VELOCITY_STALL', 'LOAD_FACTOR_STALL', 'EFICIENCY_STALL', 'RADIUS_STALL', 'TURNING_RATE_STALL'),
+    'cruise_fuel_weight': ('DELTA_FUEL', 'ZETA', 'VALID_FUEL'),
+    'gliding': ('GLIDING_RANGE_CONSTANT_LIFT_STANDARD', 'GLIDING_ENDURANCE_CONSTANT_LIFT_STANDARD',
+                'GLIDING_MAX_RANGE_CONSTANT_LIFT', 'GLIDING_ENDURANCE_MAX_RANGE_CONSTANT_LIFT_MAX',
+                'GLIDING_MAX_ENDURANCE_CONSTANT_LIFT', 'GLIDING_RANGE_MAX_ENDURANCE_CONSTANT_LIFT',
+                'GLIDING_RANGE_CONSTANT_AIRSPEED_STANDARD', 'GLIDING_ENDURANCE_CONSTANT_AIRSPEED_STANDARD',
+                'GLIDING_MAX_RANGE_CONSTANT_AIRSPEED', 'GLIDING_ENDURANCE_MAX_RANGE_CONSTANT_AIRSPEED',
+                'GLIDING_RANGE_MAX_ENDURANCE_CONSTANT_AIRSPEED', 'GLIDING_MAX_ENDURANCE_CONSTANT_AIRSPEED'),
+    'gliding_angle': ('GLIDING_ANGLE', 'GLIDING_RATE_OF_DESCENT'),
+}
+
+RESULT_COLUMNS = ((CASE_ID, 'AIRCRAFT_NAME')
+                  + tuple(column for columns in PHASE_COLUMNS.values() for column in columns)
+                  + (ERROR,))
+
+PARQUET_BATCH_SIZE = 5000
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# ------------------------------------------------------ ENTRADAS ---------------------------------------------------- #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+def _parse_value(value):
+
+    if not isinstance(value, str):
+        return value
+
+    value = value.strip()
+
+    if value == "":
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def read_cases(path):
+    """
+    Lê os casos de um arquivo CSV ou JSON. O CSV é lido linha a linha, sem carregar o arquivo inteiro na memória.
+
+    Parâmetros:
+    - path (str): Caminho do arquivo (.csv ou .json).
+
+    Retorna:
+    generator: Um dicionário por caso.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        with open(path, newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                yield {key.strip(): _parse_value(value) for key, value in row.items()}
+
+    elif extension == ".json":
+        with open(path, encoding="utf-8") as file:
+            cases = json.load(file)
+        for case in (cases if isinstance(cases, list) else [cases]):
+            yield case
+
+    else:
+        raise ValueError(f"Unsupported case file '{path}' (expected .csv or .json)")
+
+
+def read_db_aircrafts(db_path):
+    """
+    Lê as aeronaves cadastradas na tabela Airplanes do banco, convertendo-as para o formato de aircraft_parameters
+    (mesmas conversões de GUI_AIRCRAFT_PARAMETERS.get_aircraft_parameters com convert_units=True).
+
+    Parâmetros:
+    - db_path (str): Caminho do banco SQLite (aero.db).
+
+    Retorna:
+    dict: Parâmetros da aeronave por nome.
+    """
+
+    aircrafts = {}
+
+    for row in get_repository(db_path=db_path).get_aircrafts().values():
+
+        aircraft = {
+            'AIRCRAFT_NAME': row['nome_aeronave'],
+            'OEW': row['oew'] * aero.g,
+            'b': row['b'],
+            'e': row['e'],
+            'TSFC': row['tsfc'],
+            'T0': row['t0'],
+            'NE': row['ne'],
+            'CL_MAX': row['cl_max'],
+            'S': row['area'],
+            'CD0': row['cd0'],
+        }
+
+        # Colunas que nem todas as versões do banco possuem
+        for column, key in (('mtow', 'MTOW'), ('fuel_weight', 'MAXIMUM_FUEL_WEIGHT'),
+                            ('maximum_payload_weight', 'MAXIMUM_PAYLOAD_WEIGHT')):
+            if row.get(column) is not None:
+                aircraft[key] = row[column] * aero.g
+
+        aircrafts[row['nome_aeronave']] = aircraft
+
+    return aircrafts
+
+
+def build_parameters(case, aircrafts=None):
+    """
+    Monta aircraft_parameters e flight_parameters a partir de um caso.
+
+    Parâmetros:
+    - case (dict): Caso plano (chaves de aircraft_parameters e flight_parameters) ou com as chaves
+      'aircraft_parameters' e 'flight_parameters'.
+    - aircrafts (dict, opcional): Aeronaves do banco por nome (read_db_aircrafts).
+
+    Retorna:
+    tuple: (aircraft_parameters, flight_parameters).
+    """
+
+    if 'aircraft_parameters' in case or 'flight_parameters' in case:
+        aircraft_parameters = dict(case.get('aircraft_parameters', {}))
+        flat_flight_parameters = dict(case.get('flight_parameters', {}))
+        for key in ('takeoff_parameters', 'landing_parameters'):
+            flat_flight_parameters.update(flat_flight_parameters.pop(key, {}))
+    else:
+        aircraft_parameters = {key: value for key, value in case.items() if key in AIRCRAFT_KEYS and value is not None}
+        flat_flight_parameters = {key: value for key, value in case.items() if key not in AIRCRAFT_KEYS}
+
+    if aircrafts is not None and 'AIRCRAFT_NAME' in case.get('aircraft_parameters', case):
+        name = case.get('aircraft_parameters', case)['AIRCRAFT_NAME']
+        if name not in aircrafts:
+            raise KeyError(f"Aircraft '{name}' not found in the database")
+        aircraft_parameters = {**aircrafts[name], **aircraft_parameters}
+
+    if 'K' not in aircraft_parameters:
+        # Mesma expressão de GUI_AIRCRAFT_PARAMETERS.get_aircraft_parameters
+        aircraft_parameters['K'] = 1 / (3.14 * aircraft_parameters['e'] *
+                                        ((aircraft_parameters['b'] ** 2) / aircraft_parameters['S']))
+
+    if 'E_m' not in aircraft_parameters:
+        aircraft_parameters['E_m'] = 1 / (2 * math.sqrt(aircraft_parameters['K'] * aircraft_parameters['CD0']))
+
+    takeoff_parameters = dict(DEFAULT_TAKEOFF_PARAMETERS)
+    landing_parameters = dict(DEFAULT_LANDING_PARAMETERS)
+    flight_parameters = dict(DEFAULT_FLIGHT_PARAMETERS)
+
+    for key, value in flat_flight_parameters.items():
+        if value is None or key == CASE_ID:
+            continue
+        if key.endswith("_TAKEOFF"):
+            takeoff_parameters[key] = value
+        elif key.endswith("_LANDING"):
+            landing_parameters[key] = value
+        else:
+            flight_parameters[key] = value
+
+    flight_parameters['takeoff_parameters'] = takeoff_parameters
+    flight_parameters['landing_parameters'] = landing_parameters
+
+    return aircraft_parameters, flight_parameters
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# ------------------------------------------------------ CÁLCULO ----------------------------------------------------- #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+def _flatten(result, row):
+
+    # Os resultados aninhados (ex.: planeio) já trazem nomes completos; uma chave repetida sobrescreveria outra coluna
+    for key, value in result.items():
+        if key.endswith("_SERIES"):
+            # Curvas para gráficos não viram colunas
+            continue
+        elif isinstance(value, dict):
+            _flatten(value, row)
+        elif isinstance(value, (bool, int, float)):
+            if key in row:
+                raise ValueError(f"Duplicated result column '{key}'")
+            row[key] = value if isinstance(value, bool) else float(value)
+
+
+def run_case(aircraft_parameters, flight_parameters):
+    """
+    Calcula todas as fases de voo de um caso.
+
+    O planeio só é calculado quando GLIDING_VELOCITY > 0 e o combustível de cruzeiro só quando as coordenadas de
+    partida e chegada são informadas; as colunas dessas fases ficam com NaN quando elas não são calculadas.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
+    - flight_parameters (dict): Dicionário contendo os parâmetros de voo.
+
+    Retorna:
+    dict: Resultados escalares de todas as fases, num único nível.
+    """
+
+    mission = Mission(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+
+    skipped_phases = set()
+
+    coordinates = ('LATITUDE_TAKEOFF', 'LONGITUDE_TAKEOFF', 'LATITUDE_LANDING', 'LONGITUDE_LANDING')
+    if not all(key in flight_parameters['takeoff_parameters'] or key in flight_parameters['landing_parameters']
+               for key in coordinates):
+        skipped_phases.add('cruise_fuel_weight')
+
+    if not flight_parameters['GLIDING_VELOCITY'] > 0:
+        skipped_phases.update(['gliding', 'gliding_angle'])
+
+    row = {}
+    for phase, columns in PHASE_COLUMNS.items():
+        if phase in skipped_phases:
+            row.update(dict.fromkeys(columns, math.nan))
+        else:
+            _flatten(getattr(mission, phase), row)
+
+    return row
+
+
+def iter_results(cases, aircrafts=None):
+    """
+    Calcula os casos um a um. Um erro em um caso é registrado na coluna ERROR e não interrompe os demais.
+
+    Parâmetros:
+    - cases (iterable): Casos (ver build_parameters).
+    - aircrafts (dict, opcional): Aeronaves do banco por nome (read_db_aircrafts).
+
+    Retorna:
+    generator: Um dicionário de resultados por caso, com CASE_ID, AIRCRAFT_NAME e ERROR.
+    """
+
+    for i, case in enumerate(cases):
+
+        case_id = case.get(CASE_ID, i)
+        row = {CASE_ID: case_id}
+
+        try:
+            aircraft_parameters, flight_parameters = build_parameters(case=case, aircrafts=aircrafts)
+            row['AIRCRAFT_NAME'] = aircraft_parameters.get('AIRCRAFT_NAME', "")
+            row.update(run_case(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters))
+            row[ERROR] = ""
+        except Exception as error:
+            logger.error("Case %s failed: %r", case_id, error)
+            row[ERROR] = repr(error)
+
+        yield row
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# ------------------------------------------------------ SAÍDAS ------------------------------------------------------ #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+class _ResultWriter:
+
+    """
+    Base dos escritores de resultados. As colunas são fixas (RESULT_COLUMNS) e conhecidas antes do primeiro caso: as
+    colunas ausentes de um caso (casos com erro) ficam vazias, e uma coluna fora do esquema é um erro.
+    """
+
+    def __init__(self, path, columns=RESULT_COLUMNS):
+        self.path = path
+        self.columns = list(columns)
+        self._column_set = set(self.columns)
+        self._opened = False
+
+    def write(self, row):
+
+        extra_columns = [column for column in row if column not in self._column_set]
+        if extra_columns:
+            raise ValueError(f"Result columns not in the output schema: {extra_columns}")
+
+        if not self._opened:
+            self._open()
+            self._opened = True
+
+        self._write_rows([row])
+
+    def close(self):
+
+        if not self._opened:
+            self._open()
+            self._opened = True
+
+        self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvResultWriter(_ResultWriter):
+
+    """Escreve os resultados em CSV à medida que são calculados."""
+
+    def _open(self):
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns, restval="")
+        self._writer.writeheader()
+
+    def _write_rows(self, rows):
+        self._writer.writerows(rows)
+
+    def _close(self):
+        self._file.close()
+
+
+class ParquetResultWriter(_ResultWriter):
+
+    """Escreve os resultados em Parquet, em grupos de PARQUET_BATCH_SIZE casos. Requer pyarrow."""
+
+    def __init__(self, path, columns=RESULT_COLUMNS, batch_size=PARQUET_BATCH_SIZE):
+
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Writing Parquet files requires pyarrow (pip install pyarrow)")
+
+        super().__init__(path, columns=columns)
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.batch_size = batch_size
+        self._batch = []
+
+    def _open(self):
+
+        string_columns = (CASE_ID, 'AIRCRAFT_NAME', ERROR)
+        self._schema = self._pa.schema([
+            (column, self._pa.string() if column in string_columns else self._pa.float64())
+            for column in self.columns])
+        self._writer = self._pq.ParquetWriter(self.path, self._schema)
+
+    def _write_rows(self, rows):
+
+        self._batch.extend(rows)
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+
+        if not self._batch:
+            return
+
+        columns = {}
+        for field in self._schema:
+            values = [row.get(field.name) for row in self._batch]
+            if field.name in (CASE_ID, 'AIRCRAFT_NAME', ERROR):
+                values = [None if value is None else str(value) for value in values]
+            else:
+                values = [None if value is None else float(value) for value in values]
+            columns[field.name] = self._pa.array(values, type=field.type)
+
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+        self._batch = []
+
+    def _close(self):
+        self._flush()
+        self._writer.close()
+
+
+def get_result_writer(path):
+    """Escolhe o escritor de resultados pela extensão do arquivo de saída (.csv ou .parquet)."""
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        return CsvResultWriter(path)
+    elif extension in (".parquet", ".pq"):
+        return ParquetResultWriter(path)
+
+    raise ValueError(f"Unsupported output file '{path}' (expected .csv or .parquet)")
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# -------------------------------------------------------- CLI ------------------------------------------------------- #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+def run_batch(cases_path, output_path, db_path=None):
+    """
+    Lê os casos, calcula e grava os resultados.
+
+    Parâmetros:
+    - cases_path (str): Arquivo de casos (.csv ou .json).
+    - output_path (str): Arquivo de resultados (.csv ou .parquet).
+    - db_path (str, opcional): Banco SQLite com as aeronaves (aero.db).
+
+    Retorna:
+    dict: Número de casos, número de casos com erro e tempo total (s).
+    """
+
+    aircrafts = read_db_aircrafts(db_path=db_path) if db_path is not None else None
+
+    start = time.perf_counter()
+    n_cases = 0
+    n_errors = 0
+
+    with get_result_writer(output_path) as writer:
+        for row in iter_results(cases=read_cases(cases_path), aircrafts=aircrafts):
+            writer.write(row)
+            n_cases += 1
+            n_errors += bool(row[ERROR])
+
+    elapsed = time.perf_counter() - start
+
+    logger.info("%d cases (%d errors) in %.2f s", n_cases, n_errors, elapsed)
+
+    return {"CASES": n_cases, "ERRORS": n_errors, "ELAPSED_TIME": elapsed}
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(prog="python -m app.batch",
+                                     description="Headless aircraft performance batch runner.")
+    parser.add_argument("--cases", required=True, help="Case file (.csv or .json).")
+    parser.add_argument("--output", required=True, help="Result file (.csv or .parquet).")
+    parser.add_argument("--db", default=None, help="SQLite database with the Airplanes table (e.g. app/db/aero.db).")
+    parser.add_argument("--log-level", default="INFO", help="Logging level (default: INFO).")
+    parser.add_argument("--atmosphere-table-step", type=float, default=None,
+                        help="Interpolate air density from a table with this altitude step in m (default: exact ISA).")
+
+    args = parser.parse_args(argv)
+
+    configure_logging(level=args.log_level.upper())
+
+    if args.atmosphere_table_step is not None:
+        aero.enable_atmosphere_table(step=args.atmosphere_table_step)
+
+    summary = run_batch(cases_path=args.cases, output_path=args.output, db_path=args.db)
+
+    # Falha apenas se nenhum caso pôde ser calculado
+    return 1 if summary["CASES"] and summary["ERRORS"] == summary["CASES"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
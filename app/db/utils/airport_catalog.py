@@ -0,0 +1,172 @@
+"""
+Catálogo de aeroportos em memória, para consultas por código e busca conforme o usuário digita.
+
+- Códigos IATA e ICAO ficam em dicionários (consulta em tempo constante).
+- Palavras do nome, da cidade e do país, além dos códigos, ficam numa lista ordenada; as palavras que começam com o
+  texto digitado formam um intervalo contínuo dessa lista, encontrado por busca binária (bisect). Os aeroportos de cada
+  palavra ficam num vetor numpy alinhado à lista, de modo que combinar palavras e escolher os primeiros resultados não
+  percorre o catálogo em Python.
+
+Palavras são comparadas sem acentos e sem diferenciar maiúsculas de minúsculas.
+"""
+
+import bisect
+import re
+import unicodedata
+
+from numpy import array, zeros, partition, unique, int64
+
+# Colunas de Airports guardadas no catálogo
+AIRPORT_FIELDS = ("iata", "icao", "aeroporto", "cidade", "pais", "pista", "elevacao", "latitude", "longitude")
+
+# Colunas cujas palavras entram na busca por prefixo
+SEARCH_FIELDS = ("iata", "icao", "aeroporto", "cidade", "pais")
+
+_WORD = re.compile(r"\w+")
+
+# Maior caractere possível: prefix + _MAX_CHAR é maior que qualquer palavra que começa com prefix
+_MAX_CHAR = "\U0010ffff"
+
+
+def normalize(text):
+    """Remove acentos e converte para minúsculas ("Belém" -> "belem")."""
+
+    text = str(text)
+
+    if text.isascii():
+        return text.lower()
+
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text):
+    return _WORD.findall(normalize(text)) if text is not None else []
+
+
+class AirportCatalog:
+
+    """
+    Catálogo de aeroportos, em ordem de código IATA.
+
+    Parâmetros:
+    - airports (iterable): Aeroportos, cada um um dict (ou sqlite3.Row) com as colunas de AIRPORT_FIELDS que existirem.
+    """
+
+    def __init__(self, airports):
+
+        airports = [{field: row[field] if field in row.keys() else None for field in AIRPORT_FIELDS} for row in airports]
+        airports.sort(key=lambda airport: airport['iata'] or "")
+
+        self.airports = airports
+        self._by_iata = {}
+        self._by_icao = {}
+        tokens = []
+
+        # Um aeroporto aparece no máximo uma vez por palavra, mas pode ter várias palavras com o mesmo prefixo
+        self._max_words = 1
+
+        for index, airport in enumerate(airports):
+
+            if airport['iata']:
+                self._by_iata.setdefault(airport['iata'].upper(), index)
+            if airport['icao']:
+                self._by_icao.setdefault(airport['icao'].upper(), index)
+
+            words = set()
+            for field in SEARCH_FIELDS:
+                words.update(tokenize(airport[field]))
+
+            tokens.extend((word, index) for word in words)
+            self._max_words = max(self._max_words, len(words))
+
+        tokens.sort()
+
+        self._words = [word for word, _ in tokens]
+        self._indexes = array([index for _, index in tokens], dtype=int64)
+
+    def __len__(self):
+        return len(self.airports)
+
+    def get(self, code):
+        """
+        Retorna o aeroporto pelo código IATA ou ICAO.
+
+        Parâmetros:
+        - code (str): Código IATA (3 letras) ou ICAO (4 letras).
+
+        Retorna:
+        dict: Colunas do aeroporto, ou None se não existir.
+        """
+
+        index = self._index(code)
+
+        return dict(self.airports[index]) if index is not None else None
+
+    def _index(self, code):
+
+        if not code:
+            return None
+
+        code = code.strip().upper()
+
+        return self._by_iata.get(code, self._by_icao.get(code))
+
+    def __contains__(self, code):
+        return self._index(code) is not None
+
+    def codes(self):
+        """Códigos IATA cadastrados."""
+        return set(self._by_iata)
+
+    def _prefix_matches(self, prefix):
+        """Aeroportos (índices, podendo repetir) com alguma palavra que começa com prefix."""
+
+        start = bisect.bisect_left(self._words, prefix)
+        end = bisect.bisect_left(self._words, prefix + _MAX_CHAR, start)
+
+        return self._indexes[start:end]
+
+    def search(self, text, limit=10):
+        """
+        Busca aeroportos pelo início das palavras do código, nome, cidade ou país ("sao pau", "gru", "sbg").
+
+        Parâmetros:
+        - text (str): Texto digitado. Todas as palavras devem ser início de alguma palavra do aeroporto.
+        - limit (int, opcional): Número máximo de resultados. Default é 10.
+
+        Retorna:
+        list: Aeroportos encontrados (dict). Um código idêntico ao texto vem primeiro, depois os demais em ordem de IATA.
+        """
+
+        words = tokenize(text)
+
+        if not words or limit <= 0:
+            return []
+
+        candidates = [self._prefix_matches(word) for word in words]
+        candidates.sort(key=len)
+
+        # Parte da palavra com menos correspondências e mantém os aeroportos que também têm as demais
+        matches = candidates[0]
+
+        for other in candidates[1:]:
+            if len(matches) == 0:
+                break
+            mask = zeros(len(self.airports), dtype=bool)
+            mask[other] = True
+            matches = matches[mask[matches]]
+
+        # Os limit menores índices distintos estão entre os limit * _max_words menores índices
+        n_smallest = limit * self._max_words
+        if len(matches) > n_smallest:
+            matches = partition(matches, n_smallest - 1)[:n_smallest]
+
+        result = [int(index) for index in unique(matches)[:limit]]
+
+        # O código idêntico vem primeiro mesmo que não esteja entre os limit primeiros em ordem de IATA
+        exact = self._index(text)
+        if exact is not None:
+            result = [exact] + [index for index in result if index != exact]
+
+        return [dict(self.airports[index]) for index in result[:limit]]
@@ -1,57 +1,48 @@
-import sqlite3
+from .repository import get_repository
+
 
 def get_con(db_path="db/aero.db"):
-    con = sqlite3.connect(db_path)
-    return con
+    # Conexão da thread atual, compartilhada pelas consultas ao mesmo banco
+    return get_repository(db_path=db_path).pool.connection()
 
-def delete_db_query(db_path, query):
+def delete_db_query(db_path, query, params=()):
 
-    con = get_con(db_path=db_path)
-    cur = con.cursor()
-    cur.execute(query)
-    con.commit()
+    get_repository(db_path=db_path).execute(table=None, query=query, params=params)
 
 
-def execute_generic_query(db_path, query, first_value=True):
+def execute_generic_query(db_path, query, first_value=True, params=()):
 
-    con = get_con(db_path=db_path)
-    cur = con.cursor()
+    rows = get_repository(db_path=db_path).fetch_all(table=None, query=query, params=params)
 
     dict_results = {}
 
     # Retornamos apenas o primeiro valor da tupla. Mesmo que seja uma query que retorne um único valor, ele em no formato de tupla.
     if first_value is True:
-        result = [i[0] for i in cur.execute(query).fetchall()]
+        result = [i[0] for i in rows]
         if len(result) == 1:
             result = result[0]
     else:
-        result = cur.execute(query).fetchall()
-        columns = [descricao[0] for descricao in cur.description]
-
-        for row in result:
-            dict_results[row[0]] = dict(zip(columns, row))
+        result = [tuple(row) for row in rows]
 
-        print(dict_results)
+        for row in rows:
+            dict_results[row[0]] = dict(row)
 
     return result, dict_results
 
 
-def insert_data_to_db(db_path, query):
+def insert_data_to_db(db_path, query, params=()):
 
-    con = get_con(db_path=db_path)
-    cur = con.cursor()
-    cur.execute(query)
-    con.commit()
+    get_repository(db_path=db_path).execute(table=None, query=query, params=params)
 
 
 
 def drop_generic_table(table_name: str):
-    con = get_con()
-    cur = con.cursor()
+    from functions.utils import get_logger
+
+    logger = get_logger(log_name="DB_UTILS")
 
     try:
-        cur.execute(f"DROP TABLE {table_name}")
-        print(f"{table_name} table deleted succesfully.")
+        get_repository().execute(table=table_name, query=f"DROP TABLE {table_name}")
+        logger.info("%s table deleted succesfully.", table_name)
     except Exception:
-        print(Exception(f"Error while trying to delete table {table_name}."))
-
+        logger.exception("Error while trying to delete table %s.", table_name)
@@ -0,0 +1,389 @@
+"""
+Camada de acesso ao banco (aero.db).
+
+- Uma conexão por thread, aberta uma única vez e reutilizada (ConnectionPool). O sqlite3 não permite usar uma conexão
+  em outra thread, então cada thread recebe a sua.
+- Todas as consultas usam parâmetros (?), nunca valores formatados na string SQL.
+- As consultas às tabelas de aeronaves, aeroportos e tipos de solo ficam em memória e são descartadas quando a tabela
+  correspondente é alterada.
+
+Uso:
+    repository = get_repository(db_path="db/aero.db")
+    aircrafts = repository.get_aircrafts()
+    repository.delete_aircraft("A320")
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import threading
+
+from .airport_catalog import AirportCatalog
+
+# Mesmo namespace de functions.utils.get_logger ("aero"), sem depender do pacote functions
+logger = logging.getLogger("aero.REPOSITORY")
+
+AIRCRAFTS_TABLE = "Airplanes"
+AIRPORTS_TABLE = "Airports"
+GROUND_TYPES_TABLE = "GroundTypes"
+GROUND_FRICTION_TABLE = "groundtype"
+
+# Colunas de Airplanes gravadas a partir de GUI_AIRCRAFT_PARAMETERS.get_aircraft_parameters
+AIRCRAFT_COLUMNS = {
+    "nome_aeronave": "AIRCRAFT_NAME",
+    "cd0": "CD0",
+    "area": "S",
+    "cl_max": "CL_MAX",
+    "oew": "OEW",
+    "tsfc": "TSFC",
+    "b": "b",
+    "e": "e",
+    "t0": "T0",
+    "ne": "NE",
+    "mtow": "MTOW",
+    "fuel_weight": "MAXIMUM_FUEL_WEIGHT",
+    "maximum_payload_weight": "MAXIMUM_PAYLOAD_WEIGHT",
+}
+
+# Pesos e empuxo em toneladas/kN, como exibidos na aba de parâmetros da aeronave
+AIRCRAFTS_IN_TONS_QUERY = ("select nome_aeronave, id, cd0, area, cl_max, oew/1000 as oew, tsfc, b, e, t0/1000 as t0, ne, "
+                           "mtow/1000 as mtow, fuel_weight/1000 as fuel_weight, "
+                           "maximum_payload_weight/1000 as maximum_payload_weight from Airplanes;")
+
+AIRCRAFTS_QUERY = "select * from Airplanes;"
+
+AIRPORTS_QUERY = "select iata, icao, aeroporto from Airports order by iata asc;"
+
+AIRPORT_CATALOG_QUERY = "select * from Airports order by iata asc;"
+
+GROUND_TYPES_QUERY = "select * from GroundTypes;"
+
+GROUND_FRICTION_QUERY = ("select superficie, min_mu_decolagem, max_mu_decolagem, min_mu_pouso, max_mu_pouso "
+                         "from groundtype;")
+
+# Índices das consultas por código de aeroporto; criados (se não existirem) por migrate_database
+INDEXES = (
+    "create index if not exists airports_iata on Airports (iata);",
+    "create index if not exists airports_icao on Airports (icao);",
+)
+
+
+class ConnectionPool:
+
+    """
+    Conexões SQLite de longa duração, uma por thread.
+
+    Parâmetros:
+    - db_path (str): Caminho do banco SQLite.
+    """
+
+    def __init__(self, db_path):
+
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def connection(self):
+        """Retorna a conexão da thread atual, abrindo-a na primeira chamada."""
+
+        con = getattr(self._local, "connection", None)
+
+        if con is None:
+            # Cada conexão é usada só pela sua thread; check_same_thread=False permite que close() a feche de outra
+            con = sqlite3.connect(self.db_path, check_same_thread=False)
+            con.row_factory = sqlite3.Row
+            self._local.connection = con
+
+            with self._lock:
+                self._connections.append(con)
+
+        return con
+
+    def close(self):
+        """Fecha as conexões de todas as threads."""
+
+        with self._lock:
+            connections, self._connections = self._connections, []
+
+        for con in connections:
+            con.close()
+
+        self._local = threading.local()
+
+
+class Repository:
+
+    """
+    Acesso ao banco com consultas parametrizadas e cache em memória por tabela.
+
+    Parâmetros:
+    - db_path (str): Caminho do banco SQLite.
+    """
+
+    def __init__(self, db_path):
+
+        self.db_path = db_path
+        self.pool = ConnectionPool(db_path=db_path)
+
+        # {tabela: {(consulta, parâmetros): linhas}}
+        self._cache = {}
+        self._cache_lock = threading.RLock()
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Genérico
+
+    def fetch_all(self, table, query, params=()):
+        """
+        Executa uma consulta de leitura, guardando o resultado até a próxima alteração da tabela.
+
+        Parâmetros:
+        - table (str): Tabela consultada (chave do cache). None desativa o cache.
+        - query (str): Consulta SQL, com ? no lugar dos valores.
+        - params (tuple, opcional): Valores da consulta.
+
+        Retorna:
+        list: Linhas (sqlite3.Row, acessíveis por índice ou por nome de coluna).
+        """
+
+        params = tuple(params)
+
+        if table is None:
+            return self.pool.connection().execute(query, params).fetchall()
+
+        rows = self.cached(table=table, key=(query, params),
+                           build=lambda: self.pool.connection().execute(query, params).fetchall())
+
+        # Cópia da lista: quem chama pode alterá-la sem afetar o cache
+        return list(rows)
+
+    def cached(self, table, key, build):
+        """
+        Retorna o valor guardado para a chave, calculando-o com build() se ainda não estiver no cache da tabela.
+
+        Parâmetros:
+        - table (str): Tabela da qual o valor depende; o valor é descartado quando a tabela é alterada.
+        - key (hashable): Chave do valor.
+        - build (callable): Função sem argumentos que calcula o valor.
+        """
+
+        with self._cache_lock:
+            table_cache = self._cache.setdefault(table.lower(), {})
+            if key not in table_cache:
+                table_cache[key] = build()
+            return table_cache[key]
+
+    def fetch_values(self, table, query, params=()):
+        """Como fetch_all, mas retorna apenas a primeira coluna de cada linha."""
+        return [row[0] for row in self.fetch_all(table=table, query=query, params=params)]
+
+    def execute(self, table, query, params=()):
+        """
+        Executa uma alteração (insert, update, delete) numa transação e descarta o cache da tabela.
+
+        Parâmetros:
+        - table (str): Tabela alterada. None descarta o cache de todas as tabelas.
+        - query (str): Comando SQL, com ? no lugar dos valores.
+        - params (tuple, opcional): Valores do comando.
+        """
+
+        self.execute_many(table=table, statements=[(query, params)])
+
+    def execute_many(self, table, statements):
+        """Executa vários comandos (consulta, parâmetros) numa única transação e descarta o cache da tabela."""
+
+        con = self.pool.connection()
+
+        try:
+            with con:
+                for query, params in statements:
+                    con.execute(query, tuple(params))
+        finally:
+            self.invalidate(table=table)
+
+    def invalidate(self, table=None):
+        """Descarta o cache de uma tabela (ou de todas, se table=None)."""
+
+        with self._cache_lock:
+            if table is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(table.lower(), None)
+
+    def create_indexes(self):
+        """Cria os índices de INDEXES. Bancos somente leitura ou sem as tabelas são ignorados."""
+
+        for index in INDEXES:
+            try:
+                self.execute(table=None, query=index)
+            except sqlite3.DatabaseError as error:
+                logger.debug("Index not created (%s): %s", error, index)
+
+    def close(self):
+        self.invalidate()
+        self.pool.close()
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Aeronaves
+
+    def get_aircrafts(self, query=AIRCRAFTS_QUERY):
+        """
+        Retorna as aeronaves cadastradas.
+
+        Parâmetros:
+        - query (str, opcional): Consulta à tabela Airplanes (ex.: AIRCRAFTS_IN_TONS_QUERY). Default é todas as colunas.
+
+        Retorna:
+        dict: Colunas de cada aeronave (dict) por nome da aeronave.
+        """
+        return {row[0]: dict(row) for row in self.fetch_all(table=AIRCRAFTS_TABLE, query=query)}
+
+    def insert_aircraft(self, aircraft):
+        """Cadastra uma aeronave (chaves de GUI_AIRCRAFT_PARAMETERS.get_aircraft_parameters)."""
+        self.execute_many(table=AIRCRAFTS_TABLE, statements=[_insert_aircraft_statement(aircraft)])
+
+    def update_aircraft(self, aircraft):
+        """Substitui os valores de uma aeronave já cadastrada, numa única transação."""
+        self.execute_many(table=AIRCRAFTS_TABLE,
+                          statements=[_delete_aircraft_statement(aircraft['AIRCRAFT_NAME']),
+                                      _insert_aircraft_statement(aircraft)])
+
+    def delete_aircraft(self, aircraft_name):
+        self.execute_many(table=AIRCRAFTS_TABLE, statements=[_delete_aircraft_statement(aircraft_name)])
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Aeroportos
+
+    def get_airports(self):
+        """Retorna (iata, icao, aeroporto) de cada aeroporto, em ordem de código IATA."""
+        return self.fetch_all(table=AIRPORTS_TABLE, query=AIRPORTS_QUERY)
+
+    def get_airport_catalog(self):
+        """Retorna o catálogo de aeroportos (AirportCatalog), montado uma vez e descartado quando Airports é alterada."""
+        return self.cached(table=AIRPORTS_TABLE, key="CATALOG",
+                           build=lambda: AirportCatalog(self.fetch_all(table=AIRPORTS_TABLE, query=AIRPORT_CATALOG_QUERY)))
+
+    def get_airport(self, code):
+        """
+        Retorna os dados de um aeroporto.
+
+        Parâmetros:
+        - code (str): Código IATA ou ICAO do aeroporto.
+
+        Retorna:
+        dict: Colunas do aeroporto (iata, icao, aeroporto, cidade, pais, pista, elevacao, latitude, longitude), ou None
+        se não existir.
+        """
+        return self.get_airport_catalog().get(code)
+
+    def search_airports(self, text, limit=10):
+        """Busca aeroportos pelo início do código, nome, cidade ou país (ver AirportCatalog.search)."""
+        return self.get_airport_catalog().search(text, limit=limit)
+
+    def get_airport_codes(self):
+        return self.get_airport_catalog().codes()
+
+    def get_airport_index(self, cell_size=1.0):
+        """Retorna o índice espacial dos aeroportos (AirportIndex), descartado quando Airports é alterada."""
+
+        # Importado aqui: functions depende de db.utils, não o contrário
+        from functions.airport_index import AirportIndex
+
+        return self.cached(table=AIRPORTS_TABLE, key=("INDEX", cell_size),
+                           build=lambda: AirportIndex(self.get_airport_catalog().airports, cell_size=cell_size))
+
+    def insert_airport(self, airport):
+        """
+        Cadastra um aeroporto.
+
+        Parâmetros:
+        - airport (dict): iata, icao, aeroporto, pista, elevacao, latitude e longitude.
+        """
+
+        columns = ("iata", "icao", "aeroporto", "pista", "elevacao", "latitude", "longitude")
+
+        self.execute(table=AIRPORTS_TABLE,
+                     query=f"insert into Airports ({', '.join(columns)}) values ({', '.join('?' * len(columns))});",
+                     params=[airport[column] for column in columns])
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Tipos de solo
+
+    def get_ground_types(self):
+        """Retorna as colunas de cada tipo de solo (dict) por superfície."""
+        return {row['superficie']: dict(row) for row in self.fetch_all(table=GROUND_TYPES_TABLE, query=GROUND_TYPES_QUERY)}
+
+    def get_ground_type(self, surface):
+        return self.get_ground_types().get(surface)
+
+    def get_ground_friction_ranges(self):
+        """Retorna, por superfície, as faixas (mínimo, máximo) de MU_TAKEOFF e MU_LANDING da tabela groundtype."""
+        return {row['superficie']: {"MU_TAKEOFF": (row['min_mu_decolagem'], row['max_mu_decolagem']),
+                                    "MU_LANDING": (row['min_mu_pouso'], row['max_mu_pouso'])}
+                for row in self.fetch_all(table=GROUND_FRICTION_TABLE, query=GROUND_FRICTION_QUERY)}
+
+
+def _insert_aircraft_statement(aircraft):
+
+    query = (f"insert into Airplanes ({', '.join(AIRCRAFT_COLUMNS)}) "
+             f"values ({', '.join('?' * len(AIRCRAFT_COLUMNS))});")
+
+    return query, [aircraft[key] for key in AIRCRAFT_COLUMNS.values()]
+
+
+def _delete_aircraft_statement(aircraft_name):
+    return "delete from Airplanes where nome_aeronave = ?;", (aircraft_name,)
+
+
+_repositories = {}
+_repositories_lock = threading.Lock()
+
+
+def get_repository(db_path="db/aero.db"):
+    """
+    Retorna o repositório compartilhado do banco (um por caminho), criando-o na primeira chamada.
+
+    Parâmetros:
+    - db_path (str, opcional): Caminho do banco SQLite.
+
+    Retorna:
+    Repository: Repositório do banco.
+    """
+
+    key = os.path.abspath(db_path)
+
+    with _repositories_lock:
+        if key not in _repositories:
+            _repositories[key] = Repository(db_path=db_path)
+        return _repositories[key]
+
+
+def migrate_database(db_path="db/aero.db"):
+    """
+    Aplica as alterações de esquema do banco (índices de INDEXES). É um passo explícito (python -m app.db.utils.repository
+    --db <banco>); nem a aplicação nem get_repository alteram o banco ao abri-lo.
+
+    Parâmetros:
+    - db_path (str, opcional): Caminho do banco SQLite.
+    """
+
+    get_repository(db_path=db_path).create_indexes()
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(prog="python -m app.db.utils.repository",
+                                     description="Apply the schema migrations (indexes) to an aero.db copy.")
+    parser.add_argument("--db", required=True, help="SQLite database to migrate (e.g. a copy of app/db/aero.db).")
+
+    args = parser.parse_args(argv)
+
+    migrate_database(db_path=args.db)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
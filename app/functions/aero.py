@@ -5,15 +5,45 @@ current_dir = os.path.dirname(os.path.realpath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 import math
+from bisect import bisect_left
+import numpy as np
 from .utils import get_logger
 
 
 class Aero:
 
+    # Tabelas de atmosfera compartilhadas entre todas as instâncias, indexadas por (passo, altitude máxima, dtype)
+    _atmosphere_tables = {}
+
+    # Tabela ativa (Aero.enable_atmosphere_table), a mesma para todas as instâncias do processo
+    atmosphere_table = None
+    _atmosphere_table_list = None
+    _atmosphere_table_step = None
+    _atmosphere_table_max_altitude = None
+
+    # Incrementado a cada troca do modo de atmosfera; caches de resultados que dependem da densidade o usam na chave
+    atmosphere_version = 0
+
     def __init__(self):
 
         self.R_gas = 287.058  
         self.g = 9.81 # Aceleração da gravidade [m/s^2]
+        self.logger = get_logger()
+
+        # Camadas da atmosfera padrão (ISA): gradiente térmico [K/m] e altitude de topo [m] de cada camada
+        self.layer_lapse_rates = [-0.0065, 0, 0.001, 0.0028]
+        self.layer_top_altitudes = [11000, 20000, 32000, 47000]
+        self.layer_base_altitudes, self.layer_base_temperatures, self.layer_base_pressures = self.get_layer_base_conditions()
+
+        self._layer_lapse_rates_array = np.array(self.layer_lapse_rates, dtype=float)
+        self._layer_base_altitudes_array = np.array(self.layer_base_altitudes, dtype=float)
+        self._layer_base_temperatures_array = np.array(self.layer_base_temperatures, dtype=float)
+        self._layer_base_pressures_array = np.array(self.layer_base_pressures, dtype=float)
+        self._layer_gradient_exponents_array = np.array(
+            [-1 * self.g / a / self.R_gas if a != 0 else 0 for a in self.layer_lapse_rates])
+        self._layer_isothermal_exponents_array = np.array(
+            [-self.g / self.R_gas / t0 if a == 0 else 0 for a, t0 in zip(self.layer_lapse_rates, self.layer_base_temperatures)])
+
         self.rho_0 = self.get_density(altitude=0)
         self.h_Sc = 15.24                   # Altura mínima de decolagem (screen height)
         self.maximum_breaking_constant = 0.55 * 9.81
@@ -21,7 +51,6 @@ class Aero:
         self.minimum_breaking_constant = 0.15 * 9.81
         self.gamma_Ap = math.radians(3)
         self.person_weight = 75 * 9.81  # [kg]
-        self.logger = get_logger()
 
     def calculate_general_drag_coefficient(self, K, CD0, S=None, altitude=None, V=None, W=None, CL=None):
         """
@@ -78,23 +107,225 @@ class Aero:
             p1 = p0 * math.exp(-self.g / self.R_gas / t0 * (h1 - h0))
         return t1, p1
 
+    def get_layer_base_conditions(self, p0=101325, t0=288.15):
+        """
+        Calcula as condições (altitude, temperatura e pressão) na base de cada camada da atmosfera padrão.
+
+        As condições são obtidas uma única vez, propagando a temperatura e a pressão do nível do mar até o topo de cada
+        camada com Aero.cal.
+
+        Parâmetros:
+        - p0 (float): Pressão ao nível do mar (Pa).
+        - t0 (float): Temperatura ao nível do mar (K).
+
+        Retorna:
+        tuple: Listas com a altitude (m), a temperatura (K) e a pressão (Pa) na base de cada camada.
+        """
+
+        base_altitudes, base_temperatures, base_pressures = [], [], []
+        prevh = 0
+
+        for a_i, h_i in zip(self.layer_lapse_rates, self.layer_top_altitudes):
+            base_altitudes.append(prevh)
+            base_temperatures.append(t0)
+            base_pressures.append(p0)
+
+            t0, p0 = self.cal(p0, t0, a_i, prevh, h_i)
+            prevh = h_i
+
+        return base_altitudes, base_temperatures, base_pressures
+
+    def get_atmosphere(self, altitude):
+        """
+        Calcula as propriedades da atmosfera padrão (ISA) para um vetor de altitudes numa única passagem vetorizada.
+
+        Parâmetros:
+        - altitude (float ou array_like): Altitude(s) em metros (m), no intervalo [0, 47000].
+
+        Retorna:
+        dict: Dicionário contendo arrays do mesmo formato de 'altitude':
+            - "DENSITY": Densidade do ar (kg/m^3).
+            - "TEMPERATURE": Temperatura (K).
+            - "PRESSURE": Pressão (Pa).
+            - "SIGMA": Razão de densidade do ar não-dimensional (adimensional).
+        Altitudes fora do intervalo resultam em NaN.
+        """
+
+        h = np.asarray(altitude, dtype=float)
+
+        out_of_range = (h < 0) | (h > self.layer_top_altitudes[-1])
+        if np.any(out_of_range):
+            self.logger.error("altitude must be in [0, 47000]")
+
+        # Camada i é a primeira cujo topo é maior ou igual à altitude (mesmo critério de get_density)
+        layer = (h > self.layer_top_altitudes[0]).astype(np.intp)
+        for top_altitude in self.layer_top_altitudes[1:-1]:
+            layer += h > top_altitude
+
+        h_base = self._layer_base_altitudes_array[layer]
+        t_base = self._layer_base_temperatures_array[layer]
+
+        temperature = t_base + self._layer_lapse_rates_array[layer] * (h - h_base)
+
+        # Expoente da pressão: camadas com gradiente usam (T/T_b)^(-g/(a*R)) e camadas isotérmicas
+        # exp(-g/(R*T_b) * (h - h_b)). Como T = T_b nas camadas isotérmicas, log(T/T_b) = 0 e uma única expressão atende
+        # as quatro camadas.
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            exponent = (self._layer_gradient_exponents_array[layer] * np.log(temperature / t_base) +
+                        self._layer_isothermal_exponents_array[layer] * (h - h_base))
+            pressure = self._layer_base_pressures_array[layer] * np.exp(exponent)
+
+        if np.any(out_of_range):
+            temperature = np.where(out_of_range, np.nan, temperature)
+            pressure = np.where(out_of_range, np.nan, pressure)
+
+        density = pressure / (self.R_gas * temperature)
+
+        return {
+            "DENSITY": density,
+            "TEMPERATURE": temperature,
+            "PRESSURE": pressure,
+            "SIGMA": density / self.rho_0
+        }
+
+    def build_atmosphere_table(self, step=1.0, max_altitude=47000, dtype=np.float64):
+        """
+        Constrói (uma única vez por processo) uma tabela de densidade do ar em uma grade uniforme de altitudes e estima o
+        pior erro da interpolação linear em relação a Aero.get_atmosphere.
+
+        Parâmetros:
+        - step (float): Espaçamento da grade de altitudes (m).
+        - max_altitude (float): Altitude máxima da tabela (m), no máximo 47000.
+        - dtype (numpy.dtype): Tipo usado para armazenar a tabela (np.float32 ou np.float64).
+
+        Retorna:
+        dict: Dicionário contendo:
+            - "ALTITUDE_STEP" (float): Espaçamento da grade (m).
+            - "MAX_ALTITUDE" (float): Altitude máxima coberta pela tabela (m).
+            - "DENSITY" (numpy.ndarray): Densidade do ar em cada ponto da grade (kg/m^3).
+            - "MAX_ABSOLUTE_ERROR_DENSITY" (float): Maior erro absoluto da densidade interpolada (kg/m^3).
+            - "MAX_RELATIVE_ERROR_DENSITY" (float): Maior erro relativo da densidade interpolada (adimensional).
+        """
+
+        if step <= 0 or max_altitude <= 0 or max_altitude > self.layer_top_altitudes[-1]:
+            raise ValueError("step must be positive and max_altitude must be in (0, 47000]")
+
+        key = (float(step), float(max_altitude), np.dtype(dtype).name)
+
+        if key not in Aero._atmosphere_tables:
+
+            n_points = int(math.ceil(max_altitude / step)) + 1
+            altitudes = np.minimum(np.arange(n_points) * step, max_altitude)
+            density = self.get_atmosphere(altitude=altitudes)['DENSITY'].astype(dtype)
+
+            # O maior erro da interpolação linear ocorre entre os nós; os nós capturam o erro de arredondamento do dtype.
+            check_altitudes = np.concatenate((altitudes, 0.5 * (altitudes[1:] + altitudes[:-1])))
+            exact_density = self.get_atmosphere(altitude=check_altitudes)['DENSITY']
+            absolute_error = np.abs(self._interpolate_atmosphere_table(density, step, check_altitudes) - exact_density)
+
+            Aero._atmosphere_tables[key] = {
+                "ALTITUDE_STEP": float(step),
+                "MAX_ALTITUDE": float(max_altitude),
+                "DENSITY": density,
+                "MAX_ABSOLUTE_ERROR_DENSITY": float(np.max(absolute_error)),
+                "MAX_RELATIVE_ERROR_DENSITY": float(np.max(absolute_error / exact_density))
+            }
+
+        return Aero._atmosphere_tables[key]
+
+    def enable_atmosphere_table(self, step=1.0, max_altitude=47000, dtype=np.float32):
+        """
+        Ativa o modo tabelado: get_density e get_sigma passam a interpolar a tabela de Aero.build_atmosphere_table em
+        tempo O(1), em vez de calcular a atmosfera exata. Altitudes acima de 'max_altitude' continuam exatas.
+
+        O modo vale para todas as instâncias de Aero do processo, inclusive as criadas nos módulos de cálculo, desde
+        que importadas pelo mesmo caminho (functions.aero ou app.functions.aero): cada caminho carrega uma classe Aero
+        própria.
+
+        Parâmetros:
+        - step (float): Espaçamento da grade de altitudes (m).
+        - max_altitude (float): Altitude máxima da tabela (m).
+        - dtype (numpy.dtype): Tipo usado para armazenar a tabela.
+
+        Retorna:
+        dict: Tabela ativada, incluindo os erros máximos em relação à atmosfera exata.
+        """
+
+        table = self.build_atmosphere_table(step=step, max_altitude=max_altitude, dtype=dtype)
+
+        Aero.atmosphere_table = table
+        Aero._atmosphere_table_list = table['DENSITY'].tolist()
+        Aero._atmosphere_table_step = table['ALTITUDE_STEP']
+        Aero._atmosphere_table_max_altitude = table['MAX_ALTITUDE']
+        Aero.atmosphere_version += 1
+
+        self.logger.debug("Atmosphere table enabled (step = %s m, max relative error = %.3e)",
+                          step, table['MAX_RELATIVE_ERROR_DENSITY'])
+
+        return table
+
+    def disable_atmosphere_table(self):
+        """
+        Desativa o modo tabelado, voltando ao cálculo exato da atmosfera.
+        """
+
+        Aero.atmosphere_table = None
+        Aero._atmosphere_table_list = None
+        Aero.atmosphere_version += 1
+
+    @staticmethod
+    def _interpolate_atmosphere_table(table, step, altitude):
+
+        position = np.asarray(altitude, dtype=float) / step
+        index = np.clip(np.floor(position).astype(np.intp), 0, len(table) - 2)
+        fraction = position - index
+
+        return table[index] + fraction * (table[index + 1] - table[index])
+
+    def _get_density_from_table(self, altitude):
+
+        table = self.atmosphere_table
+        h = np.asarray(altitude, dtype=float)
+
+        density = self._interpolate_atmosphere_table(table['DENSITY'], table['ALTITUDE_STEP'], h)
+
+        outside_table = (h < 0) | (h > table['MAX_ALTITUDE'])
+        if np.any(outside_table):
+            density = np.where(outside_table, self.get_atmosphere(altitude=h)['DENSITY'], density)
+
+        return density
+
     #https://gist.github.com/buzzerrookie/5b6438c603eabf13d07e
     def get_density(self, altitude, get_temp=None):
-        a = [-0.0065, 0, 0.001, 0.0028]
-        h = [11000, 20000, 32000, 47000]
-        p0 = 101325
-        t0 = 288.15
-        prevh = 0
+
+        table = self._atmosphere_table_list
+
+        if table is not None and get_temp is None:
+
+            if isinstance(altitude, (np.ndarray, list, tuple)):
+                return self._get_density_from_table(altitude=altitude)
+
+            # Interpolação linear na grade uniforme: o índice é obtido diretamente da altitude, em tempo O(1)
+            if 0 <= altitude <= self._atmosphere_table_max_altitude:
+                position = altitude / self._atmosphere_table_step
+                index = min(int(position), len(table) - 2)
+                return table[index] + (position - index) * (table[index + 1] - table[index])
+
+        if isinstance(altitude, (np.ndarray, list, tuple)):
+            atmosphere = self.get_atmosphere(altitude=altitude)
+            if get_temp is None:
+                return atmosphere['DENSITY']
+            else:
+                return atmosphere['DENSITY'], atmosphere['TEMPERATURE']
+
         if altitude < 0 or altitude > 47000:
             self.logger.error("altitude must be in [0, 47000]")
             return
-        for i in range(0, 4):
-            if altitude <= h[i]:
-                temperature, pressure = self.cal(p0, t0, a[i], prevh, altitude)
-                break
-            else:
-                t0, p0 = self.cal(p0, t0, a[i], prevh, h[i])
-                prevh = h[i]
+
+        # As condições na base de cada camada já foram pré-calculadas no construtor
+        i = min(bisect_left(self.layer_top_altitudes, altitude), 3)
+        temperature, pressure = self.cal(self.layer_base_pressures[i], self.layer_base_temperatures[i],
+                                         self.layer_lapse_rates[i], self.layer_base_altitudes[i], altitude)
 
         density = pressure / (self.R_gas * temperature)
 
@@ -109,12 +340,15 @@ class Aero:
         Calcula a razão de densidade do ar não-dimensional (sigma) em uma dada altitude.
 
         Parâmetros:
-        - altitude (float): Altitude em metros.
+        - altitude (float ou array_like): Altitude em metros.
 
         Retorna:
-        float: Razão de densidade do ar não-dimensional (sigma).
+        float: Razão de densidade do ar não-dimensional (sigma). Se 'altitude' for um array, retorna um array.
         """
 
+        if isinstance(altitude, (np.ndarray, list, tuple)):
+            return self.get_density(altitude=altitude) / self.rho_0
+
         try:
             rho = self.get_density(altitude=altitude)
             sigma = float(rho / self.rho_0)
@@ -183,4 +417,69 @@ class Aero:
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         radius_of_earth = 6_371_000  # Raio da terra em metros
         distance = radius_of_earth * c
-        return distance
\ No newline at end of file
+        return distance
+
+    @staticmethod
+    def get_haversine_distances(latitude, longitude, latitudes, longitudes):
+
+        """
+        Versão vetorizada de get_haversine_distance: distâncias de um ponto a vários pontos de uma só vez.
+
+        Parâmetros:
+        latitude (float): Latitude do ponto de origem em graus.
+        longitude (float): Longitude do ponto de origem em graus.
+        latitudes (array): Latitudes dos pontos de destino em graus.
+        longitudes (array): Longitudes dos pontos de destino em graus.
+
+        Retorna:
+        numpy.ndarray: Distâncias em metros (m), na ordem dos pontos de destino.
+        """
+
+        lat1, lon1 = math.radians(latitude), math.radians(longitude)
+        lat2 = np.radians(np.asarray(latitudes, dtype=float))
+        lon2 = np.radians(np.asarray(longitudes, dtype=float))
+
+        a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        a = np.clip(a, 0, 1)  # Erros de arredondamento podem levar a ligeiramente fora de [0, 1]
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        radius_of_earth = 6_371_000  # Raio da terra em metros
+
+        return radius_of_earth * c
+
+
+    @staticmethod
+    def get_haversine_distance_matrix(latitudes_1, longitudes_1, latitudes_2=None, longitudes_2=None, dtype=np.float64):
+
+        """
+        Matriz de distâncias Haversine entre dois conjuntos de pontos (origens x destinos).
+
+        Parâmetros:
+        latitudes_1 (array): Latitudes das origens em graus.
+        longitudes_1 (array): Longitudes das origens em graus.
+        latitudes_2 (array, opcional): Latitudes dos destinos em graus. Default são as próprias origens.
+        longitudes_2 (array, opcional): Longitudes dos destinos em graus. Default são as próprias origens.
+        dtype (numpy.dtype, opcional): Tipo do resultado (np.float32 ou np.float64). Default é np.float64.
+            O termo Haversine é sempre calculado em float64: em float32, o arcsin perto de pontos antípodas amplifica o
+            arredondamento para mais de 1 km. Com np.float32 só o resultado é arredondado (erro de ~1 m a 20000 km).
+
+        Retorna:
+        numpy.ndarray: Matriz (número de origens, número de destinos) de distâncias em metros (m).
+        """
+
+        if latitudes_2 is None or longitudes_2 is None:
+            latitudes_2, longitudes_2 = latitudes_1, longitudes_1
+
+        lat1 = np.radians(np.asarray(latitudes_1, dtype=np.float64))[:, np.newaxis]
+        lon1 = np.radians(np.asarray(longitudes_1, dtype=np.float64))[:, np.newaxis]
+        lat2 = np.radians(np.asarray(latitudes_2, dtype=np.float64))[np.newaxis, :]
+        lon2 = np.radians(np.asarray(longitudes_2, dtype=np.float64))[np.newaxis, :]
+
+        # Os termos de cada linha e de cada coluna são calculados uma vez; só os produtos são feitos para a matriz inteira
+        a = np.sin((lat2 - lat1) / 2) ** 2
+        a += np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        np.clip(a, 0, 1, out=a)  # Erros de arredondamento podem levar a ligeiramente fora de [0, 1]
+
+        c = 2 * np.arcsin(np.sqrt(a, out=a), out=a)  # Igual a 2 * atan2(sqrt(a), sqrt(1 - a)) para a em [0, 1]
+        radius_of_earth = 6_371_000  # Raio da terra em metros
+
+        return np.multiply(c, radius_of_earth, out=c).astype(dtype, copy=False)
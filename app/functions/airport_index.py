@@ -0,0 +1,247 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import math
+import numpy as np
+from .aero import Aero
+from .gliding import gliding_range_endurance
+from .utils import get_logger
+
+aero = Aero()
+logger = get_logger(log_name="AIRPORT_INDEX")
+
+RADIUS_OF_EARTH = 6_371_000  # Raio da terra em metros, o mesmo de Aero.get_haversine_distance
+
+
+class AirportIndex:
+
+    """
+    Índice espacial de aeroportos: uma grade de células de latitude x longitude. Uma consulta calcula a distância
+    (haversine vetorizada) apenas aos aeroportos das células que podem estar dentro do raio, em vez de a todos.
+
+    Parâmetros:
+    - airports (list): Aeroportos, cada um um dict com 'latitude' e 'longitude' em graus (ex.: AirportCatalog.airports).
+      Aeroportos sem coordenadas são ignorados.
+    - cell_size (float, opcional): Tamanho das células em graus. Default é 1 (~111 km de latitude).
+    """
+
+    def __init__(self, airports, cell_size=1.0):
+
+        airports = [airport for airport in airports
+                    if airport.get('latitude') is not None and airport.get('longitude') is not None]
+
+        self.airports = airports
+        self.cell_size = cell_size
+        self.latitudes = np.array([float(airport['latitude']) for airport in airports])
+        self.longitudes = np.array([float(airport['longitude']) for airport in airports])
+
+        self.n_lat_cells = int(math.ceil(180 / cell_size))
+        self.n_lon_cells = int(math.ceil(360 / cell_size))
+
+        cells = self._cell(self.latitudes, self.longitudes)
+
+        # Índices dos aeroportos ordenados por célula; cada célula ocupa um trecho contínuo de self._order
+        self._order = np.argsort(cells, kind="stable")
+        cell_ids, starts, counts = np.unique(cells[self._order], return_index=True, return_counts=True)
+        self._cells = {int(cell): (int(start), int(start + count)) for cell, start, count in zip(cell_ids, starts, counts)}
+
+    def __len__(self):
+        return len(self.airports)
+
+    def _lat_cell(self, latitude):
+        return np.clip(np.floor((np.asarray(latitude) + 90) / self.cell_size).astype(int), 0, self.n_lat_cells - 1)
+
+    def _lon_cell(self, longitude):
+        return np.floor((np.asarray(longitude) + 180) / self.cell_size).astype(int) % self.n_lon_cells
+
+    def _cell(self, latitude, longitude):
+        return self._lat_cell(latitude) * self.n_lon_cells + self._lon_cell(longitude)
+
+    def _candidates(self, latitude, longitude, radius):
+        """Índices dos aeroportos das células que podem ter pontos a até radius (m) de (latitude, longitude)."""
+
+        angular_radius = radius / RADIUS_OF_EARTH
+
+        if angular_radius >= math.pi:
+            return np.arange(len(self.airports))
+
+        delta_latitude = math.degrees(angular_radius)
+        lat_rows = range(int(self._lat_cell(latitude - delta_latitude)), int(self._lat_cell(latitude + delta_latitude)) + 1)
+
+        # Maior diferença de longitude de um círculo de raio angular d centrado na latitude phi: asin(sin d / cos phi).
+        # Se o círculo contém um polo, todas as longitudes.
+        cos_latitude = math.cos(math.radians(latitude))
+
+        if latitude + delta_latitude >= 90 or latitude - delta_latitude <= -90 or math.sin(angular_radius) >= cos_latitude:
+            lon_columns = range(self.n_lon_cells)
+        else:
+            delta_longitude = math.degrees(math.asin(math.sin(angular_radius) / cos_latitude))
+            first = int(math.floor((longitude - delta_longitude + 180) / self.cell_size))
+            last = int(math.floor((longitude + delta_longitude + 180) / self.cell_size))
+            lon_columns = {column % self.n_lon_cells for column in range(first, min(last, first + self.n_lon_cells - 1) + 1)}
+
+        slices = [self._cells[cell] for cell in (row * self.n_lon_cells + column for row in lat_rows for column in lon_columns)
+                  if cell in self._cells]
+
+        if not slices:
+            return np.empty(0, dtype=int)
+
+        return np.concatenate([self._order[start:end] for start, end in slices])
+
+    def within_radius(self, latitude, longitude, radius):
+        """
+        Aeroportos a até uma distância de um ponto.
+
+        Parâmetros:
+        - latitude (float): Latitude do ponto em graus.
+        - longitude (float): Longitude do ponto em graus.
+        - radius (float): Distância máxima em metros (m).
+
+        Retorna:
+        list: (aeroporto, distância em m) dos aeroportos encontrados, do mais próximo ao mais distante.
+        """
+
+        candidates = self._candidates(latitude, longitude, radius)
+        distances = aero.get_haversine_distances(latitude, longitude, self.latitudes[candidates], self.longitudes[candidates])
+
+        inside = distances <= radius
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+
+        return [(self.airports[i], float(d)) for i, d in zip(candidates[order], distances[order])]
+
+    def nearest(self, latitude, longitude, n=1, max_radius=None):
+        """
+        Os n aeroportos mais próximos de um ponto.
+
+        Parâmetros:
+        - latitude (float): Latitude do ponto em graus.
+        - longitude (float): Longitude do ponto em graus.
+        - n (int, opcional): Número de aeroportos. Default é 1.
+        - max_radius (float, opcional): Distância máxima em metros (m). Default é sem limite.
+
+        Retorna:
+        list: (aeroporto, distância em m), do mais próximo ao mais distante. Pode ter menos de n aeroportos.
+        """
+
+        max_radius = math.pi * RADIUS_OF_EARTH if max_radius is None else max_radius
+
+        # Raio inicial de uma célula; dobra até encontrar n aeroportos (todos os aeroportos dentro do raio são
+        # encontrados, então os n primeiros são os n mais próximos)
+        radius = min(math.radians(self.cell_size) * RADIUS_OF_EARTH, max_radius)
+
+        while True:
+
+            found = self.within_radius(latitude, longitude, radius)
+
+            if len(found) >= n or radius >= max_radius:
+                return found[:n]
+
+            radius = min(2 * radius, max_radius)
+
+    def alternates_along_route(self, latitudes, longitudes, radius):
+        """
+        Aeroportos alternativos ao longo de uma rota: para cada ponto, os aeroportos a até radius.
+
+        Parâmetros:
+        - latitudes (array): Latitudes dos pontos da rota em graus.
+        - longitudes (array): Longitudes dos pontos da rota em graus.
+        - radius (float): Distância máxima em metros (m), por exemplo o alcance de planeio.
+
+        Retorna:
+        list: Uma lista de (aeroporto, distância em m) por ponto da rota, como em within_radius.
+        """
+
+        return [self.within_radius(latitude, longitude, radius) for latitude, longitude in zip(latitudes, longitudes)]
+
+
+def get_great_circle_points(departure, arrival, n_points=20):
+
+    """
+    Pontos igualmente espaçados sobre o grande círculo entre dois pontos (incluindo os extremos).
+
+    Parâmetros:
+    - departure (dict): 'LATITUDE' e 'LONGITUDE' do ponto de partida em graus.
+    - arrival (dict): 'LATITUDE' e 'LONGITUDE' do ponto de chegada em graus.
+    - n_points (int, opcional): Número de pontos. Default é 20.
+
+    Retorna:
+    tuple: (latitudes, longitudes) em graus, como numpy.ndarray.
+    """
+
+    lat1, lon1 = math.radians(departure['LATITUDE']), math.radians(departure['LONGITUDE'])
+    lat2, lon2 = math.radians(arrival['LATITUDE']), math.radians(arrival['LONGITUDE'])
+
+    # Interpolação esférica entre os vetores unitários dos dois pontos
+    p1 = np.array([math.cos(lat1) * math.cos(lon1), math.cos(lat1) * math.sin(lon1), math.sin(lat1)])
+    p2 = np.array([math.cos(lat2) * math.cos(lon2), math.cos(lat2) * math.sin(lon2), math.sin(lat2)])
+
+    omega = math.acos(min(1.0, max(-1.0, float(np.dot(p1, p2)))))
+    fractions = np.linspace(0, 1, n_points)
+
+    if omega < 1e-12:
+        points = np.outer(np.ones(n_points), p1)
+    else:
+        points = (np.outer(np.sin((1 - fractions) * omega), p1) + np.outer(np.sin(fractions * omega), p2)) / math.sin(omega)
+
+    latitudes = np.degrees(np.arctan2(points[:, 2], np.hypot(points[:, 0], points[:, 1])))
+    longitudes = np.degrees(np.arctan2(points[:, 1], points[:, 0]))
+
+    return latitudes, longitudes
+
+
+def calc_route_alternates(aircraft_parameters: dict, flight_parameters: dict, airport_index, n_points=20, W=None):
+
+    """
+    Aeroportos alcançáveis em planeio ao longo do cruzeiro, para o planejamento de alternativas.
+
+    A rota é o grande círculo entre os aeroportos de decolagem e de pouso; o raio de busca é o maior alcance de planeio
+    (sustentação constante ou velocidade constante) de gliding_range_endurance, da altitude de cruzeiro até o nível do
+    mar.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave.
+    - flight_parameters (dict): Parâmetros de voo, com as coordenadas em takeoff_parameters e landing_parameters.
+    - airport_index (AirportIndex): Índice dos aeroportos.
+    - n_points (int, opcional): Número de pontos da rota. Default é 20.
+    - W (float, opcional): Peso da aeronave (N), repassado a gliding_range_endurance.
+
+    Retorna:
+    dict: Dicionário contendo:
+        - "GLIDING_RANGE" (float): Raio de busca (m).
+        - "LATITUDE" (numpy.ndarray): Latitudes dos pontos da rota (graus).
+        - "LONGITUDE" (numpy.ndarray): Longitudes dos pontos da rota (graus).
+        - "ALTERNATES" (list): Para cada ponto, (aeroporto, distância em m) dos aeroportos alcançáveis.
+    """
+
+    departure = {
+        "LATITUDE": flight_parameters['takeoff_parameters']['LATITUDE_TAKEOFF'],
+        "LONGITUDE": flight_parameters['takeoff_parameters']['LONGITUDE_TAKEOFF']
+    }
+
+    arrival = {
+        "LATITUDE": flight_parameters['landing_parameters']['LATITUDE_LANDING'],
+        "LONGITUDE": flight_parameters['landing_parameters']['LONGITUDE_LANDING']
+    }
+
+    gliding = gliding_range_endurance(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters, W=W)
+    gliding_range = max(gliding['GLIDING_CONSTANT_LIFT']['GLIDING_MAX_RANGE_CONSTANT_LIFT'],
+                        gliding['GLIDING_CONSTANT_AIRSPEED']['GLIDING_MAX_RANGE_CONSTANT_AIRSPEED'])
+
+    latitudes, longitudes = get_great_circle_points(departure=departure, arrival=arrival, n_points=n_points)
+
+    alternates = airport_index.alternates_along_route(latitudes=latitudes, longitudes=longitudes, radius=gliding_range)
+
+    logger.debug("Route alternates: %d points, gliding range %.1f km, %d points without alternates",
+                 n_points, gliding_range / 1000, sum(len(a) == 0 for a in alternates))
+
+    return {
+        "GLIDING_RANGE": gliding_range,
+        "LATITUDE": latitudes,
+        "LONGITUDE": longitudes,
+        "ALTERNATES": alternates,
+    }
@@ -1,11 +1,14 @@
 import math
 from .aero import Aero
 from .utils import get_logger, linspace
-from functions.cruising_jet import calc_cruise_velocity
-import matplotlib.pyplot as plt
-from numpy import polyfit, polyval
+from .cruising_jet import calc_cruise_velocity
+import numpy as np
 
 aero = Aero()
+logger = get_logger(log_name="CLIMB")
+
+# Razões de subida (m/s) que definem os tetos de serviço, de desempenho e operacional
+CEILING_RATES_OF_CLIMB = (0.51, 0.76, 2.54)
 
 
 def get_climb_parameters(altitude):
@@ -44,7 +47,7 @@ def get_climb_parameters(altitude):
 
 def calc_max_climb_angle_rate_of_climb(aircraft_parameters: dict, flight_parameters: dict,
                                        ALTITUDE_GLI=None, V_CRUISE=None,
-                                       plot=False, display=False):
+                                       series=False, plot=False, display=False):
     """
     Calcula o ângulo máximo de subida (gamma_max) e a taxa máxima de subida (h_max) de uma aeronave.
 
@@ -66,6 +69,7 @@ def calc_max_climb_angle_rate_of_climb(aircraft_parameters: dict, flight_paramet
         - 'CRUISE_VELOCITY' (float): Velocidade de cruzeiro em metros por segundo (m/s).
     ALTITUDE_GLI (float, opcional): Altitude de subida em metros (m). Se None, usa metade da altitude de cruzeiro.
     V_CRUISE (float, opcional): Velocidade de cruzeiro em metros por segundo (m/s). Se None, calcula a partir dos parâmetros de voo.
+    series (bool, opcional): Se True, inclui a curva da taxa de subida por velocidade. Padrão é False.
     plot (bool, opcional): Se True, plota o gráfico da taxa de subida por velocidade. Padrão é False.
     display (bool, opcional): Se True, exibe o gráfico. Padrão é False.
 
@@ -73,14 +77,13 @@ def calc_max_climb_angle_rate_of_climb(aircraft_parameters: dict, flight_paramet
     dict: Dicionário contendo os resultados:
         - "MAX_GAMMA_CLIMB" (float): Ângulo máximo de subida (adimensional).
         - "MAX_RATE_OF_CLIMB" (float): Taxa máxima de subida em metros por segundo (m/s).
+        - "RATE_OF_CLIMB_PER_VELOCITY_SERIES" (dict): Velocidades e taxas de subida, se series ou plot for True.
         - "GRAPH_RATE_OF_CLIMB_PER_VELOCITY" (fig): Figura do gráfico da taxa de subida por velocidade, se plot for True.
 
     A função calcula o ângulo máximo de subida (gamma_max) e a taxa máxima de subida (h_max) usando as equações relevantes
     e os parâmetros fornecidos. Se plot for True, plota e opcionalmente exibe o gráfico da taxa de subida em função da velocidade.
     """
 
-    logger = get_logger(log_name="CLIMB")
-
     NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
     FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
     CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
@@ -128,8 +131,13 @@ def calc_max_climb_angle_rate_of_climb(aircraft_parameters: dict, flight_paramet
     else:
         V_cru = flight_parameters['CRUISE_VELOCITY']
 
-    if plot is True:
+    result = {
+        "MAX_GAMMA_CLIMB": gamma_max,
+        "MAX_RATE_OF_CLIMB": h_max,
+        "GRAPH_RATE_OF_CLIMB_PER_VELOCITY": None
+    }
 
+    if series is True or plot is True:
 
         V_linspace = linspace(0.3 * V_cru, 4 * V_cru, 100)
         h_dot_list = []
@@ -141,28 +149,54 @@ def calc_max_climb_angle_rate_of_climb(aircraft_parameters: dict, flight_paramet
 
             h_dot_list.append(h_dot_i)
 
+        result["RATE_OF_CLIMB_PER_VELOCITY_SERIES"] = {
+            "VELOCITY": V_linspace,
+            "RATE_OF_CLIMB": h_dot_list
+        }
 
-        filter_h_dot_list = [h for h in h_dot_list if h >= 0]
-        filter_V_linspace = [V_linspace[i] for i, v in enumerate(h_dot_list) if v >= 0]
+    if plot is True:
+        result["GRAPH_RATE_OF_CLIMB_PER_VELOCITY"] = plot_rate_of_climb_per_velocity(result=result, display=display)
 
-        fig_climb = plt.figure(figsize=(5, 5))
-        plt.plot(filter_V_linspace, filter_h_dot_list, c='black')
-        plt.xlabel("Velocity [m/s]", size=12)
-        plt.ylabel("Rate of Climb [m/s]", size=12)
-        plt.title("Rate of Climb per Velocity")
-        plt.ylim(0, max(h_dot_list) + 1)
-        plt.grid()
+    return result
 
-        if display is True:
-            plt.show()
-        else:
-            pass
 
-    return {
-        "MAX_GAMMA_CLIMB": gamma_max,
-        "MAX_RATE_OF_CLIMB": h_max,
-        "GRAPH_RATE_OF_CLIMB_PER_VELOCITY": fig_climb if plot is True else None
-    }
+def plot_rate_of_climb_per_velocity(result, display=False, ax=None):
+    """
+    Gera o gráfico da taxa de subida por velocidade (apenas os pontos com taxa de subida positiva).
+
+    Parâmetros:
+    result (dict): Resultado de calc_max_climb_angle_rate_of_climb com series=True.
+    display (bool, opcional): Se True, exibe o gráfico. Padrão é False.
+    ax (matplotlib.axes.Axes, opcional): Eixo onde desenhar o gráfico (ex.: um painel de compose_panels). Se None, cria uma figura nova.
+
+    Retorna:
+    matplotlib.figure.Figure: Figura do gráfico da taxa de subida por velocidade.
+    """
+
+    import matplotlib.pyplot as plt
+
+    V_linspace = result['RATE_OF_CLIMB_PER_VELOCITY_SERIES']['VELOCITY']
+    h_dot_list = result['RATE_OF_CLIMB_PER_VELOCITY_SERIES']['RATE_OF_CLIMB']
+
+    filter_h_dot_list = [h for h in h_dot_list if h >= 0]
+    filter_V_linspace = [V_linspace[i] for i, v in enumerate(h_dot_list) if v >= 0]
+
+    if ax is None:
+        fig_climb, ax = plt.subplots(figsize=(5, 5))
+    else:
+        fig_climb = ax.figure
+
+    ax.plot(filter_V_linspace, filter_h_dot_list, c='black')
+    ax.set_xlabel("Velocity [m/s]", size=12)
+    ax.set_ylabel("Rate of Climb [m/s]", size=12)
+    ax.set_title("Rate of Climb per Velocity")
+    ax.set_ylim(0, max(h_dot_list) + 1)
+    ax.grid()
+
+    if display is True:
+        plt.show()
+
+    return fig_climb
 
 
 def calc_distance_time_steepest_climb(aircraft_parameters: dict, flight_parameters: dict):
@@ -196,8 +230,6 @@ def calc_distance_time_steepest_climb(aircraft_parameters: dict, flight_paramete
     para determinar os valores.
     """
 
-    logger = get_logger(log_name="CLIMB")
-
     CD0 = aircraft_parameters['CD0']
     K = aircraft_parameters['K']
     S = aircraft_parameters['S']
@@ -282,7 +314,7 @@ def calc_distance_time_steepest_climb(aircraft_parameters: dict, flight_paramete
     }
 
 
-def calc_service_ceiling(aircraft_parameters: dict, flight_parameters: dict):
+def calc_service_ceiling(aircraft_parameters: dict, flight_parameters: dict, plot=True):
     """
     Calcula o teto de serviço, o teto de desempenho e o teto operacional de uma aeronave.
 
@@ -301,13 +333,15 @@ def calc_service_ceiling(aircraft_parameters: dict, flight_parameters: dict):
         - 'FUEL_WEIGHT' (float): Peso do combustível em Newtons (N).
         - 'DISPATCHED_CARGO_WEIGHT' (float): Peso da carga despachada em Newtons (N).
         - 'CRUISE_ALTITUDE' (float): Altitude de cruzeiro em metros (m).
+    plot (bool, opcional): Se True, gera o gráfico da razão de subida por altitude. Padrão é True.
 
     Retorna:
     dict: Dicionário contendo os resultados:
         - "SERVICE_CEILING" (float): Teto de serviço em metros (m).
         - "PERFORMANCE_CEILING" (float): Teto de desempenho em metros (m).
         - "OPERATIONAL_CEILING" (float): Teto operacional em metros (m).
-        - "RATE_OF_CLIMB_PER_ALTITUDE" (matplotlib.figure.Figure): Gráfico da razão de subida por altitude.
+        - "RATE_OF_CLIMB_PER_ALTITUDE_SERIES" (dict): Altitudes e razões de subida máximas, para o gráfico.
+        - "RATE_OF_CLIMB_PER_ALTITUDE" (matplotlib.figure.Figure): Gráfico da razão de subida por altitude, se plot for True.
 
     A função calcula o teto de serviço, o teto de desempenho e o teto operacional usando os parâmetros da aeronave e do voo.
     Utiliza a densidade do ar, o empuxo geral e outros parâmetros aerodinâmicos para determinar os valores de teto.
@@ -321,63 +355,165 @@ def calc_service_ceiling(aircraft_parameters: dict, flight_parameters: dict):
     CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
     OEW = aircraft_parameters['OEW']
 
+    TOW = float(NP * aero.person_weight + OEW + FW + CW)
+
+    W = TOW - 0.10 * FW
+
+    roc_linspace = calc_max_rate_of_climb_per_altitude(aircraft_parameters=aircraft_parameters,
+                                                       altitudes=altitude_linspace, W=W).tolist()
+
+    service_ceiling, performance_ceiling, operational_ceiling = (
+        float(ceiling) for ceiling in calc_ceilings(aircraft_parameters=aircraft_parameters, W=W,
+                                                    rates_of_climb=CEILING_RATES_OF_CLIMB))
+
+    result = {
+        "SERVICE_CEILING": service_ceiling,
+        "PERFORMANCE_CEILING": performance_ceiling,
+        "OPERATIONAL_CEILING": operational_ceiling,
+        "RATE_OF_CLIMB_PER_ALTITUDE_SERIES": {
+            "ALTITUDE": altitude_linspace,
+            "RATE_OF_CLIMB": roc_linspace
+        },
+        "RATE_OF_CLIMB_PER_ALTITUDE": None
+    }
+
+    if plot is True:
+        result["RATE_OF_CLIMB_PER_ALTITUDE"] = plot_rate_of_climb_per_altitude(result=result)
+
+    return result
+
+
+def calc_max_rate_of_climb_per_altitude(aircraft_parameters: dict, altitudes, W):
+    """
+    Razão de subida máxima (OJHA - 10.65) para várias altitudes de uma vez.
+
+    Os parâmetros da aeronave, as altitudes e os pesos podem ser números ou arrays numpy, combinados por broadcasting
+    (por exemplo, parâmetros de várias aeronaves em arrays de forma (N, 1) e altitudes de forma (M,)).
+
+    Parâmetros:
+    aircraft_parameters (dict): 'CD0', 'S', 'T0', 'NE', 'TSFC' e 'E_m'.
+    altitudes (array): Altitudes em metros (m), no intervalo [0, 47000].
+    W (float ou array): Peso da aeronave em Newtons (N).
+
+    Retorna:
+    numpy.ndarray: Razão de subida máxima em metros por segundo (m/s).
+    """
+
+    altitudes = np.asarray(altitudes, dtype=float)
+    sigma = aero.get_sigma(altitude=np.atleast_1d(altitudes)).reshape(altitudes.shape)
+    W = np.asarray(W, dtype=float)
+
     CD0 = aircraft_parameters['CD0']
-    K = aircraft_parameters['K']
     S = aircraft_parameters['S']
+    E_m = aircraft_parameters['E_m']
 
-    TOW = float(NP * aero.person_weight + OEW + FW + CW)
-
-    T0 = aircraft_parameters['T0']
-    T = T0 * aircraft_parameters['NE']
+    T = aircraft_parameters['T0'] * aircraft_parameters['NE']
     n = (aircraft_parameters['TSFC'] / 3600)
+    T_Em_SSL = T * aero.get_sigma(altitude=0) ** n  # Aero.calculate_general_thrust ao nível do mar
 
-    E_m = aircraft_parameters['E_m']
-    T_Em_SSL = aero.calculate_general_thrust(thrust_factor=n, altitude=0, sea_level_thrust=T)
+    TT = 1 + np.sqrt(1 + 3 / (E_m ** 2 * (T_Em_SSL * sigma / W) ** 2))
 
-    W = TOW - 0.10 * FW
+    return (
+            np.sqrt(((W / S) * TT) / (3 * aero.rho_0 * CD0)) *
+            (T_Em_SSL / W) ** 1.5 *
+            (1 - TT / 6) *
+            (sigma - 1 / (
+                    (2 * TT / 3) * (1 - TT / 6) * (E_m ** 2) * (T_Em_SSL / W) ** 2 * sigma
+            )))
 
-    roc_linspace = []
 
-    for altitude_i in altitude_linspace:
+def calc_ceilings(aircraft_parameters: dict, W, rates_of_climb=CEILING_RATES_OF_CLIMB, tolerance=0.01):
+    """
+    Altitudes em que a razão de subida máxima (calc_max_rate_of_climb_per_altitude) cai para cada valor pedido, por
+    bisseção vetorizada entre 0 e 47000 m: todas as aeronaves, pesos e razões de subida são resolvidos juntos.
 
-        sigma_i = aero.get_sigma(altitude=altitude_i)
+    Parâmetros:
+    aircraft_parameters (dict): 'CD0', 'S', 'T0', 'NE', 'TSFC' e 'E_m', números ou arrays (ver
+        calc_max_rate_of_climb_per_altitude).
+    W (float ou array): Peso da aeronave em Newtons (N).
+    rates_of_climb (array, opcional): Razões de subida que definem os tetos, em m/s. Padrão é (0.51, 0.76, 2.54):
+        tetos de serviço, de desempenho e operacional.
+    tolerance (float, opcional): Precisão da altitude em metros (m). Padrão é 0.01.
 
-        #OJHA - 10.65
-        TT_i = 1 + math.sqrt(1 + 3 / (E_m ** 2 * (T_Em_SSL * sigma_i / W) ** 2))
+    Retorna:
+    numpy.ndarray: Tetos em metros (m), com a forma do broadcasting dos parâmetros e do peso seguida de uma dimensão
+    por razão de subida. NaN se a razão de subida já é menor ao nível do mar; 47000 se ainda é maior no topo da
+    atmosfera padrão.
+    """
 
-        h_max_i = (
-                math.sqrt(((W / S) * TT_i) / (3 * aero.rho_0 * CD0)) *
-                (T_Em_SSL / W) ** 1.5 *
-                (1 - TT_i / 6) *
-                (sigma_i - 1 / (
-                        (2 * TT_i / 3) * (1 - TT_i / 6) * (E_m ** 2) * (T_Em_SSL / W) ** 2 * sigma_i
-                )))
+    rates_of_climb = np.asarray(rates_of_climb, dtype=float)
 
-        roc_linspace.append(h_max_i)
+    # Uma dimensão a mais no fim dos parâmetros e do peso, para as razões de subida
+    parameters = {key: np.asarray(aircraft_parameters[key], dtype=float)[..., np.newaxis]
+                  for key in ('CD0', 'S', 'T0', 'NE', 'TSFC', 'E_m')}
+    W = np.asarray(W, dtype=float)[..., np.newaxis]
 
-    poly_ceiling = polyfit(roc_linspace, altitude_linspace, deg=3)
-    service_ceiling = polyval(poly_ceiling, x=0.51)
-    performance_ceiling = polyval(poly_ceiling, x=0.76)
-    operational_ceiling = polyval(poly_ceiling, x=2.54)
+    def excess_rate_of_climb(altitudes):
+        return calc_max_rate_of_climb_per_altitude(aircraft_parameters=parameters, altitudes=altitudes, W=W) - rates_of_climb
 
-    fig_ceiling = plt.figure(figsize=(5, 5))
-    plt.plot(roc_linspace, [h/1000 for h in altitude_linspace], c='black', label="Rate Of Climb")
-    plt.axhline(y=service_ceiling/1000, label=f"Service Ceiling = {round(service_ceiling/1000, 2)}", color='red')
-    plt.axhline(y=performance_ceiling/1000, label=f"Performance Ceiling = {round(performance_ceiling/1000, 2)}", color='blue')
-    plt.axhline(y=operational_ceiling/1000, label=f"Operational Ceiling= {round(operational_ceiling/1000, 2)}", color='green')
-    plt.xlabel("Rate of Climb [m/s]", size=12)
-    plt.ylabel("Altitude [km]", size=12)
-    plt.title("Rate of Climb per Altitude")
-    plt.xlim(-10, max([h/1000 for h in altitude_linspace]))
-    plt.grid()
-    plt.legend()
+    top = float(aero.layer_top_altitudes[-1])
 
-    return {
-        "SERVICE_CEILING": service_ceiling,
-        "PERFORMANCE_CEILING": performance_ceiling,
-        "OPERATIONAL_CEILING": operational_ceiling,
-        "RATE_OF_CLIMB_PER_ALTITUDE": fig_ceiling
-    }
+    at_sea_level = excess_rate_of_climb(np.zeros(len(rates_of_climb)))
+    at_top = excess_rate_of_climb(np.full(len(rates_of_climb), top))
+
+    low = np.zeros(at_sea_level.shape)
+    high = np.full(at_sea_level.shape, top)
+
+    for _ in range(int(math.ceil(math.log2(top / tolerance)))):
+
+        middle = 0.5 * (low + high)
+
+        # A razão de subida diminui com a altitude: acima do teto o excesso é negativo
+        above = excess_rate_of_climb(middle) < 0
+        high = np.where(above, middle, high)
+        low = np.where(above, low, middle)
+
+    ceilings = np.where(at_top >= 0, top, 0.5 * (low + high))
+
+    return np.where(at_sea_level < 0, np.nan, ceilings)
+
+
+def plot_rate_of_climb_per_altitude(result, display=False, ax=None):
+    """
+    Gera o gráfico da razão de subida máxima por altitude, com os tetos de serviço, de desempenho e operacional.
+
+    Parâmetros:
+    result (dict): Resultado de calc_service_ceiling.
+    display (bool, opcional): Se True, exibe o gráfico. Padrão é False.
+    ax (matplotlib.axes.Axes, opcional): Eixo onde desenhar o gráfico. Se None, cria uma figura nova.
+
+    Retorna:
+    matplotlib.figure.Figure: Figura do gráfico da razão de subida por altitude.
+    """
+
+    import matplotlib.pyplot as plt
+
+    altitude_linspace = result['RATE_OF_CLIMB_PER_ALTITUDE_SERIES']['ALTITUDE']
+    roc_linspace = result['RATE_OF_CLIMB_PER_ALTITUDE_SERIES']['RATE_OF_CLIMB']
+    service_ceiling = result['SERVICE_CEILING']
+    performance_ceiling = result['PERFORMANCE_CEILING']
+    operational_ceiling = result['OPERATIONAL_CEILING']
+
+    if ax is None:
+        fig_ceiling, ax = plt.subplots(figsize=(5, 5))
+    else:
+        fig_ceiling = ax.figure
+
+    ax.plot(roc_linspace, [h/1000 for h in altitude_linspace], c='black', label="Rate Of Climb")
+    ax.axhline(y=service_ceiling/1000, label=f"Service Ceiling = {round(service_ceiling/1000, 2)}", color='red')
+    ax.axhline(y=performance_ceiling/1000, label=f"Performance Ceiling = {round(performance_ceiling/1000, 2)}", color='blue')
+    ax.axhline(y=operational_ceiling/1000, label=f"Operational Ceiling= {round(operational_ceiling/1000, 2)}", color='green')
+    ax.set_xlabel("Rate of Climb [m/s]", size=12)
+    ax.set_ylabel("Altitude [km]", size=12)
+    ax.set_title("Rate of Climb per Altitude")
+    ax.set_xlim(-10, max([h/1000 for h in altitude_linspace]))
+    ax.grid()
+    ax.legend()
+
+    if display is True:
+        plt.show()
+
+    return fig_ceiling
 
 
 def calc_distance_time_fastest_climb(aircraft_parameters: dict, flight_parameters: dict):
@@ -409,8 +545,6 @@ def calc_distance_time_fastest_climb(aircraft_parameters: dict, flight_parameter
 
     """
 
-    logger = get_logger(log_name="CLIMB")
-
     CD0 = aircraft_parameters['CD0']
     K = aircraft_parameters['K']
     S = aircraft_parameters['S']
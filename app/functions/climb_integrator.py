@@ -0,0 +1,374 @@
+"""
+Subida integrada numericamente, como alternativa às fórmulas fechadas de calc_distance_time_steepest_climb e
+calc_distance_time_fastest_climb.
+
+O estado (tempo, distância horizontal e peso) é integrado em função da altitude por Runge-Kutta Dormand-Prince 5(4)
+com passo adaptativo, usando a atmosfera padrão de Aero (em vez do modelo exponencial de get_climb_parameters) e o peso
+variando com o combustível consumido. Vários casos são integrados juntos: cada um é uma posição dos arrays de entrada,
+com o seu próprio passo (uma fração da subida do caso); casos que terminam a subida ou deixam de valer saem do laço.
+"""
+
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+from .aero import Aero
+from .climb import calc_distance_time_steepest_climb, calc_distance_time_fastest_climb
+from .utils import get_logger
+
+aero = Aero()
+logger = get_logger(log_name="CLIMB_INTEGRATOR")
+
+CLIMB_SCHEDULES = ("STEEPEST", "FASTEST")
+
+_AIRCRAFT_KEYS = ('CD0', 'K', 'S', 'T0', 'NE', 'TSFC', 'E_m')
+
+# Tabela de Butcher de Dormand-Prince 5(4)
+_DP_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_DP_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+_DP_E = _DP_B - np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+
+def get_thrust_exponent(aircraft_parameters: dict, thrust_exponent=None):
+
+    """
+    Expoente m do empuxo T = T_SSL * sigma ** m. Se thrust_exponent for None, usa TSFC / 3600, o mesmo de
+    Aero.calculate_general_thrust e de calc_cruise_velocity.
+    """
+
+    return aircraft_parameters['TSFC'] / 3600 if thrust_exponent is None else thrust_exponent
+
+
+def calc_climb_rates(aircraft_parameters: dict, altitude, W, schedule="FASTEST", thrust_exponent=None):
+
+    """
+    Velocidade, ângulo e razão de subida num ponto da subida, para arrays de casos.
+
+    Parâmetros:
+    - aircraft_parameters (dict): 'CD0', 'K', 'S', 'T0', 'NE', 'TSFC', 'E_m' (números ou arrays).
+    - altitude (array): Altitude (m).
+    - W (array): Peso (N).
+    - schedule (str, opcional): "STEEPEST" (velocidade de arrasto mínimo, maior ângulo de subida) ou "FASTEST"
+      (velocidade de maior razão de subida, OJHA - 10.62). Default é "FASTEST".
+    - thrust_exponent (float, opcional): Expoente m do empuxo T = T_SSL * sigma ** m. Default é TSFC / 3600
+      (get_thrust_exponent); as fórmulas fechadas de OJHA supõem m = 1.
+
+    Retorna:
+    dict: Arrays "VELOCITY" (m/s), "SIN_GAMMA" (adimensional), "RATE_OF_CLIMB" (m/s) e "THRUST" (N).
+    """
+
+    CD0 = aircraft_parameters['CD0']
+    K = aircraft_parameters['K']
+    S = aircraft_parameters['S']
+    E_m = aircraft_parameters['E_m']
+
+    altitude = np.asarray(altitude, dtype=float)
+    rho = aero.get_density(altitude=np.atleast_1d(altitude)).reshape(altitude.shape)
+    sigma = rho / aero.rho_0
+
+    thrust_exponent = get_thrust_exponent(aircraft_parameters=aircraft_parameters, thrust_exponent=thrust_exponent)
+    thrust = aircraft_parameters['T0'] * aircraft_parameters['NE'] * sigma ** thrust_exponent
+
+    if schedule == "STEEPEST":
+        # OJHA - 10.31: velocidade de arrasto mínimo; sen(gama) = T/W - 1/E_m
+        velocity = np.sqrt((2 * W / S) / rho) * (K / CD0) ** 0.25
+
+    elif schedule == "FASTEST":
+        # OJHA - 10.62
+        TT = 1 + np.sqrt(1 + 3 / (E_m ** 2 * (thrust / W) ** 2))
+        velocity = np.sqrt((W / S) * (thrust / W) * TT / (3 * rho * CD0))
+
+    else:
+        raise ValueError(f"schedule must be one of {CLIMB_SCHEDULES}")
+
+    drag = 0.5 * rho * velocity ** 2 * S * CD0 + 2 * K * W ** 2 / (rho * S * velocity ** 2)
+    sin_gamma = np.clip((thrust - drag) / W, -1, 1)
+
+    return {
+        "VELOCITY": velocity,
+        "SIN_GAMMA": sin_gamma,
+        "RATE_OF_CLIMB": velocity * sin_gamma,
+        "THRUST": thrust
+    }
+
+
+def integrate_climb(aircraft_parameters: dict, W_0, altitude_start, altitude_end, schedule="FASTEST",
+                    thrust_exponent=None, fuel_weight=None, rtol=1e-6, atol=1e-3, max_steps=1000):
+
+    """
+    Integra a subida de vários casos de uma vez (Dormand-Prince 5(4), passo adaptativo por caso).
+
+    As equações, com a altitude h como variável independente, são:
+        dt/dh = 1 / RC,    dx/dh = V cos(gama) / RC,    dW/dh = -n T / RC,
+    com n = TSFC / 3600 e V, gama, RC e T de calc_climb_rates.
+
+    Cada caso tem o seu próprio passo: um caso perto do teto (razão de subida pequena) não reduz o passo dos demais.
+    Casos que chegam à altitude final ou deixam de valer saem do laço e não são mais calculados.
+
+    Parâmetros:
+    - aircraft_parameters (dict): 'CD0', 'K', 'S', 'T0', 'NE', 'TSFC', 'E_m' (números ou arrays com um valor por caso).
+    - W_0 (array): Peso no início da subida (N).
+    - altitude_start (array): Altitude inicial (m).
+    - altitude_end (array): Altitude final (m).
+    - schedule (str, opcional): "STEEPEST" ou "FASTEST" (ver calc_climb_rates). Default é "FASTEST".
+    - thrust_exponent (float, opcional): Expoente do empuxo com a densidade. Default é TSFC / 3600
+      (get_thrust_exponent).
+    - fuel_weight (array, opcional): Combustível disponível no início da subida (N). Se fornecido, o caso deixa de
+      valer quando o peso cai abaixo de W_0 - fuel_weight. Default é None (sem limite).
+    - rtol (float, opcional): Tolerância relativa do passo. Default é 1e-6.
+    - atol (float, opcional): Tolerância absoluta do passo (s, m e N). Default é 1e-3.
+    - max_steps (int, opcional): Número máximo de passos aceitos por caso; casos que não terminam a subida nesse
+      número de passos deixam de valer. Default é 1000.
+
+    Retorna:
+    dict: Um valor por passo aceito (linhas) e por caso (colunas), incluindo o ponto inicial. Casos com menos passos
+    que o maior repetem o ponto final nas últimas linhas.
+        - "ALTITUDE" (numpy.ndarray): Altitude (m).
+        - "TIME" (numpy.ndarray): Tempo desde o início da subida (s).
+        - "DISTANCE" (numpy.ndarray): Distância horizontal percorrida (m).
+        - "FUEL" (numpy.ndarray): Combustível consumido (N).
+        - "WEIGHT" (numpy.ndarray): Peso (N).
+        - "STEPS" (numpy.ndarray): Por caso, número de passos aceitos.
+        - "VALID" (numpy.ndarray): Por caso, False se a altitude final não está acima da inicial, a razão de subida
+          chega a zero, o combustível acaba antes da altitude final ou a integração não converge em max_steps passos
+          (os valores desse caso são NaN).
+    """
+
+    if schedule not in CLIMB_SCHEDULES:
+        raise ValueError(f"schedule must be one of {CLIMB_SCHEDULES}")
+
+    inputs = [np.asarray(value, dtype=float) for value in (W_0, altitude_start, altitude_end)]
+    inputs += [np.asarray(aircraft_parameters[key], dtype=float) for key in _AIRCRAFT_KEYS]
+    inputs.append(np.asarray(get_thrust_exponent(aircraft_parameters=aircraft_parameters,
+                                                 thrust_exponent=thrust_exponent), dtype=float))
+    inputs.append(np.asarray(np.inf if fuel_weight is None else fuel_weight, dtype=float))
+
+    # Os casos são integrados como um vetor (size,) e voltam ao formato do broadcast no final
+    shape = np.broadcast(*inputs).shape
+    size = int(np.prod(shape))
+    W_0, altitude_start, altitude_end = [np.broadcast_to(value, shape).ravel() for value in inputs[:3]]
+    parameters = {key: np.broadcast_to(value, shape).ravel() for key, value in zip(_AIRCRAFT_KEYS, inputs[3:10])}
+    exponents = np.broadcast_to(inputs[10], shape).ravel()
+    W_min = W_0 - np.broadcast_to(inputs[11], shape).ravel()
+
+    climb_height = altitude_end - altitude_start
+    n = parameters['TSFC'] / 3600
+
+    def derivatives(cases, s, y):
+        """Derivadas de (t, x, W) em relação à fração s da subida (h = h_inicial + s * altura da subida)."""
+
+        rates = calc_climb_rates(aircraft_parameters={key: value[cases] for key, value in parameters.items()},
+                                 altitude=altitude_start[cases] + s * climb_height[cases], W=y[2], schedule=schedule,
+                                 thrust_exponent=exponents[cases])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dh_roc = np.where(rates['RATE_OF_CLIMB'] > 0, climb_height[cases] / rates['RATE_OF_CLIMB'], np.nan)
+
+        cos_gamma = np.sqrt(1 - rates['SIN_GAMMA'] ** 2)
+
+        return np.stack((dh_roc, rates['VELOCITY'] * cos_gamma * dh_roc, -n[cases] * rates['THRUST'] * dh_roc))
+
+    s = np.zeros(size)
+    step = np.full(size, 0.05)
+    y = np.stack((np.zeros(size), np.zeros(size), W_0))
+    k_first = derivatives(np.arange(size), s, y)
+
+    # Só há subida se a altitude final está acima da inicial
+    valid = np.all(np.isfinite(k_first), axis=0) & (climb_height > 0)
+    steps = np.zeros(size, dtype=int)
+
+    # Pontos aceitos de cada passo: (casos, s, y)
+    accepted_cases, accepted_s, accepted_y = [np.arange(size)], [s.copy()], [y.copy()]
+
+    cases = np.flatnonzero(valid & (s < 1.0))
+
+    while cases.size:
+
+        # Casos que não convergem em max_steps passos deixam de valer; os demais continuam
+        stalled = steps[cases] >= max_steps
+        if np.any(stalled):
+            logger.warning("Climb integration (%s): %d cases did not converge in %d steps", schedule,
+                           int(np.sum(stalled)), max_steps)
+            valid[cases[stalled]] = False
+            cases = cases[~stalled]
+            if not cases.size:
+                break
+
+        h = np.minimum(step[cases], 1.0 - s[cases])
+        s_cases, y_cases = s[cases], y[:, cases]
+
+        k = [k_first[:, cases]]
+        for i in range(1, 7):
+            y_i = y_cases + h * sum(a * k_j for a, k_j in zip(_DP_A[i], k))
+            k.append(derivatives(cases, s_cases + _DP_C[i] * h, y_i))
+
+        y_new = y_cases + h * sum(b * k_i for b, k_i in zip(_DP_B, k) if b != 0)
+        error = h * sum(e * k_i for e, k_i in zip(_DP_E, k) if e != 0)
+
+        scale = atol + rtol * np.maximum(np.abs(y_cases), np.abs(y_new))
+        error_norm = np.max(np.abs(error) / scale, axis=0)
+
+        # Casos em que a razão de subida chega a zero ou o combustível acaba deixam de valer e saem do laço
+        finite = np.all(np.isfinite(y_new), axis=0)
+        accepted = finite & (error_norm <= 1.0)
+        exhausted = accepted & (y_new[2] < W_min[cases])
+        valid[cases[~finite | exhausted]] = False
+        accepted &= ~exhausted
+
+        done = cases[accepted]
+        s[done] += h[accepted]
+        y[:, done] = y_new[:, accepted]
+        k_first[:, done] = k[6][:, accepted]
+        steps[done] += 1
+
+        accepted_cases.append(done)
+        accepted_s.append(s[done])
+        accepted_y.append(y[:, done])
+
+        with np.errstate(divide="ignore"):
+            factor = np.where(error_norm > 0, np.clip(0.9 * error_norm ** -0.2, 0.2, 5.0), 5.0)
+        step[cases] *= factor
+
+        cases = cases[finite & ~exhausted]
+        cases = cases[valid[cases] & (s[cases] < 1.0)]
+
+    # Linha de cada ponto aceito: posição do ponto na sequência do seu caso
+    point_cases = np.concatenate(accepted_cases)
+    order = np.argsort(point_cases, kind="stable")
+    point_cases = point_cases[order]
+    rows = np.arange(point_cases.size) - np.repeat(np.cumsum(steps + 1) - (steps + 1), steps + 1)
+
+    fractions = np.broadcast_to(s, (int(np.max(steps)) + 1, size)).copy()
+    trajectory = np.broadcast_to(y, (len(fractions), 3, size)).copy()
+    fractions[rows, point_cases] = np.concatenate(accepted_s)[order]
+    trajectory[rows, :, point_cases] = np.concatenate(accepted_y, axis=1)[:, order].T
+
+    trajectory[:, :, ~valid] = np.nan
+    trajectory = trajectory.reshape((len(fractions), 3) + shape)
+
+    logger.debug("Climb integration (%s): %d steps (longest case), %d/%d valid cases", schedule, len(fractions) - 1,
+                 int(np.sum(valid)), valid.size)
+
+    return {
+        "ALTITUDE": (altitude_start + fractions * climb_height).reshape((len(fractions),) + shape),
+        "TIME": trajectory[:, 0],
+        "DISTANCE": trajectory[:, 1],
+        "FUEL": W_0.reshape(shape) - trajectory[:, 2],
+        "WEIGHT": trajectory[:, 2],
+        "STEPS": steps.reshape(shape),
+        "VALID": valid.reshape(shape)
+    }
+
+
+def calc_integrated_climb(aircraft_parameters: dict, flight_parameters: dict, schedule="FASTEST", thrust_exponent=None):
+
+    """
+    Tempo, distância e combustível da subida integrada de um caso, do fim da decolagem (altura de obstáculo acima do
+    aeroporto de decolagem) até a altitude de cruzeiro, partindo do peso de decolagem.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave.
+    - flight_parameters (dict): Parâmetros de voo ('NUMBER_OF_PASSENGERS', 'FUEL_WEIGHT', 'DISPATCHED_CARGO_WEIGHT',
+      'CRUISE_ALTITUDE' e, opcionalmente, 'ALTITUDE_TAKEOFF' em takeoff_parameters).
+    - schedule (str, opcional): "STEEPEST" ou "FASTEST". Default é "FASTEST".
+    - thrust_exponent (float, opcional): Expoente do empuxo com a densidade. Default é TSFC / 3600
+      (get_thrust_exponent).
+
+    Retorna:
+    dict: Dicionário contendo:
+        - "INTEGRATED_CLIMB_TIME" (float): Tempo de subida (s).
+        - "INTEGRATED_CLIMB_DISTANCE" (float): Distância horizontal da subida (m).
+        - "INTEGRATED_CLIMB_FUEL_CONSUMED" (float): Combustível consumido na subida (N).
+        - "INTEGRATED_CLIMB_VALID" (bool): False se a altitude de cruzeiro não está acima de ALTITUDE_TAKEOFF + h_Sc,
+          a aeronave não chega a ela ou o combustível (FUEL_WEIGHT) acaba antes dela; nesse caso os demais valores são
+          NaN.
+    """
+
+    TOW = float(flight_parameters['NUMBER_OF_PASSENGERS'] * aero.person_weight + aircraft_parameters['OEW'] +
+                flight_parameters['FUEL_WEIGHT'] + flight_parameters['DISPATCHED_CARGO_WEIGHT'])
+
+    altitude_takeoff = flight_parameters.get('takeoff_parameters', {}).get('ALTITUDE_TAKEOFF', 0)
+
+    climb = integrate_climb(aircraft_parameters=aircraft_parameters, W_0=TOW, altitude_start=altitude_takeoff + aero.h_Sc,
+                            altitude_end=flight_parameters['CRUISE_ALTITUDE'], schedule=schedule,
+                            thrust_exponent=thrust_exponent, fuel_weight=flight_parameters['FUEL_WEIGHT'])
+
+    return {
+        "INTEGRATED_CLIMB_TIME": float(climb['TIME'][-1]),
+        "INTEGRATED_CLIMB_DISTANCE": float(climb['DISTANCE'][-1]),
+        "INTEGRATED_CLIMB_FUEL_CONSUMED": float(climb['FUEL'][-1]),
+        "INTEGRATED_CLIMB_VALID": bool(climb['VALID']),
+    }
+
+
+def compare_with_closed_form(aircraft_parameters: dict, flight_parameters: dict):
+
+    """
+    Diferença entre a subida integrada e as fórmulas fechadas, nas mesmas condições das fórmulas: peso inicial
+    TOW - 0.10 * FW, da altura de obstáculo até CRUISE_ALTITUDE (subida mais íngreme) ou CRUISE_ALTITUDE / 2 (subida
+    mais rápida), empuxo proporcional a sigma.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave.
+    - flight_parameters (dict): Parâmetros de voo.
+
+    Retorna:
+    dict: Para "STEEPEST" e "FASTEST", um dict com "TIME", "DISTANCE" e "FUEL_FRACTION", cada um com os valores
+    "CLOSED_FORM", "INTEGRATED" e "RELATIVE_DIFFERENCE" ((integrado - fechado) / fechado).
+    """
+
+    TOW = float(flight_parameters['NUMBER_OF_PASSENGERS'] * aero.person_weight + aircraft_parameters['OEW'] +
+                flight_parameters['FUEL_WEIGHT'] + flight_parameters['DISPATCHED_CARGO_WEIGHT'])
+    W = TOW - 0.10 * flight_parameters['FUEL_WEIGHT']
+
+    steepest = calc_distance_time_steepest_climb(aircraft_parameters=aircraft_parameters,
+                                                 flight_parameters=flight_parameters)
+    fastest = calc_distance_time_fastest_climb(aircraft_parameters=aircraft_parameters,
+                                               flight_parameters=flight_parameters)
+
+    closed_forms = {
+        "STEEPEST": (flight_parameters['CRUISE_ALTITUDE'], steepest['STEEPEST_CLIMB_TIME'],
+                     steepest['STEEPEST_CLIMB_DISTANCE'], steepest['STEEPEST_CLIMB_FUEL_CONSUPTION']),
+        "FASTEST": (flight_parameters['CRUISE_ALTITUDE'] / 2, fastest['FASTEST_CLIMB_TIME'],
+                    fastest['FASTEST_CLIMB_DISTANCE'], fastest['FASTEST_CLIMB_FUEL_CONSUPTION']),
+    }
+
+    comparison = {}
+
+    for schedule, (altitude_end, time, distance, fuel_fraction) in closed_forms.items():
+
+        climb = integrate_climb(aircraft_parameters=aircraft_parameters, W_0=W, altitude_start=aero.h_Sc,
+                                altitude_end=altitude_end, schedule=schedule, thrust_exponent=1.0)
+
+        integrated = {
+            "TIME": (time, float(climb['TIME'][-1])),
+            "DISTANCE": (distance, float(climb['DISTANCE'][-1])),
+            "FUEL_FRACTION": (fuel_fraction, float(climb['FUEL'][-1]) / W),
+        }
+
+        comparison[schedule] = {
+            key: {
+                "CLOSED_FORM": closed_form,
+                "INTEGRATED": value,
+                "RELATIVE_DIFFERENCE": (value - closed_form) / closed_form if closed_form else float("nan")
+            }
+            for key, (closed_form, value) in integrated.items()
+        }
+
+        logger.debug("%s climb vs closed form: time %+.2f%%, distance %+.2f%%, fuel fraction %+.2f%%", schedule,
+                     *(100 * comparison[schedule][key]['RELATIVE_DIFFERENCE'] for key in integrated))
+
+    return comparison
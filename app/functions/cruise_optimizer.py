@@ -0,0 +1,324 @@
+"""
+Altitude e velocidade de cruzeiro que maximizam o alcance (ou minimizam o combustível) em cada um dos três casos de
+calc_cruising_jet_range: altitude e CL constantes, velocidade e CL constantes, altitude e velocidade constantes.
+
+A busca é feita em duas etapas:
+- uma grade altitude x velocidade avaliada de uma só vez (numpy), descartando os pontos fora do envelope de voo
+  (empuxo disponível de calc_cruise_velocity e velocidade de estol de Aero.calculate_stall_velocity);
+- um refinamento por seção áurea em torno do melhor ponto da grade, alternando velocidade e altitude.
+"""
+
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import math
+import numpy as np
+from .aero import Aero
+from .utils import get_logger
+
+aero = Aero()
+logger = get_logger(log_name="CRUISE_OPTIMIZER")
+
+# Casos de calc_cruising_jet_range, pela chave do alcance correspondente
+RANGE_CASES = {
+    "CONSTANT_HEIGHT_CL": "RANGE_CONSTANT_HEIGHT_CL",
+    "CONSTANT_VELOCITY_CL": "RANGE_CONSTANT_VELOCITY_CL",
+    "CONSTANT_HEIGHT_VELOCITY": "RANGE_CONSTANT_HEIGHT_VELOCITY",
+}
+
+DEFAULT_ALTITUDES = np.arange(1000, 15001, 250, dtype=float)
+DEFAULT_VELOCITIES = np.arange(50, 351, 5, dtype=float)
+
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+
+def get_cruise_weights(aircraft_parameters: dict, flight_parameters: dict, W_CRUISE=None, zeta_CRUISE=None):
+
+    """
+    Peso no início do cruzeiro e fração de combustível consumida, como em calc_cruising_jet_range.
+
+    Retorna:
+    tuple: (W_1 em N, zeta adimensional).
+    """
+
+    FW = flight_parameters['FUEL_WEIGHT']
+
+    TOW = float(flight_parameters['NUMBER_OF_PASSENGERS'] * aero.person_weight + aircraft_parameters['OEW'] + FW +
+                flight_parameters['DISPATCHED_CARGO_WEIGHT']) if W_CRUISE is None else W_CRUISE
+
+    W_1 = TOW - 0.15 * FW
+    W_2 = TOW - 0.95 * FW
+
+    zeta = ((W_1 - W_2) / W_1) if zeta_CRUISE is None else zeta_CRUISE
+
+    return W_1, zeta
+
+
+def calc_thrust_velocity_limits(aircraft_parameters: dict, altitudes, W):
+
+    """
+    Menor e maior velocidade em que o empuxo disponível equilibra o arrasto, para várias altitudes de uma vez
+    (mesmas equações de CRUISE_VELOCITIES em calc_cruise_velocity).
+
+    Parâmetros:
+    - aircraft_parameters (dict): 'T0', 'NE', 'S', 'CD0', 'TSFC' e 'E_m'.
+    - altitudes (array): Altitudes (m).
+    - W (float): Peso da aeronave (N).
+
+    Retorna:
+    tuple: (velocidades mínimas, velocidades máximas) em m/s; NaN onde o empuxo não é suficiente para voo nivelado.
+    """
+
+    altitudes = np.asarray(altitudes, dtype=float)
+    sigma = aero.get_sigma(altitude=np.atleast_1d(altitudes)).reshape(altitudes.shape)
+
+    n = aircraft_parameters['TSFC'] / 3600
+    T = aircraft_parameters['T0'] * aircraft_parameters['NE']
+    T_CRU = T * sigma ** n  # Aero.calculate_general_thrust
+
+    V_11 = (T_CRU * sigma ** n) / (sigma * aero.rho_0 * aircraft_parameters['S'] * aircraft_parameters['CD0'])
+    V_12 = 1 - (1 / (aircraft_parameters['E_m'] ** 2)) * ((W ** 2) / ((T_CRU * sigma ** n) ** 2))
+
+    with np.errstate(invalid="ignore"):
+        root = np.where(V_12 >= 0, np.sqrt(np.maximum(V_12, 0)), np.nan)
+
+    return np.sqrt(np.maximum(V_11 * (1 - root), 0)), np.sqrt(np.maximum(V_11 * (1 + root), 0))
+
+
+def calc_cruise_envelope(aircraft_parameters: dict, altitudes, velocities, W):
+
+    """
+    Indica quais pares (altitude, velocidade) estão dentro do envelope de cruzeiro: acima da velocidade de estol
+    (Aero.calculate_stall_velocity com a densidade da altitude) e entre os limites de empuxo de
+    calc_thrust_velocity_limits.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave ('T0', 'NE', 'S', 'CD0', 'TSFC', 'E_m', 'CL_MAX').
+    - altitudes (array): Altitudes (m).
+    - velocities (array): Velocidades (m/s), combinadas com as altitudes por broadcasting.
+    - W (float): Peso da aeronave (N).
+
+    Retorna:
+    numpy.ndarray: Máscara booleana.
+    """
+
+    altitudes = np.asarray(altitudes, dtype=float)
+    velocities = np.asarray(velocities, dtype=float)
+
+    V_min, V_max = calc_thrust_velocity_limits(aircraft_parameters=aircraft_parameters, altitudes=altitudes, W=W)
+
+    rho = aero.get_density(altitude=np.atleast_1d(altitudes)).reshape(altitudes.shape)
+    V_S = np.sqrt(2 * W / (aircraft_parameters['CL_MAX'] * aircraft_parameters['S'] * rho))  # calculate_stall_velocity
+
+    return (velocities >= np.fmax(V_min, V_S)) & (velocities <= V_max)
+
+
+def calc_cruise_ranges(aircraft_parameters: dict, altitudes, velocities, W_1, zeta):
+
+    """
+    Versão vetorizada dos três alcances de calc_cruising_jet_range, para arrays de altitude e velocidade.
+
+    Parâmetros:
+    - aircraft_parameters (dict): 'TSFC', 'S', 'K', 'CD0' e 'E_m'.
+    - altitudes (array): Altitudes de cruzeiro (m).
+    - velocities (array): Velocidades de cruzeiro (m/s), combinadas com as altitudes por broadcasting.
+    - W_1 (float): Peso no início do cruzeiro (N).
+    - zeta (float): Fração do peso consumida em combustível (adimensional).
+
+    Retorna:
+    dict: Alcances (m) nas chaves de RANGE_CASES ("RANGE_CONSTANT_HEIGHT_CL", ...).
+    """
+
+    c, E_m, K, CL_cru, E_cru, V_cru = _cruise_coefficients(aircraft_parameters, altitudes, velocities, W_1)
+
+    # OJHA 8.16, 8.23 e 8.35
+    return {
+        "RANGE_CONSTANT_HEIGHT_CL": (2 * E_cru * V_cru / c) * (1 - math.sqrt(1 - zeta)),
+        "RANGE_CONSTANT_VELOCITY_CL": ((E_cru * V_cru) / c) * math.log(1 / (1 - zeta)),
+        "RANGE_CONSTANT_HEIGHT_VELOCITY": ((2 * V_cru * E_m) / c) * np.arctan(
+            E_cru * zeta / (2 * E_m * (1 - K * E_cru * CL_cru * zeta))),
+    }
+
+
+def calc_cruise_fuel_fractions(aircraft_parameters: dict, altitudes, velocities, W_1, distance):
+
+    """
+    Inverso de calc_cruise_ranges: fração do peso consumida (zeta) para percorrer uma distância em cada caso.
+
+    Parâmetros:
+    - aircraft_parameters (dict): 'TSFC', 'S', 'K', 'CD0' e 'E_m'.
+    - altitudes (array): Altitudes de cruzeiro (m).
+    - velocities (array): Velocidades de cruzeiro (m/s).
+    - W_1 (float): Peso no início do cruzeiro (N).
+    - distance (float): Distância de cruzeiro (m).
+
+    Retorna:
+    dict: zeta nas chaves de RANGE_CASES; infinito onde a distância não pode ser percorrida em nenhum zeta < 1.
+    """
+
+    c, E_m, K, CL_cru, E_cru, V_cru = _cruise_coefficients(aircraft_parameters, altitudes, velocities, W_1)
+
+    u_h_CL = distance * c / (2 * E_cru * V_cru)
+    u_h_V = distance * c / (2 * V_cru * E_m)
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        tangent = np.tan(np.minimum(u_h_V, math.pi / 2))
+        zeta_h_V = 2 * E_m * tangent / (E_cru * (1 + 2 * E_m * K * CL_cru * tangent))
+
+    return {
+        "RANGE_CONSTANT_HEIGHT_CL": np.where(u_h_CL < 1, 1 - (1 - np.minimum(u_h_CL, 1)) ** 2, np.inf),
+        "RANGE_CONSTANT_VELOCITY_CL": 1 - np.exp(-distance * c / (E_cru * V_cru)),
+        "RANGE_CONSTANT_HEIGHT_VELOCITY": np.where((u_h_V < math.pi / 2) & (zeta_h_V < 1), zeta_h_V, np.inf),
+    }
+
+
+def _cruise_coefficients(aircraft_parameters, altitudes, velocities, W_1):
+
+    altitudes = np.asarray(altitudes, dtype=float)
+    V_cru = np.asarray(velocities, dtype=float)
+
+    sigma = aero.get_sigma(altitude=np.atleast_1d(altitudes)).reshape(altitudes.shape)
+
+    c = aircraft_parameters['TSFC'] / 3600
+    K = aircraft_parameters['K']
+
+    CL_cru = (2 * W_1) / (aircraft_parameters['S'] * aero.rho_0 * sigma * V_cru ** 2)
+    CD_cru = aircraft_parameters['CD0'] + K * CL_cru ** 2
+
+    return c, aircraft_parameters['E_m'], K, CL_cru, CL_cru / CD_cru, V_cru
+
+
+def _golden_section_maximize(function, a, b, tolerance):
+    """Máximo de uma função unimodal em [a, b] por seção áurea. Retorna (x, f(x))."""
+
+    x_1 = b - GOLDEN_RATIO * (b - a)
+    x_2 = a + GOLDEN_RATIO * (b - a)
+    f_1, f_2 = function(x_1), function(x_2)
+
+    while b - a > tolerance:
+        if f_1 >= f_2:
+            b, x_2, f_2 = x_2, x_1, f_1
+            x_1 = b - GOLDEN_RATIO * (b - a)
+            f_1 = function(x_1)
+        else:
+            a, x_1, f_1 = x_1, x_2, f_2
+            x_2 = a + GOLDEN_RATIO * (b - a)
+            f_2 = function(x_2)
+
+    return (x_1, f_1) if f_1 >= f_2 else (x_2, f_2)
+
+
+def optimize_cruise(aircraft_parameters: dict, flight_parameters: dict, objective="RANGE", distance=None,
+                    altitudes=None, velocities=None, W_CRUISE=None, zeta_CRUISE=None, sweeps=3):
+
+    """
+    Busca a altitude e a velocidade de cruzeiro de maior alcance (ou de menor combustível para uma distância) em cada
+    caso de calc_cruising_jet_range, dentro do envelope de voo no início do cruzeiro (peso W_1).
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave ('TSFC', 'S', 'K', 'CD0', 'OEW', 'E_m', 'T0', 'NE', 'CL_MAX').
+    - flight_parameters (dict): Parâmetros de voo ('NUMBER_OF_PASSENGERS', 'FUEL_WEIGHT', 'DISPATCHED_CARGO_WEIGHT').
+    - objective (str, opcional): "RANGE" (maior alcance com o combustível de flight_parameters) ou "FUEL" (menor
+      combustível para percorrer distance). Default é "RANGE".
+    - distance (float, opcional): Distância de cruzeiro (m), obrigatória com objective="FUEL".
+    - altitudes (array, opcional): Grade de altitudes (m). Default é 1000 a 15000 m a cada 250 m.
+    - velocities (array, opcional): Grade de velocidades (m/s). Default é 50 a 350 m/s a cada 5 m/s.
+    - W_CRUISE (float, opcional): Peso de decolagem a ser usado (N).
+    - zeta_CRUISE (float, opcional): Fração do peso do combustível a ser consumido.
+    - sweeps (int, opcional): Número de refinamentos alternados (velocidade, altitude). Default é 3.
+
+    Retorna:
+    dict: Para cada caso de RANGE_CASES ("CONSTANT_HEIGHT_CL", ...), None se nenhum ponto da grade é viável ou um dict:
+        - "ALTITUDE" (float): Altitude ótima (m).
+        - "VELOCITY" (float): Velocidade ótima (m/s).
+        - "RANGE" (float): Alcance nesse ponto (m), com o combustível de flight_parameters.
+        - "FUEL" (float): Combustível consumido no cruzeiro (N): zeta * W_1 com objective="RANGE" e o necessário para
+          percorrer distance com objective="FUEL".
+        - "ON_GRID_BOUNDARY" (bool): True se o melhor ponto da grade está na borda da grade (menor ou maior altitude ou
+          velocidade). Nesse caso o ótimo pode estar fora da grade e o ponto retornado não deve ser tomado como ótimo.
+    """
+
+    objective = objective.upper()
+
+    if objective not in ("RANGE", "FUEL"):
+        raise ValueError("objective must be 'RANGE' or 'FUEL'")
+
+    if objective == "FUEL" and distance is None:
+        raise ValueError("distance is required when objective='FUEL'")
+
+    altitudes = DEFAULT_ALTITUDES if altitudes is None else np.sort(np.asarray(altitudes, dtype=float))
+    velocities = DEFAULT_VELOCITIES if velocities is None else np.sort(np.asarray(velocities, dtype=float))
+
+    W_1, zeta = get_cruise_weights(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                   W_CRUISE=W_CRUISE, zeta_CRUISE=zeta_CRUISE)
+
+    def scores(altitude, velocity):
+        """Valor a maximizar em cada caso: alcance, ou combustível negativo; -inf fora do envelope."""
+
+        if objective == "RANGE":
+            values = calc_cruise_ranges(aircraft_parameters=aircraft_parameters, altitudes=altitude,
+                                        velocities=velocity, W_1=W_1, zeta=zeta)
+        else:
+            fractions = calc_cruise_fuel_fractions(aircraft_parameters=aircraft_parameters, altitudes=altitude,
+                                                   velocities=velocity, W_1=W_1, distance=distance)
+            values = {key: np.where(fraction <= zeta, -fraction * W_1, -np.inf) for key, fraction in fractions.items()}
+
+        inside = calc_cruise_envelope(aircraft_parameters=aircraft_parameters, altitudes=altitude,
+                                      velocities=velocity, W=W_1)
+
+        return {key: np.where(inside, value, -np.inf) for key, value in values.items()}
+
+    grid = scores(altitudes[:, np.newaxis], velocities[np.newaxis, :])
+
+    result = {}
+
+    for case, key in RANGE_CASES.items():
+
+        if not np.any(np.isfinite(grid[key])):
+            logger.debug("%s: no feasible point in the altitude x velocity grid", case)
+            result[case] = None
+            continue
+
+        i, j = np.unravel_index(np.argmax(grid[key]), grid[key].shape)
+        altitude, velocity, best = altitudes[i], velocities[j], grid[key][i, j]
+
+        # Melhor ponto na borda da grade: o ótimo pode estar fora dela, então o resultado não é um ótimo convergido
+        on_grid_boundary = bool(i in (0, len(altitudes) - 1) or j in (0, len(velocities) - 1))
+
+        if on_grid_boundary:
+            logger.warning("%s: optimum at the grid boundary (%.0f m, %.1f m/s); widen the altitude/velocity grid",
+                           case, altitude, velocity)
+
+        def score(h, v):
+            return float(scores(np.float64(h), np.float64(v))[key])
+
+        # Intervalos vizinhos ao melhor ponto da grade; o refinamento só aceita pontos melhores
+        h_low, h_high = altitudes[max(i - 1, 0)], altitudes[min(i + 1, len(altitudes) - 1)]
+        v_low, v_high = velocities[max(j - 1, 0)], velocities[min(j + 1, len(velocities) - 1)]
+
+        for _ in range(sweeps):
+
+            v, value = _golden_section_maximize(lambda v: score(altitude, v), v_low, v_high, tolerance=1e-3)
+            if value > best:
+                velocity, best = v, value
+
+            h, value = _golden_section_maximize(lambda h: score(h, velocity), h_low, h_high, tolerance=1e-2)
+            if value > best:
+                altitude, best = h, value
+
+        ranges = calc_cruise_ranges(aircraft_parameters=aircraft_parameters, altitudes=np.float64(altitude),
+                                    velocities=np.float64(velocity), W_1=W_1, zeta=zeta)
+
+        result[case] = {
+            "ALTITUDE": float(altitude),
+            "VELOCITY": float(velocity),
+            "RANGE": float(ranges[key]),
+            "FUEL": float(zeta * W_1 if objective == "RANGE" else -best),
+            "ON_GRID_BOUNDARY": on_grid_boundary,
+        }
+
+    return result
@@ -14,19 +14,21 @@ sys.path.append(parent_dir)
 import sys
 
 sys.path.append('functions')
-from .utils import hash_dict, print_formatted_string, get_logger, linspace
-import matplotlib.pyplot as plt
+from .utils import print_formatted_string, get_logger, linspace
 # from aero import Aero
 import math
-# import numpy as np
+import numpy as np
 from functools import lru_cache
 from .aero import Aero
 
 aero = Aero()
+logger = get_logger(log_name="Cruise")
+
+CRUISE_VELOCITY_CACHE_SIZE = 256
 
 
 def calc_cruise_velocity(aircraft_parameters: dict, flight_parameters: dict, W_CRUISE=None, V_STALL=None,
-                         T_CRUISE=None, plot=False, display=False):
+                         T_CRUISE=None, series=False, plot=False, display=False):
 
     """
     Calcula a velocidade de cruzeiro da aeronave, considerando o arrasto total mínimo.
@@ -50,6 +52,7 @@ def calc_cruise_velocity(aircraft_parameters: dict, flight_parameters: dict, W_C
     W_CRUISE (float, opcional): Peso de decolagem da aeronave para o cálculo da velocidade de cruzeiro em Newtons (N).
     V_STALL (float, opcional): Velocidade de estol da aeronave em metros por segundo (m/s).
     T_CRUISE (float, opcional): Empuxo do motor durante o cruzeiro em Newtons (N).
+    series (bool, opcional): Se True, inclui as curvas de arrasto e empuxo em função da velocidade (ver plot_cruise_drag).
     plot (bool, opcional): Se True, gera um gráfico do arrasto e impulso em função da velocidade.
     display (bool, opcional): Se True e plot=True, exibe o gráfico.
 
@@ -58,37 +61,87 @@ def calc_cruise_velocity(aircraft_parameters: dict, flight_parameters: dict, W_C
         - "CRUISE_VELOCITY" (float): Velocidade de cruzeiro calculada em metros por segundo (m/s).
         - "MINIMUM_DRAG" (float): Arrasto mínimo durante o cruzeiro em Newtons (N).
         - "CRUISE_VELOCITIES" (list): Lista contendo as duas possíveis velocidades de cruzeiro calculadas em metros por segundo (m/s).
+        - "CRUISE_DRAG_SERIES" (dict, opcional): Curvas de arrasto e empuxo, se series=True ou plot=True.
         - "CRUISE_DRAG_GRAPH" (matplotlib.figure.Figure, opcional): Figura do gráfico de arrasto e impulso, se plot=True.
 
     """
 
     altitude = flight_parameters['CRUISE_ALTITUDE']
-    sigma = aero.get_sigma(altitude=altitude)
-
-    rho_0 = aero.rho_0
-    T0 = aircraft_parameters['T0']
-    T = T0 * aircraft_parameters['NE']
     S = aircraft_parameters['S']
     CD0 = aircraft_parameters['CD0']
     K = aircraft_parameters['K']
+    T = aircraft_parameters['T0'] * aircraft_parameters['NE']
     n = (aircraft_parameters['TSFC'] / 3600)
-    CL_max = aircraft_parameters['CL_MAX']
 
-    NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
-    FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
-    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
-    OEW = aircraft_parameters['OEW']
+    if W_CRUISE is None:
+        NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
+        FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
+        CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
+        OEW = aircraft_parameters['OEW']
+
+        TOW = float(NP * aero.person_weight + OEW + FW + CW)
+
+        # TOW - (50% do combustível)
+        W = TOW - 0.5 * FW
+    else:
+        W = W_CRUISE
+
+    # O cache é indexado apenas pelas grandezas escalares usadas no cálculo e pelo modo de atmosfera (exata ou tabelada)
+    V_cru, D_min, V_cru_1, V_cru_2, T_CRU = _calc_cruise_velocity(
+        altitude, T, S, CD0, K, n, aircraft_parameters['CL_MAX'], aircraft_parameters['E_m'],
+        flight_parameters['CRUISE_VELOCITY'], W, V_STALL, T_CRUISE, Aero.atmosphere_version)
+
+    result = {
+        "CRUISE_VELOCITY": V_cru,
+        "MINIMUM_DRAG": D_min,
+        "CRUISE_VELOCITIES": [V_cru_1, V_cru_2],
+        "CRUISE_DRAG_GRAPH": None
+    }
+
+    if series is True or plot is True:
+
+        sigma = aero.get_sigma(altitude=altitude)
+        rho_0 = aero.rho_0
+
+        lista_arrasto_total = []
+        lista_arrasto_parasita = []
+        lista_arrasto_induzido = []
+
+        v_range = linspace(max(0.1 * V_cru, 50), min(V_cru + 300, 600), 50)
+
+        for v in v_range:
+            arrasto_parasita = 0.5 * sigma * rho_0 * (v ** 2) * S * CD0
+            arrasto_induzido = (2 * K * W ** 2) / (sigma * rho_0 * S * v ** 2)
+
+            arrasto_total = arrasto_parasita + arrasto_induzido
+
+            lista_arrasto_total.append(arrasto_total)
+            lista_arrasto_parasita.append(arrasto_parasita)
+            lista_arrasto_induzido.append(arrasto_induzido)
+
+        result["CRUISE_DRAG_SERIES"] = {
+            "VELOCITY": v_range,
+            "TOTAL_DRAG": lista_arrasto_total,
+            "PARASITIC_DRAG": lista_arrasto_parasita,
+            "INDUCED_DRAG": lista_arrasto_induzido,
+            "THRUST": T_CRU
+        }
+
+    if plot is True:
+        result["CRUISE_DRAG_GRAPH"] = plot_cruise_drag(result=result, display=display)
+
+    return result
 
-    TOW = float(NP * aero.person_weight + OEW + FW + CW)
 
-    # TOW - (50% do combustível)
-    W = TOW - 0.5 * FW if W_CRUISE is None else W_CRUISE
+@lru_cache(maxsize=CRUISE_VELOCITY_CACHE_SIZE)
+def _calc_cruise_velocity(altitude, T, S, CD0, K, n, CL_max, E_m, V_cruise, W, V_STALL, T_CRUISE, atmosphere_version):
+
+    sigma = aero.get_sigma(altitude=altitude)
+    rho_0 = aero.rho_0
 
     T_CRU = aero.calculate_general_thrust(altitude=altitude, sea_level_thrust=T,
                                           thrust_factor=n) if T_CRUISE is None else T_CRUISE
 
-    E_m = aircraft_parameters['E_m']
-
     V_11 = (T_CRU * sigma ** n) / (sigma * rho_0 * S * CD0)
     V_12 = 1 - (1 / (E_m ** 2)) * ((W ** 2) / ((T_CRU * sigma ** n) ** 2))
 
@@ -100,60 +153,60 @@ def calc_cruise_velocity(aircraft_parameters: dict, flight_parameters: dict, W_C
 
     V_S = aero.calculate_stall_velocity(W=W, CL_max=CL_max, S=S, rho=rho_0) if V_STALL is None else V_STALL
 
-    if flight_parameters['CRUISE_VELOCITY'] == 0:
+    if V_cruise == 0:
         # Se for zero, queremos computar o valor
         # Selecionamos a maior velocidade de cruzeiro
         V_cru = max(V_cru_1, V_cru_2) if (V_cru_1 > V_S and V_cru_2 > V_S) else V_cru_1 if (
                     V_cru_1 > V_S > V_cru_2) else V_cru_2
     else:
-        V_cru = flight_parameters['CRUISE_VELOCITY']
+        V_cru = V_cruise
 
     D_min = (2 * W) * (K * CD0) ** 0.5
 
-    if plot is True:
+    return V_cru, D_min, V_cru_1, V_cru_2, T_CRU
 
-        lista_arrasto_total = []
-        lista_arrasto_parasita = []
-        lista_arrasto_induzido = []
 
-        v_range = linspace(max(0.1 * V_cru, 50), min(V_cru + 300, 600), 50)
+# Estatísticas (hits/misses) e invalidação explícita do cache, com a mesma interface do functools.lru_cache
+calc_cruise_velocity.cache_info = _calc_cruise_velocity.cache_info
+calc_cruise_velocity.cache_clear = _calc_cruise_velocity.cache_clear
 
-        for v in v_range:
-            arrasto_parasita = 0.5 * sigma * rho_0 * (v ** 2) * S * CD0
-            arrasto_induzido = (2 * K * W ** 2) / (sigma * rho_0 * S * v ** 2)
 
-            arrasto_total = arrasto_parasita + arrasto_induzido
+def plot_cruise_drag(result, display=False):
+    """
+    Gera o gráfico do arrasto (total, parasita e induzido) e do empuxo em função da velocidade.
 
-            lista_arrasto_total.append(arrasto_total)
-            lista_arrasto_parasita.append(arrasto_parasita)
-            lista_arrasto_induzido.append(arrasto_induzido)
+    Parâmetros:
+    - result (dict): Resultado de calc_cruise_velocity com series=True.
+    - display (bool, opcional): Se True, exibe o gráfico.
 
-        fig_cruzeiro = plt.figure(figsize=(5, 3))
-        plt.plot(v_range, [i / 1e3 for i in lista_arrasto_total], c='black', label="Total Drag")
-        plt.plot(v_range, [i / 1e3 for i in lista_arrasto_parasita], c='black', ls='--', label="Parasitic Drag")
-        plt.plot(v_range, [i / 1e3 for i in lista_arrasto_induzido], c='black', ls='-.', label="Induced Drag")
-        plt.plot(v_range, [T_CRU / 1e3] * len(v_range), label="Thrust", ls=(0, (5, 10)), color='black')
-        plt.scatter(v_range[lista_arrasto_total.index(min(lista_arrasto_total))], min(lista_arrasto_total) / 1e3,
-                    c='black', label=f"Minimum Drag = {round(D_min / 1e3, 2)}")
-        plt.xlabel("Velocity [m/s]", size=12)
-        plt.ylabel("Drag [kN]", size=12)
-        plt.title("Thrust and drag per velocity")
-        plt.grid()
-        plt.legend()
-
-        if display is True:
-            plt.show()
-        else:
-            pass
+    Retorna:
+    matplotlib.figure.Figure: Figura do gráfico de arrasto e impulso.
+    """
 
-    result = {
-        "CRUISE_VELOCITY": V_cru,
-        "MINIMUM_DRAG": D_min,
-        "CRUISE_VELOCITIES": [V_cru_1, V_cru_2],
-        "CRUISE_DRAG_GRAPH": fig_cruzeiro if plot is True else None
-    }
+    import matplotlib.pyplot as plt
+
+    curves = result['CRUISE_DRAG_SERIES']
+    v_range = curves['VELOCITY']
+    lista_arrasto_total = curves['TOTAL_DRAG']
+    D_min = result['MINIMUM_DRAG']
+
+    fig_cruzeiro = plt.figure(figsize=(5, 3))
+    plt.plot(v_range, [i / 1e3 for i in lista_arrasto_total], c='black', label="Total Drag")
+    plt.plot(v_range, [i / 1e3 for i in curves['PARASITIC_DRAG']], c='black', ls='--', label="Parasitic Drag")
+    plt.plot(v_range, [i / 1e3 for i in curves['INDUCED_DRAG']], c='black', ls='-.', label="Induced Drag")
+    plt.plot(v_range, [curves['THRUST'] / 1e3] * len(v_range), label="Thrust", ls=(0, (5, 10)), color='black')
+    plt.scatter(v_range[lista_arrasto_total.index(min(lista_arrasto_total))], min(lista_arrasto_total) / 1e3,
+                c='black', label=f"Minimum Drag = {round(D_min / 1e3, 2)}")
+    plt.xlabel("Velocity [m/s]", size=12)
+    plt.ylabel("Drag [kN]", size=12)
+    plt.title("Thrust and drag per velocity")
+    plt.grid()
+    plt.legend()
 
-    return result
+    if display is True:
+        plt.show()
+
+    return fig_cruzeiro
 
 
 def calc_cruising_jet_range(aircraft_parameters: dict, flight_parameters: dict, V_CRUISE=None, W_CRUISE=None,
@@ -197,8 +250,6 @@ def calc_cruising_jet_range(aircraft_parameters: dict, flight_parameters: dict,
     # 9.3.2 - Maximum Range of constant airspeed-constant lift coefficient flight (página 241)
     # 9.3.3 - Maximum Range of constant altitude-airspeed (página 243)
 
-    logger = get_logger(log_name="Cruise")
-
     c = (aircraft_parameters['TSFC'] / 3600)
 
     altitude = flight_parameters['CRUISE_ALTITUDE']
@@ -334,8 +385,6 @@ def calc_cruising_jet_endurance(aircraft_parameters: dict, flight_parameters: di
     - 'MAX_ENDURANCE_CONSTANT_HEIGHT_VELOCITY' (float): Endurance máxima em voo de altitude constante com velocidade constante.
     """
 
-    logger = get_logger(log_name="Cruise")
-
     c = (aircraft_parameters['TSFC'] / 3600)
 
     altitude = flight_parameters['CRUISE_ALTITUDE']
@@ -420,9 +469,9 @@ def calc_cruising_jet_endurance(aircraft_parameters: dict, flight_parameters: di
 # ------------------------------------------------- PAYLOAD x RANGE -------------------------------------------------- #
 # -------------------------------------------------------------------------------------------------------------------- #
 
-def calc_payload_x_range(aircraft_parameters: dict, flight_parameters: dict, V_CRUISE=None, display=False):
+def calc_payload_range_diagram(aircraft_parameters: dict, flight_parameters: dict, V_CRUISE=None):
     """
-    Calcula e visualiza o diagrama de carga paga de uma aeronave.
+    Calcula os pontos A, B, C e D do diagrama de carga paga versus alcance de uma aeronave.
 
     Parâmetros:
     - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
@@ -438,21 +487,14 @@ def calc_payload_x_range(aircraft_parameters: dict, flight_parameters: dict, V_C
         - 'CRUISE_ALTITUDE' (float): Altitude de cruzeiro (m).
         - 'CRUISE_VELOCITY' (float): Velocidade de cruzeiro (m/s).
     - V_CRUISE (float, opcional): Velocidade de cruzeiro específica a ser usada (m/s).
-    - display (bool, opcional): Se True, exibe o gráfico. Default é False.
 
     Retorna:
-    - fig_payload_range (matplotlib.figure.Figure): Figura contendo o gráfico de carga paga versus alcance.
+    dict: Dicionário contendo:
+        - "RANGE" (list): Alcance nos pontos A, B, C e D (m).
+        - "PAYLOAD" (list): Carga paga nos pontos A, B, C e D (kg).
     """
 
-    logger = get_logger(log_name="Cruise")
-
-    n = (aircraft_parameters['TSFC'] / 3600)
-    S = aircraft_parameters['S']
-    K = aircraft_parameters['K']
-    CD0 = aircraft_parameters['CD0']
-
     altitude = flight_parameters['CRUISE_ALTITUDE']  # Cruise Height
-    h_cru = altitude
 
     if flight_parameters['CRUISE_VELOCITY'] == 0:
         # Se for zero, quremos computar o valor
@@ -462,10 +504,80 @@ def calc_payload_x_range(aircraft_parameters: dict, flight_parameters: dict, V_C
     else:
         V_cru = flight_parameters['CRUISE_VELOCITY']
 
+    ranges, payloads = _calc_payload_range_points(aircraft_parameters=aircraft_parameters,
+                                                  rho=aero.get_density(altitude=altitude), V_cru=V_cru)
+
+    return {
+        "RANGE": [float(x) for x in ranges],
+        "PAYLOAD": [float(y) for y in payloads]
+    }
+
+
+def calc_payload_range_diagrams(aircraft_parameters: dict, altitudes, velocities):
+    """
+    Versão vetorizada de calc_payload_range_diagram: pontos A, B, C e D para muitas configurações (aeronave, altitude,
+    velocidade) de uma só vez, sem gerar gráficos (ver plot_payload_range).
+
+    Os parâmetros da aeronave, as altitudes e as velocidades podem ser números ou arrays e são combinados pelas regras
+    de broadcasting do numpy. Por exemplo, com os parâmetros de stack_aircraft_parameters (forma (N, 1)) e altitudes
+    de forma (M,), o resultado tem forma (N, M): toda a frota em todas as altitudes.
+
+    Parâmetros:
+    - aircraft_parameters (dict): 'TSFC', 'S', 'K', 'CD0', 'OEW', 'MTOW', 'MAXIMUM_FUEL_WEIGHT',
+      'MAXIMUM_PAYLOAD_WEIGHT' e 'E_m', como em calc_payload_range_diagram.
+    - altitudes (array): Altitudes de cruzeiro (m).
+    - velocities (array): Velocidades de cruzeiro (m/s), positivas (ex.: calculadas com calc_cruise_velocity).
+
+    Retorna:
+    dict: Dicionário contendo:
+        - "RANGE" (numpy.ndarray): Alcance nos pontos A, B, C e D (m), com forma (..., 4).
+        - "PAYLOAD" (numpy.ndarray): Carga paga nos pontos A, B, C e D (kg), com forma (..., 4).
+    """
+
+    velocities = np.asarray(velocities, dtype=float)
+
+    if np.any(velocities <= 0):
+        raise ValueError("velocities must be positive; compute them with calc_cruise_velocity")
+
+    rho = aero.get_density(altitude=np.asarray(altitudes, dtype=float))
+
+    ranges, payloads = _calc_payload_range_points(aircraft_parameters=aircraft_parameters, rho=rho, V_cru=velocities)
+
+    # Todos os pontos com a mesma forma (A e D não dependem da altitude nem da velocidade)
+    points = np.broadcast_arrays(*ranges, *payloads)
+
+    return {
+        "RANGE": np.stack(points[:4], axis=-1),
+        "PAYLOAD": np.stack(points[4:], axis=-1)
+    }
+
+
+def stack_aircraft_parameters(aircrafts, keys=('TSFC', 'S', 'K', 'CD0', 'OEW', 'MTOW', 'MAXIMUM_FUEL_WEIGHT',
+                                               'MAXIMUM_PAYLOAD_WEIGHT', 'E_m')):
+    """
+    Junta os parâmetros de várias aeronaves em arrays de forma (N, 1), para calc_payload_range_diagrams.
+
+    Parâmetros:
+    - aircrafts (list): aircraft_parameters de cada aeronave.
+    - keys (tuple, opcional): Chaves copiadas.
+
+    Retorna:
+    dict: Um array (N, 1) por chave.
+    """
+
+    return {key: np.array([[aircraft[key]] for aircraft in aircrafts], dtype=float) for key in keys}
+
+
+def _calc_payload_range_points(aircraft_parameters, rho, V_cru):
+    """Alcances (m) e cargas pagas (kg) dos pontos A, B, C e D; funciona com números ou arrays numpy."""
+
+    n = (aircraft_parameters['TSFC'] / 3600)
+    S = aircraft_parameters['S']
+    K = aircraft_parameters['K']
+    CD0 = aircraft_parameters['CD0']
+
     MFW = aircraft_parameters['MAXIMUM_FUEL_WEIGHT']  # max fuel weight
 
-    # NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
-    # CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
     OEW = aircraft_parameters['OEW']
     MTOW = aircraft_parameters['MTOW']
     MPW = aircraft_parameters['MAXIMUM_PAYLOAD_WEIGHT']
@@ -474,44 +586,48 @@ def calc_payload_x_range(aircraft_parameters: dict, flight_parameters: dict, V_C
 
     def range_iter(W, zeta):
 
-        range_list = []
-
-        V_i = V_cru
-
-        # for V_i in linspace(V_cru - 50, V_cru + 50, 20):
-
-        rho_i = aero.get_density(altitude=h_cru)
-        CL_i = (2 * W) / (S * rho_i * V_i ** 2)
+        CL_i = (2 * W) / (S * rho * V_cru ** 2)
         CD_i = CD0 + K * CL_i ** 2
         E_i = CL_i / CD_i
 
         # -----------------------------------------------------------------------------------------------------------------#
         # Case 3 - Range of Flight Parameters of Constant Altitude-Constant Airspeed Flight
 
-        x_h_V = (2 * V_i * E_i / n) * math.atan((E_i * zeta) / (2 * E_m * (1 - K * E_i * CL_i * zeta)))
-
-        range_list.append(x_h_V)
-
-        return max(range_list)
+        return (2 * V_cru * E_i / n) * np.arctan((E_i * zeta) / (2 * E_m * (1 - K * E_i * CL_i * zeta)))
 
     y_A = MPW / aero.g  # condição de máxima carga paga, porém sem combustível (alcance zero)
-    x_A = 0
+    x_A = 0 * y_A
 
     y_B = MPW / aero.g  # MTOW
     zeta_B = (MTOW - OEW - MPW) / MTOW
 
-    y_C = max((MTOW - OEW - MFW) / aero.g, 0)  # Aumenta o combustível, porém reduz carga paga
+    y_C = np.maximum((MTOW - OEW - MFW) / aero.g, 0)  # Aumenta o combustível, porém reduz carga paga
     zeta_C = MFW / MTOW
 
-    y_D = 0  # Zero carga paga
+    y_D = 0 * y_A  # Zero carga paga
     zeta_D = MFW / (MFW + OEW)
 
-
-
     x_B = range_iter(zeta=zeta_B, W=MTOW)
     x_C = range_iter(zeta=zeta_C, W=MTOW)
     x_D = range_iter(zeta=zeta_D, W=OEW + MFW)
 
+    return (x_A, x_B, x_C, x_D), (y_A, y_B, y_C, y_D)
+
+
+def plot_payload_range(diagram, display=False):
+    """
+    Gera o gráfico de carga paga versus alcance.
+
+    Parâmetros:
+    - diagram (dict): Resultado de calc_payload_range_diagram.
+    - display (bool, opcional): Se True, exibe o gráfico. Default é False.
+
+    Retorna:
+    - fig_payload_range (matplotlib.figure.Figure): Figura contendo o gráfico de carga paga versus alcance.
+    """
+
+    (x_A, x_B, x_C, x_D), (y_A, y_B, y_C, y_D) = diagram['RANGE'], diagram['PAYLOAD']
+
     # Ponto A:
     xy_A = [x_A / 1000, y_A / 1000]
     # Ponto B:
@@ -521,6 +637,8 @@ def calc_payload_x_range(aircraft_parameters: dict, flight_parameters: dict, V_C
     # Ponto D:
     xy_D = [x_D / 1000, y_D / 1000]
 
+    import matplotlib.pyplot as plt
+
     fig_payload_range = plt.figure(figsize=(5, 3))
 
     plt.plot([xy_A[0], xy_B[0]], [xy_A[1], xy_B[1]], linewidth=2.5, c="#1D3D7B")
@@ -551,6 +669,26 @@ def calc_payload_x_range(aircraft_parameters: dict, flight_parameters: dict, V_C
     return fig_payload_range
 
 
+def calc_payload_x_range(aircraft_parameters: dict, flight_parameters: dict, V_CRUISE=None, display=False):
+    """
+    Calcula e visualiza o diagrama de carga paga de uma aeronave (calc_payload_range_diagram + plot_payload_range).
+
+    Parâmetros:
+    - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
+    - flight_parameters (dict): Dicionário contendo os parâmetros de voo.
+    - V_CRUISE (float, opcional): Velocidade de cruzeiro específica a ser usada (m/s).
+    - display (bool, opcional): Se True, exibe o gráfico. Default é False.
+
+    Retorna:
+    - fig_payload_range (matplotlib.figure.Figure): Figura contendo o gráfico de carga paga versus alcance.
+    """
+
+    diagram = calc_payload_range_diagram(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                         V_CRUISE=V_CRUISE)
+
+    return plot_payload_range(diagram=diagram, display=display)
+
+
 def calc_cruise_fuel_weight(aircraft_parameters: dict, flight_parameters: dict, W_CRUISE=None, V_CRUISE=None):
 
     """
@@ -585,8 +723,6 @@ def calc_cruise_fuel_weight(aircraft_parameters: dict, flight_parameters: dict,
         - 'VALID_FUEL' (bool): Indicação se a quantidade restante de combustível é válida após o voo de cruzeiro.
     """
 
-    logger = get_logger(log_name="Cruise")
-
     c = (aircraft_parameters['TSFC'] / 3600)
 
     altitude = flight_parameters['CRUISE_ALTITUDE']
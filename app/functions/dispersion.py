@@ -0,0 +1,332 @@
+"""
+Análise de dispersão (Monte-Carlo) das distâncias de decolagem e de pouso.
+
+As entradas (peso, altitude do aeroporto, vento, inclinação da pista e atrito) são sorteadas em blocos e avaliadas com
+calc_takeoff_batch e calc_landing_batch, as versões vetorizadas de calc_total_takeoff_distance e
+calc_total_landing_distance. Cada bloco vira um histograma de distâncias em escala logarítmica (largura relativa
+resolution), e os histogramas são somados à medida que os blocos terminam, então a memória não cresce com o número de
+amostras. Os percentis vêm do histograma somado, com erro relativo de no máximo resolution.
+
+Cada bloco tem a sua semente, derivada de numpy.random.SeedSequence(seed): o resultado é o mesmo com qualquer número de
+processos.
+
+Distribuições (uma tupla por variável):
+    ("CONSTANT", valor)
+    ("UNIFORM", mínimo, máximo)
+    ("NORMAL", média, desvio padrão)
+    ("TRIANGULAR", mínimo, moda, máximo)
+"""
+
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .takeoff import calc_takeoff_batch
+from .landing import calc_landing_batch
+from .utils import get_logger
+
+logger = get_logger(log_name="DISPERSION")
+
+DISPERSION_PHASES = ("TAKEOFF", "LANDING")
+
+# Ordem fixa do sorteio, para que o resultado não dependa da ordem das chaves de distributions
+DISPERSION_VARIABLES = ("TOW", "W_LANDING", "ALTITUDE", "WIND_VELOCITY", "RUNWAY_SLOPE", "MU_TAKEOFF", "MU_LANDING")
+
+DEFAULT_DISTRIBUTIONS = {
+    "ALTITUDE": ("CONSTANT", 0.0),
+    "WIND_VELOCITY": ("CONSTANT", 0.0),
+    "RUNWAY_SLOPE": ("CONSTANT", 0.0),
+}
+
+PHASE_VARIABLES = {
+    "TAKEOFF": ("TOW", "ALTITUDE", "WIND_VELOCITY", "RUNWAY_SLOPE", "MU_TAKEOFF"),
+    "LANDING": ("W_LANDING", "ALTITUDE", "WIND_VELOCITY", "MU_LANDING"),
+}
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+DEFAULT_CHUNK_SIZE = 100000
+
+# Limites do histograma (m); valores fora deles vão para os bins das pontas
+HISTOGRAM_MINIMUM_DISTANCE = 1.0
+HISTOGRAM_MAXIMUM_DISTANCE = 1e6
+
+
+def sample_distribution(rng, distribution, size):
+
+    """
+    Sorteia size valores de uma distribuição.
+
+    Parâmetros:
+    - rng (numpy.random.Generator): Gerador de números aleatórios.
+    - distribution (tuple): Tipo e parâmetros da distribuição (ver o docstring do módulo).
+    - size (int): Número de amostras.
+
+    Retorna:
+    numpy.ndarray: Amostras.
+    """
+
+    kind, parameters = distribution[0], distribution[1:]
+
+    if kind == "CONSTANT":
+        return np.full(size, float(parameters[0]))
+    if kind == "UNIFORM":
+        return rng.uniform(parameters[0], parameters[1], size)
+    if kind == "NORMAL":
+        return rng.normal(parameters[0], parameters[1], size)
+    if kind == "TRIANGULAR":
+        return rng.triangular(parameters[0], parameters[1], parameters[2], size)
+
+    raise ValueError(f"Unknown distribution: {kind}")
+
+
+def get_ground_friction_distributions(friction_ranges, surface):
+
+    """
+    Distribuições uniformes de MU_TAKEOFF e MU_LANDING entre o mínimo e o máximo de um tipo de solo.
+
+    Parâmetros:
+    - friction_ranges (dict): Resultado de Repository.get_ground_friction_ranges.
+    - surface (str): Superfície (coluna superficie da tabela groundtype).
+
+    Retorna:
+    dict: {"MU_TAKEOFF": ("UNIFORM", mínimo, máximo), "MU_LANDING": ("UNIFORM", mínimo, máximo)}.
+    """
+
+    return {key: ("UNIFORM",) + tuple(limits) for key, limits in friction_ranges[surface].items()}
+
+
+class DistanceHistogram:
+
+    """
+    Histograma de distâncias com bins de largura relativa constante (escala logarítmica), que pode ser somado a outros
+    histogramas com os mesmos limites. Guarda também o mínimo, o máximo e a soma exatos, e o número de resultados
+    inválidos (NaN).
+    """
+
+    def __init__(self, resolution=1e-4, minimum=HISTOGRAM_MINIMUM_DISTANCE, maximum=HISTOGRAM_MAXIMUM_DISTANCE):
+
+        self.resolution = resolution
+        self.minimum = minimum
+        self.log_step = math.log1p(resolution)
+        self.n_bins = int(math.ceil(math.log(maximum / minimum) / self.log_step))
+
+        # Bin 0: abaixo de minimum; bin n_bins + 1: acima de maximum
+        self.counts = np.zeros(self.n_bins + 2, dtype=np.int64)
+        self.invalid = 0
+        self.total = 0.0
+        self.lowest = math.inf
+        self.highest = -math.inf
+
+    def add(self, distances):
+
+        distances = np.asarray(distances, dtype=float)
+        valid = np.isfinite(distances)
+        distances = distances[valid]
+
+        self.invalid += int(valid.size - distances.size)
+
+        if distances.size == 0:
+            return self
+
+        with np.errstate(divide="ignore"):
+            bins = np.floor(np.log(distances / self.minimum) / self.log_step)
+
+        bins = np.clip(bins + 1, 0, self.n_bins + 1).astype(np.int64)
+
+        self.counts += np.bincount(bins, minlength=self.n_bins + 2)
+        self.total += float(np.sum(distances))
+        self.lowest = min(self.lowest, float(np.min(distances)))
+        self.highest = max(self.highest, float(np.max(distances)))
+
+        return self
+
+    def merge(self, other):
+
+        self.counts += other.counts
+        self.invalid += other.invalid
+        self.total += other.total
+        self.lowest = min(self.lowest, other.lowest)
+        self.highest = max(self.highest, other.highest)
+
+        return self
+
+    @property
+    def samples(self):
+        return int(self.counts.sum())
+
+    def percentile(self, q):
+
+        """Percentil q (0 a 100): borda superior do bin onde a frequência acumulada atinge q (conservador)."""
+
+        if self.samples == 0:
+            return math.nan
+
+        cumulative = np.cumsum(self.counts)
+        index = int(np.searchsorted(cumulative, q / 100 * cumulative[-1]))
+
+        # Fora dos limites do histograma, os únicos valores conhecidos são o mínimo e o máximo
+        if index == 0:
+            return self.lowest
+        if index == self.n_bins + 1:
+            return self.highest
+
+        upper_edge = self.minimum * math.exp(index * self.log_step)
+
+        return min(max(upper_edge, self.lowest), self.highest)
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+
+        result = {f"P{q:g}": self.percentile(q) for q in percentiles}
+        result.update({
+            "MEAN": self.total / self.samples if self.samples else math.nan,
+            "MIN": self.lowest if self.samples else math.nan,
+            "MAX": self.highest if self.samples else math.nan,
+            "SAMPLES": self.samples,
+            "INVALID": self.invalid,
+        })
+
+        return result
+
+
+def calc_dispersion_distances(aircraft_parameters, samples, phases=DISPERSION_PHASES):
+
+    """
+    Distâncias de decolagem e de pouso para arrays de entradas sorteadas.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave ('S', 'CD0', 'K', 'T0', 'NE', 'TSFC', 'CL_MAX').
+    - samples (dict): Arrays com as variáveis de PHASE_VARIABLES de cada fase. O vento segue a convenção de
+      calc_takeoff_batch e calc_landing_batch (positivo aumenta a distância); a inclinação da pista (graus) só entra
+      na decolagem, como em calc_landing_batch.
+    - phases (tuple, opcional): Fases avaliadas. Default é ("TAKEOFF", "LANDING").
+
+    Retorna:
+    dict: Distâncias (m) por fase.
+    """
+
+    distances = {}
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+
+        if "TAKEOFF" in phases:
+            distances["TAKEOFF"] = calc_takeoff_batch(aircraft_parameters=aircraft_parameters, TOW=samples['TOW'],
+                                                      altitude=samples['ALTITUDE'], mu=samples['MU_TAKEOFF'],
+                                                      V_wind=samples['WIND_VELOCITY'],
+                                                      runway_slope=samples['RUNWAY_SLOPE'])['TAKEOFF_DISTANCE']
+
+        if "LANDING" in phases:
+            distances["LANDING"] = calc_landing_batch(aircraft_parameters=aircraft_parameters,
+                                                      W_landing=samples['W_LANDING'], altitude=samples['ALTITUDE'],
+                                                      mu=samples['MU_LANDING'],
+                                                      V_wind=samples['WIND_VELOCITY'])['LANDING_DISTANCE']
+
+    return distances
+
+
+def _run_chunk(task):
+
+    """Sorteia e avalia um bloco; retorna um histograma por fase. Função de módulo para ser usada em outros processos."""
+
+    aircraft_parameters, distributions, phases, seed_sequence, size, resolution = task
+
+    rng = np.random.default_rng(seed_sequence)
+    samples = {name: sample_distribution(rng, distributions[name], size)
+               for name in DISPERSION_VARIABLES if name in distributions}
+
+    distances = calc_dispersion_distances(aircraft_parameters=aircraft_parameters, samples=samples, phases=phases)
+
+    return {phase: DistanceHistogram(resolution=resolution).add(values) for phase, values in distances.items()}
+
+
+def run_dispersion(aircraft_parameters, distributions, n_samples=1000000, phases=DISPERSION_PHASES,
+                   percentiles=DEFAULT_PERCENTILES, chunk_size=DEFAULT_CHUNK_SIZE, workers=1, seed=None,
+                   resolution=1e-4):
+
+    """
+    Monte-Carlo das distâncias de decolagem e de pouso.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave.
+    - distributions (dict): Distribuição de cada variável de DISPERSION_VARIABLES (ver o docstring do módulo). ALTITUDE,
+      WIND_VELOCITY e RUNWAY_SLOPE são zero se omitidas; TOW e MU_TAKEOFF são obrigatórias na decolagem, W_LANDING e
+      MU_LANDING no pouso.
+    - n_samples (int, opcional): Número de amostras. Default é 1e6.
+    - phases (tuple, opcional): Fases avaliadas. Default é ("TAKEOFF", "LANDING").
+    - percentiles (tuple, opcional): Percentis calculados. Default é (50, 95, 99).
+    - chunk_size (int, opcional): Amostras por bloco. Default é 100000.
+    - workers (int, opcional): Número de processos. Com 1, os blocos são avaliados no próprio processo. Default é 1.
+    - seed (int ou numpy.random.SeedSequence, opcional): Semente. Default é None (não reprodutível).
+    - resolution (float, opcional): Largura relativa dos bins do histograma. Default é 1e-4.
+
+    Retorna:
+    dict: Por fase, um dict com "P50", "P95", "P99" (ou os percentis pedidos), "MEAN", "MIN", "MAX" (m), "SAMPLES" e
+    "INVALID" (amostras com distância não definida).
+    """
+
+    for phase in phases:
+        if phase not in PHASE_VARIABLES:
+            raise ValueError(f"phases must be in {DISPERSION_PHASES}")
+        missing = [name for name in PHASE_VARIABLES[phase] if name not in distributions and
+                   name not in DEFAULT_DISTRIBUTIONS]
+        if missing:
+            raise ValueError(f"Missing distributions for {phase}: {', '.join(missing)}")
+
+    distributions = dict(DEFAULT_DISTRIBUTIONS, **distributions)
+
+    seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    n_chunks = max(1, int(math.ceil(n_samples / chunk_size)))
+
+    tasks = ((aircraft_parameters, distributions, tuple(phases), child, min(chunk_size, n_samples - i * chunk_size),
+              resolution)
+             for i, child in enumerate(seed_sequence.spawn(n_chunks)))
+
+    histograms = {phase: DistanceHistogram(resolution=resolution) for phase in phases}
+
+    def merge(chunk_histograms):
+        for phase, histogram in chunk_histograms.items():
+            histograms[phase].merge(histogram)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_histograms in executor.map(_run_chunk, tasks):
+                merge(chunk_histograms)
+    else:
+        for task in tasks:
+            merge(_run_chunk(task))
+
+    logger.debug("Dispersion: %d samples in %d chunks, %d worker(s)", n_samples, n_chunks, workers)
+
+    return {phase: histogram.summary(percentiles=percentiles) for phase, histogram in histograms.items()}
+
+
+def run_airports_dispersion(aircraft_parameters, airports, distributions, seed=None, **kwargs):
+
+    """
+    run_dispersion para cada aeroporto, com ALTITUDE igual à elevação do aeroporto.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave.
+    - airports (list): Aeroportos (dicts com 'iata' e 'elevacao' em metros, como em Repository.get_airport).
+    - distributions (dict): Distribuições comuns a todos os aeroportos.
+    - seed (int, opcional): Semente; cada aeroporto recebe uma semente derivada dela.
+    - kwargs: Demais argumentos de run_dispersion.
+
+    Retorna:
+    dict: Resultado de run_dispersion por código IATA.
+    """
+
+    seeds = np.random.SeedSequence(seed).spawn(len(airports))
+
+    return {
+        airport['iata']: run_dispersion(aircraft_parameters=aircraft_parameters,
+                                        distributions=dict(distributions,
+                                                           ALTITUDE=("CONSTANT", float(airport['elevacao']))),
+                                        seed=airport_seed, **kwargs)
+        for airport, airport_seed in zip(airports, seeds)
+    }
@@ -0,0 +1,137 @@
+"""
+Matrizes de distâncias Haversine entre aeroportos (origens x destinos).
+
+- get_distance_matrix calcula a matriz inteira em memória, ou a grava num arquivo .npy e a abre com numpy.memmap
+  (cache em disco reaproveitado enquanto as coordenadas e o dtype forem os mesmos).
+- iter_distance_matrix entrega a matriz em blocos de linhas, para catálogos grandes demais para caber na memória.
+"""
+
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import hashlib
+import numpy as np
+from .aero import Aero
+from .utils import get_logger
+
+aero = Aero()
+logger = get_logger(log_name="DISTANCE_MATRIX")
+
+
+def _coordinates(latitudes_1, longitudes_1, latitudes_2, longitudes_2):
+
+    latitudes_1 = np.asarray(latitudes_1, dtype=np.float64)
+    longitudes_1 = np.asarray(longitudes_1, dtype=np.float64)
+
+    if latitudes_2 is None or longitudes_2 is None:
+        return latitudes_1, longitudes_1, latitudes_1, longitudes_1
+
+    return latitudes_1, longitudes_1, np.asarray(latitudes_2, dtype=np.float64), np.asarray(longitudes_2, dtype=np.float64)
+
+
+def iter_distance_matrix(latitudes_1, longitudes_1, latitudes_2=None, longitudes_2=None, chunk_size=1024, dtype=np.float64):
+
+    """
+    Calcula a matriz de distâncias em blocos de linhas (origens), sem manter a matriz inteira na memória.
+
+    Parâmetros:
+    - latitudes_1 (array): Latitudes das origens em graus.
+    - longitudes_1 (array): Longitudes das origens em graus.
+    - latitudes_2 (array, opcional): Latitudes dos destinos em graus. Default são as próprias origens.
+    - longitudes_2 (array, opcional): Longitudes dos destinos em graus. Default são as próprias origens.
+    - chunk_size (int, opcional): Número de origens por bloco. Default é 1024.
+    - dtype (numpy.dtype, opcional): np.float32 ou np.float64. Default é np.float64.
+
+    Retorna:
+    generator: (índice da primeira origem do bloco, matriz (origens do bloco, destinos) de distâncias em metros).
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    latitudes_1, longitudes_1, latitudes_2, longitudes_2 = _coordinates(latitudes_1, longitudes_1, latitudes_2, longitudes_2)
+
+    for start in range(0, len(latitudes_1), chunk_size):
+        end = start + chunk_size
+        yield start, aero.get_haversine_distance_matrix(latitudes_1[start:end], longitudes_1[start:end],
+                                                        latitudes_2, longitudes_2, dtype=dtype)
+
+
+def get_distance_matrix(latitudes_1, longitudes_1, latitudes_2=None, longitudes_2=None, dtype=np.float64,
+                        cache_path=None, chunk_size=1024):
+
+    """
+    Retorna a matriz de distâncias origens x destinos, opcionalmente com cache em disco.
+
+    Com cache_path, a matriz é gravada em blocos num arquivo .npy e retornada como numpy.memmap somente leitura; as
+    chamadas seguintes com as mesmas coordenadas e o mesmo dtype apenas abrem o arquivo. Se as coordenadas mudarem, o
+    arquivo é recalculado.
+
+    Parâmetros:
+    - latitudes_1 (array): Latitudes das origens em graus.
+    - longitudes_1 (array): Longitudes das origens em graus.
+    - latitudes_2 (array, opcional): Latitudes dos destinos em graus. Default são as próprias origens.
+    - longitudes_2 (array, opcional): Longitudes dos destinos em graus. Default são as próprias origens.
+    - dtype (numpy.dtype, opcional): np.float32 ou np.float64. Default é np.float64.
+    - cache_path (str, opcional): Arquivo .npy do cache. Default é sem cache (matriz em memória).
+    - chunk_size (int, opcional): Número de origens calculadas por vez ao gravar o cache. Default é 1024.
+
+    Retorna:
+    numpy.ndarray: Matriz (número de origens, número de destinos) de distâncias em metros (m).
+    """
+
+    latitudes_1, longitudes_1, latitudes_2, longitudes_2 = _coordinates(latitudes_1, longitudes_1, latitudes_2, longitudes_2)
+
+    if cache_path is None:
+        return aero.get_haversine_distance_matrix(latitudes_1, longitudes_1, latitudes_2, longitudes_2, dtype=dtype)
+
+    dtype = np.dtype(dtype)
+    shape = (len(latitudes_1), len(latitudes_2))
+    key = _cache_key(latitudes_1, longitudes_1, latitudes_2, longitudes_2, dtype)
+    key_path = cache_path + ".key"
+
+    if os.path.exists(cache_path) and os.path.exists(key_path):
+
+        with open(key_path) as file:
+            cached_key = file.read().strip()
+
+        if cached_key == key:
+            matrix = np.load(cache_path, mmap_mode="r")
+            if matrix.shape == shape and matrix.dtype == dtype:
+                logger.debug("Distance matrix %s loaded from %s", shape, cache_path)
+                return matrix
+
+    if os.path.exists(key_path):
+        os.remove(key_path)
+
+    matrix = np.lib.format.open_memmap(cache_path, mode="w+", dtype=dtype, shape=shape)
+
+    for start, block in iter_distance_matrix(latitudes_1, longitudes_1, latitudes_2, longitudes_2,
+                                             chunk_size=chunk_size, dtype=dtype):
+        matrix[start:start + len(block)] = block
+
+    matrix.flush()
+    del matrix
+
+    # A chave é gravada por último: um cache interrompido no meio nunca é considerado válido
+    with open(key_path, "w") as file:
+        file.write(key)
+
+    logger.debug("Distance matrix %s written to %s", shape, cache_path)
+
+    return np.load(cache_path, mmap_mode="r")
+
+
+def _cache_key(latitudes_1, longitudes_1, latitudes_2, longitudes_2, dtype):
+
+    digest = hashlib.sha1(dtype.name.encode())
+
+    for coordinates in (latitudes_1, longitudes_1, latitudes_2, longitudes_2):
+        digest.update(np.ascontiguousarray(coordinates).tobytes())
+        digest.update(b"|")
+
+    return digest.hexdigest()
@@ -1,9 +1,9 @@
 import sys
 sys.path.append('functions')
-from functions.aero import Aero
-from functions.utils import default_graph_colors
+from .aero import Aero
+from .utils import default_graph_colors
 from numpy import linspace, arange
-import matplotlib.pyplot as plt
+import numpy as np
 import math
 
 
@@ -11,7 +11,7 @@ c = Aero()
 colors = default_graph_colors()
 
 
-def gliding_angle_rate_of_descent(aircraft_parameters, flight_parameters, altitude=None, W=None, V_gli=None, plot=False, display=False):
+def gliding_angle_rate_of_descent(aircraft_parameters, flight_parameters, altitude=None, W=None, V_gli=None, series=False, plot=False, display=False):
     """
     Calcula o ângulo de planeio e a taxa de descida para uma aeronave em voo de planeio numa altitude específica.
 
@@ -36,6 +36,7 @@ def gliding_angle_rate_of_descent(aircraft_parameters, flight_parameters, altitu
     - altitude (float, opcional): Altitude específica para calcular o ângulo de planagem e a taxa de descida (m).
     - W (float, opcional): Peso de decolagem a ser usado (N).
     - V_gli (float, opcional): Velocidade de planeio a ser usada (m/s).
+    - series (bool, opcional): Se True, inclui as curvas do ângulo de planeio e da taxa de descida por velocidade. Default é False.
     - plot (bool, opcional): Se True, plota os gráficos do ângulo de planeio e da taxa de descida. Default é False.
     - display (bool, opcional): Se True, exibe os gráficos se plot=True. Default é False.
 
@@ -43,6 +44,7 @@ def gliding_angle_rate_of_descent(aircraft_parameters, flight_parameters, altitu
     - dict: Dicionário contendo as seguintes informações:
         - 'GLIDING_ANGLE' (float): Ângulo de planeio calculado em graus.
         - 'GLIDING_RATE_OF_DESCENT' (float): Taxa de descida calculada em m/s.
+        - 'GLIDING_ANGLE_SERIES' (dict): Curvas por velocidade, uma por altitude, se series=True ou plot=True.
         - 'GLIDING_ANGLE_GRAPH' (matplotlib.figure.Figure): Figura do gráfico do ângulo de planeio, se plot=True, se não None.
         - 'RATE_OF_DESCENT_GRAPH' (matplotlib.figure.Figure): Figura do gráfico da taxa de descida, se plot=True, se não None.
     """
@@ -77,66 +79,223 @@ def gliding_angle_rate_of_descent(aircraft_parameters, flight_parameters, altitu
 
     gliding_angle_cru, rate_of_descent_cru = get_gliding_angle_rate_of_descent(V_i=V_gli, sigma=sigma)
 
-    if plot is True:
+    result = {
+        "GLIDING_ANGLE": round(math.degrees(gliding_angle_cru), 2),
+        "GLIDING_RATE_OF_DESCENT": round(rate_of_descent_cru, 2),
+        "GLIDING_ANGLE_GRAPH": None,
+        "RATE_OF_DESCENT_GRAPH": None
+    }
+
+    if series is True or plot is True:
 
         velocity_range = linspace(0.5 * V_gli, 3 * V_gli, 25)
         altitude_values = linspace(0.2 * altitude_cru, altitude_cru, 5)
 
-        fig_rate_of_descent, ax_rate_of_descent = plt.subplots(figsize=(6, 5))
-        fig_gliding_angle, ax_gliding_angle = plt.subplots(figsize=(6, 5))
+        envelope = calc_gliding_envelope(aircraft_parameters=aircraft_parameters, W=W, altitudes=altitude_values,
+                                         velocities=velocity_range)
 
-        for altitude_i in altitude_values:
+        gliding_angle_lists = envelope['GLIDING_ANGLE'].tolist()
+        rate_of_descent_lists = (-1 * envelope['RATE_OF_DESCENT']).tolist()
 
-            sigma_i = c.get_sigma(altitude=altitude_i)
-            gliding_angle_list = []
-            rate_of_descent_list = []
+        result["GLIDING_ANGLE_SERIES"] = {
+            "VELOCITY": velocity_range,
+            "ALTITUDE": altitude_values,
+            "GLIDING_ANGLE": gliding_angle_lists,
+            "RATE_OF_DESCENT": rate_of_descent_lists,
+            "GLIDING_VELOCITY": V_gli
+        }
 
-            for V_i in velocity_range:
-                gliding_angle_i, rate_of_descent_i = get_gliding_angle_rate_of_descent(V_i=V_i, sigma=sigma_i)
-                gliding_angle_list.append(math.degrees(gliding_angle_i))
-                rate_of_descent_list.append(-1 * rate_of_descent_i)
+    if plot is True:
+        result["GLIDING_ANGLE_GRAPH"], result["RATE_OF_DESCENT_GRAPH"] = plot_gliding_angle_rate_of_descent(
+            result=result, display=display)
 
-            ax_gliding_angle.plot(velocity_range, gliding_angle_list, label=f"Altitude: {altitude_i / 1000:.2f} km")
-            ax_rate_of_descent.plot(velocity_range, rate_of_descent_list, label=f"Altitude: {altitude_i / 1000:.2f} km")
+    return result
 
-        ax_gliding_angle.set_xlabel("Velocity [m/s]", fontsize=14)
-        ax_gliding_angle.set_ylabel('Gliding Angle [º]', color="black", fontsize=14)
 
-        ax_rate_of_descent.set_xlabel("Velocity [m/s]", fontsize=14)
-        ax_rate_of_descent.set_ylabel('Rate of Descent [m/s]', color="black", fontsize=14)
+def calc_gliding_envelope(aircraft_parameters, W, altitudes, velocities):
+    """
+    Calcula o ângulo de planeio e a taxa de descida numa grade altitude x velocidade, por broadcasting, com as mesmas
+    equações de gliding_angle_rate_of_descent, e os pontos de melhor planeio e de menor taxa de descida em cada altitude.
 
-        ax_rate_of_descent.axvline(V_gli, c=colors['dark_green'], label="Descending Velocity", ls="-.")
-        ax_rate_of_descent.legend(loc=0)
+    Parâmetros:
+    - aircraft_parameters (dict): Dicionário contendo 'CD0', 'S' e 'K'. Os valores podem ser arrays (uma aeronave por
+      posição, ex.: formato (N,)); as altitudes e as velocidades são acrescentadas como os dois últimos eixos.
+    - W (float ou array): Peso da aeronave (N), com o mesmo formato dos parâmetros (ou broadcast com eles).
+    - altitudes (array_like): Altitudes da grade (m), uma dimensão.
+    - velocities (array_like): Velocidades da grade (m/s), uma dimensão.
 
-        ax_gliding_angle.axvline(V_gli, c=colors['dark_green'], label="Descending Velocity", ls="-.")
-        ax_gliding_angle.legend(loc=0)
+    Retorna:
+    - dict: Dicionário contendo:
+        - 'ALTITUDE' (numpy.ndarray): Altitudes da grade (m).
+        - 'VELOCITY' (numpy.ndarray): Velocidades da grade (m/s).
+        - 'GLIDING_ANGLE' (numpy.ndarray): Ângulo de planeio (graus, negativo), formato (..., altitudes, velocidades).
+        - 'RATE_OF_DESCENT' (numpy.ndarray): Taxa de descida (m/s, positiva), formato (..., altitudes, velocidades).
+        - 'BEST_GLIDE_VELOCITY', 'BEST_GLIDE_ANGLE', 'BEST_GLIDE_RATE_OF_DESCENT' (numpy.ndarray): Velocidade de
+          arrasto mínimo (menor ângulo), com o ângulo e a taxa de descida correspondentes, formato (..., altitudes).
+        - 'MINIMUM_SINK_VELOCITY', 'MINIMUM_SINK_ANGLE', 'MINIMUM_SINK_RATE_OF_DESCENT' (numpy.ndarray): Velocidade
+          de menor taxa de descida (V_md / 3^0.25), com o ângulo e a taxa de descida correspondentes, formato
+          (..., altitudes).
+    """
 
-        ax_gliding_angle.set_title("Gliding angle")
-        ax_gliding_angle.grid()
+    altitudes = np.asarray(altitudes, dtype=float).ravel()
+    velocities = np.asarray(velocities, dtype=float).ravel()
 
-        ax_rate_of_descent.grid()
-        ax_rate_of_descent.set_title("Rate of Descent")
+    CD0 = np.asarray(aircraft_parameters['CD0'], dtype=float)
+    S = np.asarray(aircraft_parameters['S'], dtype=float)
+    K = np.asarray(aircraft_parameters['K'], dtype=float)
+    W = np.asarray(W, dtype=float)
 
-        ax_rate_of_descent.yaxis.set_ticks(arange(ax_rate_of_descent.get_ylim()[0], ax_rate_of_descent.get_ylim()[1], 4))
-        ax_gliding_angle.yaxis.set_ticks(arange(ax_gliding_angle.get_ylim()[0], ax_gliding_angle.get_ylim()[1], 5))
-        plt.tight_layout()
+    rho = c.rho_0 * c.get_sigma(altitude=altitudes)
 
-        if display is True:
-            plt.show()
-        else:
-            pass
+    def get_gliding_angle_rate_of_descent(V_i, rho_i, n_axes):
 
-    result = {
-        "GLIDING_ANGLE": round(math.degrees(gliding_angle_cru), 2),
-        "GLIDING_RATE_OF_DESCENT": round(rate_of_descent_cru, 2),
-        "GLIDING_ANGLE_GRAPH": fig_gliding_angle if plot is True else None,
-        "RATE_OF_DESCENT_GRAPH": fig_rate_of_descent if plot is True else None
+        # Os parâmetros da frota ocupam os primeiros eixos; altitudes e velocidades, os n_axes últimos
+        CD0_i, S_i, K_i, W_i = (value[(Ellipsis,) + (np.newaxis,) * n_axes] for value in (CD0, S, K, W))
+
+        part_1 = (rho_i * V_i ** 2 * CD0_i) / (2 * W_i / S_i)
+        part_2 = (2 * K_i * (W_i / S_i)) / (rho_i * V_i ** 2)
+        gliding_angle = -1 * (part_1 + part_2)
+
+        return np.degrees(gliding_angle), -1 * V_i * gliding_angle
+
+    gliding_angle, rate_of_descent = get_gliding_angle_rate_of_descent(V_i=velocities, rho_i=rho[:, np.newaxis],
+                                                                       n_axes=2)
+
+    # Melhor planeio: arrasto mínimo (part_1 = part_2); menor taxa de descida: d(V * (part_1 + part_2))/dV = 0
+    W_S = (W / S)[..., np.newaxis]
+    best_glide_velocity = np.sqrt((2 * W_S) / rho) * ((K / CD0) ** 0.25)[..., np.newaxis]
+    minimum_sink_velocity = best_glide_velocity / 3 ** 0.25
+
+    best_glide_angle, best_glide_rate_of_descent = get_gliding_angle_rate_of_descent(V_i=best_glide_velocity,
+                                                                                     rho_i=rho, n_axes=1)
+    minimum_sink_angle, minimum_sink_rate_of_descent = get_gliding_angle_rate_of_descent(V_i=minimum_sink_velocity,
+                                                                                         rho_i=rho, n_axes=1)
+
+    return {
+        "ALTITUDE": altitudes,
+        "VELOCITY": velocities,
+        "GLIDING_ANGLE": gliding_angle,
+        "RATE_OF_DESCENT": rate_of_descent,
+        "BEST_GLIDE_VELOCITY": best_glide_velocity,
+        "BEST_GLIDE_ANGLE": best_glide_angle,
+        "BEST_GLIDE_RATE_OF_DESCENT": best_glide_rate_of_descent,
+        "MINIMUM_SINK_VELOCITY": minimum_sink_velocity,
+        "MINIMUM_SINK_ANGLE": minimum_sink_angle,
+        "MINIMUM_SINK_RATE_OF_DESCENT": minimum_sink_rate_of_descent
     }
 
-    return result
 
+def plot_gliding_angle_rate_of_descent(result, display=False):
+    """
+    Gera os gráficos do ângulo de planeio e da taxa de descida por velocidade, com uma curva por altitude.
+
+    Parâmetros:
+    - result (dict): Resultado de gliding_angle_rate_of_descent com series=True.
+    - display (bool, opcional): Se True, exibe os gráficos. Default é False.
+
+    Retorna:
+    - tuple: (figura do ângulo de planeio, figura da taxa de descida).
+    """
+
+    import matplotlib.pyplot as plt
+
+    fig_rate_of_descent = plot_rate_of_descent(result=result)
+    fig_gliding_angle = plot_gliding_angle(result=result)
+
+    fig_rate_of_descent.tight_layout()
+    fig_gliding_angle.tight_layout()
+
+    if display is True:
+        plt.show()
+
+    return fig_gliding_angle, fig_rate_of_descent
+
+
+def plot_gliding_angle(result, display=False, ax=None):
+    """
+    Gera o gráfico do ângulo de planeio por velocidade, com uma curva por altitude.
+
+    Parâmetros:
+    - result (dict): Resultado de gliding_angle_rate_of_descent com series=True.
+    - display (bool, opcional): Se True, exibe o gráfico. Default é False.
+    - ax (matplotlib.axes.Axes, opcional): Eixo onde desenhar o gráfico. Se None, cria uma figura nova.
+
+    Retorna:
+    - matplotlib.figure.Figure: Figura do gráfico.
+    """
+
+    import matplotlib.pyplot as plt
+
+    curves = result['GLIDING_ANGLE_SERIES']
 
-def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gli=None, graph_V=False, graph_CL=False, display=False):
+    if ax is None:
+        fig_gliding_angle, ax = plt.subplots(figsize=(6, 5))
+    else:
+        fig_gliding_angle = ax.figure
+
+    for altitude_i, gliding_angle_list in zip(curves['ALTITUDE'], curves['GLIDING_ANGLE']):
+        ax.plot(curves['VELOCITY'], gliding_angle_list, label=f"Altitude: {altitude_i / 1000:.2f} km")
+
+    ax.set_xlabel("Velocity [m/s]", fontsize=14)
+    ax.set_ylabel('Gliding Angle [º]', color="black", fontsize=14)
+
+    ax.axvline(curves['GLIDING_VELOCITY'], c=colors['dark_green'], label="Descending Velocity", ls="-.")
+    ax.legend(loc=0)
+
+    ax.set_title("Gliding angle")
+    ax.grid()
+
+    ax.yaxis.set_ticks(arange(ax.get_ylim()[0], ax.get_ylim()[1], 5))
+
+    if display is True:
+        plt.show()
+
+    return fig_gliding_angle
+
+
+def plot_rate_of_descent(result, display=False, ax=None):
+    """
+    Gera o gráfico da taxa de descida por velocidade, com uma curva por altitude.
+
+    Parâmetros:
+    - result (dict): Resultado de gliding_angle_rate_of_descent com series=True.
+    - display (bool, opcional): Se True, exibe o gráfico. Default é False.
+    - ax (matplotlib.axes.Axes, opcional): Eixo onde desenhar o gráfico. Se None, cria uma figura nova.
+
+    Retorna:
+    - matplotlib.figure.Figure: Figura do gráfico.
+    """
+
+    import matplotlib.pyplot as plt
+
+    curves = result['GLIDING_ANGLE_SERIES']
+
+    if ax is None:
+        fig_rate_of_descent, ax = plt.subplots(figsize=(6, 5))
+    else:
+        fig_rate_of_descent = ax.figure
+
+    for altitude_i, rate_of_descent_list in zip(curves['ALTITUDE'], curves['RATE_OF_DESCENT']):
+        ax.plot(curves['VELOCITY'], rate_of_descent_list, label=f"Altitude: {altitude_i / 1000:.2f} km")
+
+    ax.set_xlabel("Velocity [m/s]", fontsize=14)
+    ax.set_ylabel('Rate of Descent [m/s]', color="black", fontsize=14)
+
+    ax.axvline(curves['GLIDING_VELOCITY'], c=colors['dark_green'], label="Descending Velocity", ls="-.")
+    ax.legend(loc=0)
+
+    ax.grid()
+    ax.set_title("Rate of Descent")
+
+    ax.yaxis.set_ticks(arange(ax.get_ylim()[0], ax.get_ylim()[1], 4))
+
+    if display is True:
+        plt.show()
+
+    return fig_rate_of_descent
+
+
+def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gli=None, series=False, graph_V=False, graph_CL=False, display=False):
 
     """
     Calcula o alcance e a autonomia de planeio para uma aeronave em voo de planeio com várias condições de velocidade ou coeficiente de sustentação.
@@ -156,6 +315,7 @@ def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gl
         - 'GLIDING_VELOCITY' (float): Velocidade de planeio (m/s).
     - W (float, opcional): Peso de decolagem a ser usado (N).
     - V_gli (float, opcional): Velocidade de planeio a ser usada (m/s).
+    - series (bool, opcional): Se True, inclui as curvas de alcance e autonomia por CL e por velocidade. Default é False.
     - graph_V (bool, opcional): Se True, plota os gráficos de velocidade. Default é False.
     - graph_CL (bool, opcional): Se True, plota os gráficos de coeficiente de sustentação. Default é False.
     - display (bool, opcional): Se True, exibe os gráficos se plot=True. Default é False.
@@ -169,6 +329,7 @@ def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gl
             - 'GLIDING_ENDURANCE_MAX_RANGE_CONSTANT_LIFT_MAX' (float): Autonomia de planeio máxima para alcance máximo calculada (s).
             - 'GLIDING_MAX_ENDURANCE_CONSTANT_LIFT' (float): Autonomia máxima de planeio para sustentação constante calculada (s).
             - 'GLIDING_RANGE_MAX_ENDURANCE_CONSTANT_LIFT' (float): Alcance máximo de planeio para autonomia máxima calculado (m).
+            - 'GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_SERIES' (dict): Curvas por CL, se series=True ou graph_CL=True.
             - 'GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_GRAPH' (matplotlib.figure.Figure): Figura do gráfico se graph_CL=True, se não None.
         - 'GLIDING_CONSTANT_AIRSPEED' (dict): Resultados para condição de velocidade constante.
             - 'GLIDING_RANGE_CONSTANT_AIRSPEED_STANDARD' (float): Alcance de planeio padrão calculado (m).
@@ -177,6 +338,7 @@ def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gl
             - 'GLIDING_ENDURANCE_MAX_RANGE_CONSTANT_AIRSPEED' (float): Autonomia de planeio máxima para alcance máximo calculada (s).
             - 'GLIDING_RANGE_MAX_ENDURANCE_CONSTANT_AIRSPEED' (float): Alcance máximo de planeio para autonomia máxima calculado (m).
             - 'GLIDING_MAX_ENDURANCE_CONSTANT_AIRSPEED' (float): Autonomia máxima de planeio para velocidade constante calculada (s).
+            - 'GLIDING_RANGE_ENDURANCE_CONSTANT_AIRSPEED_SERIES' (dict): Curvas por velocidade, se series=True ou graph_V=True.
             - 'GLIDING_RANGE_ENDURANCE_CONSTANT_AIRSPEED_GRAPH' (matplotlib.figure.Figure): Figura do gráfico se graph_V=True, se não None.
     """
 
@@ -238,7 +400,21 @@ def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gl
         x_cl_max_endurance = get_x_cl(E_i=E_max_endurance)  # Alcance máximo da autonomia máxima
 
 
-        if graph_CL is True:
+        result = {
+            "GLIDING_RANGE_CONSTANT_LIFT_STANDARD": round(x_cl_st, 2),
+            "GLIDING_ENDURANCE_CONSTANT_LIFT_STANDARD": round(t_cl_st, 2),
+
+            "GLIDING_MAX_RANGE_CONSTANT_LIFT": round(x_cl_max_range, 2),
+            "GLIDING_ENDURANCE_MAX_RANGE_CONSTANT_LIFT_MAX": round(t_cl_max_range, 2),
+
+            "GLIDING_MAX_ENDURANCE_CONSTANT_LIFT": round(t_cl_max_endurance, 2),
+            "GLIDING_RANGE_MAX_ENDURANCE_CONSTANT_LIFT": round(x_cl_max_endurance, 2),
+
+            "GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_GRAPH": None
+
+        }
+
+        if series is True or graph_CL is True:
 
             CL_i_list = linspace(0.1 * min(CL_max, CL_max_range_cond, CL_max_endurance_cond), 1.2 * max(CL_max, CL_max_range_cond, CL_max_endurance_cond), 20)
             x_cl_i_list, t_cl_i_list = [], []
@@ -254,52 +430,23 @@ def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gl
                 x_cl_i_list.append(x_cl_i)
                 t_cl_i_list.append(t_cl_i)
 
-            fig_cl_constant, ax_cl_constant = plt.subplots(figsize=(6, 5))
+            result["GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_SERIES"] = {
+                "LIFT_COEFFICIENT": CL_i_list,
+                "RANGE": x_cl_i_list,
+                "ENDURANCE": t_cl_i_list,
+                "CL_MAX": CL_max,
+                "CL_MAX_RANGE": CL_max_range_cond,
+                "MAX_RANGE": x_cl_max_range,
+                "CL_MAX_ENDURANCE": CL_max_endurance_cond,
+                "MAX_ENDURANCE": t_cl_max_endurance,
+                "INITIAL_ALTITUDE": altitude_inicial,
+                "FINAL_ALTITUDE": altitude_final
+            }
 
-            fig1 = ax_cl_constant.plot(CL_i_list, [t/3600 for t in t_cl_i_list], c=colors['blue'], label="Endurance", ls='--')
-            ax_cl_constant.set_xlabel("Lit Coefficient [-]", fontsize=14)
-            ax_cl_constant.set_ylabel('Time [h]', color="black", fontsize=14)
-
-            fig2 = ax_cl_constant.axvline(CL_max, c=colors['dark_green'], label="CLmax", ls="-.")
-
-            fig7 = ax_cl_constant.scatter(CL_max_endurance_cond, t_cl_max_endurance / 3600,
-                                          label=f"Maximum Endurance = {round(t_cl_max_endurance / 3600, 2)}", marker='v', color=colors['red'], s=50)
-
-            ax2 = ax_cl_constant.twinx()
-            fig3 = ax2.plot(CL_i_list, [x/1000 for x in x_cl_i_list], c='black', label="Range")
-            ax2.set_ylabel('Range [km]', color="black", fontsize=14)
-
-            fig4 = ax_cl_constant.scatter(CL_i_list[-1], t_cl_i_list[-1] / 2500, alpha=0)
-            fig5 = ax2.scatter(CL_max_range_cond, x_cl_max_range / 1000,
-                               label=f"Maximum Range = {round(x_cl_max_range / 1000, 2)}", marker ='<', color=colors['green'], s=50)
-
-
-            lines, labels = ax_cl_constant.get_legend_handles_labels()
-            lines2, labels2 = ax2.get_legend_handles_labels()
-            ax2.legend(lines + lines2, labels + labels2, loc=0)
-
-            plt.title(f"Range & Endurance per Lift Coefficient\nfrom h2 = {altitude_inicial / 1000} [km] to h1 = {altitude_final / 1000} [km]", fontsize = 12)
-            plt.tight_layout()
-            ax_cl_constant.grid()
-
-            if display is True:
-                plt.show()
-            else:
-                pass
-
-        result = {
-            "GLIDING_RANGE_CONSTANT_LIFT_STANDARD": round(x_cl_st, 2),
-            "GLIDING_ENDURANCE_CONSTANT_LIFT_STANDARD": round(t_cl_st, 2),
-
-            "GLIDING_MAX_RANGE_CONSTANT_LIFT": round(x_cl_max_range, 2),
-            "GLIDING_ENDURANCE_MAX_RANGE_CONSTANT_LIFT_MAX": round(t_cl_max_range, 2),
-
-            "GLIDING_MAX_ENDURANCE_CONSTANT_LIFT": round(t_cl_max_endurance, 2),
-            "GLIDING_RANGE_MAX_ENDURANCE_CONSTANT_LIFT": round(x_cl_max_endurance, 2),
-
-            "GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_GRAPH": fig_cl_constant if graph_CL is True else None
+        if graph_CL is True:
+            result["GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_GRAPH"] = plot_gliding_range_endurance_constant_lift(
+                result=result, display=display)
 
-        }
         return result
 
     def gliding_range_endurance_constant_airspeed():
@@ -351,7 +498,21 @@ def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gl
         t_v_max_endurance = x_v_max_endurance / V_max_endurance  # Ou get_t_v(CD0_i=CD0, V_i=V_max_endurance)
 
 
-        if graph_V is True:
+        result = {
+            "GLIDING_RANGE_CONSTANT_AIRSPEED_STANDARD": round(x_v_st, 2),
+            "GLIDING_ENDURANCE_CONSTANT_AIRSPEED_STANDARD": round(t_v_st, 2),
+
+            "GLIDING_MAX_RANGE_CONSTANT_AIRSPEED": round(x_v_max_range, 2),
+            "GLIDING_ENDURANCE_MAX_RANGE_CONSTANT_AIRSPEED": round(t_v_max_range, 2),
+
+            "GLIDING_RANGE_MAX_ENDURANCE_CONSTANT_AIRSPEED": round(x_v_max_endurance, 2),
+            "GLIDING_MAX_ENDURANCE_CONSTANT_AIRSPEED": round(t_v_max_endurance, 2),
+
+            "GLIDING_RANGE_ENDURANCE_CONSTANT_AIRSPEED_GRAPH": None
+
+        }
+
+        if series is True or graph_V is True:
             V_i_list, x_v_i_list, t_v_i_list = [], [], []
 
             for V_i in linspace(0.1 * min(V_gli, V_max_endurance, V_max_range), 1.2 * max(V_gli, V_max_endurance, V_max_range), 100):
@@ -364,65 +525,153 @@ def gliding_range_endurance(aircraft_parameters, flight_parameters, W=None, V_gl
                 x_v_i_list.append(x_v_i)
                 t_v_i_list.append(t_v_i)
 
-            fig_v_constant, ax_v_constant = plt.subplots(figsize=(6, 5))
+            result["GLIDING_RANGE_ENDURANCE_CONSTANT_AIRSPEED_SERIES"] = {
+                "VELOCITY": V_i_list,
+                "RANGE": x_v_i_list,
+                "ENDURANCE": t_v_i_list,
+                "GLIDING_VELOCITY": V_gli,
+                "VELOCITY_MAX_RANGE": V_max_range,
+                "MAX_RANGE": x_v_max_range,
+                "VELOCITY_MAX_ENDURANCE": V_max_endurance,
+                "MAX_ENDURANCE": t_v_max_endurance,
+                "INITIAL_ALTITUDE": altitude_inicial,
+                "FINAL_ALTITUDE": altitude_final
+            }
 
-            fig1 = ax_v_constant.plot(V_i_list, [t/3600 for t in t_v_i_list], c=colors['blue'], label="Endurance", ls='--')
-            ax_v_constant.set_xlabel("Velocity (m/s)", fontsize=14)
-            ax_v_constant.set_ylabel('Time [h]', color="black", fontsize=14)
+        if graph_V is True:
+            result["GLIDING_RANGE_ENDURANCE_CONSTANT_AIRSPEED_GRAPH"] = plot_gliding_range_endurance_constant_airspeed(
+                result=result, display=display)
 
-            fig2 = ax_v_constant.axvline(V_gli, c=colors["dark_green"], label="Gliding Velocity", ls = "-.")
-            # fig6 = ax_v_constant.scatter(V_max_range, t_v_max_range / 3600, label="Endurance of the maximum range", marker='<', color=colors['green'],s=50)
+        return result
 
-            fig7 = ax_v_constant.scatter(V_max_endurance, t_v_max_endurance / 3600,
-                                         label=f"Maximum Endurance = {round(t_v_max_endurance / 3600, 2)}", marker='^', color=colors['red'], s=50)
+    results_gliding_range_endurance = {
+        "GLIDING_CONSTANT_LIFT": gliding_range_endurance_constant_lift(),
+        "GLIDING_CONSTANT_AIRSPEED": gliding_range_endurance_constant_airspeed(),
+    }
 
-            ax2 = ax_v_constant.twinx()
-            fig3 = ax2.plot(V_i_list, [x/1000 for x in x_v_i_list], c='black', label="Range")
-            ax2.set_ylabel('Range [km]', color="black", fontsize=14)
+    return results_gliding_range_endurance
 
-            fig4 = ax_v_constant.scatter(V_i_list[-1], t_v_i_list[-1] / 2500, alpha=0)
 
-            fig5 = ax2.scatter(V_max_range, x_v_max_range / 1000,
-                               label=f"Maximum Range = {round(x_v_max_range / 1000, 2)}", marker='>', color=colors['green'], s=50)
+def plot_gliding_range_endurance_constant_lift(result, display=False, ax=None):
+    """
+    Gera o gráfico de alcance e autonomia de planeio por coeficiente de sustentação.
 
-            # fig8 = ax2.scatter(V_max_endurance, x_v_max_endurance / 1000, label="Range of the maximum endurance", marker='v', color=colors['red'], s=50)
+    Parâmetros:
+    - result (dict): Resultado 'GLIDING_CONSTANT_LIFT' de gliding_range_endurance com series=True.
+    - display (bool, opcional): Se True, exibe o gráfico. Default é False.
+    - ax (matplotlib.axes.Axes, opcional): Eixo onde desenhar o gráfico. Se None, cria uma figura nova.
 
-            lines, labels = ax_v_constant.get_legend_handles_labels()
-            lines2, labels2 = ax2.get_legend_handles_labels()
-            ax2.legend(lines + lines2, labels + labels2, loc=0)
+    Retorna:
+    - matplotlib.figure.Figure: Figura do gráfico.
+    """
 
-            plt.title(f"Range & Endurance per Velocity \nfrom h2 = {altitude_inicial / 1000} [km] to h1 = {altitude_final / 1000} [km]", fontsize=12)
-            ax_v_constant.grid()
-            plt.tight_layout()
+    import matplotlib.pyplot as plt
 
-            if display is True:
-                plt.show()
-            else:
-                pass
+    curves = result['GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_SERIES']
+    CL_i_list = curves['LIFT_COEFFICIENT']
+    x_cl_i_list = curves['RANGE']
+    t_cl_i_list = curves['ENDURANCE']
+    t_cl_max_endurance = curves['MAX_ENDURANCE']
+    x_cl_max_range = curves['MAX_RANGE']
+    altitude_inicial = curves['INITIAL_ALTITUDE']
+    altitude_final = curves['FINAL_ALTITUDE']
 
+    if ax is None:
+        fig_cl_constant, ax_cl_constant = plt.subplots(figsize=(6, 5))
+    else:
+        fig_cl_constant, ax_cl_constant = ax.figure, ax
 
+    ax_cl_constant.plot(CL_i_list, [t/3600 for t in t_cl_i_list], c=colors['blue'], label="Endurance", ls='--')
+    ax_cl_constant.set_xlabel("Lit Coefficient [-]", fontsize=14)
+    ax_cl_constant.set_ylabel('Time [h]', color="black", fontsize=14)
 
-        result = {
-            "GLIDING_RANGE_CONSTANT_AIRSPEED_STANDARD": round(x_v_st, 2),
-            "GLIDING_ENDURANCE_CONSTANT_AIRSPEED_STANDARD": round(t_v_st, 2),
+    ax_cl_constant.axvline(curves['CL_MAX'], c=colors['dark_green'], label="CLmax", ls="-.")
 
-            "GLIDING_MAX_RANGE_CONSTANT_AIRSPEED": round(x_v_max_range, 2),
-            "GLIDING_ENDURANCE_MAX_RANGE_CONSTANT_AIRSPEED": round(t_v_max_range, 2),
+    ax_cl_constant.scatter(curves['CL_MAX_ENDURANCE'], t_cl_max_endurance / 3600,
+                           label=f"Maximum Endurance = {round(t_cl_max_endurance / 3600, 2)}", marker='v', color=colors['red'], s=50)
 
-            "GLIDING_RANGE_MAX_ENDURANCE_CONSTANT_AIRSPEED": round(x_v_max_endurance, 2),
-            "GLIDING_MAX_ENDURANCE_CONSTANT_AIRSPEED": round(t_v_max_endurance, 2),
+    ax2 = ax_cl_constant.twinx()
+    ax2.plot(CL_i_list, [x/1000 for x in x_cl_i_list], c='black', label="Range")
+    ax2.set_ylabel('Range [km]', color="black", fontsize=14)
 
-            "GLIDING_RANGE_ENDURANCE_CONSTANT_AIRSPEED_GRAPH": fig_v_constant if graph_V is True else None
+    ax_cl_constant.scatter(CL_i_list[-1], t_cl_i_list[-1] / 2500, alpha=0)
+    ax2.scatter(curves['CL_MAX_RANGE'], x_cl_max_range / 1000,
+                label=f"Maximum Range = {round(x_cl_max_range / 1000, 2)}", marker ='<', color=colors['green'], s=50)
 
-        }
+    lines, labels = ax_cl_constant.get_legend_handles_labels()
+    lines2, labels2 = ax2.get_legend_handles_labels()
+    ax2.legend(lines + lines2, labels + labels2, loc=0)
 
-        return result
+    ax2.set_title(f"Range & Endurance per Lift Coefficient\nfrom h2 = {altitude_inicial / 1000} [km] to h1 = {altitude_final / 1000} [km]", fontsize = 12)
+    ax_cl_constant.grid()
 
-    results_gliding_range_endurance = {
-        "GLIDING_CONSTANT_LIFT": gliding_range_endurance_constant_lift(),
-        "GLIDING_CONSTANT_AIRSPEED": gliding_range_endurance_constant_airspeed(),
-    }
+    if ax is None:
+        fig_cl_constant.tight_layout()
 
-    return results_gliding_range_endurance
+    if display is True:
+        plt.show()
+
+    return fig_cl_constant
+
+
+def plot_gliding_range_endurance_constant_airspeed(result, display=False, ax=None):
+    """
+    Gera o gráfico de alcance e autonomia de planeio por velocidade.
+
+    Parâmetros:
+    - result (dict): Resultado 'GLIDING_CONSTANT_AIRSPEED' de gliding_range_endurance com series=True.
+    - display (bool, opcional): Se True, exibe o gráfico. Default é False.
+    - ax (matplotlib.axes.Axes, opcional): Eixo onde desenhar o gráfico. Se None, cria uma figura nova.
+
+    Retorna:
+    - matplotlib.figure.Figure: Figura do gráfico.
+    """
+
+    import matplotlib.pyplot as plt
+
+    curves = result['GLIDING_RANGE_ENDURANCE_CONSTANT_AIRSPEED_SERIES']
+    V_i_list = curves['VELOCITY']
+    x_v_i_list = curves['RANGE']
+    t_v_i_list = curves['ENDURANCE']
+    t_v_max_endurance = curves['MAX_ENDURANCE']
+    x_v_max_range = curves['MAX_RANGE']
+    altitude_inicial = curves['INITIAL_ALTITUDE']
+    altitude_final = curves['FINAL_ALTITUDE']
+
+    if ax is None:
+        fig_v_constant, ax_v_constant = plt.subplots(figsize=(6, 5))
+    else:
+        fig_v_constant, ax_v_constant = ax.figure, ax
+
+    ax_v_constant.plot(V_i_list, [t/3600 for t in t_v_i_list], c=colors['blue'], label="Endurance", ls='--')
+    ax_v_constant.set_xlabel("Velocity (m/s)", fontsize=14)
+    ax_v_constant.set_ylabel('Time [h]', color="black", fontsize=14)
+
+    ax_v_constant.axvline(curves['GLIDING_VELOCITY'], c=colors["dark_green"], label="Gliding Velocity", ls = "-.")
+
+    ax_v_constant.scatter(curves['VELOCITY_MAX_ENDURANCE'], t_v_max_endurance / 3600,
+                          label=f"Maximum Endurance = {round(t_v_max_endurance / 3600, 2)}", marker='^', color=colors['red'], s=50)
+
+    ax2 = ax_v_constant.twinx()
+    ax2.plot(V_i_list, [x/1000 for x in x_v_i_list], c='black', label="Range")
+    ax2.set_ylabel('Range [km]', color="black", fontsize=14)
+
+    ax_v_constant.scatter(V_i_list[-1], t_v_i_list[-1] / 2500, alpha=0)
+
+    ax2.scatter(curves['VELOCITY_MAX_RANGE'], x_v_max_range / 1000,
+                label=f"Maximum Range = {round(x_v_max_range / 1000, 2)}", marker='>', color=colors['green'], s=50)
+
+    lines, labels = ax_v_constant.get_legend_handles_labels()
+    lines2, labels2 = ax2.get_legend_handles_labels()
+    ax2.legend(lines + lines2, labels + labels2, loc=0)
+
+    ax2.set_title(f"Range & Endurance per Velocity \nfrom h2 = {altitude_inicial / 1000} [km] to h1 = {altitude_final / 1000} [km]", fontsize=12)
+    ax_v_constant.grid()
+
+    if ax is None:
+        fig_v_constant.tight_layout()
 
+    if display is True:
+        plt.show()
 
+    return fig_v_constant
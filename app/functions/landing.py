@@ -5,10 +5,11 @@ current_dir = os.path.dirname(os.path.realpath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
-from functions.aero import Aero
+from .aero import Aero
 import math
-from pandas import DataFrame
+from pandas import DataFrame, Index
 from numpy import linspace
+import numpy as np
 
 aero = Aero()
 
@@ -17,6 +18,31 @@ aero = Aero()
 # -------------------------------------------------------------------------------------------------------------------- #
 
 
+LANDING_DISTANCE_KEYS = ("LANDING_DISTANCE", "LANDING_APPROACH_DISTANCE", "LANDING_ROTATION_DISTANCE",
+                         "LANDING_ROLL_DISTANCE", "LANDING_FLARE_DISTANCE")
+
+LANDING_TIME_KEYS = ("LANDING_TIME", "LANDING_APPROACH_TIME", "LANDING_ROTATION_TIME", "LANDING_ROLL_TIME",
+                     "LANDING_FLARE_TIME")
+
+
+def _calc_single_landing(aircraft_parameters, flight_parameters, altitude=None):
+
+    landing_parameters = flight_parameters['landing_parameters']
+
+    NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
+    FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
+    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
+    OEW = aircraft_parameters['OEW']
+
+    TOW = float(NP * aero.person_weight + OEW + FW + CW)
+
+    return calc_landing_batch(aircraft_parameters=aircraft_parameters,
+                              W_landing=TOW - 0.95 * FW,
+                              altitude=landing_parameters['ALTITUDE_LANDING'] if altitude is None else altitude,
+                              mu=landing_parameters['MU_LANDING'],
+                              V_wind=landing_parameters['WIND_VELOCITY_LANDING'])
+
+
 def calc_total_landing_distance(aircraft_parameters: dict, flight_parameters: dict, altitude=None):
 
     """
@@ -46,51 +72,10 @@ def calc_total_landing_distance(aircraft_parameters: dict, flight_parameters: di
         - 'LANDING_FLARE_DISTANCE' (float): Distância de flare durante o pouso (m).
     """
 
-    gamma_Ap = aero.gamma_Ap
-    V_wind = flight_parameters['landing_parameters']['WIND_VELOCITY_LANDING']
-
-    S  = aircraft_parameters['S']
-    altitude = flight_parameters['landing_parameters']['ALTITUDE_LANDING'] if altitude is None else altitude
-    mu = flight_parameters['landing_parameters']['MU_LANDING']
-    CL_max = aircraft_parameters['CL_MAX']
-    rho = aero.get_density(altitude=altitude)
-
-    NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
-    FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
-    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
-    OEW = aircraft_parameters['OEW']
-
-    TOW = float(NP * aero.person_weight + OEW + FW + CW)
-
-    W_ap = TOW - 0.95 * FW
-
-    V_S_Ap = math.sqrt((2 * W_ap / S) / (rho * CL_max))  # 16.22 OJHA
-
-    V_Ap = 1.3 * V_S_Ap
-
-    R_f = (V_Ap ** 2) / (0.08 * aero.g)
-    h_f = R_f * (1 - math.cos(gamma_Ap))
-
-    V_Td = 1.15 * V_S_Ap  # Página 382 - Secao 16.3.8
-
-    d_breaking = aero.medium_breaking_constant + mu / 2
-
-    x_ap = (aero.h_Sc - h_f) / math.tan(gamma_Ap)  # 16.21 OHJA
-    x_f = ((V_Ap ** 2)/(0.08 * aero.g)) * math.sin(gamma_Ap)  # 16.25 OHJA
-    x_R_La = 3 * V_Td  # 16.27 OHJA
-
-    x_g_La = ((V_Td ** 2)/d_breaking) * (1 + V_wind/V_Td)
-
-    x_la = x_ap + x_f + x_R_La + x_g_La
-
-    landing_distance_result = {
-        "LANDING_DISTANCE": x_la,
-        "LANDING_APPROACH_DISTANCE": x_ap,
-        "LANDING_ROTATION_DISTANCE": x_R_La,
-        "LANDING_ROLL_DISTANCE": x_g_La,
-        "LANDING_FLARE_DISTANCE": x_f}
+    result = _calc_single_landing(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                  altitude=altitude)
 
-    return landing_distance_result
+    return {key: float(result[key]) for key in LANDING_DISTANCE_KEYS}
 
 
 def calc_total_landing_time(aircraft_parameters: dict, flight_parameters: dict, altitude=None):
@@ -122,29 +107,47 @@ def calc_total_landing_time(aircraft_parameters: dict, flight_parameters: dict,
         - 'LANDING_FLARE_TIME' (float): Tempo de flare durante o pouso (s).
     """
 
-    gamma_Ap = aero.gamma_Ap
+    result = _calc_single_landing(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                  altitude=altitude)
 
-    V_wind = flight_parameters['landing_parameters']['WIND_VELOCITY_LANDING']
+    return {key: float(result[key]) for key in LANDING_TIME_KEYS}
 
-    S = aircraft_parameters['S']
-    altitude = flight_parameters['landing_parameters']['ALTITUDE_LANDING'] if altitude is None else altitude
-    mu = flight_parameters['landing_parameters']['MU_LANDING']
-    CL_max = aircraft_parameters['CL_MAX']
-    rho = aero.get_density(altitude=altitude)
 
-    NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
-    FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
-    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
-    OEW = aircraft_parameters['OEW']
+def calc_landing_batch(aircraft_parameters, W_landing, altitude, mu, V_wind=0):
 
-    TOW = float(NP * aero.person_weight + OEW + FW + CW)
+    """
+    Calcula todas as componentes de distância e de tempo de pouso para vários casos de uma só vez, numa única passagem
+    vetorizada. V_S_Ap, V_Ap, V_Td, R_f e h_f são calculados uma única vez e compartilhados entre distância e tempo.
+
+    É o único núcleo de cálculo do pouso: calc_total_landing_distance e calc_total_landing_time chamam esta função com
+    entradas escalares.
 
-    W_ap = TOW - 0.95 * FW
+    Parâmetros:
+    - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave ('S', 'CL_MAX'). Os valores podem ser
+      escalares ou arrays (uma aeronave por caso).
+    - W_landing (float ou array_like): Peso na aproximação (N).
+    - altitude (float ou array_like): Altitude do pouso (m).
+    - mu (float ou array_like): Coeficiente de atrito para o pouso.
+    - V_wind (float ou array_like, opcional): Velocidade do vento durante o pouso (m/s).
 
-    V_S_Ap = math.sqrt((2 * W_ap / S) / (rho * CL_max))  # 16.22 OJHA
+    Retorna:
+    - dict: Dicionário com arrays (no formato resultante do broadcast das entradas) contendo as mesmas chaves de
+      calc_total_landing_distance e calc_total_landing_time.
+    """
 
-    V_Ap = 1.3 * V_S_Ap
+    gamma_Ap = aero.gamma_Ap
 
+    W_ap = np.asarray(W_landing, dtype=float)
+    mu = np.asarray(mu, dtype=float)
+    V_wind = np.asarray(V_wind, dtype=float)
+
+    S = np.asarray(aircraft_parameters['S'], dtype=float)
+    CL_max = np.asarray(aircraft_parameters['CL_MAX'], dtype=float)
+    rho = aero.get_density(altitude=np.asarray(altitude, dtype=float))
+
+    V_S_Ap = np.sqrt((2 * W_ap / S) / (rho * CL_max))  # 16.22 OJHA
+
+    V_Ap = 1.3 * V_S_Ap
     V_Td = 1.15 * V_S_Ap  # Página 382 - Secao 16.3.8
 
     d_breaking = aero.medium_breaking_constant + mu / 2
@@ -152,30 +155,36 @@ def calc_total_landing_time(aircraft_parameters: dict, flight_parameters: dict,
     R_f = (V_Ap ** 2) / (0.08 * aero.g)
     h_f = R_f * (1 - math.cos(gamma_Ap))
 
-    x_ap = (aero.h_Sc - h_f) / math.tan(gamma_Ap)
+    x_ap = (aero.h_Sc - h_f) / math.tan(gamma_Ap)  # 16.21 OHJA
+    x_f = R_f * math.sin(gamma_Ap)  # 16.25 OHJA
+    x_R_La = 3 * V_Td  # 16.27 OHJA
+    x_g_La = ((V_Td ** 2) / d_breaking) * (1 + V_wind / V_Td)
 
     t_ap = x_ap / (V_Ap * math.cos(gamma_Ap))
     t_f = V_Ap * gamma_Ap / (0.08 * aero.g)  # 16.26 OJHA
-    t_R_La = 3
+    t_R_La = np.full(np.shape(x_R_La), 3.0)
     t_g_La = V_Td / d_breaking
 
-    t_la = t_ap + t_f + t_R_La + t_g_La
-
-    landing_time_result = {
-        "LANDING_TIME": t_la,
+    landing_result = {
+        "LANDING_DISTANCE": x_ap + x_f + x_R_La + x_g_La,
+        "LANDING_APPROACH_DISTANCE": x_ap,
+        "LANDING_ROTATION_DISTANCE": x_R_La,
+        "LANDING_ROLL_DISTANCE": x_g_La,
+        "LANDING_FLARE_DISTANCE": x_f,
+        "LANDING_TIME": t_ap + t_f + t_R_La + t_g_La,
         "LANDING_APPROACH_TIME": t_ap,
         "LANDING_ROTATION_TIME": t_R_La,
         "LANDING_ROLL_TIME": t_g_La,
         "LANDING_FLARE_TIME": t_f}
 
-    return landing_time_result
+    return landing_result
 
 
-def calc_landing_distance_time_per_altitude(flight_parameters, aircraft_parameters, altitude=None):
+def calc_landing_distance_time_per_altitude(flight_parameters, aircraft_parameters, altitude=None, altitude_range=None):
 
     """
-    Calcula a distância de pouso e o tempo de pouso para diferentes altitudes de pouso, variando de metade da altitude
-    de pouso até no máximo 3500 m.
+    Calcula a distância de pouso e o tempo de pouso para uma grade de altitudes de pouso, numa única passagem
+    vetorizada.
 
     Parâmetros:
     - flight_parameters (dict): Dicionário contendo os parâmetros de voo e de pouso.
@@ -183,6 +192,8 @@ def calc_landing_distance_time_per_altitude(flight_parameters, aircraft_paramete
             - 'ALTITUDE_LANDING' (float): Altitude de pouso (m).
     - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
     - altitude (float, opcional): Altitude específica de pouso (m). Se não fornecido, usa o valor de 'ALTITUDE_LANDING'.
+    - altitude_range (array_like, opcional): Grade de altitudes (m). Se não fornecida, usa 10 pontos entre metade da
+      altitude de pouso e no máximo 3500 m.
 
     Retorna:
     - pandas.DataFrame: DataFrame contendo as seguintes colunas:
@@ -190,23 +201,27 @@ def calc_landing_distance_time_per_altitude(flight_parameters, aircraft_paramete
         - 'Landing Time [s]': Tempo de pouso calculado para cada altitude de pouso (s).
     """
 
-    landing_altitude = flight_parameters['landing_parameters']['ALTITUDE_LANDING'] if altitude is None else altitude
+    if altitude_range is None:
+        landing_altitude = flight_parameters['landing_parameters']['ALTITUDE_LANDING'] if altitude is None else altitude
+        altitude_range = np.round(linspace(0.5 * landing_altitude, min(30 * landing_altitude, 3500), 10), -1)
 
-    altitude_range = [round(i, -1) for i in linspace(0.5 * landing_altitude, min(30 * landing_altitude, 3500), 10)]
+    altitude_range = np.asarray(altitude_range, dtype=float)
+
+    NP = flight_parameters['NUMBER_OF_PASSENGERS']
+    FW = flight_parameters['FUEL_WEIGHT']
+    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
 
-    landing_distance_range = [
-        round(calc_total_landing_distance(flight_parameters=flight_parameters, aircraft_parameters=aircraft_parameters,
-                                          altitude=alti)['LANDING_DISTANCE'], 2)
-        for alti in altitude_range]
+    TOW = float(NP * aero.person_weight + aircraft_parameters['OEW'] + FW + CW)
 
-    landing_time_range = [
-        round(calc_total_landing_time(flight_parameters=flight_parameters, aircraft_parameters=aircraft_parameters,
-                                      altitude=alti)['LANDING_TIME'], 2)
-        for alti in altitude_range]
+    landing = calc_landing_batch(aircraft_parameters=aircraft_parameters,
+                                 W_landing=TOW - 0.95 * FW,
+                                 altitude=altitude_range,
+                                 mu=flight_parameters['landing_parameters']['MU_LANDING'],
+                                 V_wind=flight_parameters['landing_parameters']['WIND_VELOCITY_LANDING'])
 
-    df = DataFrame(index=altitude_range, data={
-        'Landing Distance [m]': landing_distance_range, 'Landing Time [s]': landing_time_range})
-    df.index.name = 'Altitude [m]'
+    df = DataFrame(index=Index(altitude_range, name='Altitude [m]'), data={
+        'Landing Distance [m]': np.round(landing['LANDING_DISTANCE'], 2),
+        'Landing Time [s]': np.round(landing['LANDING_TIME'], 2)})
 
     return df
 
@@ -1,18 +1,17 @@
 import math
 from .aero import Aero
-from functions.cruising_jet import calc_cruise_velocity
-from functions.utils import default_graph_colors
+from .cruising_jet import calc_cruise_velocity
+from .utils import default_graph_colors
 from numpy import linspace
-import matplotlib.pyplot as plt
 
 aero = Aero()
 colors = default_graph_colors()
 
 
-def calc_load_factor_turning_rate_turning_radius_graph(aircraft_parameters: dict, flight_parameters: dict, V_CRUISE=None, display=False,  W_CRUISE=None):
+def calc_load_factor_turning_rate_turning_radius(aircraft_parameters: dict, flight_parameters: dict, V_CRUISE=None, W_CRUISE=None):
 
     """
-    Calcula e plota o fator de carga, velocidade angular e raio de curva em função da velocidade para uma aeronave em um voo de cruzeiro.
+    Calcula o fator de carga, velocidade angular e raio de curva em função da velocidade para uma aeronave em um voo de cruzeiro.
 
     Parâmetros:
     - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
@@ -27,13 +26,16 @@ def calc_load_factor_turning_rate_turning_radius_graph(aircraft_parameters: dict
         - 'CRUISE_ALTITUDE' (float): Altitude de cruzeiro (m).
         - 'CRUISE_VELOCITY' (float): Velocidade de cruzeiro (m/s).
     - V_CRUISE (float, opcional): Velocidade de cruzeiro para cálculos (m/s). Se não fornecido, calcula automaticamente.
-    - display (bool, opcional): Se True, exibe o gráfico. Caso contrário, apenas retorna a figura (default: False).
     - W_CRUISE (float, opcional): Peso durante o cruzeiro (N). Se não fornecido, calcula automaticamente.
 
     Retorna:
-    - matplotlib.figure.Figure: Figura contendo dois subplots:
-        - Subplot 1: Gráfico de fator de carga (n) e velocidade angular (rad/s) em função da velocidade (m/s).
-        - Subplot 2: Gráfico de raio de curva (km) em função da velocidade (m/s).
+    - dict: Dicionário contendo:
+        - 'VELOCITY' (list): Velocidades (m/s).
+        - 'LOAD_FACTOR' (list): Fator de carga em cada velocidade (adimensional).
+        - 'TURNING_RATE' (list): Velocidade angular em cada velocidade (rad/s).
+        - 'TURNING_RADIUS' (list): Raio de curva em cada velocidade (m).
+        - 'VELOCITY_FASTEST_TURN', 'VELOCITY_TIGHEST_TURN', 'VELOCITY_STALL' (float): Velocidades das curvas
+          características (m/s).
 
     """
 
@@ -60,9 +62,9 @@ def calc_load_factor_turning_rate_turning_radius_graph(aircraft_parameters: dict
     sigma = aero.get_sigma(altitude=altitude)
     rho_SSL = aero.rho_0
 
-    results_fastest_turn = calc_fastest_turn(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
-    results_tighest_turn = calc_tighest_turn(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
-    results_stall = calc_stall_turn(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+    results_fastest_turn = calc_fastest_turn(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters, W_CRUISE=W)
+    results_tighest_turn = calc_tighest_turn(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters, W_CRUISE=W)
+    results_stall = calc_stall_turn(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters, W_CRUISE=W)
 
     VELOCITY_FASTEST_TURN = results_fastest_turn['VELOCITY_FASTEST_TURN']
     LOAD_FACTOR_FASTEST_TURN = results_fastest_turn['LOAD_FACTOR_FASTEST_TURN']
@@ -127,6 +129,43 @@ def calc_load_factor_turning_rate_turning_radius_graph(aircraft_parameters: dict
         omega_list.append(omega_i)
         radius_list.append(radius_i)
 
+    return {
+        "VELOCITY": V_linspace,
+        "LOAD_FACTOR": n_list,
+        "TURNING_RATE": omega_list,
+        "TURNING_RADIUS": radius_list,
+        "VELOCITY_FASTEST_TURN": VELOCITY_FASTEST_TURN,
+        "VELOCITY_TIGHEST_TURN": VELOCITY_TIGHEST_TURN,
+        "VELOCITY_STALL": VELOCITY_STALL
+    }
+
+
+def plot_load_factor_turning_rate_turning_radius(curves, display=False):
+
+    """
+    Gera o gráfico do fator de carga, velocidade angular e raio de curva em função da velocidade.
+
+    Parâmetros:
+    - curves (dict): Resultado de calc_load_factor_turning_rate_turning_radius.
+    - display (bool, opcional): Se True, exibe o gráfico. Caso contrário, apenas retorna a figura (default: False).
+
+    Retorna:
+    - matplotlib.figure.Figure: Figura contendo dois subplots:
+        - Subplot 1: Gráfico de fator de carga (n) e velocidade angular (rad/s) em função da velocidade (m/s).
+        - Subplot 2: Gráfico de raio de curva (km) em função da velocidade (m/s).
+    """
+
+    V_linspace = curves['VELOCITY']
+    n_list = curves['LOAD_FACTOR']
+    omega_list = curves['TURNING_RATE']
+    radius_list = curves['TURNING_RADIUS']
+
+    VELOCITY_FASTEST_TURN = curves['VELOCITY_FASTEST_TURN']
+    VELOCITY_TIGHEST_TURN = curves['VELOCITY_TIGHEST_TURN']
+    VELOCITY_STALL = curves['VELOCITY_STALL']
+
+    import matplotlib.pyplot as plt
+
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     plt.subplots_adjust(wspace=0.3)
 
@@ -169,6 +208,23 @@ def calc_load_factor_turning_rate_turning_radius_graph(aircraft_parameters: dict
     return fig
 
 
+def calc_load_factor_turning_rate_turning_radius_graph(aircraft_parameters: dict, flight_parameters: dict, V_CRUISE=None, display=False,  W_CRUISE=None):
+
+    """
+    Calcula e plota o fator de carga, velocidade angular e raio de curva em função da velocidade
+    (calc_load_factor_turning_rate_turning_radius + plot_load_factor_turning_rate_turning_radius).
+
+    Retorna:
+    - matplotlib.figure.Figure: Figura do gráfico.
+    """
+
+    curves = calc_load_factor_turning_rate_turning_radius(aircraft_parameters=aircraft_parameters,
+                                                          flight_parameters=flight_parameters,
+                                                          V_CRUISE=V_CRUISE, W_CRUISE=W_CRUISE)
+
+    return plot_load_factor_turning_rate_turning_radius(curves=curves, display=display)
+
+
 def calc_fastest_turn(aircraft_parameters: dict, flight_parameters: dict, V_CRUISE=None, display=False,  W_CRUISE=None):
     """
         Calcula os parâmetros de desempenho para a curva coordenada mais rápida da aeronave.
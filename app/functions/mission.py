@@ -0,0 +1,258 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from .aero import Aero
+from .utils import lazy_property
+from .takeoff import calc_takeoff_batch, calc_takeoff_distance_time_per_altitude
+from .landing import calc_landing_batch, calc_landing_distance_time_per_altitude
+from .cruising_jet import (calc_cruise_velocity, calc_cruising_jet_range, calc_cruising_jet_endurance,
+                           calc_cruise_fuel_weight)
+from .climb import (calc_max_climb_angle_rate_of_climb, calc_distance_time_steepest_climb, calc_service_ceiling,
+                    calc_distance_time_fastest_climb)
+from .climb_integrator import calc_integrated_climb
+from .manevour import calc_fastest_turn, calc_tighest_turn, calc_stall_turn
+from .gliding import gliding_range_endurance, gliding_angle_rate_of_descent
+from .mission_simulator import calc_mission_trajectory
+
+aero = Aero()
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# ------------------------------------------------------ MISSION ----------------------------------------------------- #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+class Mission:
+
+    """
+    Reúne os cálculos de todas as fases de voo para um par (aircraft_parameters, flight_parameters).
+
+    As grandezas derivadas (TOW, pesos de cruzeiro, sigma e velocidade de cruzeiro, ...) e os resultados de cada fase são
+    calculados apenas no primeiro acesso e ficam guardados na instância. Os resultados das fases são os mesmos
+    dicionários devolvidos pelas funções de cada módulo, que recebem as grandezas já calculadas (V_CRUISE, W_CRUISE, ...)
+    em vez de recalculá-las.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
+    - flight_parameters (dict): Dicionário contendo os parâmetros de voo, de decolagem e de pouso.
+    """
+
+    def __init__(self, aircraft_parameters: dict, flight_parameters: dict):
+
+        self.aircraft_parameters = aircraft_parameters
+        self.flight_parameters = flight_parameters
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Grandezas derivadas
+
+    @lazy_property
+    def TOW(self):
+        """Peso de decolagem (N)."""
+
+        NP = self.flight_parameters['NUMBER_OF_PASSENGERS']
+        FW = self.flight_parameters['FUEL_WEIGHT']
+        CW = self.flight_parameters['DISPATCHED_CARGO_WEIGHT']
+        OEW = self.aircraft_parameters['OEW']
+
+        return float(NP * aero.person_weight + OEW + FW + CW)
+
+    @lazy_property
+    def W_1(self):
+        """Peso no início do cruzeiro, TOW - 15% do combustível (N)."""
+        return self.TOW - 0.15 * self.flight_parameters['FUEL_WEIGHT']
+
+    @lazy_property
+    def W_2(self):
+        """Peso no fim do cruzeiro, TOW - 95% do combustível (N). Também é o peso na aproximação para o pouso."""
+        return self.TOW - 0.95 * self.flight_parameters['FUEL_WEIGHT']
+
+    @lazy_property
+    def W_cruise(self):
+        """Peso médio de cruzeiro, TOW - 50% do combustível (N)."""
+        return self.TOW - 0.5 * self.flight_parameters['FUEL_WEIGHT']
+
+    @lazy_property
+    def zeta(self):
+        """Fração de combustível consumida no cruzeiro (adimensional)."""
+        return (self.W_1 - self.W_2) / self.W_1
+
+    @lazy_property
+    def cruise_sigma(self):
+        """Razão de densidade na altitude de cruzeiro (adimensional)."""
+        return aero.get_sigma(altitude=self.flight_parameters['CRUISE_ALTITUDE'])
+
+    @lazy_property
+    def cruise_velocity(self):
+        """Resultado de calc_cruise_velocity (sem gráfico)."""
+        return calc_cruise_velocity(aircraft_parameters=self.aircraft_parameters,
+                                    flight_parameters=self.flight_parameters,
+                                    W_CRUISE=self.W_cruise)
+
+    @lazy_property
+    def V_cru(self):
+        """Velocidade de cruzeiro (m/s)."""
+        return self.cruise_velocity['CRUISE_VELOCITY']
+
+    @lazy_property
+    def CL_cru(self):
+        """Coeficiente de sustentação no início do cruzeiro (adimensional)."""
+        return (2 * self.W_1) / (self.aircraft_parameters['S'] * aero.rho_0 * self.cruise_sigma * self.V_cru ** 2)
+
+    @lazy_property
+    def E_cru(self):
+        """Eficiência aerodinâmica no início do cruzeiro (adimensional)."""
+        CD_cru = self.aircraft_parameters['CD0'] + self.aircraft_parameters['K'] * self.CL_cru ** 2
+        return self.CL_cru / CD_cru
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Decolagem e pouso
+
+    @lazy_property
+    def takeoff(self):
+        """Distâncias e tempos de decolagem (mesmas chaves de calc_total_takeoff_distance/time)."""
+
+        takeoff_parameters = self.flight_parameters['takeoff_parameters']
+
+        result = calc_takeoff_batch(aircraft_parameters=self.aircraft_parameters,
+                                    TOW=self.TOW,
+                                    altitude=takeoff_parameters['ALTITUDE_TAKEOFF'],
+                                    mu=takeoff_parameters['MU_TAKEOFF'],
+                                    V_wind=takeoff_parameters['WIND_VELOCITY_TAKEOFF'],
+                                    runway_slope=takeoff_parameters['RUNWAY_SLOPE_TAKEOFF'])
+
+        return {key: float(value) for key, value in result.items()}
+
+    @lazy_property
+    def takeoff_per_altitude(self):
+        """Tabela de distância e tempo de decolagem por altitude."""
+        return calc_takeoff_distance_time_per_altitude(flight_parameters=self.flight_parameters,
+                                                       aircraft_parameters=self.aircraft_parameters)
+
+    @lazy_property
+    def landing(self):
+        """Distâncias e tempos de pouso (mesmas chaves de calc_total_landing_distance/time)."""
+
+        landing_parameters = self.flight_parameters['landing_parameters']
+
+        result = calc_landing_batch(aircraft_parameters=self.aircraft_parameters,
+                                    W_landing=self.W_2,
+                                    altitude=landing_parameters['ALTITUDE_LANDING'],
+                                    mu=landing_parameters['MU_LANDING'],
+                                    V_wind=landing_parameters['WIND_VELOCITY_LANDING'])
+
+        return {key: float(value) for key, value in result.items()}
+
+    @lazy_property
+    def landing_per_altitude(self):
+        """Tabela de distância e tempo de pouso por altitude."""
+        return calc_landing_distance_time_per_altitude(flight_parameters=self.flight_parameters,
+                                                       aircraft_parameters=self.aircraft_parameters)
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Subida
+
+    @lazy_property
+    def climb(self):
+        """Ângulo máximo e razão de subida máxima (sem gráfico)."""
+        return calc_max_climb_angle_rate_of_climb(aircraft_parameters=self.aircraft_parameters,
+                                                  flight_parameters=self.flight_parameters,
+                                                  V_CRUISE=self.V_cru)
+
+    @lazy_property
+    def steepest_climb(self):
+        """Distância, tempo e consumo da subida mais íngreme."""
+        return calc_distance_time_steepest_climb(aircraft_parameters=self.aircraft_parameters,
+                                                 flight_parameters=self.flight_parameters)
+
+    @lazy_property
+    def fastest_climb(self):
+        """Distância, tempo e consumo da subida mais rápida."""
+        return calc_distance_time_fastest_climb(aircraft_parameters=self.aircraft_parameters,
+                                                flight_parameters=self.flight_parameters)
+
+    @lazy_property
+    def integrated_climb(self):
+        """Tempo, distância e combustível da subida integrada numericamente até a altitude de cruzeiro."""
+        return calc_integrated_climb(aircraft_parameters=self.aircraft_parameters,
+                                     flight_parameters=self.flight_parameters)
+
+    @lazy_property
+    def service_ceiling(self):
+        """Tetos de serviço, de desempenho e operacional (sem gráfico)."""
+        return calc_service_ceiling(aircraft_parameters=self.aircraft_parameters,
+                                    flight_parameters=self.flight_parameters,
+                                    plot=False)
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Cruzeiro
+
+    @lazy_property
+    def cruise_range(self):
+        """Alcances de cruzeiro."""
+        return calc_cruising_jet_range(aircraft_parameters=self.aircraft_parameters,
+                                       flight_parameters=self.flight_parameters,
+                                       V_CRUISE=self.V_cru, W_CRUISE=self.TOW)
+
+    @lazy_property
+    def cruise_endurance(self):
+        """Autonomias de cruzeiro."""
+        return calc_cruising_jet_endurance(aircraft_parameters=self.aircraft_parameters,
+                                           flight_parameters=self.flight_parameters,
+                                           V_CRUISE=self.V_cru, W_CRUISE=self.TOW)
+
+    @lazy_property
+    def cruise_fuel_weight(self):
+        """Combustível consumido no cruzeiro entre os aeroportos de partida e de chegada."""
+        return calc_cruise_fuel_weight(aircraft_parameters=self.aircraft_parameters,
+                                       flight_parameters=self.flight_parameters,
+                                       V_CRUISE=self.V_cru, W_CRUISE=self.TOW)
+
+    @lazy_property
+    def trajectory(self):
+        """Série temporal da missão completa entre os aeroportos de partida e de chegada."""
+        return calc_mission_trajectory(aircraft_parameters=self.aircraft_parameters,
+                                       flight_parameters=self.flight_parameters)
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Manobra
+
+    @lazy_property
+    def fastest_turn(self):
+        """Curva mais rápida."""
+        return calc_fastest_turn(aircraft_parameters=self.aircraft_parameters,
+                                 flight_parameters=self.flight_parameters,
+                                 V_CRUISE=self.V_cru, W_CRUISE=self.W_cruise)
+
+    @lazy_property
+    def tighest_turn(self):
+        """Curva mais fechada."""
+        return calc_tighest_turn(aircraft_parameters=self.aircraft_parameters,
+                                 flight_parameters=self.flight_parameters,
+                                 V_CRUISE=self.V_cru, W_CRUISE=self.W_cruise)
+
+    @lazy_property
+    def stall_turn(self):
+        """Curva na velocidade de estol."""
+        return calc_stall_turn(aircraft_parameters=self.aircraft_parameters,
+                               flight_parameters=self.flight_parameters,
+                               V_CRUISE=self.V_cru, W_CRUISE=self.W_cruise)
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # Planeio
+
+    @lazy_property
+    def gliding(self):
+        """Alcance e autonomia de planeio (sem gráficos)."""
+        return gliding_range_endurance(aircraft_parameters=self.aircraft_parameters,
+                                       flight_parameters=self.flight_parameters,
+                                       W=self.W_cruise)
+
+    @lazy_property
+    def gliding_angle(self):
+        """Ângulo de planeio e razão de descida (sem gráficos)."""
+        return gliding_angle_rate_of_descent(aircraft_parameters=self.aircraft_parameters,
+                                             flight_parameters=self.flight_parameters,
+                                             W=self.W_cruise)
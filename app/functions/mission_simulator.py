@@ -0,0 +1,383 @@
+"""
+Simulação da missão completa (decolagem, subida, cruzeiro, descida e pouso) como série temporal contínua de altitude,
+velocidade, peso e combustível, para muitas missões de uma só vez.
+
+Ao contrário de calc_flight_phases (plot_phases), que soma tempos escalares de cada fase num polígono de 12 pontos, aqui
+cada fase é amostrada ao longo da sua trajetória:
+    - Decolagem e pouso: os pontos de troca de segmento de calc_takeoff_batch e calc_landing_batch.
+    - Subida: os passos adaptativos de integrate_climb (subida mais rápida, peso variando com o combustível).
+    - Cruzeiro: altitude e velocidade constantes, peso pela solução exata de dW/dx = -n D / V, em n_points pontos.
+    - Descida: planeio sem empuxo, integrado em n_points altitudes igualmente espaçadas.
+
+A série de cada missão fica num array estruturado (MISSION_DTYPE) de float32, uma linha por missão.
+"""
+
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import math
+import numpy as np
+from .aero import Aero
+from .takeoff import calc_takeoff_batch
+from .landing import calc_landing_batch
+from .cruising_jet import calc_cruise_velocity
+from .climb_integrator import integrate_climb, calc_climb_rates, get_thrust_exponent
+from .utils import get_logger
+
+aero = Aero()
+logger = get_logger(log_name="MISSION_SIMULATOR")
+
+MISSION_PHASES = ("TAKEOFF", "CLIMB", "CRUISE", "DESCENT", "LANDING")
+
+MISSION_DTYPE = np.dtype([
+    ("TIME", np.float32),       # s
+    ("DISTANCE", np.float32),   # m
+    ("ALTITUDE", np.float32),   # m
+    ("VELOCITY", np.float32),   # m/s
+    ("WEIGHT", np.float32),     # N
+    ("FUEL", np.float32),       # N, combustível consumido desde o início da decolagem
+    ("PHASE", np.uint8),        # índice em MISSION_PHASES
+])
+
+_AIRCRAFT_KEYS = ('S', 'CD0', 'K', 'T0', 'NE', 'TSFC', 'CL_MAX', 'E_m')
+
+
+def _get_density(altitude):
+    """Densidade (kg/m^3) para um array de altitudes de qualquer formato."""
+    altitude = np.asarray(altitude, dtype=float)
+    return aero.get_density(altitude=altitude.ravel()).reshape(altitude.shape)
+
+
+def _calc_descent(aircraft_parameters, altitude_start, altitude_end, W, velocity, n_points):
+
+    """
+    Planeio sem empuxo de altitude_start até altitude_end, com sen(gama) = D / W, integrado pela regra do trapézio em
+    n_points altitudes igualmente espaçadas. Se velocity for None, usa a velocidade de arrasto mínimo em cada altitude.
+    Retorna arrays (n_points, casos...) de altitude, tempo, distância e velocidade.
+    """
+
+    S, CD0, K = aircraft_parameters['S'], aircraft_parameters['CD0'], aircraft_parameters['K']
+
+    fractions = np.linspace(0, 1, n_points).reshape((-1,) + (1,) * np.ndim(W))
+    altitude = altitude_start + fractions * (altitude_end - altitude_start)
+    rho = _get_density(altitude)
+
+    if velocity is None:
+        velocity = np.sqrt((2 * W / S) / rho) * (K / CD0) ** 0.25
+    else:
+        velocity = np.broadcast_to(velocity, altitude.shape)
+
+    drag = 0.5 * rho * velocity ** 2 * S * CD0 + 2 * K * W ** 2 / (rho * S * velocity ** 2)
+    sin_gamma = np.clip(drag / W, 1e-9, 1)
+
+    step = (altitude_start - altitude_end) / (n_points - 1)
+
+    dt_dh = 1 / (velocity * sin_gamma)
+    dx_dh = np.sqrt(1 - sin_gamma ** 2) / sin_gamma
+
+    def cumulative(values):
+        segments = step * 0.5 * (values[1:] + values[:-1])
+        return np.concatenate((np.zeros((1,) + segments.shape[1:]), np.cumsum(segments, axis=0)))
+
+    return altitude, cumulative(dt_dh), cumulative(dx_dh), velocity
+
+
+def simulate_missions(aircraft_parameters: dict, TOW, fuel_weight, distance, cruise_altitude, cruise_velocity,
+                      altitude_takeoff=0, altitude_landing=0, mu_takeoff=0.04, mu_landing=0.3, descent_velocity=None,
+                      n_points=20, thrust_exponent=None):
+
+    """
+    Simula várias missões de uma vez. Todas as entradas aceitam números ou arrays (uma missão por posição, com
+    broadcast entre elas).
+
+    Parâmetros:
+    - aircraft_parameters (dict): 'S', 'CD0', 'K', 'T0', 'NE', 'TSFC', 'CL_MAX' e 'E_m'.
+    - TOW (array): Peso de decolagem (N).
+    - fuel_weight (array): Combustível a bordo na decolagem (N).
+    - distance (array): Distância entre os aeroportos (m).
+    - cruise_altitude (array): Altitude de cruzeiro (m).
+    - cruise_velocity (array): Velocidade de cruzeiro (m/s).
+    - altitude_takeoff, altitude_landing (array, opcional): Altitude dos aeroportos (m). Default é 0.
+    - mu_takeoff, mu_landing (array, opcional): Coeficientes de atrito da pista. Default é 0.04 e 0.3.
+    - descent_velocity (array, opcional): Velocidade de planeio na descida (m/s). Se None, usa a velocidade de arrasto
+      mínimo em cada altitude.
+    - n_points (int, opcional): Número de pontos do cruzeiro e da descida. Default é 20.
+    - thrust_exponent (float, opcional): Expoente do empuxo com a densidade na subida e no cruzeiro. Default é
+      TSFC / 3600 (get_thrust_exponent), o mesmo de calc_mission_trajectory.
+
+    Retorna:
+    dict: Dicionário contendo:
+        - "SERIES" (numpy.ndarray): Array estruturado (MISSION_DTYPE) com formato (missões..., amostras).
+        - "VALID" (numpy.ndarray): False quando a missão não é possível (a aeronave não sobe até o cruzeiro, não tem
+          empuxo para o cruzeiro, os aeroportos estão perto demais para subir e descer, ou falta combustível).
+        - "FLIGHT_TIME" (numpy.ndarray): Tempo total (s).
+        - "FLIGHT_DISTANCE" (numpy.ndarray): Distância total percorrida (m).
+        - "FUEL_CONSUMED" (numpy.ndarray): Combustível consumido (N).
+    """
+
+    inputs = [np.asarray(value, dtype=float) for value in (TOW, fuel_weight, distance, cruise_altitude, cruise_velocity,
+                                                           altitude_takeoff, altitude_landing, mu_takeoff, mu_landing)]
+    inputs += [np.asarray(aircraft_parameters[key], dtype=float) for key in _AIRCRAFT_KEYS]
+    if descent_velocity is not None:
+        inputs.append(np.asarray(descent_velocity, dtype=float))
+
+    shape = np.broadcast(*inputs).shape
+    TOW, fuel_weight, distance, cruise_altitude, cruise_velocity, altitude_takeoff, altitude_landing, mu_takeoff, \
+        mu_landing = [np.broadcast_to(value, shape) for value in inputs[:9]]
+    parameters = {key: np.broadcast_to(value, shape) for key, value in zip(_AIRCRAFT_KEYS, inputs[9:17])}
+    if descent_velocity is not None:
+        descent_velocity = np.broadcast_to(inputs[17], shape)
+
+    S, CD0, K, CL_max = parameters['S'], parameters['CD0'], parameters['K'], parameters['CL_MAX']
+    n = parameters['TSFC'] / 3600
+    thrust_exponent = get_thrust_exponent(aircraft_parameters=parameters, thrust_exponent=thrust_exponent)
+
+    valid = (cruise_altitude > altitude_takeoff + aero.h_Sc) & (cruise_altitude > altitude_landing + aero.h_Sc)
+
+    # Decolagem: corrida no solo (aceleração constante), rotação, transição e subida até a altura de obstáculo
+    takeoff = calc_takeoff_batch(aircraft_parameters=parameters, TOW=TOW, altitude=altitude_takeoff, mu=mu_takeoff)
+
+    rho_takeoff = _get_density(altitude_takeoff)
+    V_S = np.sqrt(2 * TOW / (CL_max * S * rho_takeoff))
+    T_takeoff = parameters['T0'] * parameters['NE'] * (rho_takeoff / aero.rho_0) ** n
+
+    takeoff_time = np.cumsum([np.zeros(shape)] + [takeoff[key] for key in (
+        "TAKEOFF_GROUND_TIME", "TAKEOFF_ROTATION_TIME", "TAKEOFF_TRANSITION_TIME", "TAKEOFF_CLIMB_TIME")], axis=0)
+    takeoff_fuel = n * T_takeoff * takeoff_time
+
+    phases = [{
+        "TIME": takeoff_time,
+        "DISTANCE": np.cumsum([np.zeros(shape)] + [takeoff[key] for key in (
+            "TAKEOFF_GROUND_DISTANCE", "TAKEOFF_ROTATION_DISTANCE", "TAKEOFF_TRANSITION_DISTANCE",
+            "TAKEOFF_CLIMB_DISTANCE")], axis=0),
+        "ALTITUDE": altitude_takeoff + np.array([0, 0, 0, aero.h_Sc / 2, aero.h_Sc]).reshape((-1,) + (1,) * len(shape)),
+        "VELOCITY": np.stack([np.zeros(shape), 1.15 * V_S, 1.15 * V_S, 1.15 * V_S, 1.3 * V_S]),
+        "WEIGHT": TOW - takeoff_fuel,
+    }]
+
+    # Subida mais rápida até a altitude de cruzeiro; a missão deixa de valer se o combustível acaba na subida
+    climb = integrate_climb(aircraft_parameters=parameters, W_0=phases[0]['WEIGHT'][-1],
+                            altitude_start=altitude_takeoff + aero.h_Sc, altitude_end=cruise_altitude,
+                            schedule="FASTEST", thrust_exponent=thrust_exponent,
+                            fuel_weight=fuel_weight - takeoff_fuel[-1])
+    valid = valid & climb['VALID']
+
+    with np.errstate(invalid="ignore"):
+        climb_velocity = calc_climb_rates(aircraft_parameters=parameters, altitude=climb['ALTITUDE'],
+                                          W=climb['WEIGHT'], thrust_exponent=thrust_exponent)['VELOCITY']
+
+    phases.append({key: climb[key] for key in ("TIME", "DISTANCE", "ALTITUDE", "WEIGHT")})
+    phases[-1]["VELOCITY"] = climb_velocity
+
+    # Cruzeiro: dW/dx = -(n / V) (a + b W^2) => arctan(W sqrt(b / a)) cai linearmente com x
+    W_1 = climb['WEIGHT'][-1]
+    rho_cruise = _get_density(cruise_altitude)
+    a = 0.5 * rho_cruise * cruise_velocity ** 2 * S * CD0
+    b = 2 * K / (rho_cruise * S * cruise_velocity ** 2)
+
+    T_cruise = parameters['T0'] * parameters['NE'] * (rho_cruise / aero.rho_0) ** thrust_exponent
+    valid = valid & (T_cruise * (1 + 1e-9) >= a + b * W_1 ** 2)
+
+    # A distância da descida depende pouco do peso: é estimada com o peso no início do cruzeiro
+    descent_estimate = _calc_descent(aircraft_parameters=parameters, altitude_start=cruise_altitude,
+                                     altitude_end=altitude_landing + aero.h_Sc, W=W_1, velocity=descent_velocity,
+                                     n_points=n_points)
+    landing_estimate = calc_landing_batch(aircraft_parameters=parameters, W_landing=W_1, altitude=altitude_landing,
+                                          mu=mu_landing)
+
+    landing_distance = (landing_estimate['LANDING_DISTANCE'] -
+                        np.minimum(landing_estimate['LANDING_APPROACH_DISTANCE'], 0))
+
+    cruise_distance = (distance - phases[0]['DISTANCE'][-1] - climb['DISTANCE'][-1] - descent_estimate[2][-1] -
+                       landing_distance)
+    valid = valid & (cruise_distance >= 0)
+    cruise_distance = np.maximum(np.nan_to_num(cruise_distance), 0)
+
+    fractions = np.linspace(0, 1, n_points).reshape((-1,) + (1,) * len(shape))
+    cruise_x = fractions * cruise_distance
+
+    with np.errstate(invalid="ignore"):
+        angle = np.arctan(W_1 * np.sqrt(b / a)) - (n / cruise_velocity) * np.sqrt(a * b) * cruise_x
+        valid = valid & (angle[-1] > 0)
+        cruise_weight = np.sqrt(a / b) * np.tan(np.maximum(angle, 0))
+
+    phases.append({
+        "TIME": cruise_x / cruise_velocity,
+        "DISTANCE": cruise_x,
+        "ALTITUDE": np.broadcast_to(cruise_altitude, cruise_x.shape),
+        "VELOCITY": np.broadcast_to(cruise_velocity, cruise_x.shape),
+        "WEIGHT": cruise_weight,
+    })
+
+    # Descida em planeio, sem consumo
+    W_2 = cruise_weight[-1]
+    descent_altitude, descent_time, descent_distance, descent_velocities = _calc_descent(
+        aircraft_parameters=parameters, altitude_start=cruise_altitude, altitude_end=altitude_landing + aero.h_Sc,
+        W=W_2, velocity=descent_velocity, n_points=n_points)
+
+    phases.append({
+        "TIME": descent_time,
+        "DISTANCE": descent_distance,
+        "ALTITUDE": descent_altitude,
+        "VELOCITY": descent_velocities,
+        "WEIGHT": np.broadcast_to(W_2, descent_time.shape),
+    })
+
+    # Pouso: aproximação, arredondamento (flare), rotação e frenagem
+    landing = calc_landing_batch(aircraft_parameters=parameters, W_landing=W_2, altitude=altitude_landing, mu=mu_landing)
+
+    V_S_Ap = np.sqrt((2 * W_2 / S) / (_get_density(altitude_landing) * CL_max))
+    V_Ap, V_Td = 1.3 * V_S_Ap, 1.15 * V_S_Ap
+    h_f = (V_Ap ** 2) / (0.08 * aero.g) * (1 - math.cos(aero.gamma_Ap))
+
+    # Com aproximação rápida o arredondamento começa acima da altura de obstáculo e a aproximação fica negativa
+    landing['LANDING_APPROACH_TIME'] = np.maximum(landing['LANDING_APPROACH_TIME'], 0)
+    landing['LANDING_APPROACH_DISTANCE'] = np.maximum(landing['LANDING_APPROACH_DISTANCE'], 0)
+    h_f = np.minimum(h_f, aero.h_Sc)
+
+    landing_time = np.cumsum([np.zeros(shape)] + [landing[key] for key in (
+        "LANDING_APPROACH_TIME", "LANDING_FLARE_TIME", "LANDING_ROTATION_TIME", "LANDING_ROLL_TIME")], axis=0)
+
+    phases.append({
+        "TIME": landing_time,
+        "DISTANCE": np.cumsum([np.zeros(shape)] + [landing[key] for key in (
+            "LANDING_APPROACH_DISTANCE", "LANDING_FLARE_DISTANCE", "LANDING_ROTATION_DISTANCE",
+            "LANDING_ROLL_DISTANCE")], axis=0),
+        "ALTITUDE": np.stack([altitude_landing + aero.h_Sc, altitude_landing + h_f, altitude_landing,
+                              altitude_landing, altitude_landing]),
+        "VELOCITY": np.stack([V_Ap, V_Ap, V_Td, V_Td, np.zeros(shape)]),
+        "WEIGHT": np.broadcast_to(W_2, landing_time.shape),
+    })
+
+    # Cada fase começa no último ponto da anterior: tempo e distância são acumulados e o primeiro ponto é descartado
+    columns = {key: [] for key in ("TIME", "DISTANCE", "ALTITUDE", "VELOCITY", "WEIGHT", "PHASE")}
+    time_offset, distance_offset = np.zeros(shape), np.zeros(shape)
+
+    for index, phase in enumerate(phases):
+
+        start = 0 if index == 0 else 1
+
+        columns["TIME"].append(time_offset + phase["TIME"][start:])
+        columns["DISTANCE"].append(distance_offset + phase["DISTANCE"][start:])
+        columns["ALTITUDE"].append(phase["ALTITUDE"][start:])
+        columns["VELOCITY"].append(phase["VELOCITY"][start:])
+        columns["WEIGHT"].append(phase["WEIGHT"][start:])
+        columns["PHASE"].append(np.full(len(phase["TIME"]) - start, index, dtype=np.uint8))
+
+        time_offset = time_offset + phase["TIME"][-1]
+        distance_offset = distance_offset + phase["DISTANCE"][-1]
+
+    n_samples = sum(len(phase) for phase in columns["PHASE"])
+    series = np.empty(shape + (n_samples,), dtype=MISSION_DTYPE)
+
+    for key in ("TIME", "DISTANCE", "ALTITUDE", "VELOCITY", "WEIGHT"):
+        series[key] = np.moveaxis(np.concatenate(columns[key], axis=0), 0, -1)
+
+    series["FUEL"] = TOW[..., np.newaxis] - series["WEIGHT"]
+    series["PHASE"] = np.concatenate(columns["PHASE"])
+
+    fuel_consumed = TOW - W_2
+    valid = valid & (fuel_consumed <= fuel_weight)
+
+    logger.debug("Simulated %d missions (%d valid), %d samples each", valid.size, int(np.sum(valid)), n_samples)
+
+    return {
+        "SERIES": series,
+        "VALID": valid,
+        "FLIGHT_TIME": time_offset,
+        "FLIGHT_DISTANCE": distance_offset,
+        "FUEL_CONSUMED": fuel_consumed
+    }
+
+
+def calc_mission_trajectory(aircraft_parameters: dict, flight_parameters: dict, n_points=20, thrust_exponent=None):
+
+    """
+    Série temporal da missão de um caso, a partir dos mesmos dicionários das demais fases.
+
+    A distância é a distância Haversine entre os aeroportos, a velocidade de cruzeiro é CRUISE_VELOCITY quando for
+    maior que zero ou a de calc_cruise_velocity (com peso TOW - 50% do combustível, como em Mission), e a descida usa
+    GLIDING_VELOCITY quando for maior que zero.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave.
+    - flight_parameters (dict): Parâmetros de voo, com takeoff_parameters e landing_parameters contendo altitude, atrito
+      e coordenadas dos aeroportos.
+    - n_points (int, opcional): Número de pontos do cruzeiro e da descida. Default é 20.
+    - thrust_exponent (float, opcional): Expoente do empuxo com a densidade. Default é TSFC / 3600
+      (get_thrust_exponent), o mesmo de Aero.calculate_general_thrust e de calc_cruise_velocity.
+
+    Retorna:
+    dict: As mesmas chaves de simulate_missions, com "SERIES" de uma dimensão e os demais valores escalares.
+    """
+
+    takeoff_parameters = flight_parameters['takeoff_parameters']
+    landing_parameters = flight_parameters['landing_parameters']
+
+    FW = flight_parameters['FUEL_WEIGHT']
+    TOW = float(flight_parameters['NUMBER_OF_PASSENGERS'] * aero.person_weight + aircraft_parameters['OEW'] + FW +
+                flight_parameters['DISPATCHED_CARGO_WEIGHT'])
+
+    distance = aero.get_haversine_distance(
+        departure={"LATITUDE": takeoff_parameters['LATITUDE_TAKEOFF'],
+                   "LONGITUDE": takeoff_parameters['LONGITUDE_TAKEOFF']},
+        arrival={"LATITUDE": landing_parameters['LATITUDE_LANDING'],
+                 "LONGITUDE": landing_parameters['LONGITUDE_LANDING']})
+
+    V_cru = flight_parameters['CRUISE_VELOCITY']
+    if not V_cru > 0:
+        V_cru = calc_cruise_velocity(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                     W_CRUISE=TOW - 0.5 * FW)['CRUISE_VELOCITY']
+
+    V_gli = flight_parameters.get('GLIDING_VELOCITY', 0)
+
+    result = simulate_missions(aircraft_parameters=aircraft_parameters, TOW=TOW, fuel_weight=FW, distance=distance,
+                               cruise_altitude=flight_parameters['CRUISE_ALTITUDE'], cruise_velocity=V_cru,
+                               altitude_takeoff=takeoff_parameters['ALTITUDE_TAKEOFF'],
+                               altitude_landing=landing_parameters['ALTITUDE_LANDING'],
+                               mu_takeoff=takeoff_parameters['MU_TAKEOFF'], mu_landing=landing_parameters['MU_LANDING'],
+                               descent_velocity=V_gli if V_gli > 0 else None, n_points=n_points,
+                               thrust_exponent=thrust_exponent)
+
+    return {key: value if key == "SERIES" else value.item() for key, value in result.items()}
+
+
+def draw_mission_trajectory(trajectory, ax=None):
+
+    """
+    Desenha a altitude versus o tempo da série de calc_mission_trajectory, uma cor por fase.
+
+    Parâmetros:
+    - trajectory (dict): Resultado de calc_mission_trajectory.
+    - ax (matplotlib.axes.Axes, opcional): Eixo onde desenhar o gráfico. Se None, cria uma figura nova.
+
+    Retorna:
+    - fig: Objeto figura do matplotlib contendo o gráfico.
+    """
+
+    import matplotlib.pyplot as plt
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(7.5, 1.8))
+    else:
+        fig = ax.figure
+
+    series = trajectory['SERIES']
+
+    for index, phase in enumerate(MISSION_PHASES):
+        # Inclui o último ponto da fase anterior para que as linhas sejam contínuas
+        mask = series['PHASE'] == index
+        mask[:-1] |= mask[1:]
+        ax.plot(series['TIME'][mask] / 3600, series['ALTITUDE'][mask] / 1000, label=phase.capitalize())
+
+    ax.set_xlabel('Time (h)')
+    ax.set_ylabel('Altitude (km)')
+    ax.set_title('Altitude vs Time')
+    ax.legend(fontsize=8)
+    ax.grid()
+
+    return fig
@@ -0,0 +1,40 @@
+def compose_panels(panels, ncols=2, panel_size=(5, 5), display=False):
+
+    """
+    Monta uma única figura com vários gráficos lado a lado, desenhando cada um diretamente no seu painel
+    (sem renderizar figuras separadas e juntar as imagens).
+
+    Parâmetros:
+    - panels (list): Funções de desenho, uma por painel. Cada função recebe o eixo do painel (ax=...), como as funções
+      plot_* que aceitam ax (ex.: functools.partial(plot_rate_of_climb_per_velocity, result=result)).
+    - ncols (int, opcional): Número de colunas. Default é 2.
+    - panel_size (tuple, opcional): Tamanho de cada painel em polegadas (largura, altura). Default é (5, 5).
+    - display (bool, opcional): Se True, exibe a figura. Default é False.
+
+    Retorna:
+    - matplotlib.figure.Figure: Figura com os painéis.
+    """
+
+    import matplotlib.pyplot as plt
+
+    ncols = min(ncols, len(panels))
+    nrows = -(-len(panels) // ncols)
+
+    fig, axes = plt.subplots(nrows=nrows, ncols=ncols, squeeze=False,
+                             figsize=(panel_size[0] * ncols, panel_size[1] * nrows))
+
+    axes = axes.flatten()
+
+    for draw, ax in zip(panels, axes):
+        draw(ax=ax)
+
+    # Painéis que sobram na última linha
+    for ax in axes[len(panels):]:
+        ax.set_axis_off()
+
+    fig.tight_layout()
+
+    if display is True:
+        plt.show()
+
+    return fig
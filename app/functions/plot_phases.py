@@ -1,16 +1,46 @@
-import matplotlib.pyplot as plt
 from .aero import Aero
 
 aero = Aero()
 
 
 def plot_phases(flight_parameters, results_takeoff_time, results_climb_time, results_cruise_time,
-                results_descending_time, results_landing_time):
+                results_descending_time, results_landing_time, ax=None):
 
     """
     Plota um gráfico mostrando a altitude versus o tempo para diferentes fases de voo,
     além de fornecer informações adicionais sobre o voo (distância, tempo estimado e combustível estimado).
 
+    Os parâmetros são os mesmos de calc_flight_phases; ax (opcional) é o eixo onde desenhar o gráfico.
+
+    Retorna:
+    - fig: Objeto figura do matplotlib contendo o gráfico gerado.
+    - parameters (dict): Dicionário contendo parâmetros calculados como distância de cruzeiro,
+      quantidade de combustível necessário, tempo de voo total estimado em segundos.
+    """
+
+    phases = calc_flight_phases(flight_parameters=flight_parameters,
+                                results_takeoff_time=results_takeoff_time,
+                                results_climb_time=results_climb_time,
+                                results_cruise_time=results_cruise_time,
+                                results_descending_time=results_descending_time,
+                                results_landing_time=results_landing_time)
+
+    parameters = {
+        "CRUISE_DISTANCE_METERS": phases['CRUISE_DISTANCE_METERS'],
+        "NECESSARY_FUEL_KILOS": phases['NECESSARY_FUEL_KILOS'],
+        "ESTIMATED_TOTAL_FLIGHT_TIME_SECONDS": phases['ESTIMATED_TOTAL_FLIGHT_TIME_SECONDS']
+    }
+
+    return draw_flight_phases(phases=phases, ax=ax), parameters
+
+
+def calc_flight_phases(flight_parameters, results_takeoff_time, results_climb_time, results_cruise_time,
+                       results_descending_time, results_landing_time):
+
+    """
+    Calcula a altitude versus o tempo para as diferentes fases de voo, além de informações adicionais sobre o voo
+    (distância, tempo estimado e combustível estimado), sem gerar o gráfico.
+
     Parâmetros:
     - flight_parameters (dict): Dicionário contendo parâmetros de voo como altitude de decolagem,
       altitude de cruzeiro, altitude de pouso, coordenadas de decolagem e pouso, etc.
@@ -21,9 +51,14 @@ def plot_phases(flight_parameters, results_takeoff_time, results_climb_time, res
     - results_landing_time (dict): Dicionário contendo resultados dos tempos de pouso.
 
     Retorna:
-    - fig: Objeto figura do matplotlib contendo o gráfico gerado.
-    - parameters (dict): Dicionário contendo parâmetros calculados como distância de cruzeiro,
-      quantidade de combustível necessário, tempo de voo total estimado em segundos.
+    - dict: Dicionário contendo:
+        - "TIME" (list): Tempo acumulado no fim de cada trecho (h).
+        - "ALTITUDE" (list): Altitude no fim de cada trecho (km).
+        - "CRUISE_DISTANCE_METERS" (float): Distância de cruzeiro (m).
+        - "NECESSARY_FUEL_TONS" (float): Combustível necessário (t).
+        - "NECESSARY_FUEL_KILOS" (float): Combustível necessário (kg).
+        - "VALID_FUEL" (bool): Indicador de combustível válido, vindo de results_cruise_time.
+        - "ESTIMATED_TOTAL_FLIGHT_TIME_SECONDS" (float): Tempo de voo total estimado (s).
 
     """
 
@@ -137,40 +172,64 @@ def plot_phases(flight_parameters, results_takeoff_time, results_climb_time, res
 
     cont_time = [sum(i_time[:i+1])/3600 for i in range(len(i_time))]
 
-    fig, axes = plt.subplots(figsize=(7.5, 1.8))
+    phases = {
+        "TIME": cont_time,
+        "ALTITUDE": [altitude/1000 for altitude in i_altitude],
+        "CRUISE_DISTANCE_METERS": covered_distance_cruise,
+        "NECESSARY_FUEL_TONS": fuel,
+        "NECESSARY_FUEL_KILOS": results_cruise_time['DELTA_FUEL'] * 1000,
+        "VALID_FUEL": valid_fuel,
+        "ESTIMATED_TOTAL_FLIGHT_TIME_SECONDS": cont_time[-1] * 3600
+    }
 
-    axes.plot(cont_time, [altitude/1000 for altitude in i_altitude], marker='o', linestyle='-')
-    axes.set_xlabel('Time (h)')
-    axes.set_ylabel('Altitude (km)')
-    axes.set_title('Altitude vs Time')
-    axes.set_xscale('log')
+    return phases
 
-    plt.text(0.5, 0.5, f'Estimated Total Flight Time [h]: {round(cont_time[-1], 2)}',
-             fontsize=10, fontfamily='Georgia', color='k',
-             ha='left', va='bottom',
-             transform=plt.gca().transAxes)
 
-    fuel_color = 'r' if valid_fuel is True else 'k'
+def draw_flight_phases(phases, ax=None):
 
-    plt.text(0.5, 0.6, f'Necessary Fuel [ton]: {round(fuel, 2)}',
-             fontsize=10, fontfamily='Georgia', color=fuel_color,
-             ha='left', va='bottom',
-             transform=plt.gca().transAxes)
+    """
+    Desenha o gráfico de altitude versus tempo das fases de voo.
 
-    plt.text(0.5, 0.7, f'Cruise Distance [km]: {round(covered_distance_cruise/1000, 2)}',
-             fontsize=10, fontfamily='Georgia', color='k',
-             ha='left', va='bottom',
-             transform=plt.gca().transAxes)
+    Parâmetros:
+    - phases (dict): Resultado de calc_flight_phases.
+    - ax (matplotlib.axes.Axes, opcional): Eixo onde desenhar o gráfico. Se None, cria uma figura nova.
 
-    plt.grid()
+    Retorna:
+    - fig: Objeto figura do matplotlib contendo o gráfico.
+    """
 
-    parameters = {
-        "CRUISE_DISTANCE_METERS": covered_distance_cruise,
-        "NECESSARY_FUEL_KILOS": results_cruise_time['DELTA_FUEL'] * 1000,
-        "ESTIMATED_TOTAL_FLIGHT_TIME_SECONDS": cont_time[-1] * 3600
-    }
+    import matplotlib.pyplot as plt
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(7.5, 1.8))
+    else:
+        fig = ax.figure
+
+    cont_time = phases['TIME']
+
+    ax.plot(cont_time, phases['ALTITUDE'], marker='o', linestyle='-')
+    ax.set_xlabel('Time (h)')
+    ax.set_ylabel('Altitude (km)')
+    ax.set_title('Altitude vs Time')
+    ax.set_xscale('log')
+
+    ax.text(0.5, 0.5, f'Estimated Total Flight Time [h]: {round(cont_time[-1], 2)}',
+            fontsize=10, fontfamily='Georgia', color='k',
+            ha='left', va='bottom',
+            transform=ax.transAxes)
+
+    fuel_color = 'r' if phases['VALID_FUEL'] is True else 'k'
 
-    return fig, parameters
+    ax.text(0.5, 0.6, f'Necessary Fuel [ton]: {round(phases["NECESSARY_FUEL_TONS"], 2)}',
+            fontsize=10, fontfamily='Georgia', color=fuel_color,
+            ha='left', va='bottom',
+            transform=ax.transAxes)
 
+    ax.text(0.5, 0.7, f'Cruise Distance [km]: {round(phases["CRUISE_DISTANCE_METERS"]/1000, 2)}',
+            fontsize=10, fontfamily='Georgia', color='k',
+            ha='left', va='bottom',
+            transform=ax.transAxes)
 
+    ax.grid()
 
+    return fig
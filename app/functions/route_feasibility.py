@@ -0,0 +1,333 @@
+"""
+Viabilidade de rotas de uma frota numa rede de aeroportos: quais aeronaves conseguem voar quais pares de aeroportos.
+
+Para cada aeronave, as grandezas de cruzeiro que não dependem da rota (velocidade, CL, eficiência, diagrama de carga
+paga) são calculadas uma única vez; o combustível de cruzeiro (mesmo modelo de calc_cruise_fuel_weight) e o limite de
+carga paga (diagrama de calc_payload_range_diagram) são calculados para todos os pares de uma vez, sobre a matriz de
+distâncias, em blocos de aeroportos de origem. O resultado é guardado como uma matriz de bits por aeronave.
+"""
+
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import math
+import numpy as np
+from .aero import Aero
+from .cruising_jet import calc_cruise_velocity, calc_payload_range_diagram
+from .distance_matrix import iter_distance_matrix
+from .utils import get_logger
+
+aero = Aero()
+logger = get_logger(log_name="ROUTE_FEASIBILITY")
+
+# Chaves de aircraft_parameters necessárias para o limite de carga paga
+PAYLOAD_RANGE_KEYS = ('MTOW', 'MAXIMUM_FUEL_WEIGHT', 'MAXIMUM_PAYLOAD_WEIGHT')
+
+
+def get_cruise_conditions(aircraft_parameters: dict, flight_parameters: dict, W_CRUISE=None, V_CRUISE=None):
+
+    """
+    Grandezas do cruzeiro que não dependem da rota, como em calc_cruise_fuel_weight.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave ('TSFC', 'S', 'K', 'CD0', 'OEW', 'E_m').
+    - flight_parameters (dict): Parâmetros de voo ('CRUISE_ALTITUDE', 'CRUISE_VELOCITY', 'NUMBER_OF_PASSENGERS',
+      'FUEL_WEIGHT', 'DISPATCHED_CARGO_WEIGHT').
+    - W_CRUISE (float, opcional): Peso de decolagem a ser usado (N).
+    - V_CRUISE (float, opcional): Velocidade de cruzeiro a ser usada (m/s).
+
+    Retorna:
+    dict: Dicionário contendo:
+        - "CRUISE_VELOCITY" (float): Velocidade de cruzeiro (m/s).
+        - "W_1" (float): Peso no início do cruzeiro (N).
+        - "CL_CRUISE" (float): Coeficiente de sustentação no cruzeiro (adimensional).
+        - "E_CRUISE" (float): Eficiência aerodinâmica no cruzeiro (adimensional).
+        - "FUEL_AT_CRUISE" (float): Combustível disponível no início do cruzeiro (N).
+    """
+
+    FW = flight_parameters['FUEL_WEIGHT']
+
+    if flight_parameters['CRUISE_VELOCITY'] == 0:
+        V_cru = calc_cruise_velocity(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)[
+            'CRUISE_VELOCITY'] if V_CRUISE is None else V_CRUISE
+    else:
+        V_cru = flight_parameters['CRUISE_VELOCITY']
+
+    TOW = float(flight_parameters['NUMBER_OF_PASSENGERS'] * aero.person_weight + aircraft_parameters['OEW'] + FW +
+                flight_parameters['DISPATCHED_CARGO_WEIGHT']) if W_CRUISE is None else W_CRUISE
+
+    W_1 = TOW - 0.15 * FW
+
+    sigma = aero.get_sigma(altitude=flight_parameters['CRUISE_ALTITUDE'])
+
+    CL_cru = (2 * W_1) / (aircraft_parameters['S'] * aero.rho_0 * sigma * V_cru ** 2)
+    CD_cru = aircraft_parameters['CD0'] + aircraft_parameters['K'] * (CL_cru ** 2)
+
+    return {
+        "CRUISE_VELOCITY": V_cru,
+        "W_1": W_1,
+        "CL_CRUISE": CL_cru,
+        "E_CRUISE": CL_cru / CD_cru,
+        "FUEL_AT_CRUISE": FW - (TOW - W_1),
+    }
+
+
+def calc_cruise_fuel_weights(aircraft_parameters: dict, cruise_conditions: dict, distances):
+
+    """
+    Versão vetorizada de calc_cruise_fuel_weight: combustível de cruzeiro para várias distâncias de uma vez.
+
+    Parâmetros:
+    - aircraft_parameters (dict): Parâmetros da aeronave ('TSFC', 'K', 'E_m').
+    - cruise_conditions (dict): Resultado de get_cruise_conditions.
+    - distances (array): Distâncias de cruzeiro (m).
+
+    Retorna:
+    dict: Dicionário contendo:
+        - "DELTA_FUEL" (numpy.ndarray): Combustível consumido no cruzeiro (N). Infinito se a distância está além do
+          alcance do modelo.
+        - "ZETA" (numpy.ndarray): Fração de combustível consumida no cruzeiro (adimensional).
+    """
+
+    c = aircraft_parameters['TSFC'] / 3600
+    K = aircraft_parameters['K']
+    E_m = aircraft_parameters['E_m']
+
+    V_cru = cruise_conditions['CRUISE_VELOCITY']
+    CL_cru = cruise_conditions['CL_CRUISE']
+    E_cru = cruise_conditions['E_CRUISE']
+
+    # OJHA - 8.35; a tangente só tem sentido físico até pi/2 (zeta = 1 antes disso)
+    argument = c * np.asarray(distances, dtype=np.float64) / (2 * E_m * V_cru)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tangent = np.tan(np.minimum(argument, math.pi / 2))
+        zeta = 2 * E_m * tangent / (E_cru * (2 * CL_cru * E_m * K * tangent + 1))
+
+    zeta = np.where(argument < math.pi / 2, zeta, np.inf)
+
+    return {
+        "DELTA_FUEL": cruise_conditions['W_1'] * zeta,
+        "ZETA": zeta,
+    }
+
+
+def calc_payload_limits(diagram, distances):
+
+    """
+    Maior carga paga para cada distância, interpolando o diagrama de carga paga x alcance.
+
+    Parâmetros:
+    - diagram (dict): Resultado de calc_payload_range_diagram.
+    - distances (array): Distâncias (m).
+
+    Retorna:
+    numpy.ndarray: Carga paga máxima (kg); -1 para distâncias além do ponto D do diagrama.
+    """
+
+    return np.interp(distances, diagram['RANGE'], diagram['PAYLOAD'], right=-1.0)
+
+
+class RouteFeasibility:
+
+    """
+    Matriz de viabilidade aeronave x origem x destino, guardada em bits (numpy.packbits ao longo dos destinos).
+
+    Parâmetros:
+    - aircraft_names (list): Nomes das aeronaves, na ordem da primeira dimensão.
+    - airport_codes (list): Códigos dos aeroportos, na ordem das outras duas dimensões.
+    - bits (numpy.ndarray): Matriz (aeronaves, origens, ceil(destinos / 8)) de uint8.
+    - payload_range (dict, opcional): Diagrama de carga paga x alcance por aeronave, para max_payload.
+    - latitudes, longitudes (array, opcional): Coordenadas dos aeroportos, para max_payload.
+    - errors (dict, opcional): Erro (repr da exceção) por nome, para as aeronaves que não puderam ser avaliadas. As
+      linhas dessas aeronaves ficam sem nenhuma rota viável.
+    """
+
+    def __init__(self, aircraft_names, airport_codes, bits, payload_range=None, latitudes=None, longitudes=None,
+                 errors=None):
+
+        self.aircraft_names = list(aircraft_names)
+        self.airport_codes = list(airport_codes)
+        self.bits = bits
+        self.payload_range = payload_range or {}
+        self.errors = errors or {}
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+
+        self._aircraft_index = {name: i for i, name in enumerate(self.aircraft_names)}
+        self._airport_index = {code: i for i, code in enumerate(self.airport_codes)}
+
+    def is_valid(self, aircraft_name):
+        """False se a aeronave não pôde ser avaliada (ver errors)."""
+        return aircraft_name not in self.errors
+
+    def matrix(self, aircraft_name):
+        """Matriz (origens, destinos) de bool de uma aeronave."""
+
+        bits = self.bits[self._aircraft_index[aircraft_name]]
+        return np.unpackbits(bits, axis=1, count=len(self.airport_codes)).astype(bool)
+
+    def can_fly(self, aircraft_name, origin, destination):
+
+        i, j = self._airport_index[origin], self._airport_index[destination]
+        byte = self.bits[self._aircraft_index[aircraft_name], i, j // 8]
+
+        return bool((byte >> (7 - j % 8)) & 1)
+
+    def routes(self, aircraft_name):
+        """Pares (origem, destino) viáveis para uma aeronave."""
+
+        origins, destinations = np.nonzero(self.matrix(aircraft_name))
+        return [(self.airport_codes[i], self.airport_codes[j]) for i, j in zip(origins, destinations)]
+
+    def aircrafts(self, origin, destination):
+        """Aeronaves que conseguem voar de origin a destination."""
+        return [name for name in self.aircraft_names if self.can_fly(name, origin, destination)]
+
+    def count(self):
+        """Número de rotas viáveis por aeronave."""
+
+        counts = np.unpackbits(self.bits.reshape(len(self.aircraft_names), -1), axis=1).sum(axis=1)
+        return {name: int(n) for name, n in zip(self.aircraft_names, counts)}
+
+    def max_payload(self, aircraft_name, origin, destination):
+        """Maior carga paga (kg) da aeronave na rota, pelo diagrama de carga paga x alcance; None se não houver diagrama."""
+
+        diagram = self.payload_range.get(aircraft_name)
+
+        if diagram is None or self.latitudes is None:
+            return None
+
+        i, j = self._airport_index[origin], self._airport_index[destination]
+        distance = aero.get_haversine_distances(self.latitudes[i], self.longitudes[i], self.latitudes[j:j + 1],
+                                                self.longitudes[j:j + 1])
+
+        return float(max(calc_payload_limits(diagram, distance)[0], 0.0))
+
+    def save(self, path):
+        """Grava a matriz num arquivo .npz compactado."""
+
+        names = sorted(self.payload_range)
+        failed = sorted(self.errors)
+
+        np.savez_compressed(path, aircraft_names=np.array(self.aircraft_names), airport_codes=np.array(self.airport_codes),
+                            bits=self.bits, latitudes=self.latitudes if self.latitudes is not None else np.empty(0),
+                            longitudes=self.longitudes if self.longitudes is not None else np.empty(0),
+                            payload_range_names=np.array(names, dtype=str),
+                            payload_range=np.array([[self.payload_range[name]['RANGE'], self.payload_range[name]['PAYLOAD']]
+                                                    for name in names], dtype=np.float64).reshape(len(names), 2, 4),
+                            error_names=np.array(failed, dtype=str),
+                            errors=np.array([self.errors[name] for name in failed], dtype=str))
+
+    @classmethod
+    def load(cls, path):
+        """Lê uma matriz gravada com save."""
+
+        with np.load(path) as data:
+
+            payload_range = {str(name): {"RANGE": diagram[0].tolist(), "PAYLOAD": diagram[1].tolist()}
+                             for name, diagram in zip(data['payload_range_names'], data['payload_range'])}
+
+            # Arquivos gravados antes da lista de erros não têm error_names
+            errors = ({str(name): str(error) for name, error in zip(data['error_names'], data['errors'])}
+                      if 'error_names' in data.files else {})
+
+            latitudes = data['latitudes'] if len(data['latitudes']) else None
+            longitudes = data['longitudes'] if len(data['longitudes']) else None
+
+            return cls(aircraft_names=[str(name) for name in data['aircraft_names']],
+                       airport_codes=[str(code) for code in data['airport_codes']], bits=data['bits'],
+                       payload_range=payload_range, latitudes=latitudes, longitudes=longitudes, errors=errors)
+
+
+def calc_route_feasibility(aircrafts: dict, airports, flight_parameters: dict, chunk_size=256):
+
+    """
+    Calcula quais aeronaves conseguem voar quais pares de aeroportos.
+
+    Uma rota é viável para uma aeronave se:
+    - o combustível de cruzeiro (modelo de calc_cruise_fuel_weight, com a carga de flight_parameters) não passa do
+      combustível disponível no início do cruzeiro;
+    - se a aeronave tem MTOW, MAXIMUM_FUEL_WEIGHT e MAXIMUM_PAYLOAD_WEIGHT, a carga paga de flight_parameters
+      (passageiros e carga despachada) não passa do limite do diagrama de carga paga x alcance na distância da rota.
+
+    Parâmetros:
+    - aircrafts (dict): Parâmetros de cada aeronave (aircraft_parameters, com 'K' e 'E_m') por nome.
+    - airports (list): Aeroportos, cada um um dict com 'iata', 'latitude' e 'longitude' (ex.: AirportCatalog.airports).
+      Aeroportos sem coordenadas são ignorados.
+    - flight_parameters (dict): Parâmetros de voo comuns a todas as rotas ('CRUISE_ALTITUDE', 'CRUISE_VELOCITY',
+      'NUMBER_OF_PASSENGERS', 'FUEL_WEIGHT', 'DISPATCHED_CARGO_WEIGHT').
+    - chunk_size (int, opcional): Número de aeroportos de origem calculados por vez. Default é 256.
+
+    Uma aeronave que não pode ser avaliada (ex.: sem empuxo para o cruzeiro) não interrompe as demais: o erro é
+    registrado em RouteFeasibility.errors e a linha da aeronave fica sem nenhuma rota viável.
+
+    Retorna:
+    RouteFeasibility: Matriz de viabilidade.
+    """
+
+    airports = [airport for airport in airports
+                if airport.get('latitude') is not None and airport.get('longitude') is not None]
+
+    codes = [airport['iata'] for airport in airports]
+    latitudes = np.array([float(airport['latitude']) for airport in airports])
+    longitudes = np.array([float(airport['longitude']) for airport in airports])
+
+    n_airports = len(airports)
+    names = list(aircrafts)
+    bits = np.zeros((len(names), n_airports, (n_airports + 7) // 8), dtype=np.uint8)
+
+    payload = (flight_parameters['NUMBER_OF_PASSENGERS'] * aero.person_weight +
+               flight_parameters['DISPATCHED_CARGO_WEIGHT']) / aero.g
+
+    conditions = {}
+    payload_range = {}
+    errors = {}
+
+    for name in names:
+
+        aircraft_parameters = aircrafts[name]
+
+        try:
+            conditions[name] = get_cruise_conditions(aircraft_parameters=aircraft_parameters,
+                                                     flight_parameters=flight_parameters)
+
+            if all(aircraft_parameters.get(key) is not None for key in PAYLOAD_RANGE_KEYS):
+                payload_range[name] = calc_payload_range_diagram(aircraft_parameters=aircraft_parameters,
+                                                                 flight_parameters=flight_parameters,
+                                                                 V_CRUISE=conditions[name]['CRUISE_VELOCITY'])
+        except Exception as error:
+            logger.error("Aircraft %s could not be evaluated: %r", name, error)
+            errors[name] = repr(error)
+            conditions.pop(name, None)
+            payload_range.pop(name, None)
+
+    for start, distances in iter_distance_matrix(latitudes, longitudes, chunk_size=chunk_size):
+
+        rows = np.arange(start, start + len(distances))
+
+        for a, name in enumerate(names):
+
+            if name in errors:
+                continue
+
+            fuel = calc_cruise_fuel_weights(aircraft_parameters=aircrafts[name], cruise_conditions=conditions[name],
+                                            distances=distances)
+            feasible = fuel['DELTA_FUEL'] <= conditions[name]['FUEL_AT_CRUISE']
+
+            if name in payload_range:
+                feasible &= calc_payload_limits(payload_range[name], distances) >= payload
+
+            feasible[np.arange(len(rows)), rows] = False  # Origem igual ao destino não é rota
+
+            bits[a, start:start + len(rows)] = np.packbits(feasible, axis=1)
+
+    logger.debug("Route feasibility: %d aircrafts (%d failed) x %d airports (%.1f kB)", len(names), len(errors),
+                 n_airports, bits.nbytes / 1024)
+
+    return RouteFeasibility(aircraft_names=names, airport_codes=codes, bits=bits, payload_range=payload_range,
+                            latitudes=latitudes, longitudes=longitudes, errors=errors)
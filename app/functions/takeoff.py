@@ -4,10 +4,11 @@ current_dir = os.path.dirname(os.path.realpath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
-from functions.aero import Aero
+from .aero import Aero
 from .utils import get_logger
 from numpy import linspace
-from pandas import DataFrame
+from pandas import DataFrame, Index
+import numpy as np
 import math
 
 aero = Aero()
@@ -16,256 +17,223 @@ logger = get_logger()
 
 def climb_angle(T, D, W):
     """
-    Calcula o ângulo de subida durante a decolagem.
+    Calcula o ângulo de subida durante a decolagem, limitado entre 1.5° e 3.5° (3° se (T - D) / W está fora de [-1, 1]).
 
     Parâmetros:
-    - T (float): Empuxo disponível durante a decolagem.
-    - D (float): Arrasto durante a decolagem.
-    - W (float): Peso da aeronave.
+    - T (float ou array): Empuxo disponível durante a decolagem.
+    - D (float ou array): Arrasto durante a decolagem.
+    - W (float ou array): Peso da aeronave.
 
     Retorna:
-    float: Ângulo de subida em radianos.
+    numpy.ndarray: Ângulo de subida em radianos.
     """
 
-    try:
-        num = T - D
-        gamma = math.asin(num / W)  # [rad]
+    sin_gamma = (T - D) / W
+    with np.errstate(invalid='ignore'):
+        gamma = np.arcsin(sin_gamma)  # [rad]
 
-        if gamma >= math.radians(3.5):
-            gamma = math.radians(3.5)
-        elif gamma <= math.radians(1):
-            gamma = math.radians(1.5)
-
-    except ValueError:
-        gamma = math.radians(3)
-    return gamma
+    gamma = np.where(gamma >= math.radians(3.5), math.radians(3.5), gamma)
+    gamma = np.where(gamma <= math.radians(1), math.radians(1.5), gamma)
+    return np.where(np.abs(sin_gamma) > 1, math.radians(3), gamma)
 
 
 # -------------------------------------------------------------------------------------------------------------------- #
-# ---------------------------------------------------- GROUND RUN ---------------------------------------------------- #
+# ------------------------------------------------------ TAKEOFF ----------------------------------------------------- #
 # -------------------------------------------------------------------------------------------------------------------- #
 
-def ground_run_acceleration(W_takeoff, mu, V_S, altitude, S, K, CD0, CL_max, T0, thrust_factor):
-    # L e D precisa ser calculado considerando a velocidade de decolagem em 0.7 * (V_L0 = 1.15 * V_S)
-    # W é o peso de decolagem
-    # Pagina 386
-
-    V_L0 = 1.15 * V_S
-    rho = aero.get_density(altitude=altitude)
-
-    CL_L0 = 0.8 * CL_max
+TAKEOFF_DISTANCE_KEYS = ("TAKEOFF_DISTANCE", "TAKEOFF_GROUND_DISTANCE", "TAKEOFF_ROTATION_DISTANCE",
+                         "TAKEOFF_TRANSITION_DISTANCE", "TAKEOFF_CLIMB_DISTANCE")
 
-    V = 0.7 * V_L0
-
-    q = (rho * V ** 2) / 2
-    L = CL_L0 * q * S
-    D = 0.5 * rho * (V ** 2) * S * CD0 + 2 * K * S * ((W_takeoff / S) ** 2) * 1 / (rho * V ** 2)
+TAKEOFF_TIME_KEYS = ("TAKEOFF_TIME", "TAKEOFF_GROUND_TIME", "TAKEOFF_ROTATION_TIME", "TAKEOFF_TRANSITION_TIME",
+                     "TAKEOFF_CLIMB_TIME")
 
-    T = aero.calculate_general_thrust(altitude=altitude, sea_level_thrust=T0, thrust_factor=thrust_factor)
 
-    a = (aero.g / W_takeoff) * (T - D - mu * (W_takeoff - L))  # [m/s^2]
+def _calc_single_takeoff(flight_parameters, aircraft_parameters, altitude=None):
 
-    if a < 0:
-        a = 1
+    takeoff_parameters = flight_parameters['takeoff_parameters']
 
-    return a
-
-
-def ground_run_distance(V_S, W, mu, CD0, K, S, altitude, CL_max, T0, thrust_factor, V_wind=0, theta_runway=0):
-    a = ground_run_acceleration(W_takeoff=W, mu=mu, V_S=V_S, CD0=CD0, K=K, S=S, altitude=altitude, CL_max=CL_max, T0=T0,
-                                thrust_factor=thrust_factor)
-    V_L0 = 1.15 * V_S
-    x_g = ((V_L0 + V_wind) ** 2) / (2 * (a + aero.g * math.sin(theta_runway)))  # [m] Página 385
-
-    return x_g
-
-
-def ground_run_time(V_S, W, mu, CD0, K, S, altitude, CL_max, T0, thrust_factor, V_wind=0, theta_runway=0):
-    a = ground_run_acceleration(W_takeoff=W, mu=mu, V_S=V_S, CD0=CD0, K=K, S=S, altitude=altitude, CL_max=CL_max, T0=T0,
-                                thrust_factor=thrust_factor)
+    NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
+    FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
+    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
+    OEW = aircraft_parameters['OEW']
 
-    V_L0 = 1.15 * V_S
-    t_g = (V_L0 + V_wind) / (a + aero.g * math.sin(theta_runway))  # [s]
+    TOW = float(NP * aero.person_weight + OEW + FW + CW)
 
-    return t_g
+    return calc_takeoff_batch(aircraft_parameters=aircraft_parameters,
+                              TOW=TOW,
+                              altitude=takeoff_parameters['ALTITUDE_TAKEOFF'] if altitude is None else altitude,
+                              mu=takeoff_parameters['MU_TAKEOFF'],
+                              V_wind=takeoff_parameters['WIND_VELOCITY_TAKEOFF'],
+                              runway_slope=takeoff_parameters['RUNWAY_SLOPE_TAKEOFF'])
 
-# -------------------------------------------------------------------------------------------------------------------- #
-# ---------------------------------------------------- TRANSITION ---------------------------------------------------- #
-# -------------------------------------------------------------------------------------------------------------------- #
 
+def calc_total_takeoff_distance(flight_parameters, aircraft_parameters, altitude=None):
+    """
+    Calcula as distâncias de decolagem de um caso (calc_takeoff_batch com entradas escalares).
 
-def transition_time(V_S, T, W, D):
-    V_L0 = 1.15 * V_S
-    gamma = climb_angle(T=T, D=D, W=W)
-    R_tr = (V_L0 ** 2) / (0.15 * aero.g)
-    t_tr = (R_tr * gamma) / V_L0  # [s]
+    Parâmetros:
+    - flight_parameters (dict): Dicionário contendo os parâmetros de voo e 'takeoff_parameters'.
+    - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
+    - altitude (float, opcional): Altitude de decolagem (m). Se não fornecido, usa o valor de 'ALTITUDE_TAKEOFF'.
 
-    return t_tr
+    Retorna:
+    dict: Distância total de decolagem e suas componentes (m).
+    """
 
+    result = _calc_single_takeoff(flight_parameters=flight_parameters, aircraft_parameters=aircraft_parameters,
+                                  altitude=altitude)
 
-# -------------------------------------------------------------------------------------------------------------------- #
-# ------------------------------------------------------- CLIMB ------------------------------------------------------ #
-# -------------------------------------------------------------------------------------------------------------------- #
+    return {key: float(result[key]) for key in TAKEOFF_DISTANCE_KEYS}
 
 
-def climb_distance(T, D, V_S, W):
+def calc_total_takeoff_time(flight_parameters, aircraft_parameters, altitude=None, show=False):
     """
-    Calcula a distância de subida durante a decolagem.
+    Calcula os tempos de decolagem de um caso (calc_takeoff_batch com entradas escalares).
 
     Parâmetros:
-    - T (float): Empuxo disponível durante a decolagem.
-    - D (float): Arrasto durante a decolagem.
-    - V_S (float): Velocidade de estol da aeronave.
-    - W (float): Peso da aeronave.
+    - flight_parameters (dict): Dicionário contendo os parâmetros de voo e 'takeoff_parameters'.
+    - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
+    - altitude (float, opcional): Altitude de decolagem (m). Se não fornecido, usa o valor de 'ALTITUDE_TAKEOFF'.
 
     Retorna:
-    float: Distância de subida necessária durante a decolagem.
+    dict: Tempo total de decolagem e suas componentes (s).
     """
 
-    V_L0 = 1.15 * V_S
-    gamma = climb_angle(T=T, D=D, W=W)
-    R_tr = (V_L0 ** 2) / (0.15 * aero.g)
-    h_tr = (1 - math.cos(gamma)) * R_tr
-
-    if aero.h_Sc - h_tr < 0:
-        x_cl = 0
-    else:
-        x_cl = (aero.h_Sc - h_tr) / math.tan(gamma)  # [m]
+    result = _calc_single_takeoff(flight_parameters=flight_parameters, aircraft_parameters=aircraft_parameters,
+                                  altitude=altitude)
 
-    return x_cl
-
-
-def climb_time(T, D, V_S, W):
-    gamma = climb_angle(T=T, D=D, W=W)
-    x_cl = climb_distance(T=T, D=D, V_S=V_S, W=W)
+    return {key: float(result[key]) for key in TAKEOFF_TIME_KEYS}
 
-    V_cl = 1.3 * V_S  # página 382
-    t_cl = x_cl / (V_cl * math.cos(gamma))
 
-    return t_cl  # [s]
+def calc_takeoff_batch(aircraft_parameters, TOW, altitude, mu, V_wind=0, runway_slope=0):
+    """
+    Calcula as distâncias e os tempos de decolagem para vários casos de uma só vez, numa única passagem vetorizada.
 
+    É o único núcleo de cálculo da decolagem: calc_total_takeoff_distance e calc_total_takeoff_time chamam esta função
+    com entradas escalares. rho, V_S, D e a aceleração da corrida no solo são calculados uma única vez para todos os
+    casos.
 
-# -------------------------------------------------------------------------------------------------------------------- #
-# ------------------------------------------------------ TAKEOFF ----------------------------------------------------- #
-# -------------------------------------------------------------------------------------------------------------------- #
-def calc_total_takeoff_distance(flight_parameters, aircraft_parameters, altitude=None):
-
-    V_wind = flight_parameters['takeoff_parameters']['WIND_VELOCITY_TAKEOFF']
-    theta_runway = math.radians(flight_parameters['takeoff_parameters']['RUNWAY_SLOPE_TAKEOFF'])
-    altitude = flight_parameters['takeoff_parameters']['ALTITUDE_TAKEOFF'] if altitude is None else altitude
-    mu = flight_parameters['takeoff_parameters']['MU_TAKEOFF']
+    Parâmetros:
+    - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave ('S', 'K', 'CD0', 'T0', 'NE', 'CL_MAX',
+      'TSFC'). Os valores podem ser escalares ou arrays (uma aeronave por caso).
+    - TOW (float ou array_like): Peso de decolagem (N).
+    - altitude (float ou array_like): Altitude da pista (m).
+    - mu (float ou array_like): Coeficiente de atrito da pista.
+    - V_wind (float ou array_like, opcional): Velocidade do vento (m/s).
+    - runway_slope (float ou array_like, opcional): Inclinação da pista (graus).
 
-    NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
-    FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
-    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
-    OEW = aircraft_parameters['OEW']
+    Retorna:
+    dict: Dicionário com arrays (no formato resultante do broadcast das entradas) contendo as mesmas chaves de
+    calc_total_takeoff_distance e calc_total_takeoff_time.
+    """
 
-    TOW = float(NP * aero.person_weight + OEW + FW + CW)
+    W = np.asarray(TOW, dtype=float)
+    altitude = np.asarray(altitude, dtype=float)
+    mu = np.asarray(mu, dtype=float)
+    V_wind = np.asarray(V_wind, dtype=float)
+    theta_runway = np.radians(runway_slope)
 
-    S = aircraft_parameters['S']
-    K = aircraft_parameters['K']
-    CD0 = aircraft_parameters['CD0']
-    T0 = aircraft_parameters['T0']
-    T = T0 * aircraft_parameters['NE']
-    CL_max = aircraft_parameters['CL_MAX']
-    thrust_factor = (aircraft_parameters['TSFC'] / 3600)
+    S = np.asarray(aircraft_parameters['S'], dtype=float)
+    K = np.asarray(aircraft_parameters['K'], dtype=float)
+    CD0 = np.asarray(aircraft_parameters['CD0'], dtype=float)
+    CL_max = np.asarray(aircraft_parameters['CL_MAX'], dtype=float)
+    T = np.asarray(aircraft_parameters['T0'], dtype=float) * np.asarray(aircraft_parameters['NE'], dtype=float)
+    thrust_factor = np.asarray(aircraft_parameters['TSFC'], dtype=float) / 3600
 
+    # get_density usa a tabela de atmosfera quando ela está ativa (Aero.enable_atmosphere_table)
     rho = aero.get_density(altitude=altitude)
-    V_S = aero.calculate_stall_velocity(W=TOW, CL_max=CL_max, S=S, rho=rho)
+    sigma = rho / aero.rho_0
 
+    V_S = np.sqrt(2 * W / (CL_max * S * rho))
     V_L0 = 1.15 * V_S
     V = 0.7 * V_L0
-    D = 0.5 * rho * (V ** 2) * S * CD0 + 2 * K * S * ((TOW / S) ** 2) * 1 / (rho * V ** 2)
 
-    x_g = ground_run_distance(V_S=V_S, W=TOW, mu=mu, V_wind=V_wind, theta_runway=theta_runway, altitude=altitude, S=S,
-                              K=K, CD0=CD0, CL_max=CL_max, T0=T, thrust_factor=thrust_factor)
+    q = (rho * V ** 2) / 2
+    D = 0.5 * rho * (V ** 2) * S * CD0 + 2 * K * S * ((W / S) ** 2) * 1 / (rho * V ** 2)
+
+    # Ground run (página 385/386)
+    L = 0.8 * CL_max * q * S
+    T_ground = T * (sigma ** thrust_factor)
+    a = (aero.g / W) * (T_ground - D - mu * (W - L))
+    a = np.where(a < 0, 1, a)
+
+    acceleration = a + aero.g * np.sin(theta_runway)
 
+    x_g = ((V_L0 + V_wind) ** 2) / (2 * acceleration)
+    t_g = (V_L0 + V_wind) / acceleration
+
+    # Rotation
     x_r = 3 * V_L0
+    t_r = np.full(np.shape(x_r), 3.0)
 
-    x_cl = climb_distance(T=T, D=D, V_S=V_S, W=TOW)
+    # Transition
+    gamma = climb_angle(T=T, D=D, W=W)
 
-    gamma = climb_angle(T=T, D=D, W=TOW)
     R_tr = (V_L0 ** 2) / (0.15 * aero.g)
-    x_tr = R_tr * math.sin(gamma)  # [m]
+    x_tr = R_tr * np.sin(gamma)
+    t_tr = (R_tr * gamma) / V_L0
 
-    x_to = x_g + x_r + x_tr + x_cl  # [m]
+    # Climb
+    h_tr = (1 - np.cos(gamma)) * R_tr
+    x_cl = np.where(aero.h_Sc - h_tr < 0, 0, (aero.h_Sc - h_tr) / np.tan(gamma))
+    t_cl = x_cl / (1.3 * V_S * np.cos(gamma))
 
-    takeoff_distance_result = {
-        "TAKEOFF_DISTANCE": x_to,
+    return {
+        "TAKEOFF_DISTANCE": x_g + x_r + x_tr + x_cl,
         "TAKEOFF_GROUND_DISTANCE": x_g,
         "TAKEOFF_ROTATION_DISTANCE": x_r,
         "TAKEOFF_TRANSITION_DISTANCE": x_tr,
-        "TAKEOFF_CLIMB_DISTANCE": x_cl}
-
-    return takeoff_distance_result
-
-
-def calc_total_takeoff_time(flight_parameters, aircraft_parameters, altitude=None, show=False):
-
-    V_wind = flight_parameters['takeoff_parameters']['WIND_VELOCITY_TAKEOFF']
-    theta_runway = math.radians(flight_parameters['takeoff_parameters']['RUNWAY_SLOPE_TAKEOFF'])
-    altitude = flight_parameters['takeoff_parameters']['ALTITUDE_TAKEOFF'] if altitude is None else altitude
-    mu = flight_parameters['takeoff_parameters']['MU_TAKEOFF']
-
-    S = aircraft_parameters['S']
-    K = aircraft_parameters['K']
-    CD0 = aircraft_parameters['CD0']
-    CL_max = aircraft_parameters['CL_MAX']
-    T0 = aircraft_parameters['T0']
-    thrust_factor = (aircraft_parameters['TSFC'] / 3600)
-    T = T0 * aircraft_parameters['NE']
-
-    NP = flight_parameters['NUMBER_OF_PASSENGERS']  # number of passengers
-    FW = flight_parameters['FUEL_WEIGHT']  # fuel weight
-    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
-    OEW = aircraft_parameters['OEW']
-
-    TOW = float(NP * aero.person_weight + OEW + FW + CW)
-    W = TOW
+        "TAKEOFF_CLIMB_DISTANCE": x_cl,
+        "TAKEOFF_TIME": t_g + t_r + t_tr + t_cl,
+        "TAKEOFF_GROUND_TIME": t_g,
+        "TAKEOFF_ROTATION_TIME": t_r,
+        "TAKEOFF_TRANSITION_TIME": t_tr,
+        "TAKEOFF_CLIMB_TIME": t_cl}
 
-    rho = aero.get_density(altitude=altitude)
-    V_S = aero.calculate_stall_velocity(W=W, CL_max=CL_max, S=S, rho=rho)
 
-    V_L0 = 1.15 * V_S
-    V = 0.7 * V_L0
-    D = 0.5 * rho * (V ** 2) * S * CD0 + 2 * K * S * ((TOW / S) ** 2) * 1 / (rho * V ** 2)
+# Estratégias de otimização para a distância de decolagem estão na página 389.
 
-    t_g = ground_run_time(V_S=V_S, W=W, mu=mu, V_wind=V_wind, theta_runway=theta_runway, CD0=CD0, K=K, S=S,
-                          altitude=altitude, CL_max=CL_max, T0=T, thrust_factor=thrust_factor)
-    t_r = 3
-    t_tr = transition_time(V_S=V_S, T=T, W=W, D=D)
-    t_cl = climb_time(T=T, D=D, V_S=V_S, W=W)
+def calc_takeoff_distance_time_per_altitude(flight_parameters, aircraft_parameters, altitude=None, altitude_range=None):
 
-    t_to = t_g + t_r + t_tr + t_cl  # [s]
+    """
+    Calcula a distância e o tempo de decolagem para uma grade de altitudes de decolagem, numa única passagem vetorizada.
 
-    takeoff_time_result = {
-        "TAKEOFF_TIME": t_to,
-        "TAKEOFF_GROUND_TIME": t_g,
-        "TAKEOFF_ROTATION_TIME": t_r,
-        "TAKEOFF_TRANSITION_TIME": t_tr,
-        "TAKEOFF_CLIMB_TIME": t_cl}
+    Parâmetros:
+    - flight_parameters (dict): Dicionário contendo os parâmetros de voo e de decolagem.
+        - 'takeoff_parameters' (dict): Dicionário contendo parâmetros específicos de decolagem.
+            - 'ALTITUDE_TAKEOFF' (float): Altitude de decolagem (m).
+    - aircraft_parameters (dict): Dicionário contendo os parâmetros da aeronave.
+    - altitude (float, opcional): Altitude específica de decolagem (m). Se não fornecido, usa o valor de 'ALTITUDE_TAKEOFF'.
+    - altitude_range (array_like, opcional): Grade de altitudes (m). Se não fornecida, usa 10 pontos entre metade da
+      altitude de decolagem e no máximo 3500 m.
 
-    return takeoff_time_result
+    Retorna:
+    - pandas.DataFrame: DataFrame contendo as seguintes colunas:
+        - 'Takeoff Distance [m]': Distância de decolagem calculada para cada altitude de decolagem (m).
+        - 'Takeoff Time [s]': Tempo de decolagem calculado para cada altitude de decolagem (s).
+    """
 
+    if altitude_range is None:
+        takeoff_altitude = flight_parameters['takeoff_parameters']['ALTITUDE_TAKEOFF'] if altitude is None else altitude
+        altitude_range = np.round(linspace(0.5 * takeoff_altitude, min(30 * takeoff_altitude, 3500), 10), -1)
 
-# Estratégias de otimização para a distância de decolagem estão na página 389.
+    altitude_range = np.asarray(altitude_range, dtype=float)
 
-def calc_takeoff_distance_time_per_altitude(flight_parameters, aircraft_parameters, altitude=None):
-    takeoff_altitude = flight_parameters['takeoff_parameters']['ALTITUDE_TAKEOFF'] if altitude is None else altitude
+    NP = flight_parameters['NUMBER_OF_PASSENGERS']
+    FW = flight_parameters['FUEL_WEIGHT']
+    CW = flight_parameters['DISPATCHED_CARGO_WEIGHT']
 
-    altitude_range = [round(i, -1) for i in linspace(0.5 * takeoff_altitude, min(30 * takeoff_altitude, 3500), 10)]
+    TOW = float(NP * aero.person_weight + aircraft_parameters['OEW'] + FW + CW)
 
-    takeoff_distance_range = [
-        round(calc_total_takeoff_distance(flight_parameters=flight_parameters, aircraft_parameters=aircraft_parameters,
-                                          altitude=alti)['TAKEOFF_DISTANCE'], 2)
-        for alti in altitude_range]
+    takeoff = calc_takeoff_batch(aircraft_parameters=aircraft_parameters,
+                                 TOW=TOW,
+                                 altitude=altitude_range,
+                                 mu=flight_parameters['takeoff_parameters']['MU_TAKEOFF'],
+                                 V_wind=flight_parameters['takeoff_parameters']['WIND_VELOCITY_TAKEOFF'],
+                                 runway_slope=flight_parameters['takeoff_parameters']['RUNWAY_SLOPE_TAKEOFF'])
 
-    takeoff_time_range = [
-        round(calc_total_takeoff_time(flight_parameters=flight_parameters, aircraft_parameters=aircraft_parameters,
-                                      altitude=alti)['TAKEOFF_TIME'], 2)
-        for alti in altitude_range]
+    df = DataFrame(index=Index(altitude_range, name='Altitude [m]'), data={
+        'Takeoff Distance [m]': np.round(takeoff['TAKEOFF_DISTANCE'], 2),
+        'Takeoff Time [s]': np.round(takeoff['TAKEOFF_TIME'], 2)})
 
-    df = DataFrame(index=altitude_range, data={
-        'Takeoff Distance [m]': takeoff_distance_range, 'Takeoff Time [s]': takeoff_time_range})
-    df.index.name = 'Altitude [m]'
-    return df
\ No newline at end of file
+    return df
@@ -1,5 +1,8 @@
 from functools import wraps
 import logging
+import os
+import threading
+import weakref
 from logging.config import dictConfig
 
 
@@ -26,6 +29,44 @@ def deep_freeze_args(func):
     return wrapped
 
 
+# Locks de lazy_property: um por (instância, propriedade). Ficam fora do __dict__ da instância, que continua
+# serializável (pickle), e somem junto com ela.
+_lazy_property_locks = weakref.WeakKeyDictionary()
+_lazy_property_locks_lock = threading.Lock()
+
+
+class lazy_property:
+    """
+    Propriedade avaliada apenas no primeiro acesso; o valor fica guardado no __dict__ da instância, de modo que os
+    acessos seguintes não chamam mais a função (equivalente a functools.cached_property, disponível só a partir do
+    Python 3.8). O primeiro cálculo é protegido por um lock próprio da instância e da propriedade: threads que acessam a
+    mesma propriedade ao mesmo tempo não repetem o cálculo, e propriedades diferentes são calculadas em paralelo.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def get_lock(self, instance):
+        with _lazy_property_locks_lock:
+            locks = _lazy_property_locks.setdefault(instance, {})
+            return locks.setdefault(self.name, threading.RLock())
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if self.name in instance.__dict__:
+            return instance.__dict__[self.name]
+        with self.get_lock(instance):
+            # Outra thread pode ter calculado o valor enquanto esta esperava pelo lock
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+            value = self.func(instance)
+            instance.__dict__[self.name] = value
+        return value
+
+
 def print_formatted_string(input_string=None, total_length=50, how=None):
     if how == "center":
         formatted_string = f"| {input_string:^{total_length - 4}} |"
@@ -55,25 +96,86 @@ def hash_dict(func):
         return func(*args, **kwargs)
     return wrapped
 
+LOGGER_NAMESPACE = "aero"
+LOG_LEVEL_ENV_VAR = "AERO_LOG_LEVEL"
+
+_loggers = {}
+_loggers_lock = threading.Lock()
+_logging_configured = False
+
+
+def configure_logging(level=None, force=False):
+    """
+    Configura, uma única vez por processo, o handler do logger "aero" usado pela aplicação.
+
+    Parâmetros:
+    - level (str ou int, opcional): Nível de log. Se não fornecido, usa a variável de ambiente AERO_LOG_LEVEL (padrão:
+      DEBUG).
+    - force (bool, opcional): Refaz a configuração mesmo que ela já tenha sido feita.
+
+    Retorna:
+    logging.Logger: Logger raiz da aplicação ("aero").
+    """
+
+    global _logging_configured
+
+    with _loggers_lock:
+
+        if _logging_configured and not force:
+            if level is not None:
+                logging.getLogger(LOGGER_NAMESPACE).setLevel(level)
+            return logging.getLogger(LOGGER_NAMESPACE)
+
+        if level is None:
+            level = os.environ.get(LOG_LEVEL_ENV_VAR, "DEBUG").upper()
+
+        logging_config = dict(
+            version=1,
+            disable_existing_loggers=False,
+            formatters={
+                'f': {'format': '%(asctime)s | %(name)-4s | %(levelname)-4s | %(message)s'}},
+            handlers={
+                'h': {'class': 'logging.StreamHandler',
+                      'formatter': 'f',
+                      'level': logging.DEBUG}
+            },
+            loggers={
+                LOGGER_NAMESPACE: {
+                    'handlers': ['h'],
+                    'level': level,
+                    'propagate': False,
+                }
+            },
+        )
+
+        dictConfig(logging_config)
+
+        _logging_configured = True
+
+    return logging.getLogger(LOGGER_NAMESPACE)
+
+
 def get_logger(log_name=""):
-    logging_config = dict(
-        version=1,
-        formatters={
-            'f': {'format': f'%(asctime)s | %(name)-4s | %(levelname)-4s | {log_name} |%(message)s'}},
-        handlers={
-            'h': {'class': 'logging.StreamHandler',
-                  'formatter': 'f',
-                  'level': logging.DEBUG}
-        },
-        root={
-            'handlers': ['h'],
-            'level': logging.DEBUG,
-        },
-    )
-
-    dictConfig(logging_config)
-
-    logger = logging.getLogger()
+    """
+    Retorna um logger nomeado dentro do namespace "aero". A configuração do logging é feita apenas na primeira chamada
+    e os loggers ficam em cache, de modo que a função pode ser chamada em caminhos críticos sem custo relevante.
+
+    Parâmetros:
+    - log_name (str, opcional): Nome do logger (ex.: "Cruise"). Se vazio, retorna o logger "aero".
+
+    Retorna:
+    logging.Logger: Logger nomeado.
+    """
+
+    logger = _loggers.get(log_name)
+
+    if logger is None:
+
+        if not _logging_configured:
+            configure_logging()
+
+        logger = logging.getLogger(f"{LOGGER_NAMESPACE}.{log_name}" if log_name else LOGGER_NAMESPACE)
+        _loggers[log_name] = logger
 
     return logger
 
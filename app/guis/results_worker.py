@@ -0,0 +1,61 @@
+from PySide2.QtCore import QObject, QRunnable, Signal
+from functions.utils import get_logger
+
+logger = get_logger(log_name="RESULTS_WORKER")
+
+
+class PhaseSignals(QObject):
+
+    """
+    Sinais emitidos pelas tarefas de cálculo. O objeto é criado na thread principal, de modo que os slots conectados a
+    ele rodam na thread principal (conexão enfileirada) e podem atualizar a interface.
+
+    - finished(run_id, phase, result): fase calculada com sucesso.
+    - failed(run_id, phase, message): fase terminou com erro.
+    """
+
+    finished = Signal(int, str, object)
+    failed = Signal(int, str, str)
+
+
+class PhaseRunnable(QRunnable):
+
+    """
+    Calcula uma fase de voo em uma thread do QThreadPool.
+
+    Parâmetros:
+    - run_id (int): Identificador do cálculo ao qual a fase pertence.
+    - phase (str): Nome da fase (ex.: "TAKEOFF").
+    - function (callable): Função sem argumentos que calcula a fase. Não deve criar widgets nem figuras.
+    - signals (PhaseSignals): Sinais usados para devolver o resultado à thread principal.
+    - is_current (callable): Recebe run_id e indica se o cálculo ainda é o atual; fases de cálculos obsoletos não são
+      calculadas nem emitidas.
+    """
+
+    def __init__(self, run_id, phase, function, signals, is_current):
+
+        super(PhaseRunnable, self).__init__()
+
+        self.run_id = run_id
+        self.phase = phase
+        self.function = function
+        self.signals = signals
+        self.is_current = is_current
+
+        self.setAutoDelete(True)
+
+    def run(self):
+
+        if not self.is_current(self.run_id):
+            logger.debug("Skipping stale %s (run %d)", self.phase, self.run_id)
+            return
+
+        try:
+            result = self.function()
+        except Exception as error:
+            logger.exception("%s failed (run %d)", self.phase, self.run_id)
+            self.signals.failed.emit(self.run_id, self.phase, repr(error))
+            return
+
+        if self.is_current(self.run_id):
+            self.signals.finished.emit(self.run_id, self.phase, result)
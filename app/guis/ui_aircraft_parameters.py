@@ -7,7 +7,7 @@ from functions.utils import get_logger
 from PySide2 import QtWidgets
 from functions.aero import Aero
 from PySide2.QtWidgets import QMainWindow, QPushButton, QWidget, QLabel, QTextEdit
-from db.utils.db_utils import *
+from db.utils.repository import get_repository, AIRCRAFTS_IN_TONS_QUERY
 import math
 
 
@@ -40,8 +40,8 @@ class GUI_AIRCRAFT_PARAMETERS(QMainWindow):
         self.new_aircraft_name = None
         self.background_path = background_path
 
-        _, self.aircrafts_parameters = execute_generic_query(db_path=r"db/aero.db",
-                                                             query="select nome_aeronave, id, cd0, area, cl_max, oew/1000 as oew, tsfc, b, e, t0/1000 as t0, ne, mtow/1000 as mtow, fuel_weight/1000 as fuel_weight, maximum_payload_weight/1000 as maximum_payload_weight from Airplanes;", first_value=False)
+        self.repository = get_repository(db_path=r"db/aero.db")
+        self.aircrafts_parameters = self.repository.get_aircrafts(query=AIRCRAFTS_IN_TONS_QUERY)
 
         self.runway_temperature_takeoff_value = 0
         self.runway_temperature_takeoff = None
@@ -432,7 +432,7 @@ class GUI_AIRCRAFT_PARAMETERS(QMainWindow):
         if not self.text_aircraft_name:
             self.new_aircraft_name.setPlainText(" ")
 
-        self.logger.debug(f"Aircraft name: {self.text_aircraft_name}")
+        self.logger.debug("Aircraft name: %s", self.text_aircraft_name)
 
     def handle_cl_max_value(self):
         text_cl_max = self.cl_max.toPlainText()
@@ -699,7 +699,7 @@ class GUI_AIRCRAFT_PARAMETERS(QMainWindow):
             'E_m': 1 / (2 * math.sqrt(K * CD0)),
         }
 
-        self.logger.debug(f"Current aircraft parameters: {result}")
+        self.logger.debug("Current aircraft parameters: %s", result)
 
         return result
 
@@ -739,10 +739,9 @@ class GUI_AIRCRAFT_PARAMETERS(QMainWindow):
         if aircraft_name is not None:
             result = self.warning_box(message=f"Are you sure you want to delete '{aircraft_name}' from the database ?\nThis action can't be undone.", ok_and_decline=True)
             if result == 0:
-                delete_query = f"delete from airplanes where nome_aeronave = '{aircraft_name}'"
-                delete_db_query(db_path=r"./db/aero.db", query=delete_query)
+                self.repository.delete_aircraft(aircraft_name)
 
-                _, self.aircrafts_parameters = execute_generic_query(db_path=r"./db/aero.db", query="select nome_aeronave, id, cd0, area, cl_max, oew/1000 as oew, tsfc, b, e, t0/1000 as t0, ne, mtow/1000 as mtow, fuel_weight/1000 as fuel_weight, maximum_payload_weight/1000 as maximum_payload_weight from Airplanes;", first_value=False)
+                self.aircrafts_parameters = self.repository.get_aircrafts(query=AIRCRAFTS_IN_TONS_QUERY)
 
                 self.aircraft_list_db.clear()
 
@@ -756,8 +755,7 @@ class GUI_AIRCRAFT_PARAMETERS(QMainWindow):
     def save_current_aicraft_to_db(self):
 
         result = self.get_aircraft_parameters()
-        _, self.aircrafts_parameters = execute_generic_query(db_path=r"./db/aero.db", query="select nome_aeronave, id, cd0, area, cl_max, oew/1000 as oew, tsfc, b, e, t0/1000 as t0, ne, mtow/1000 as mtow, fuel_weight/1000 as fuel_weight, maximum_payload_weight/1000 as maximum_payload_weight from Airplanes;",
-                                                             first_value=False)
+        self.aircrafts_parameters = self.repository.get_aircrafts(query=AIRCRAFTS_IN_TONS_QUERY)
 
         if result['AIRCRAFT_NAME'] in self.aircrafts_parameters.keys():
             self.warning_box(message='Aircraft already in the database. Give it another name.')
@@ -767,15 +765,8 @@ class GUI_AIRCRAFT_PARAMETERS(QMainWindow):
 
         else:
 
-            insert_query = f""" 
-            INSERT INTO airplanes 
-            (nome_aeronave, cd0, area, cl_max, oew, tsfc, b, e, t0, ne, mtow, fuel_weight, maximum_payload_weight) 
-            VALUES (
-                '{result['AIRCRAFT_NAME']}', {result['CD0']}, {result['S']}, {result['CL_MAX']}, {result['OEW']}, {result['TSFC']}, {result['b']}, {result['e']}, {result['T0']}, {result['NE']}, {result['MTOW']}, {result['MAXIMUM_FUEL_WEIGHT']}, {result['MAXIMUM_PAYLOAD_WEIGHT']}) ;
-            """
-
-            insert_data_to_db(db_path=r"./db/aero.db", query=insert_query)
-            _, self.aircrafts_parameters = execute_generic_query(db_path=r"./db/aero.db", query="select nome_aeronave, id, cd0, area, cl_max, oew/1000 as oew, tsfc, b, e, t0/1000 as t0, ne, mtow/1000 as mtow, fuel_weight/1000 as fuel_weight, maximum_payload_weight/1000 as maximum_payload_weight from Airplanes;", first_value=False)
+            self.repository.insert_aircraft(result)
+            self.aircrafts_parameters = self.repository.get_aircrafts(query=AIRCRAFTS_IN_TONS_QUERY)
 
             self.aircraft_list_db.clear()
 
@@ -796,20 +787,9 @@ class GUI_AIRCRAFT_PARAMETERS(QMainWindow):
             message=f"Are you sure you want to update the values of the '{aircraft_name}'? The current values will replace the old ones.",
             ok_and_decline=True)
         if result_message == 0:
-            # Primeiro deletamos, dps inserimos novamente a aeronave
-            delete_query = f"delete from airplanes where nome_aeronave = '{aircraft_name}'"
-            delete_db_query(db_path=r"./db/aero.db", query=delete_query)
-
-
-            insert_query = f""" 
-            INSERT INTO airplanes 
-            (nome_aeronave, cd0, area, cl_max, oew, tsfc, b, e, t0, ne, mtow, fuel_weight, maximum_payload_weight) 
-            VALUES (
-                '{result['AIRCRAFT_NAME']}', {result['CD0']}, {result['S']}, {result['CL_MAX']}, {result['OEW']}, {result['TSFC']}, {result['b']}, {result['e']}, {result['T0']}, {result['NE']}, {result['MTOW']}, {result['MAXIMUM_FUEL_WEIGHT']}, {result['MAXIMUM_PAYLOAD_WEIGHT']}) ;
-            """
-
-            insert_data_to_db(db_path=r"./db/aero.db", query=insert_query)
-            _, self.aircrafts_parameters = execute_generic_query(db_path=r"./db/aero.db", query="select nome_aeronave, id, cd0, area, cl_max, oew/1000 as oew, tsfc, b, e, t0/1000 as t0, ne, mtow/1000 as mtow, fuel_weight/1000 as fuel_weight, maximum_payload_weight/1000 as maximum_payload_weight from Airplanes;", first_value=False)
+            # Remove e insere novamente a aeronave, numa única transação
+            self.repository.update_aircraft(result)
+            self.aircrafts_parameters = self.repository.get_aircrafts(query=AIRCRAFTS_IN_TONS_QUERY)
 
             self.aircraft_list_db.clear()
 
@@ -8,7 +8,7 @@ from PySide2 import QtWidgets
 from functions.aero import Aero
 from functions.plot_geo import get_map
 from PySide2.QtWidgets import QMainWindow, QPushButton, QWidget, QLabel, QCheckBox, QTextEdit
-from db.utils.db_utils import *
+from db.utils.repository import get_repository
 from guis.ui_new_airport_table import InputTableWindow
 
 
@@ -55,9 +55,10 @@ class GUI_FLIGHT_CONDITIONS(QMainWindow):
         self.new_aircraft_name = None
         self.background_path = background_path
 
-        _, self.aircrafts_parameters = execute_generic_query(db_path=r"db/aero.db", query="select * from Airplanes;", first_value=False)
-        self.airports, _ = execute_generic_query(db_path=r"db/aero.db", query="select iata, icao, aeroporto from Airports order by iata asc;", first_value=False)
-        self.runway_condition_options, _ = execute_generic_query(db_path=r"db/aero.db", query="select superficie from GroundTypes;")
+        self.repository = get_repository(db_path=r"db/aero.db")
+        self.aircrafts_parameters = self.repository.get_aircrafts()
+        self.airports = self.repository.get_airports()
+        self.runway_condition_options = list(self.repository.get_ground_types())
 
         self.runway_temperature_takeoff_value = 0
         self.runway_temperature_takeoff = None
@@ -743,7 +744,7 @@ class GUI_FLIGHT_CONDITIONS(QMainWindow):
 
     def insert_new_airport(self):
 
-        self.airports, _ = execute_generic_query(db_path=r"db/aero.db", query="select iata, icao, aeroporto from Airports order by iata asc;", first_value=False)
+        self.airports = self.repository.get_airports()
 
         self.airport_list_landing.clear()
         self.airport_list_takeoff.clear()
@@ -806,9 +807,9 @@ class GUI_FLIGHT_CONDITIONS(QMainWindow):
 
 
     def calculate_runway_takeoff_condition_parameter(self):
-        self.runway_condition_takeoff_mu, _ = execute_generic_query(
-            db_path=r"db/aero.db",
-            query=f"select cof_friction_breaking_off from GroundTypes where superficie='{self.runway_condition_takeoff_text}';")
+        ground_type = self.repository.get_ground_type(self.runway_condition_takeoff_text)
+        if ground_type is not None:
+            self.runway_condition_takeoff_mu = ground_type['cof_friction_breaking_off']
 
 
     def handle_slope_takeoff_value(self):
@@ -873,41 +874,35 @@ class GUI_FLIGHT_CONDITIONS(QMainWindow):
 
     def calculate_runway_landing_condition_parameter(self):
 
-        self.runway_condition_landing_mu, _ = execute_generic_query(
-            db_path=r"db/aero.db",
-            query=f"select cof_friction_breaking_on from GroundTypes where superficie='{self.runway_condition_landing_text}';")
+        ground_type = self.repository.get_ground_type(self.runway_condition_landing_text)
+        if ground_type is not None:
+            self.runway_condition_landing_mu = ground_type['cof_friction_breaking_on']
 
 
     def calculate_takeoff_airport_parameters(self):
 
-        airport_takeoff_results, _ = execute_generic_query(
-            db_path=r"db/aero.db",
-            query=f"select elevacao, pista, latitude, longitude, '{self.current_takeoff_airport_iata}' as airport_code, aeroporto from airports where iata='{self.current_takeoff_airport_iata}';",
-            first_value=False)
+        airport_takeoff_results = self.repository.get_airport(self.current_takeoff_airport_iata)
 
-        if len(airport_takeoff_results) != 0:
+        if airport_takeoff_results is not None:
 
-            self.airport_takeoff_parameters['AIRPORT_TAKEOFF_ELEVATION'] = airport_takeoff_results[0][0]
-            self.airport_takeoff_parameters['AIRPORT_TAKEOFF_RUNWAY_DISTANCE'] = airport_takeoff_results[0][1]
-            self.airport_takeoff_parameters['AIRPORT_TAKEOFF_LATITUDE'] = airport_takeoff_results[0][2]
-            self.airport_takeoff_parameters['AIRPORT_TAKEOFF_LONGITUDE'] = airport_takeoff_results[0][3]
-            self.airport_takeoff_parameters['AIRPORT_IATA_CODE'] = airport_takeoff_results[0][4]
-            self.airport_takeoff_parameters['AIRPORT_NAME'] = airport_takeoff_results[0][5]
+            self.airport_takeoff_parameters['AIRPORT_TAKEOFF_ELEVATION'] = airport_takeoff_results['elevacao']
+            self.airport_takeoff_parameters['AIRPORT_TAKEOFF_RUNWAY_DISTANCE'] = airport_takeoff_results['pista']
+            self.airport_takeoff_parameters['AIRPORT_TAKEOFF_LATITUDE'] = airport_takeoff_results['latitude']
+            self.airport_takeoff_parameters['AIRPORT_TAKEOFF_LONGITUDE'] = airport_takeoff_results['longitude']
+            self.airport_takeoff_parameters['AIRPORT_IATA_CODE'] = airport_takeoff_results['iata']
+            self.airport_takeoff_parameters['AIRPORT_NAME'] = airport_takeoff_results['aeroporto']
 
     def calculate_landing_airport_parameters(self):
 
-        airport_landing_results, _ = execute_generic_query(
-            db_path=r"db/aero.db",
-            query=f"select elevacao, pista, latitude, longitude, '{self.current_landing_airport_iata}' as airport_code, aeroporto from airports where iata='{self.current_landing_airport_iata}';",
-            first_value=False)
-
-        if len(airport_landing_results) != 0:
-            self.airport_landing_parameters['AIRPORT_LANDING_ELEVATION']        = airport_landing_results[0][0]
-            self.airport_landing_parameters['AIRPORT_LANDING_RUNWAY_DISTANCE']  = airport_landing_results[0][1]
-            self.airport_landing_parameters['AIRPORT_LANDING_LATITUDE']         = airport_landing_results[0][2]
-            self.airport_landing_parameters['AIRPORT_LANDING_LONGITUDE']        = airport_landing_results[0][3]
-            self.airport_landing_parameters['AIRPORT_IATA_CODE']                = airport_landing_results[0][4]
-            self.airport_landing_parameters['AIRPORT_NAME']                     = airport_landing_results[0][5]
+        airport_landing_results = self.repository.get_airport(self.current_landing_airport_iata)
+
+        if airport_landing_results is not None:
+            self.airport_landing_parameters['AIRPORT_LANDING_ELEVATION']        = airport_landing_results['elevacao']
+            self.airport_landing_parameters['AIRPORT_LANDING_RUNWAY_DISTANCE']  = airport_landing_results['pista']
+            self.airport_landing_parameters['AIRPORT_LANDING_LATITUDE']         = airport_landing_results['latitude']
+            self.airport_landing_parameters['AIRPORT_LANDING_LONGITUDE']        = airport_landing_results['longitude']
+            self.airport_landing_parameters['AIRPORT_IATA_CODE']                = airport_landing_results['iata']
+            self.airport_landing_parameters['AIRPORT_NAME']                     = airport_landing_results['aeroporto']
 
     def update_parameters(self, new_aircraft_parameters):
         self.aircraft_parameters = new_aircraft_parameters
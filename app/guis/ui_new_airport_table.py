@@ -1,7 +1,7 @@
 from PySide2.QtWidgets import QApplication, QMainWindow, QTableWidget, QTableWidgetItem, QPushButton, QVBoxLayout, \
     QWidget
 from PySide2.QtCore import Signal
-from db.utils.db_utils import *
+from db.utils.repository import get_repository
 from PySide2.QtWidgets import *
 
 class InputTableWindow(QMainWindow):
@@ -70,10 +70,10 @@ class InputTableWindow(QMainWindow):
 
         airport_code = self.input_values['Airport Code']
 
-        _, self.airports = execute_generic_query(db_path=r"./db/aero.db", query="select distinct iata from airports;", first_value=False)
+        repository = get_repository(db_path=r"./db/aero.db")
+        self.airports = repository.get_airport_codes()
 
-
-        if airport_code in self.airports.keys():
+        if airport_code in self.airports:
             self.warning_box(message='Airport code already in the database. Give it another code.')
 
         elif any(t == '' for t in list(self.input_values.values())):
@@ -81,12 +81,16 @@ class InputTableWindow(QMainWindow):
 
         else:
 
-            insert_query = f"""
-                        INSERT INTO AIRPORTS
-                        (iata, icao, aeroporto, pista, elevacao, latitude, longitude)
-                        VALUES ('{self.input_values['Airport Code']}', '{self.input_values['Airport Code']}', '{self.input_values['Airport Name']}', {self.input_values['Runway Lenght']}, {self.input_values['Elevation']}, {self.input_values['Latitude']}, {self.input_values['Longitude']}) ;
-                        """
-            insert_data_to_db(db_path=r"./db/aero.db", query=insert_query)
+            # Colunas numéricas: o SQLite converte os textos numéricos
+            repository.insert_airport({
+                "iata": self.input_values['Airport Code'],
+                "icao": self.input_values['Airport Code'],
+                "aeroporto": self.input_values['Airport Name'],
+                "pista": self.input_values['Runway Lenght'],
+                "elevacao": self.input_values['Elevation'],
+                "latitude": self.input_values['Latitude'],
+                "longitude": self.input_values['Longitude']
+            })
             self.success_box(message='Airport successfully created!')
 
 
@@ -9,32 +9,37 @@ from PySide2 import QtWidgets
 from functions.aero import Aero
 import matplotlib.pyplot as plt
 import copy
+from functools import partial
 from datetime import datetime
 import matplotlib as mpl
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, FigureCanvas, NavigationToolbar2QT as NavigationToolbar
-from numpy import array, hstack, vstack, zeros
 from pandas import DataFrame
 from PySide2.QtWidgets import QMainWindow, QPushButton, QWidget, QLabel
-from functions.takeoff import calc_total_takeoff_distance, calc_total_takeoff_time, calc_takeoff_distance_time_per_altitude
-from functions.plot_phases import plot_phases
-from functions.landing import calc_total_landing_distance, calc_total_landing_time, calc_landing_distance_time_per_altitude
-from functions.manevour import calc_load_factor_turning_rate_turning_radius_graph, calc_fastest_turn, calc_tighest_turn, calc_stall_turn
-from functions.gliding import gliding_range_endurance, gliding_angle_rate_of_descent
-from functions.cruising_jet import (calc_cruising_jet_range, calc_cruising_jet_endurance, calc_cruise_velocity,
-                                    calc_payload_x_range, calc_cruise_fuel_weight)
-from functions.climb import (calc_max_climb_angle_rate_of_climb, calc_distance_time_steepest_climb,
-                             calc_service_ceiling, calc_distance_time_fastest_climb)
+from matplotlib.figure import Figure
+from functions.plot_phases import calc_flight_phases, draw_flight_phases
+from functions.plot_panels import compose_panels
+from functions.manevour import calc_load_factor_turning_rate_turning_radius, plot_load_factor_turning_rate_turning_radius
+from functions.gliding import (gliding_range_endurance, gliding_angle_rate_of_descent, plot_gliding_angle, plot_rate_of_descent,
+                               plot_gliding_range_endurance_constant_lift, plot_gliding_range_endurance_constant_airspeed)
+from functions.cruising_jet import calc_cruise_velocity, plot_cruise_drag, calc_payload_range_diagram, plot_payload_range
+from functions.climb import calc_max_climb_angle_rate_of_climb, plot_rate_of_climb_per_velocity, plot_rate_of_climb_per_altitude
+from functions.mission import Mission
 from .ui_display_pandas_table import PandasWindow
+from .results_worker import PhaseSignals, PhaseRunnable
 
 
-backend = mpl.get_backend()
+# Propriedades de Mission calculadas por cada fase, fora da thread principal
+PHASE_PROPERTIES = {
+    "TAKEOFF": ("takeoff", "takeoff_per_altitude"),
+    "CLIMB": ("climb", "steepest_climb", "fastest_climb", "service_ceiling"),
+    "LANDING": ("landing", "landing_per_altitude"),
+    "CRUISE": ("cruise_velocity", "cruise_range", "cruise_endurance", "cruise_fuel_weight"),
+    "GLIDING": ("gliding", "gliding_angle"),
+    "MANEVOUR": ("fastest_turn", "tighest_turn", "stall_turn"),
+}
 
-def show_figure(fig):
-
-    dummy = plt.figure()
-    new_manager = dummy.canvas.manager
-    new_manager.canvas.figure = fig
-    fig.set_canvas(new_manager.canvas)
+# Fases cujos resultados são usados no gráfico das fases de voo
+FLIGHT_PHASES_DEPENDENCIES = {"TAKEOFF", "CLIMB", "LANDING", "CRUISE", "GLIDING"}
 
 class GUI_RESULTS(QMainWindow):
 
@@ -43,6 +48,7 @@ class GUI_RESULTS(QMainWindow):
         super(GUI_RESULTS, self).__init__()
 
         self.fig_phases = None
+        self.flight_phases = None
         self.font = QFont()
         self.font.setPointSize(10)
 
@@ -59,9 +65,42 @@ class GUI_RESULTS(QMainWindow):
 
         self.aircraft_parameters = aircraft_parameters
         self.flight_parameters = flight_parameters
+        self.mission = None
 
         self.logger = get_logger(log_name="UI_RESULTS")
 
+        # Cálculo em segundo plano: cada chamada de calculate_all_results recebe um run_id novo e os resultados de
+        # cálculos anteriores são descartados
+        self.thread_pool = QThreadPool()
+        self.run_id = 0
+        self.pending_phases = set()
+        self.failed_phases = set()
+        self.phase_signals = PhaseSignals()
+        self.phase_signals.finished.connect(self.on_phase_finished)
+        self.phase_signals.failed.connect(self.on_phase_failed)
+
+        self.phase_handlers = {
+            "TAKEOFF": self.calculate_takeoff_parameters,
+            "CLIMB": self.calculate_climb_parameters,
+            "LANDING": self.calculate_landing_parameters,
+            "CRUISE": self.calculate_cruising_parameters,
+            "GLIDING": self.calculate_gliding_parameters,
+            "MANEVOUR": self.calculate_manevour_parameters,
+        }
+
+        # Gráficos dos resultados: montados só quando o usuário os abre pela primeira vez e guardados até o próximo cálculo
+        self.figures = {}
+        self.figure_builders = {
+            "CRUISE_DRAG": self.build_cruise_drag_figure,
+            "PAYLOAD_RANGE": self.build_payload_range_figure,
+            "RATE_OF_CLIMB": self.build_rate_of_climb_figure,
+            "MANEVOUR": self.build_manevour_figure,
+            "GLIDING": self.build_gliding_figure,
+            "GLIDING_CONSTANT_LIFT": self.build_gliding_constant_lift_figure,
+            "GLIDING_CONSTANT_AIRSPEED": self.build_gliding_constant_airspeed_figure,
+            "FLIGHT_PHASES": self.build_flight_phases_figure,
+        }
+
         self.background_path = background_path
         self.objects_list = []
 
@@ -448,10 +487,10 @@ class GUI_RESULTS(QMainWindow):
 
     def calculate_takeoff_parameters(self):
 
-        self.results_takeoff_distance = calc_total_takeoff_distance(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
-        self.results_takeoff_time = calc_total_takeoff_time(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
+        self.results_takeoff_distance = self.mission.takeoff
+        self.results_takeoff_time = self.mission.takeoff
 
-        self.df_takeoff_per_altitude = calc_takeoff_distance_time_per_altitude(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
+        self.df_takeoff_per_altitude = self.mission.takeoff_per_altitude
 
         self.takeoff_distance_and_time_per_altitude.set_df(new_df=self.df_takeoff_per_altitude)
 
@@ -491,11 +530,11 @@ class GUI_RESULTS(QMainWindow):
 
     def calculate_landing_parameters(self):
 
-        self.results_landing_distance = calc_total_landing_distance(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
-        self.results_landing_time = calc_total_landing_time(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
+        self.results_landing_distance = self.mission.landing
+        self.results_landing_time = self.mission.landing
 
 
-        self.df_landing_per_altitude = calc_landing_distance_time_per_altitude(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
+        self.df_landing_per_altitude = self.mission.landing_per_altitude
 
         self.landing_distance_and_time_per_altitude.set_df(new_df=self.df_landing_per_altitude)
 
@@ -545,11 +584,9 @@ class GUI_RESULTS(QMainWindow):
 
     def calculate_manevour_parameters(self):
 
-        self.graph_load_factor_turning_rate_turning_radius_graph = calc_load_factor_turning_rate_turning_radius_graph(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters)
-
-        self.results_fastest_turn = calc_fastest_turn(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters)
-        self.results_tighest_turn = calc_tighest_turn(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters)
-        self.results_stall = calc_stall_turn(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters)
+        self.results_fastest_turn = self.mission.fastest_turn
+        self.results_tighest_turn = self.mission.tighest_turn
+        self.results_stall = self.mission.stall_turn
 
         velocity_fastest_turn = self.results_fastest_turn['VELOCITY_FASTEST_TURN']
         load_factor_fastest_turn = round(self.results_fastest_turn['LOAD_FACTOR_FASTEST_TURN'], 2)
@@ -585,23 +622,21 @@ class GUI_RESULTS(QMainWindow):
     def calculate_cruising_parameters(self):
 
 
-        self.results_cruise_velocity = calc_cruise_velocity(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters, plot=True)
+        self.results_cruise_velocity = self.mission.cruise_velocity
 
         self.cruise_velocity_value = round(self.results_cruise_velocity['CRUISE_VELOCITY'], 2)
         self.result_cruise_velocity.setText(str(self.cruise_velocity_value))
 
         self.minimum_cruise_drag_value = self.results_cruise_velocity['MINIMUM_DRAG']
         self.result_cruise_minimum_drag.setText(str(round(self.minimum_cruise_drag_value / 1000, 2)))
-        self.result_cruise_minimum_drag_graph = self.results_cruise_velocity['CRUISE_DRAG_GRAPH']
 
         self.cruise_velocities = self.results_cruise_velocity['CRUISE_VELOCITIES']
 
-        self.result_graph_payload_range_graph = calc_payload_x_range(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters)
-        self.results_calc_cruise_fuel_weight = calc_cruise_fuel_weight(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters)
+        self.results_calc_cruise_fuel_weight = self.mission.cruise_fuel_weight
 
 
         # Range
-        self.results_cruising_range = calc_cruising_jet_range(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters)
+        self.results_cruising_range = self.mission.cruise_range
 
         # Loiter time
 
@@ -630,7 +665,7 @@ class GUI_RESULTS(QMainWindow):
         # self.result_max_range_constant_h_v.setText(str(round(self.result_max_range_constant_h_v_value / 1000, 2)))
 
         ################ Endurance
-        self.results_cruising_endurance = calc_cruising_jet_endurance(flight_parameters=self.flight_parameters, aircraft_parameters=self.aircraft_parameters)
+        self.results_cruising_endurance = self.mission.cruise_endurance
 
         self.result_endurance_constant_h_cl_value = self.results_cruising_endurance['ENDURANCE_CONSTANT_HEIGHT_CL']
         self.result_max_endurance_constant_h_cl_value = self.results_cruising_endurance['MAX_ENDURANCE_CONSTANT_HEIGHT_CL']
@@ -667,12 +702,9 @@ class GUI_RESULTS(QMainWindow):
 
 
     def calculate_climb_parameters(self):
-        self.result_max_climb_angle_rate_of_climb = calc_max_climb_angle_rate_of_climb(flight_parameters=self.flight_parameters,
-                                                                                       aircraft_parameters=self.aircraft_parameters,
-                                                                                       plot=True)
+        self.result_max_climb_angle_rate_of_climb = self.mission.climb
 
-        self.result_service_ceiling_graph = calc_service_ceiling(flight_parameters=self.flight_parameters,
-                                                                                       aircraft_parameters=self.aircraft_parameters)
+        self.result_service_ceiling = self.mission.service_ceiling
 
         self.result_max_climb_angle_value = self.result_max_climb_angle_rate_of_climb['MAX_GAMMA_CLIMB']
         self.result_max_climb_angle.setText(str(round(math.degrees(self.result_max_climb_angle_value), 2)))
@@ -680,13 +712,9 @@ class GUI_RESULTS(QMainWindow):
         self.result_rate_of_climb_value = self.result_max_climb_angle_rate_of_climb['MAX_RATE_OF_CLIMB']
         self.result_max_rate_of_climb.setText(str(round(self.result_rate_of_climb_value, 2)))
 
-        self.result_graph_rate_of_climb = self.result_max_climb_angle_rate_of_climb['GRAPH_RATE_OF_CLIMB_PER_VELOCITY']
+        self.result_cimb_time_distance_steepest = self.mission.steepest_climb
 
-        self.result_cimb_time_distance_steepest = calc_distance_time_steepest_climb(flight_parameters=self.flight_parameters,
-                                                                           aircraft_parameters=self.aircraft_parameters)
-
-        self.result_distance_time_fastest_climb = calc_distance_time_fastest_climb(flight_parameters=self.flight_parameters,
-                                                                                   aircraft_parameters=self.aircraft_parameters)
+        self.result_distance_time_fastest_climb = self.mission.fastest_climb
 
         self.climb_distance.setText(str(round(self.result_distance_time_fastest_climb['FASTEST_CLIMB_DISTANCE'] / 1000, 2)))
         self.createToolTip(x=10, y=302, label_text="", tooltip_text=
@@ -702,21 +730,28 @@ class GUI_RESULTS(QMainWindow):
         f"Fastest Climb Time: {round(self.result_distance_time_fastest_climb['FASTEST_CLIMB_TIME'] / 60, 2)}")
 
 
-        self.service_ceiling.setText(str(round(self.result_service_ceiling_graph['SERVICE_CEILING'] / 1000, 2)))
+        self.service_ceiling.setText(self.format_ceiling(self.result_service_ceiling['SERVICE_CEILING']))
         self.createToolTip(x=10, y=349, label_text="", tooltip_text=
         f"Ceiling Altitudes [km]\n"
-        f"Service Ceiling: {round(self.result_service_ceiling_graph['SERVICE_CEILING'] / 1000, 2)}\n"
-        f"Performance Ceiling: {round(self.result_service_ceiling_graph['PERFORMANCE_CEILING'] / 1000, 2)}\n"
-        f"Operational Ceiling: {round(self.result_service_ceiling_graph['OPERATIONAL_CEILING'] / 1000, 2)}")
+        f"Service Ceiling: {self.format_ceiling(self.result_service_ceiling['SERVICE_CEILING'])}\n"
+        f"Performance Ceiling: {self.format_ceiling(self.result_service_ceiling['PERFORMANCE_CEILING'])}\n"
+        f"Operational Ceiling: {self.format_ceiling(self.result_service_ceiling['OPERATIONAL_CEILING'])}")
+
+    @staticmethod
+    def format_ceiling(ceiling):
+        """Teto em km para os rótulos; calc_ceilings devolve NaN quando a razão de subida do teto não é atingida."""
+        return "Not reached" if math.isnan(ceiling) else str(round(ceiling / 1000, 2))
+
+    @staticmethod
+    def export_ceiling(ceiling):
+        """Teto em m para o relatório; vazio (None) quando não é atingido."""
+        return None if math.isnan(ceiling) else round(ceiling, 2)
 
     def calculate_gliding_parameters(self):
 
-        self.result_gliding_range_endurance = gliding_range_endurance(flight_parameters=self.flight_parameters,
-                                                                    aircraft_parameters=self.aircraft_parameters,
-                                                                    graph_CL=True, graph_V=True)
-        # CL Constant
-        self.gliding_cl_constant_graphs = self.result_gliding_range_endurance['GLIDING_CONSTANT_LIFT']['GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_GRAPH']
+        self.result_gliding_range_endurance = self.mission.gliding
 
+        # CL Constant
         self.result_gliding_cl_constant_default_range_value = round(self.result_gliding_range_endurance['GLIDING_CONSTANT_LIFT']['GLIDING_RANGE_CONSTANT_LIFT_STANDARD'] / 1000, 2)
         self.result_gliding_cl_constant_default_endurance_value = round(self.result_gliding_range_endurance['GLIDING_CONSTANT_LIFT']['GLIDING_ENDURANCE_CONSTANT_LIFT_STANDARD'] / 3600, 2)
         self.result_gliding_cl_constant_max_endurance_value = round(self.result_gliding_range_endurance['GLIDING_CONSTANT_LIFT']['GLIDING_MAX_ENDURANCE_CONSTANT_LIFT'] / 3600, 2)
@@ -729,8 +764,6 @@ class GUI_RESULTS(QMainWindow):
         # self.result_gliding_cl_constant_max_range.setText(str(self.result_gliding_cl_constant_max_range_value))
 
         # V Constant
-        self.gliding_v_constant_graphs = self.result_gliding_range_endurance['GLIDING_CONSTANT_AIRSPEED']['GLIDING_RANGE_ENDURANCE_CONSTANT_AIRSPEED_GRAPH']
-
         self.result_gliding_v_constant_default_range_value = round(self.result_gliding_range_endurance['GLIDING_CONSTANT_AIRSPEED']['GLIDING_RANGE_CONSTANT_AIRSPEED_STANDARD'] / 1000, 2)
         self.result_gliding_v_constant_default_endurance_value = round(self.result_gliding_range_endurance['GLIDING_CONSTANT_AIRSPEED']['GLIDING_ENDURANCE_CONSTANT_AIRSPEED_STANDARD'] / 3600, 2)
 
@@ -745,21 +778,21 @@ class GUI_RESULTS(QMainWindow):
 
 
         # Rate of descent and gliding angle
-        self.result_rate_of_descent_gliding_angle = gliding_angle_rate_of_descent(aircraft_parameters=self.aircraft_parameters,
-                                                                                  flight_parameters=self.flight_parameters,
-                                                                                  plot=True)
+        self.result_rate_of_descent_gliding_angle = self.mission.gliding_angle
         self.result_rate_of_descent_value = self.result_rate_of_descent_gliding_angle['GLIDING_RATE_OF_DESCENT']
         self.result_gliding_angle_value = self.result_rate_of_descent_gliding_angle['GLIDING_ANGLE']
 
-        self.gliding_rate_of_descent_graph = self.result_rate_of_descent_gliding_angle['RATE_OF_DESCENT_GRAPH']
-        self.gliding_descending_angle_graph = self.result_rate_of_descent_gliding_angle['GLIDING_ANGLE_GRAPH']
-
         # self.result_gliding_angle.setText(str(self.result_gliding_angle_value))
         # self.result_rate_of_descent.setText(str(self.result_rate_of_descent_value))
 
 
     def download_results(self):
 
+        # Os resultados de uma fase que falhou (e o perfil de voo) seriam os do cálculo anterior
+        if self.failed_phases or self.pending_phases:
+            self.warning_box("Results are only exported after every phase has been calculated.")
+            return
+
         self.results_data = {
             "CURRENT_DATE": str(datetime.now()),
             "AIRCRAFT_NAME": self.aircraft_parameters['AIRCRAFT_NAME'],
@@ -782,9 +815,9 @@ class GUI_RESULTS(QMainWindow):
             "CLIMB_DISTANCE_STEEPEST_METERS": round(self.result_cimb_time_distance_steepest['STEEPEST_CLIMB_DISTANCE'], 2),
             "CLIMB_TIME_FASTEST_SECONDS": round(self.result_distance_time_fastest_climb['FASTEST_CLIMB_TIME'], 2),
             "CLIMB_TIME_STEEPEST_SECONDS": round(self.result_cimb_time_distance_steepest['STEEPEST_CLIMB_TIME'], 2),
-            "SERVICE_CEILING__METERS": round(self.result_service_ceiling_graph['SERVICE_CEILING'], 2),
-            "PERFORMANCE_CEILING__METERS": round(self.result_service_ceiling_graph['PERFORMANCE_CEILING'], 2),
-            "OPERATIONAL_CEILING__METERS": round(self.result_service_ceiling_graph['OPERATIONAL_CEILING'], 2),
+            "SERVICE_CEILING__METERS": self.export_ceiling(self.result_service_ceiling['SERVICE_CEILING']),
+            "PERFORMANCE_CEILING__METERS": self.export_ceiling(self.result_service_ceiling['PERFORMANCE_CEILING']),
+            "OPERATIONAL_CEILING__METERS": self.export_ceiling(self.result_service_ceiling['OPERATIONAL_CEILING']),
             "CRUISE_RANGE_HEIGHT_CL__METERS": round(self.results_cruising_range['RANGE_CONSTANT_HEIGHT_CL'], 2),
             "CRUISE_RANGE_VELOCITY_CL__METERS": round(self.results_cruising_range['RANGE_CONSTANT_VELOCITY_CL'], 2),
             "CRUISE_RANGE_HEIGHT_VELOCITY__METERS": round(self.results_cruising_range['RANGE_CONSTANT_HEIGHT_VELOCITY'], 2),
@@ -842,7 +875,8 @@ class GUI_RESULTS(QMainWindow):
             "LANDING_FLARE_TIME": self.result_landing_flare_time
         }
 
-        self.fig_phases, self.phase_parameters = plot_phases(
+        # Um único cálculo das fases: a figura do painel é desenhada agora e a da janela só quando for aberta
+        self.flight_phases = calc_flight_phases(
             flight_parameters=self.flight_parameters,
             results_takeoff_time=results_takeoff_time,
             results_climb_time=results_climb_time,
@@ -850,15 +884,11 @@ class GUI_RESULTS(QMainWindow):
             results_descending_time=results_descending_time,
             results_landing_time=results_landing_time)
 
-        self.copy_fig_phases, self.phase_parameters = plot_phases(
-            flight_parameters=self.flight_parameters,
-            results_takeoff_time=results_takeoff_time,
-            results_climb_time=results_climb_time,
-            results_cruise_time=results_cruise_time,
-            results_descending_time=results_descending_time,
-            results_landing_time=results_landing_time)
+        self.phase_parameters = {key: self.flight_phases[key] for key in
+                                 ("CRUISE_DISTANCE_METERS", "NECESSARY_FUEL_KILOS", "ESTIMATED_TOTAL_FLIGHT_TIME_SECONDS")}
 
-        # self.copy_fig_phases = copy.copy(self.fig_phases)
+        self.fig_phases = Figure(figsize=(7.5, 1.8))
+        draw_flight_phases(phases=self.flight_phases, ax=self.fig_phases.add_subplot())
 
         self.canvas = FigureCanvas(self.fig_phases)
         self.canvas.setMinimumSize(7.5, 1.8)  # Convert inches to pixels
@@ -877,37 +907,93 @@ class GUI_RESULTS(QMainWindow):
 
 
 
-    def invoke_rate_of_climb_graph(self):
+    def get_figure(self, name):
+        """Retorna o gráfico pedido, montando-o a partir das curvas numéricas na primeira vez em que é aberto."""
+
+        if name not in self.figures:
+            self.figures[name] = self.figure_builders[name]()
+
+        return self.figures[name]
+
+    def clear_figures(self):
 
-        c1 = self.result_graph_rate_of_climb.canvas
-        c2 = self.result_service_ceiling_graph['RATE_OF_CLIMB_PER_ALTITUDE'].canvas
+        for fig in self.figures.values():
+            plt.close(fig)
 
-        c1.draw()
-        c2.draw()
+        self.figures = {}
 
-        a1 = array(c1.buffer_rgba())
-        a2 = array(c2.buffer_rgba())
-        a = hstack((a1, a2))
+    def build_cruise_drag_figure(self):
+        return plot_cruise_drag(result=calc_cruise_velocity(aircraft_parameters=self.aircraft_parameters,
+                                                            flight_parameters=self.flight_parameters,
+                                                            W_CRUISE=self.mission.W_cruise, series=True))
 
-        mpl.use(backend)
+    def build_payload_range_figure(self):
+        return plot_payload_range(diagram=calc_payload_range_diagram(aircraft_parameters=self.aircraft_parameters,
+                                                                     flight_parameters=self.flight_parameters,
+                                                                     V_CRUISE=self.mission.V_cru))
 
-        fig, ax = plt.subplots(figsize=(10,5))
-        fig.subplots_adjust(0, 0, 1, 1)
-        ax.set_axis_off()
-        ax.matshow(a)
-        fig.show()
+    def build_rate_of_climb_figure(self):
+        result = calc_max_climb_angle_rate_of_climb(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters,
+                                                    V_CRUISE=self.mission.V_cru, series=True)
+        return compose_panels(panels=[partial(plot_rate_of_climb_per_velocity, result=result),
+                                      partial(plot_rate_of_climb_per_altitude, result=self.mission.service_ceiling)])
+
+    def build_manevour_figure(self):
+        return plot_load_factor_turning_rate_turning_radius(curves=calc_load_factor_turning_rate_turning_radius(aircraft_parameters=self.aircraft_parameters,
+                                                                                                                flight_parameters=self.flight_parameters,
+                                                                                                                V_CRUISE=self.mission.V_cru,
+                                                                                                                W_CRUISE=self.mission.W_cruise))
+
+    def build_gliding_figure(self):
+        result_angle = gliding_angle_rate_of_descent(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters,
+                                                     W=self.mission.W_cruise, series=True)
+        result_range = gliding_range_endurance(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters,
+                                               W=self.mission.W_cruise, series=True)
+        return compose_panels(panels=[partial(plot_rate_of_descent, result=result_angle),
+                                      partial(plot_gliding_angle, result=result_angle),
+                                      partial(plot_gliding_range_endurance_constant_airspeed, result=result_range['GLIDING_CONSTANT_AIRSPEED']),
+                                      partial(plot_gliding_range_endurance_constant_lift, result=result_range['GLIDING_CONSTANT_LIFT'])],
+                              panel_size=(6, 5))
+
+    def build_gliding_constant_lift_figure(self):
+        result = gliding_range_endurance(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters,
+                                         W=self.mission.W_cruise, series=True)
+        return plot_gliding_range_endurance_constant_lift(result=result['GLIDING_CONSTANT_LIFT'])
+
+    def build_gliding_constant_airspeed_figure(self):
+        result = gliding_range_endurance(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters,
+                                         W=self.mission.W_cruise, series=True)
+        return plot_gliding_range_endurance_constant_airspeed(result=result['GLIDING_CONSTANT_AIRSPEED'])
+
+    def clear_flight_phases(self):
+        """Descarta o perfil de voo calculado e remove a figura do painel."""
+
+        self.flight_phases = None
+        self.phase_parameters = None
+        self.fig_phases = None
+        for i in range(self.layout_fig_phases.count()): self.layout_fig_phases.itemAt(i).widget().close()
+
+    def build_flight_phases_figure(self):
+        return draw_flight_phases(phases=self.flight_phases)
+
+    def invoke_rate_of_climb_graph(self):
+
+        self.get_figure("RATE_OF_CLIMB").show()
 
     def invoke_flight_path_graph(self):
 
-        show_figure(self.copy_fig_phases)
-        self.copy_fig_phases.show()
+        if self.flight_phases is None:
+            self.warning_box("Flight phases could not be calculated for the current parameters.")
+            return
+
+        self.get_figure("FLIGHT_PHASES").show()
 
     def invoke_manevour_graphs(self):
 
-        self.graph_load_factor_turning_rate_turning_radius_graph.show()
+        self.get_figure("MANEVOUR").show()
 
     def invoke_minimum_drag_graph(self):
-        self.result_cruise_minimum_drag_graph.show()
+        self.get_figure("CRUISE_DRAG").show()
 
     def invoke_table_takeoff_distance_time(self):
         self.takeoff_distance_and_time_per_altitude.show()
@@ -916,83 +1002,95 @@ class GUI_RESULTS(QMainWindow):
         self.landing_distance_and_time_per_altitude.show()
 
     def invoke_payload_range_graph(self):
-        self.result_graph_payload_range_graph.show()
+        self.get_figure("PAYLOAD_RANGE").show()
 
 
     def invoke_gliding_descending_graphs(self):
 
-        # self.gliding_rate_of_descent_graph.show()
-        # self.gliding_descending_angle_graph.show()
-        # self.gliding_v_constant_graphs.show()
-        # self.gliding_cl_constant_graphs.show()
+        self.get_figure("GLIDING").show()
 
-        fig1 = self.gliding_rate_of_descent_graph.canvas
-        fig2 = self.gliding_descending_angle_graph.canvas
-        fig3 = self.gliding_v_constant_graphs.canvas
-        fig4 = self.gliding_cl_constant_graphs.canvas
+    def invoke_gliding_v_constant_graphs(self):
 
+        self.get_figure("GLIDING_CONSTANT_AIRSPEED").show()
 
-        fig1.draw()
-        fig2.draw()
-        fig3.draw()
-        fig4.draw()
+    def invoke_gliding_cl_constant_graphs(self):
 
-        # Convert canvas to numpy arrays
-        a1 = array(fig1.buffer_rgba())
-        a2 = array(fig2.buffer_rgba())
-        a3 = array(fig3.buffer_rgba())
-        a4 = array(fig4.buffer_rgba())
+        self.get_figure("GLIDING_CONSTANT_LIFT").show()
 
-        # Combine arrays into a single array
-        top_row = hstack((a1, a2))
-        bottom_row = hstack((a3, a4))
-        a_combined = vstack((top_row, bottom_row))
+    def is_current_run(self, run_id):
+        return run_id == self.run_id
 
-        mpl.use(backend)
+    @staticmethod
+    def calculate_phase(mission, properties):
+        """Calcula, fora da thread principal, as propriedades de Mission usadas por uma fase (sem gráficos)."""
+        return {name: getattr(mission, name) for name in properties}
 
-        dpi = 400  # Adjust DPI as needed
+    def calculate_all_results(self):
+        """
+        Dispara o cálculo de todas as fases em segundo plano. Fases independentes rodam em paralelo no QThreadPool e os
+        rótulos de cada painel são preenchidos (na thread principal) assim que a fase termina. Uma nova chamada descarta
+        o cálculo anterior: fases ainda não iniciadas são removidas da fila e resultados atrasados são ignorados.
+        """
 
-        fig, ax = plt.subplots(figsize=(10, 7), dpi=dpi)
-        ax.matshow(a_combined)
-        ax.set_axis_off()
-        plt.tight_layout()
-        fig.show()
+        self.run_id += 1
+        self.thread_pool.clear()
 
+        # Grandezas compartilhadas entre as fases (TOW, V_cru, ...) são calculadas uma única vez
+        self.mission = Mission(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
+        self.clear_figures()
+        self.pending_phases = set(PHASE_PROPERTIES)
+        self.failed_phases = set()
 
+        self.statusbar.showMessage("Calculating...")
 
+        for phase, properties in PHASE_PROPERTIES.items():
+            self.thread_pool.start(PhaseRunnable(run_id=self.run_id,
+                                                 phase=phase,
+                                                 function=partial(self.calculate_phase, self.mission, properties),
+                                                 signals=self.phase_signals,
+                                                 is_current=self.is_current_run))
 
+    def on_phase_finished(self, run_id, phase, result):
 
-    def invoke_gliding_v_constant_graphs(self):
+        if not self.is_current_run(run_id):
+            return
 
-        self.gliding_v_constant_graphs.show()
+        # Os valores já estão guardados em self.mission; aqui só são atualizados os rótulos e os gráficos
+        self.phase_handlers[phase]()
+        self.pending_phases.discard(phase)
 
-    def invoke_gliding_cl_constant_graphs(self):
+        if phase in FLIGHT_PHASES_DEPENDENCIES and not (self.pending_phases | self.failed_phases) & FLIGHT_PHASES_DEPENDENCIES:
+            self.calculate_flight_phases()
 
-        self.gliding_cl_constant_graphs.show()
+        if not self.pending_phases:
+            self.finish_calculation()
 
-    def calculate_all_results(self):
-
-        # Takeoff
-        self.calculate_takeoff_parameters()
-
-        #Climb
-        self.calculate_climb_parameters()
+    def on_phase_failed(self, run_id, phase, message):
 
-        # Landing
-        self.calculate_landing_parameters()
+        if not self.is_current_run(run_id):
+            return
 
-        # Cruise
-        self.calculate_cruising_parameters()
+        self.logger.error("%s failed: %s", phase, message)
+        self.pending_phases.discard(phase)
+        self.failed_phases.add(phase)
 
-        # Gliding
-        self.calculate_gliding_parameters()
+        # Sem uma das fases não há perfil de voo para esta execução: o do cálculo anterior não pode continuar na tela
+        if phase in FLIGHT_PHASES_DEPENDENCIES:
+            self.clear_flight_phases()
 
-        #Manevour
-        self.calculate_manevour_parameters()
+        if self.pending_phases:
+            self.statusbar.showMessage(f"{phase.capitalize()} could not be calculated: {message}")
+        else:
+            self.finish_calculation()
 
-        #Phases
-        self.calculate_flight_phases()
+    def finish_calculation(self):
+        """Troca a mensagem "Calculating..." pelo resultado da execução quando todas as fases terminaram."""
 
+        if self.failed_phases:
+            failed = ", ".join(sorted(phase.capitalize() for phase in self.failed_phases))
+            self.statusbar.showMessage(f"Could not be calculated: {failed}")
+        else:
+            self.statusbar.clearMessage()
 
     def warning_box(self, message):
 
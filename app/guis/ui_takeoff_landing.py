@@ -420,7 +420,8 @@ class GUI_DECOLAGEM(QMainWindow):
     def calculate_runway_takeoff_condition_parameter(self):
         self.runway_condition_takeoff_mu, _ = execute_generic_query(
             db_path=r"./db/utils/aero.db",
-            query=f"select (min_mu_decolagem + max_mu_decolagem)/2 from GroundType where superficie='{self.runway_condition_takeoff_text}';")
+            query="select (min_mu_decolagem + max_mu_decolagem)/2 from GroundType where superficie = ?;",
+            params=(self.runway_condition_takeoff_text,))
 
     def handle_wind_velocity_takeoff_value(self):
 
@@ -483,8 +484,9 @@ class GUI_DECOLAGEM(QMainWindow):
     def calculate_takeoff_airport_parameters(self):
         airport_takeoff_results, _ = execute_generic_query(
             db_path=r"./db/utils/aero.db",
-            query=f"select elevacao, pista, latitude, longitude, '{self.current_takeoff_airport_iata}' as airport_code from airports where iata='{self.current_takeoff_airport_iata}';",
-            first_value=False)
+            query="select elevacao, pista, latitude, longitude, ? as airport_code from airports where iata = ?;",
+            first_value=False,
+            params=(self.current_takeoff_airport_iata, self.current_takeoff_airport_iata))
 
         self.airport_takeoff_parameters['AIRPORT_TAKEOFF_ELEVATION'] = airport_takeoff_results[0][0]
         self.airport_takeoff_parameters['AIRPORT_TAKEOFF_RUNWAY_DISTANCE'] = airport_takeoff_results[0][1]
@@ -505,7 +507,8 @@ class GUI_DECOLAGEM(QMainWindow):
     def calculate_runway_landing_condition_parameter(self):
         self.runway_condition_landing_mu, _ = execute_generic_query(
             db_path=r"./db/utils/aero.db",
-            query=f"select (min_mu_decolagem + max_mu_decolagem)/2 from GroundType where superficie='{self.runway_condition_landing_text}';")
+            query="select (min_mu_decolagem + max_mu_decolagem)/2 from GroundType where superficie = ?;",
+            params=(self.runway_condition_landing_text,))
 
     def handle_runway_temperature_landing_value(self):
 
@@ -575,8 +578,9 @@ class GUI_DECOLAGEM(QMainWindow):
     def calculate_landing_airport_parameters(self):
         airport_landing_results, _ = execute_generic_query(
             db_path=r"./db/utils/aero.db",
-            query=f"select elevacao, pista, latitude, longitude, '{self.current_landing_airport_iata}' as airport_code from airports where iata='{self.current_landing_airport_iata}';",
-            first_value=False)
+            query="select elevacao, pista, latitude, longitude, ? as airport_code from airports where iata = ?;",
+            first_value=False,
+            params=(self.current_landing_airport_iata, self.current_landing_airport_iata))
 
         self.airport_landing_parameters['AIRPORT_LANDING_ELEVATION']        = airport_landing_results[0][0]
         self.airport_landing_parameters['AIRPORT_LANDING_RUNWAY_DISTANCE']  = airport_landing_results[0][1]
@@ -0,0 +1,247 @@
+"""
+Varredura paralela de parâmetros: combina aeronaves, pesos, altitudes, aeroportos, ... em uma matriz de casos e calcula
+os casos em blocos, em vários processos (ProcessPoolExecutor).
+
+Cada processo é inicializado uma única vez (initializer): importa os módulos de cálculo (instâncias de Aero) e lê as
+aeronaves do banco. Os resultados voltam na mesma ordem dos casos e são gravados à medida que os blocos terminam.
+
+Uso:
+    python -m app.sweep --spec varredura.json --db app/db/aero.db --output resultados.csv --workers 32
+    python -m app.sweep --cases casos.csv --output resultados.parquet
+
+O arquivo de varredura tem a forma:
+    {
+        "base": {"MU_TAKEOFF": 0.04, "MU_LANDING": 0.3, ...},
+        "axes": {
+            "AIRCRAFT_NAME": ["A320", "B737"],
+            "FUEL_WEIGHT": [100000, 150000],
+            "CRUISE_ALTITUDE": [9000, 10000, 11000],
+            "AIRPORTS": [{"ALTITUDE_TAKEOFF": 760, "ALTITUDE_LANDING": 10}, ...]
+        }
+    }
+Os valores de um eixo são atribuídos à chave do eixo; valores que são dicionários são mesclados ao caso (útil para
+grandezas que variam juntas, como os dados de um par de aeroportos).
+"""
+
+import argparse
+import collections
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(current_dir)
+
+from batch import (CASE_ID, ERROR, read_cases, read_db_aircrafts, iter_results, get_result_writer)
+from functions.aero import Aero
+from functions.utils import get_logger, configure_logging
+
+logger = get_logger(log_name="SWEEP")
+
+# Cada caso leva ~1 ms; blocos desse tamanho tornam desprezível o custo de enviar casos e resultados entre processos
+DEFAULT_CHUNK_SIZE = 256
+
+# Blocos em andamento por processo: mantém os processos ocupados sem carregar a matriz inteira na memória
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# Estado de cada processo, preenchido por _init_worker
+_worker_aircrafts = None
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# ------------------------------------------------------ CASOS ------------------------------------------------------- #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+def expand_sweep(base_case, axes):
+    """
+    Gera a matriz de casos (produto cartesiano dos eixos), sem montá-la inteira na memória.
+
+    Parâmetros:
+    - base_case (dict): Parâmetros comuns a todos os casos.
+    - axes (dict): Valores de cada eixo da varredura. Um valor que é dicionário é mesclado ao caso; os demais são
+      atribuídos à chave do eixo.
+
+    Retorna:
+    generator: Um caso por combinação, com CASE_ID igual à posição na matriz.
+    """
+
+    names = list(axes)
+
+    for i, values in enumerate(itertools.product(*(axes[name] for name in names))):
+
+        case = dict(base_case)
+
+        for name, value in zip(names, values):
+            if isinstance(value, dict):
+                case.update(value)
+            else:
+                case[name] = value
+
+        case[CASE_ID] = i
+
+        yield case
+
+
+def _chunked(cases, chunk_size):
+
+    cases = iter(cases)
+
+    for start in itertools.count(0, chunk_size):
+
+        chunk = list(itertools.islice(cases, chunk_size))
+
+        if not chunk:
+            return
+
+        # Sem CASE_ID, iter_results numeraria os casos a partir de zero em cada bloco; os casos do chamador são
+        # copiados, não alterados
+        yield [case if CASE_ID in case else dict(case, **{CASE_ID: i}) for i, case in enumerate(chunk, start)]
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# ---------------------------------------------------- PROCESSOS ----------------------------------------------------- #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+def _init_worker(db_path, log_level, atmosphere_table_step=None):
+
+    global _worker_aircrafts
+
+    configure_logging(level=log_level)
+
+    if atmosphere_table_step is not None:
+        Aero().enable_atmosphere_table(step=atmosphere_table_step)
+
+    # Os módulos de cálculo já foram importados junto com batch (uma instância de Aero por módulo)
+    _worker_aircrafts = read_db_aircrafts(db_path=db_path) if db_path is not None else None
+
+
+def _run_chunk(chunk):
+    return list(iter_results(cases=chunk, aircrafts=_worker_aircrafts))
+
+
+def iter_parallel_results(cases, db_path=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, log_level="INFO",
+                          atmosphere_table_step=None):
+    """
+    Calcula os casos em blocos, em vários processos, devolvendo os resultados na ordem dos casos.
+
+    Parâmetros:
+    - cases (iterable): Casos (ver batch.build_parameters).
+    - db_path (str, opcional): Banco SQLite com as aeronaves, lido uma vez por processo.
+    - workers (int, opcional): Número de processos (padrão: número de CPUs).
+    - chunk_size (int, opcional): Número de casos por bloco.
+    - log_level (str, opcional): Nível de log dos processos.
+    - atmosphere_table_step (float, opcional): Passo (m) da tabela de atmosfera ativada em cada processo
+      (Aero.enable_atmosphere_table). Por padrão, a atmosfera é calculada de forma exata.
+
+    Retorna:
+    generator: Um dicionário de resultados por caso (mesmas colunas de batch.iter_results).
+    """
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(db_path, log_level, atmosphere_table_step)) as executor:
+
+        pending = collections.deque()
+
+        for chunk in _chunked(cases, chunk_size):
+
+            pending.append(executor.submit(_run_chunk, chunk))
+
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def run_sweep(cases, output_path, db_path=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, log_level="INFO",
+              atmosphere_table_step=None):
+    """
+    Calcula os casos em paralelo e grava os resultados.
+
+    Parâmetros:
+    - cases (iterable): Casos (ver batch.build_parameters e expand_sweep).
+    - output_path (str): Arquivo de resultados (.csv ou .parquet).
+    - db_path (str, opcional): Banco SQLite com as aeronaves (aero.db).
+    - workers (int, opcional): Número de processos (padrão: número de CPUs).
+    - chunk_size (int, opcional): Número de casos por bloco.
+    - log_level (str, opcional): Nível de log dos processos.
+    - atmosphere_table_step (float, opcional): Passo (m) da tabela de atmosfera (ver iter_parallel_results).
+
+    Retorna:
+    dict: Número de casos, número de casos com erro, tempo total (s), casos por segundo e número de processos.
+    """
+
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    n_cases = 0
+    n_errors = 0
+
+    with get_result_writer(output_path) as writer:
+        for row in iter_parallel_results(cases=cases, db_path=db_path, workers=workers, chunk_size=chunk_size,
+                                         log_level=log_level, atmosphere_table_step=atmosphere_table_step):
+            writer.write(row)
+            n_cases += 1
+            n_errors += bool(row[ERROR])
+
+    elapsed = time.perf_counter() - start
+    throughput = n_cases / elapsed if elapsed > 0 else 0.0
+
+    logger.info("%d cases (%d errors) in %.2f s with %d workers: %.1f cases/s",
+                n_cases, n_errors, elapsed, workers, throughput)
+
+    return {"CASES": n_cases, "ERRORS": n_errors, "ELAPSED_TIME": elapsed, "CASES_PER_SECOND": throughput,
+            "WORKERS": workers}
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# -------------------------------------------------------- CLI ------------------------------------------------------- #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(prog="python -m app.sweep",
+                                     description="Parallel aircraft performance parameter sweep.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--spec", help="Sweep file (.json) with 'base' and 'axes'.")
+    source.add_argument("--cases", help="Case file (.csv or .json), as in app.batch.")
+    parser.add_argument("--output", required=True, help="Result file (.csv or .parquet).")
+    parser.add_argument("--db", default=None, help="SQLite database with the Airplanes table (e.g. app/db/aero.db).")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count).")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Cases per chunk (default: {DEFAULT_CHUNK_SIZE}).")
+    parser.add_argument("--log-level", default="INFO", help="Logging level (default: INFO).")
+    parser.add_argument("--atmosphere-table-step", type=float, default=None,
+                        help="Interpolate air density from a table with this altitude step in m (default: exact ISA).")
+
+    args = parser.parse_args(argv)
+
+    log_level = args.log_level.upper()
+    configure_logging(level=log_level)
+
+    if args.spec is not None:
+        with open(args.spec, encoding="utf-8") as file:
+            spec = json.load(file)
+        cases = expand_sweep(base_case=spec.get("base", {}), axes=spec["axes"])
+    else:
+        cases = read_cases(args.cases)
+
+    summary = run_sweep(cases=cases, output_path=args.output, db_path=args.db, workers=args.workers,
+                        chunk_size=args.chunk_size, log_level=log_level,
+                        atmosphere_table_step=args.atmosphere_table_step)
+
+    # Falha apenas se nenhum caso pôde ser calculado
+    return 1 if summary["CASES"] and summary["ERRORS"] == summary["CASES"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+import os
+import sys
+import timeit
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(os.path.join(parent_dir, 'app'))
+
+import numpy as np
+from functions.aero import Aero
+
+
+def bench_atmosphere(n_altitudes=1_000_000, n_scalar=20_000, repeat=3):
+    """
+    Compara o custo por altitude da atmosfera vetorizada (Aero.get_atmosphere) com o da chamada escalar
+    (Aero.get_density).
+
+    Parâmetros:
+    - n_altitudes (int): Número de altitudes avaliadas pela chamada vetorizada.
+    - n_scalar (int): Número de altitudes avaliadas, uma a uma, pela chamada escalar.
+    - repeat (int): Número de repetições; o menor tempo é considerado.
+
+    Retorna:
+    dict: Custo por altitude em nanossegundos para cada caminho.
+    """
+
+    aero = Aero()
+    rng = np.random.default_rng(0)
+
+    altitudes = rng.uniform(0, 47000, n_altitudes)
+    scalar_altitudes = altitudes[:n_scalar].tolist()
+
+    vectorized_time = min(timeit.repeat(lambda: aero.get_atmosphere(altitude=altitudes), number=1, repeat=repeat))
+    scalar_time = min(timeit.repeat(lambda: [aero.get_density(altitude=h) for h in scalar_altitudes], number=1,
+                                    repeat=repeat))
+
+    return {
+        "VECTORIZED_NS_PER_ALTITUDE": 1e9 * vectorized_time / n_altitudes,
+        "SCALAR_NS_PER_ALTITUDE": 1e9 * scalar_time / n_scalar
+    }
+
+
+if __name__ == "__main__":
+
+    results = bench_atmosphere()
+
+    print(f"get_atmosphere (1e6 altitudes): {results['VECTORIZED_NS_PER_ALTITUDE']:.1f} ns/altitude")
+    print(f"get_density (escalar):          {results['SCALAR_NS_PER_ALTITUDE']:.1f} ns/altitude")
+    print(f"Speedup: {results['SCALAR_NS_PER_ALTITUDE'] / results['VECTORIZED_NS_PER_ALTITUDE']:.0f}x")
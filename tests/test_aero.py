@@ -0,0 +1,67 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import numpy as np
+from app.functions.aero import Aero
+
+
+class TestAero(unittest.TestCase):
+
+    def setUp(self):
+        self.aero = Aero()
+
+    def test_get_atmosphere_matches_scalar_density(self):
+
+        altitudes = np.array([0, 5000, 11000, 15000, 20000, 25000, 32000, 40000, 47000])
+
+        atmosphere = self.aero.get_atmosphere(altitude=altitudes)
+
+        for i, altitude in enumerate(altitudes):
+            density, temperature = self.aero.get_density(altitude=float(altitude), get_temp=True)
+            self.assertAlmostEqual(atmosphere['DENSITY'][i], density, places=12)
+            self.assertAlmostEqual(atmosphere['TEMPERATURE'][i], temperature, places=9)
+            self.assertAlmostEqual(atmosphere['SIGMA'][i], self.aero.get_sigma(altitude=float(altitude)), places=12)
+
+    def test_get_atmosphere_standard_values(self):
+
+        atmosphere = self.aero.get_atmosphere(altitude=[0, 11000])
+
+        self.assertAlmostEqual(atmosphere['PRESSURE'][0], 101325, places=6)
+        self.assertAlmostEqual(atmosphere['TEMPERATURE'][1], 216.65, places=6)
+        self.assertAlmostEqual(atmosphere['DENSITY'][0], 1.225, places=3)
+
+    def test_get_atmosphere_out_of_range(self):
+
+        sigma = self.aero.get_sigma(altitude=np.array([-10, 1000, 50000]))
+
+        self.assertTrue(np.isnan(sigma[0]))
+        self.assertTrue(np.isnan(sigma[2]))
+        self.assertIsNone(self.aero.get_density(altitude=50000))
+
+    def test_atmosphere_table(self):
+
+        exact_density = self.aero.get_density(altitude=np.array([123.4, 9000.3, 25000.7]))
+
+        table = self.aero.enable_atmosphere_table(step=1.0, dtype=np.float32)
+        self.addCleanup(self.aero.disable_atmosphere_table)
+        table_density = self.aero.get_density(altitude=np.array([123.4, 9000.3, 25000.7]))
+
+        self.assertLess(table['MAX_RELATIVE_ERROR_DENSITY'], 1e-6)
+        np.testing.assert_allclose(table_density, exact_density, rtol=1e-6)
+        self.assertAlmostEqual(self.aero.get_density(altitude=9000.3), exact_density[1], places=6)
+
+        # O modo tabelado vale para todas as instâncias do processo
+        self.assertIs(Aero().atmosphere_table, table)
+
+        self.aero.disable_atmosphere_table()
+        self.assertIsNone(Aero().atmosphere_table)
+        self.assertAlmostEqual(self.aero.get_density(altitude=9000.3), exact_density[1], places=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import itertools
+import string
+import time
+
+from app.db.utils.airport_catalog import AirportCatalog
+
+
+class TestAirportCatalog(unittest.TestCase):
+
+    def setUp(self):
+
+        self.airports = [
+            {"iata": "GRU", "icao": "SBGR", "aeroporto": "Aeroporto Internacional de Guarulhos", "cidade": "São Paulo",
+             "pais": "Brazil", "pista": 3700, "elevacao": 750, "latitude": -23.43, "longitude": -46.47},
+            {"iata": "CGH", "icao": "SBSP", "aeroporto": "Congonhas", "cidade": "São Paulo", "pais": "Brazil",
+             "pista": 1940, "elevacao": 802, "latitude": -23.63, "longitude": -46.66},
+            {"iata": "BEL", "icao": "SBBE", "aeroporto": "Aeroporto Internacional de Belém", "cidade": "Belem",
+             "pais": "Brazil", "pista": 2800, "elevacao": 17, "latitude": -1.38, "longitude": -48.48},
+        ]
+
+        self.catalog = AirportCatalog(self.airports)
+
+    def test_get(self):
+
+        self.assertEqual(self.catalog.get("gru")['aeroporto'], "Aeroporto Internacional de Guarulhos")
+        self.assertEqual(self.catalog.get("SBSP")['iata'], "CGH")
+        self.assertIsNone(self.catalog.get("XXX"))
+        self.assertIn("BEL", self.catalog)
+        self.assertEqual(self.catalog.codes(), {"GRU", "CGH", "BEL"})
+
+    def test_search(self):
+
+        self.assertEqual([a['iata'] for a in self.catalog.search("sao paulo")], ["CGH", "GRU"])
+        self.assertEqual([a['iata'] for a in self.catalog.search("Sã Pau Guar")], ["GRU"])
+        self.assertEqual([a['iata'] for a in self.catalog.search("belem")], ["BEL"])
+        self.assertEqual([a['iata'] for a in self.catalog.search("sbg")], ["GRU"])
+        self.assertEqual([a['iata'] for a in self.catalog.search("internacional", limit=1)], ["BEL"])
+        self.assertEqual(self.catalog.search("   "), [])
+
+        # Código idêntico ao texto vem antes das demais correspondências ("bel" também é início de "Belem"/"Belém")
+        self.assertEqual(self.catalog.search("BEL")[0]['iata'], "BEL")
+
+        # Mesmo quando o código idêntico não está entre os limit primeiros em ordem de IATA
+        catalog = AirportCatalog(self.airports + [
+            {"iata": "AAA", "icao": "AAAA", "aeroporto": "Gru Field", "cidade": "Anaa", "pais": "French Polynesia",
+             "pista": 1500, "elevacao": 3, "latitude": -17.35, "longitude": -145.51}])
+        self.assertEqual([a['iata'] for a in catalog.search("gru", limit=1)], ["GRU"])
+        self.assertEqual([a['iata'] for a in catalog.search("gru")], ["GRU", "AAA"])
+
+    def test_search_large_catalog(self):
+
+        # ~70 mil aeroportos, como a lista global
+        codes = ("".join(c) for c in itertools.product(string.ascii_uppercase, repeat=3))
+        airports = [{"iata": code, "icao": f"K{code}", "aeroporto": f"{code} Field {i % 997}", "cidade": f"City {i % 5003}",
+                     "pais": "Country"} for i, code in zip(range(17576), codes)] * 4
+
+        catalog = AirportCatalog(airports)
+        self.assertEqual(len(catalog), 70304)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            catalog.get("KQRS")
+            catalog.search("city 4711")
+        elapsed = (time.perf_counter() - start) / 100
+
+        self.assertEqual(catalog.get("KQRS")['iata'], "QRS")
+        self.assertTrue(all(a['cidade'].startswith("City 4711") for a in catalog.search("city 4711")))
+        self.assertLess(elapsed, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
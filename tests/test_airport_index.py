@@ -0,0 +1,132 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import math
+import numpy as np
+
+from app.functions.aero import Aero
+from app.functions.airport_index import AirportIndex, get_great_circle_points, calc_route_alternates
+
+
+class TestAirportIndex(unittest.TestCase):
+
+    def setUp(self):
+
+        rng = np.random.default_rng(16)
+        latitudes = np.degrees(np.arcsin(rng.uniform(-1, 1, 2000)))
+        longitudes = rng.uniform(-180, 180, 2000)
+
+        self.airports = [{"iata": f"A{i:04d}", "latitude": lat, "longitude": lon}
+                         for i, (lat, lon) in enumerate(zip(latitudes, longitudes))]
+
+        # Aeroportos dos dois lados do antimeridiano e perto do polo norte
+        self.airports += [
+            {"iata": "WST", "latitude": -17.0, "longitude": 179.9},
+            {"iata": "EST", "latitude": -17.0, "longitude": -179.9},
+            {"iata": "PL1", "latitude": 89.5, "longitude": 10.0},
+            {"iata": "PL2", "latitude": 89.5, "longitude": -170.0},
+            {"iata": "NUL", "latitude": None, "longitude": None},
+        ]
+
+        self.index = AirportIndex(self.airports, cell_size=2.0)
+        self.aero = Aero()
+
+    def brute_force(self, latitude, longitude, radius):
+
+        found = []
+        for airport in self.airports:
+            if airport['latitude'] is None:
+                continue
+            distance = self.aero.get_haversine_distance({"LATITUDE": latitude, "LONGITUDE": longitude},
+                                                        {"LATITUDE": airport['latitude'], "LONGITUDE": airport['longitude']})
+            if distance <= radius:
+                found.append(airport['iata'])
+
+        return sorted(found)
+
+    def test_within_radius_matches_brute_force(self):
+
+        points = [(0, 0), (45, 90), (-33.4, -70.7), (-17.0, 180.0), (-17.0, -180.0), (88.0, 0.0), (-89.9, 45.0), (60, 179)]
+
+        for latitude, longitude in points:
+            for radius in (50_000, 500_000, 3_000_000):
+                found = self.index.within_radius(latitude, longitude, radius)
+                self.assertEqual(sorted(airport['iata'] for airport, _ in found),
+                                 self.brute_force(latitude, longitude, radius), msg=(latitude, longitude, radius))
+
+                distances = [distance for _, distance in found]
+                self.assertEqual(distances, sorted(distances))
+
+    def test_within_radius_across_antimeridian_and_pole(self):
+
+        codes = [airport['iata'] for airport, _ in self.index.within_radius(-17.0, 179.95, 30_000)]
+        self.assertIn("WST", codes)
+        self.assertIn("EST", codes)
+
+        codes = [airport['iata'] for airport, _ in self.index.within_radius(89.9, 100.0, 150_000)]
+        self.assertIn("PL1", codes)
+        self.assertIn("PL2", codes)
+
+    def test_nearest(self):
+
+        nearest = self.index.nearest(10.0, 20.0, n=5)
+
+        distances = sorted(self.aero.get_haversine_distances(10.0, 20.0, self.index.latitudes, self.index.longitudes))
+
+        self.assertEqual(len(nearest), 5)
+        np.testing.assert_allclose([distance for _, distance in nearest], distances[:5])
+
+        self.assertEqual(len(self.index.nearest(10.0, 20.0, n=10_000)), len(self.index))
+        self.assertEqual(self.index.nearest(10.0, 20.0, n=3, max_radius=1.0), [])
+
+    def test_great_circle_points(self):
+
+        latitudes, longitudes = get_great_circle_points({"LATITUDE": -23.43, "LONGITUDE": -46.47},
+                                                        {"LATITUDE": 40.64, "LONGITUDE": -73.78}, n_points=11)
+
+        self.assertAlmostEqual(latitudes[0], -23.43)
+        self.assertAlmostEqual(longitudes[-1], -73.78)
+
+        steps = [self.aero.get_haversine_distance({"LATITUDE": latitudes[i], "LONGITUDE": longitudes[i]},
+                                                  {"LATITUDE": latitudes[i + 1], "LONGITUDE": longitudes[i + 1]})
+                 for i in range(10)]
+
+        for step in steps:
+            self.assertAlmostEqual(step, steps[0], delta=1)
+
+    def test_route_alternates(self):
+
+        K = 0.045
+        CD0 = 0.0185
+
+        aircraft_parameters = {"S": 124.6, "CD0": CD0, "K": K, "CL_MAX": 1.6, "OEW": 41000 * 9.81,
+                               'E_m': 1 / (2 * math.sqrt(K * CD0))}
+
+        flight_parameters = {
+            "takeoff_parameters": {"LATITUDE_TAKEOFF": -23.43, "LONGITUDE_TAKEOFF": -46.47},
+            "landing_parameters": {"LATITUDE_LANDING": -22.81, "LONGITUDE_LANDING": -43.25},
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * 9.81,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+            "CRUISE_ALTITUDE": 11000,
+            "GLIDING_VELOCITY": 100,
+        }
+
+        result = calc_route_alternates(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                       airport_index=self.index, n_points=5)
+
+        self.assertGreater(result['GLIDING_RANGE'], 0)
+        self.assertEqual(len(result['ALTERNATES']), 5)
+
+        for latitude, longitude, alternates in zip(result['LATITUDE'], result['LONGITUDE'], result['ALTERNATES']):
+            self.assertEqual(sorted(airport['iata'] for airport, _ in alternates),
+                             self.brute_force(latitude, longitude, result['GLIDING_RANGE']))
+
+
+if __name__ == '__main__':
+    unittest.main()
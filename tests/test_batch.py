@@ -0,0 +1,147 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import csv
+import json
+import math
+import subprocess
+import tempfile
+import unittest
+
+from app.batch import (run_batch, run_case, build_parameters, read_db_aircrafts, get_result_writer, _flatten,
+                       PHASE_COLUMNS, RESULT_COLUMNS)
+
+DB_PATH = os.path.join(parent_dir, "app", "db", "aero.db")
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        K = 0.045
+        CD0 = 0.0185
+
+        self.case = {
+            "CASE_ID": "A320",
+            "S": 124.6,
+            "CD0": CD0,
+            "K": K,
+            "T0": 120000,
+            "CL_MAX": 1.6,
+            "TSFC": 0.6,
+            "OEW": 41000 * 9.81,
+            "NE": 2,
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * 9.81,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+            "CRUISE_ALTITUDE": 11000,
+            "GLIDING_VELOCITY": 120,
+            "ALTITUDE_TAKEOFF": 760,
+            "MU_TAKEOFF": 0.04,
+            "ALTITUDE_LANDING": 10,
+            "MU_LANDING": 0.3,
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_build_parameters(self):
+
+        aircraft_parameters, flight_parameters = build_parameters(case=self.case)
+
+        self.assertAlmostEqual(aircraft_parameters['E_m'], 1 / (2 * math.sqrt(0.045 * 0.0185)))
+        self.assertEqual(flight_parameters['takeoff_parameters']['ALTITUDE_TAKEOFF'], 760)
+        self.assertEqual(flight_parameters['landing_parameters']['WIND_VELOCITY_LANDING'], 0)
+        self.assertNotIn('CASE_ID', flight_parameters)
+
+    def test_run_batch_json(self):
+
+        cases_path = os.path.join(self.tmp_dir.name, "cases.json")
+        output_path = os.path.join(self.tmp_dir.name, "results.csv")
+
+        bad_case = dict(self.case, CASE_ID="BAD")
+        del bad_case['MU_TAKEOFF']
+
+        with open(cases_path, "w") as file:
+            json.dump([bad_case, self.case], file)
+
+        summary = run_batch(cases_path=cases_path, output_path=output_path)
+
+        self.assertEqual((summary['CASES'], summary['ERRORS']), (2, 1))
+
+        with open(output_path, newline="") as file:
+            rows = list(csv.DictReader(file))
+
+        self.assertEqual([row['CASE_ID'] for row in rows], ["BAD", "A320"])
+        self.assertIn("MU_TAKEOFF", rows[0]['ERROR'])
+        self.assertEqual(rows[1]['ERROR'], "")
+        self.assertGreater(float(rows[1]['TAKEOFF_DISTANCE']), 0)
+        self.assertGreater(float(rows[1]['SERVICE_CEILING']), 0)
+        self.assertIn('GLIDING_RANGE_CONSTANT_LIFT_STANDARD', rows[1])
+
+    def test_schema_independent_of_first_case(self):
+
+        # Primeiro caso sem coordenadas e sem planeio; o segundo calcula todas as fases
+        partial_case = dict(self.case, CASE_ID="PARTIAL", GLIDING_VELOCITY=0)
+        full_case = dict(self.case, CASE_ID="FULL", LATITUDE_TAKEOFF=-23.43, LONGITUDE_TAKEOFF=-46.47,
+                         LATITUDE_LANDING=-3.04, LONGITUDE_LANDING=-60.05)
+
+        aircraft_parameters, flight_parameters = build_parameters(case=full_case)
+        full_row = run_case(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+        self.assertEqual(list(full_row), [column for columns in PHASE_COLUMNS.values() for column in columns])
+
+        cases_path = os.path.join(self.tmp_dir.name, "cases.json")
+        output_path = os.path.join(self.tmp_dir.name, "results.csv")
+
+        with open(cases_path, "w") as file:
+            json.dump([partial_case, full_case], file)
+
+        run_batch(cases_path=cases_path, output_path=output_path)
+
+        with open(output_path, newline="") as file:
+            reader = csv.DictReader(file)
+            rows = list(reader)
+
+        self.assertEqual(reader.fieldnames, list(RESULT_COLUMNS))
+        self.assertTrue(math.isnan(float(rows[0]['DELTA_FUEL'])))
+        self.assertTrue(math.isnan(float(rows[0]['GLIDING_ANGLE'])))
+        self.assertAlmostEqual(float(rows[1]['DELTA_FUEL']), full_row['DELTA_FUEL'])
+        self.assertAlmostEqual(float(rows[1]['GLIDING_MAX_RANGE_CONSTANT_AIRSPEED']),
+                               full_row['GLIDING_MAX_RANGE_CONSTANT_AIRSPEED'])
+
+        with self.assertRaises(ValueError):
+            with get_result_writer(os.path.join(self.tmp_dir.name, "extra.csv")) as writer:
+                writer.write({'CASE_ID': 1, 'UNKNOWN_COLUMN': 1.0, 'ERROR': ""})
+
+        with self.assertRaises(ValueError):
+            _flatten({'A': {'X': 1.0}, 'B': {'X': 2.0}}, {})
+
+    def test_db_aircrafts(self):
+
+        aircrafts = read_db_aircrafts(db_path=DB_PATH)
+        name = next(iter(aircrafts))
+
+        case = {key: value for key, value in self.case.items() if key not in ('S', 'CD0', 'K', 'T0', 'CL_MAX', 'TSFC', 'OEW', 'NE')}
+        case['AIRCRAFT_NAME'] = name
+
+        aircraft_parameters, _ = build_parameters(case=case, aircrafts=aircrafts)
+
+        self.assertEqual(aircraft_parameters['S'], aircrafts[name]['S'])
+        self.assertIn('K', aircraft_parameters)
+
+    def test_headless_imports(self):
+
+        code = "import sys; import app.batch; print('matplotlib' in sys.modules or any('PySide' in m for m in sys.modules))"
+        output = subprocess.run([sys.executable, "-c", code], cwd=parent_dir, capture_output=True, text=True, check=True)
+
+        self.assertEqual(output.stdout.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()
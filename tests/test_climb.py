@@ -0,0 +1,107 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import math
+import numpy as np
+
+from app.functions.aero import Aero
+from app.functions.climb import calc_service_ceiling, calc_max_rate_of_climb_per_altitude, calc_ceilings
+
+
+class TestClimb(unittest.TestCase):
+
+    def setUp(self):
+
+        K = 0.045
+        CD0 = 0.0185
+
+        self.aircraft_parameters = {
+            "S": 124.6,
+            "CD0": CD0,
+            "K": K,
+            "T0": 120000,
+            "CL_MAX": 1.6,
+            "TSFC": 0.6,
+            "OEW": 41000 * 9.81,
+            "NE": 2,
+            'E_m': 1 / (2 * math.sqrt(K * CD0)),
+        }
+
+        self.flight_parameters = {
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * 9.81,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+            "CRUISE_ALTITUDE": 11000,
+            "CRUISE_VELOCITY": 0,
+        }
+
+        aero = Aero()
+        TOW = 150 * aero.person_weight + 41000 * 9.81 + 15000 * 9.81 + 2000 * 9.81
+        self.W = TOW - 0.10 * 15000 * 9.81
+
+    def rate_of_climb(self, altitude, W, T0=120000):
+        """OJHA - 10.65, um ponto por vez."""
+
+        aero = Aero()
+        sigma = aero.get_sigma(altitude=altitude)
+        p = self.aircraft_parameters
+        T_Em_SSL = T0 * p['NE']
+        E_m, S, CD0 = p['E_m'], p['S'], p['CD0']
+
+        TT = 1 + math.sqrt(1 + 3 / (E_m ** 2 * (T_Em_SSL * sigma / W) ** 2))
+
+        return (math.sqrt(((W / S) * TT) / (3 * aero.rho_0 * CD0)) * (T_Em_SSL / W) ** 1.5 * (1 - TT / 6) *
+                (sigma - 1 / ((2 * TT / 3) * (1 - TT / 6) * (E_m ** 2) * (T_Em_SSL / W) ** 2 * sigma)))
+
+    def test_vectorized_rate_of_climb(self):
+
+        altitudes = [0, 3000, 11000, 20000]
+        roc = calc_max_rate_of_climb_per_altitude(aircraft_parameters=self.aircraft_parameters, altitudes=altitudes,
+                                                  W=self.W)
+
+        for altitude, value in zip(altitudes, roc):
+            self.assertAlmostEqual(value, self.rate_of_climb(altitude, self.W), places=9)
+
+    def test_service_ceiling_is_root_of_rate_of_climb(self):
+
+        result = calc_service_ceiling(aircraft_parameters=self.aircraft_parameters,
+                                      flight_parameters=self.flight_parameters, plot=False)
+
+        for key, rate_of_climb in (("SERVICE_CEILING", 0.51), ("PERFORMANCE_CEILING", 0.76),
+                                   ("OPERATIONAL_CEILING", 2.54)):
+            self.assertAlmostEqual(self.rate_of_climb(result[key], self.W), rate_of_climb, places=3)
+
+        self.assertGreater(result['SERVICE_CEILING'], result['PERFORMANCE_CEILING'])
+        self.assertGreater(result['PERFORMANCE_CEILING'], result['OPERATIONAL_CEILING'])
+        self.assertIsNone(result['RATE_OF_CLIMB_PER_ALTITUDE'])
+        self.assertEqual(len(result['RATE_OF_CLIMB_PER_ALTITUDE_SERIES']['RATE_OF_CLIMB']), 50)
+
+    def test_batched_ceilings(self):
+
+        parameters = dict(self.aircraft_parameters, T0=np.array([[100000.0], [120000.0], [10000.0]]))
+        weights = np.array([0.8, 0.9, 1.0]) * self.W
+
+        ceilings = calc_ceilings(aircraft_parameters=parameters, W=weights, rates_of_climb=[0.0, 0.51, 5.0])
+
+        self.assertEqual(ceilings.shape, (3, 3, 3))
+
+        for i, T0 in enumerate([100000.0, 120000.0]):
+            for j, W in enumerate(weights):
+                single = calc_ceilings(aircraft_parameters=dict(self.aircraft_parameters, T0=T0), W=W,
+                                       rates_of_climb=[0.0, 0.51, 5.0])
+                np.testing.assert_allclose(ceilings[i, j], single)
+
+                for k, rate_of_climb in enumerate([0.0, 0.51, 5.0]):
+                    self.assertAlmostEqual(self.rate_of_climb(ceilings[i, j, k], W, T0=T0), rate_of_climb, places=3)
+
+        # Sem empuxo para subir ao nível do mar
+        self.assertTrue(np.all(np.isnan(ceilings[2])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import math
+import numpy as np
+
+from app.functions.aero import Aero
+from app.functions.climb_integrator import (integrate_climb, calc_integrated_climb, compare_with_closed_form,
+                                            CLIMB_SCHEDULES)
+
+
+class TestClimbIntegrator(unittest.TestCase):
+
+    def setUp(self):
+
+        K = 0.045
+        CD0 = 0.0185
+
+        self.aircraft_parameters = {
+            "S": 124.6,
+            "CD0": CD0,
+            "K": K,
+            "T0": 120000,
+            "CL_MAX": 1.6,
+            "TSFC": 0.6,
+            "OEW": 41000 * 9.81,
+            "NE": 2,
+            'E_m': 1 / (2 * math.sqrt(K * CD0)),
+        }
+
+        self.flight_parameters = {
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * 9.81,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+            "CRUISE_ALTITUDE": 11000,
+            "CRUISE_VELOCITY": 0,
+            "takeoff_parameters": {"ALTITUDE_TAKEOFF": 0},
+        }
+
+        aero = Aero()
+        self.FW = 15000 * 9.81
+        self.TOW = 150 * aero.person_weight + 41000 * 9.81 + self.FW + 2000 * 9.81
+
+    def test_time_and_distance_close_to_closed_form(self):
+
+        comparison = compare_with_closed_form(aircraft_parameters=self.aircraft_parameters,
+                                              flight_parameters=self.flight_parameters)
+
+        for schedule in CLIMB_SCHEDULES:
+            for key in ("TIME", "DISTANCE"):
+                self.assertLess(abs(comparison[schedule][key]["RELATIVE_DIFFERENCE"]), 0.1, msg=(schedule, key))
+
+    def test_vectorized_matches_single_cases(self):
+
+        weights = self.TOW * np.array([0.8, 0.9, 1.0])
+        thrusts = np.array([[100000.0], [120000.0]])
+        parameters = dict(self.aircraft_parameters, T0=thrusts)
+
+        climb = integrate_climb(aircraft_parameters=parameters, W_0=weights, altitude_start=15.24, altitude_end=11000)
+
+        self.assertEqual(climb['TIME'].shape[1:], (2, 3))
+        self.assertTrue(np.all(climb['VALID']))
+
+        # Cada caso tem o seu próprio passo: o resultado é o mesmo do caso integrado sozinho
+        for i, T0 in enumerate(thrusts[:, 0]):
+            for j, W in enumerate(weights):
+                single = integrate_climb(aircraft_parameters=dict(self.aircraft_parameters, T0=T0), W_0=W,
+                                         altitude_start=15.24, altitude_end=11000)
+                steps = int(single['STEPS'])
+                self.assertEqual(climb['STEPS'][i, j], steps)
+                for key in ("ALTITUDE", "TIME", "DISTANCE", "FUEL"):
+                    np.testing.assert_allclose(climb[key][:steps + 1, i, j], single[key], rtol=1e-12)
+
+                # Tempo, distância e combustível crescem com a altitude; o peso cai; depois do último passo o ponto
+                # final se repete
+                for key in ("ALTITUDE", "TIME", "DISTANCE", "FUEL"):
+                    self.assertTrue(np.all(np.diff(climb[key][:steps + 1, i, j]) > 0), msg=key)
+                    self.assertTrue(np.all(climb[key][steps:, i, j] == climb[key][-1, i, j]), msg=key)
+                self.assertTrue(np.all(np.diff(climb['WEIGHT'][:steps + 1, i, j]) < 0))
+
+        np.testing.assert_allclose(climb['ALTITUDE'][-1], 11000)
+
+    def test_case_near_ceiling_does_not_shrink_other_steps(self):
+
+        altitudes = np.array([11000, 20000])
+
+        climb = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW, altitude_start=15.24,
+                                altitude_end=altitudes, thrust_exponent=1.0)
+        single = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW, altitude_start=15.24,
+                                 altitude_end=11000, thrust_exponent=1.0)
+
+        self.assertTrue(np.all(climb['VALID']))
+        self.assertGreater(climb['STEPS'][1], 10 * climb['STEPS'][0])
+        self.assertEqual(climb['STEPS'][0], single['STEPS'])
+
+    def test_case_hitting_max_steps_is_invalid(self):
+
+        altitudes = np.array([11000, 20000])
+
+        climb = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW, altitude_start=15.24,
+                                altitude_end=altitudes, thrust_exponent=1.0, max_steps=50)
+        single = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW, altitude_start=15.24,
+                                 altitude_end=11000, thrust_exponent=1.0)
+
+        # Só o caso perto do teto passa de 50 passos; o outro termina normalmente
+        self.assertEqual(climb['VALID'].tolist(), [True, False])
+        self.assertEqual(climb['STEPS'][1], 50)
+        self.assertTrue(np.all(np.isnan(climb['TIME'][:, 1])))
+        self.assertEqual(climb['TIME'][-1, 0], single['TIME'][-1])
+
+    def test_fuel_exhaustion(self):
+
+        # Com empuxo proporcional a sigma, a subida até 16500 m ou 20000 m consome mais que o combustível a bordo
+        altitudes = np.array([11000, 16500, 20000])
+
+        unlimited = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW, altitude_start=15.24,
+                                    altitude_end=altitudes, thrust_exponent=1.0)
+        limited = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW, altitude_start=15.24,
+                                  altitude_end=altitudes, thrust_exponent=1.0, fuel_weight=self.FW)
+
+        self.assertEqual(unlimited['VALID'].tolist(), [True, True, True])
+        self.assertEqual((unlimited['FUEL'][-1] > self.FW).tolist(), [False, True, True])
+
+        self.assertEqual(limited['VALID'].tolist(), [True, False, False])
+        self.assertTrue(np.all(np.isnan(limited['FUEL'][:, 1:])))
+        self.assertEqual(limited['FUEL'][-1, 0], unlimited['FUEL'][-1, 0])
+
+        result = calc_integrated_climb(aircraft_parameters=self.aircraft_parameters,
+                                       flight_parameters=dict(self.flight_parameters, CRUISE_ALTITUDE=16500),
+                                       thrust_exponent=1.0)
+        self.assertFalse(result['INTEGRATED_CLIMB_VALID'])
+        self.assertTrue(math.isnan(result['INTEGRATED_CLIMB_FUEL_CONSUMED']))
+
+    def test_tolerance_and_invalid_cases(self):
+
+        weights = self.TOW * np.array([0.9, 1.0, 6.0])
+
+        coarse = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=weights, altitude_start=15.24,
+                                 altitude_end=11000, schedule="STEEPEST", thrust_exponent=1.0)
+        fine = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=weights, altitude_start=15.24,
+                               altitude_end=11000, schedule="STEEPEST", thrust_exponent=1.0, rtol=1e-10, atol=1e-8)
+
+        self.assertEqual(coarse['VALID'].tolist(), [True, True, False])
+        self.assertTrue(np.all(np.isnan(coarse['TIME'][:, 2])))
+        np.testing.assert_allclose(coarse['TIME'][-1, :2], fine['TIME'][-1, :2], rtol=1e-5)
+        self.assertGreater(len(fine['TIME']), len(coarse['TIME']))
+
+        with self.assertRaises(ValueError):
+            integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW, altitude_start=0,
+                            altitude_end=1000, schedule="SLOWEST")
+
+    def test_descending_cases_are_invalid(self):
+
+        climb = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW,
+                                altitude_start=np.array([5000, 5000, 1000]), altitude_end=np.array([1000, 5000, 5000]))
+
+        self.assertEqual(climb['VALID'].tolist(), [False, False, True])
+        self.assertTrue(np.all(np.isnan(climb['TIME'][:, :2])))
+        self.assertGreater(climb['TIME'][-1, 2], 0)
+
+        # Aeroporto de decolagem acima da altitude de cruzeiro
+        result = calc_integrated_climb(aircraft_parameters=self.aircraft_parameters,
+                                       flight_parameters=dict(self.flight_parameters, CRUISE_ALTITUDE=1000,
+                                                              takeoff_parameters={"ALTITUDE_TAKEOFF": 1000}))
+        self.assertFalse(result['INTEGRATED_CLIMB_VALID'])
+        self.assertTrue(math.isnan(result['INTEGRATED_CLIMB_TIME']))
+
+    def test_calc_integrated_climb(self):
+
+        result = calc_integrated_climb(aircraft_parameters=self.aircraft_parameters,
+                                       flight_parameters=self.flight_parameters)
+
+        climb = integrate_climb(aircraft_parameters=self.aircraft_parameters, W_0=self.TOW, altitude_start=15.24,
+                                altitude_end=11000)
+
+        self.assertAlmostEqual(result['INTEGRATED_CLIMB_TIME'], float(climb['TIME'][-1]))
+        self.assertAlmostEqual(result['INTEGRATED_CLIMB_FUEL_CONSUMED'], float(climb['FUEL'][-1]))
+        self.assertGreater(result['INTEGRATED_CLIMB_DISTANCE'], 0)
+        self.assertTrue(result['INTEGRATED_CLIMB_VALID'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import math
+import numpy as np
+
+from app.functions.cruising_jet import calc_cruise_velocity, calc_cruising_jet_range
+from app.functions.cruise_optimizer import (optimize_cruise, calc_cruise_ranges, calc_cruise_fuel_fractions,
+                                            calc_cruise_envelope, calc_thrust_velocity_limits, get_cruise_weights,
+                                            RANGE_CASES)
+
+
+class TestCruiseOptimizer(unittest.TestCase):
+
+    def setUp(self):
+
+        K = 0.045
+        CD0 = 0.0185
+
+        self.aircraft_parameters = {
+            "S": 124.6,
+            "CD0": CD0,
+            "K": K,
+            "T0": 22000,
+            "CL_MAX": 1.6,
+            "TSFC": 0.6,
+            "OEW": 41000 * 9.81,
+            "NE": 2,
+            'E_m': 1 / (2 * math.sqrt(K * CD0)),
+        }
+
+        self.flight_parameters = {
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * 9.81,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+            "CRUISE_ALTITUDE": 11000,
+            "CRUISE_VELOCITY": 0,
+        }
+
+        self.W_1, self.zeta = get_cruise_weights(aircraft_parameters=self.aircraft_parameters,
+                                                 flight_parameters=self.flight_parameters)
+
+    def test_thrust_limits_match_calc_cruise_velocity(self):
+
+        altitudes = [0, 5000, 11000]
+        V_min, V_max = calc_thrust_velocity_limits(aircraft_parameters=self.aircraft_parameters, altitudes=altitudes,
+                                                   W=self.W_1)
+
+        for i, altitude in enumerate(altitudes):
+            result = calc_cruise_velocity(aircraft_parameters=self.aircraft_parameters,
+                                          flight_parameters=dict(self.flight_parameters, CRUISE_ALTITUDE=altitude),
+                                          W_CRUISE=self.W_1)
+            self.assertAlmostEqual(V_max[i], result['CRUISE_VELOCITIES'][0], places=6)
+            self.assertAlmostEqual(V_min[i], result['CRUISE_VELOCITIES'][1], places=6)
+
+        inside = calc_cruise_envelope(aircraft_parameters=self.aircraft_parameters, altitudes=11000,
+                                      velocities=[10, 200, 5000], W=self.W_1)
+        self.assertEqual(inside.tolist(), [False, True, False])
+
+    def test_vectorized_ranges_match_calc_cruising_jet_range(self):
+
+        ranges = calc_cruise_ranges(aircraft_parameters=self.aircraft_parameters, altitudes=[9000, 11000],
+                                    velocities=[[200], [230]], W_1=self.W_1, zeta=self.zeta)
+
+        for i, velocity in enumerate([200, 230]):
+            for j, altitude in enumerate([9000, 11000]):
+                scalar = calc_cruising_jet_range(aircraft_parameters=self.aircraft_parameters,
+                                                 flight_parameters=dict(self.flight_parameters, CRUISE_ALTITUDE=altitude,
+                                                                        CRUISE_VELOCITY=velocity))
+                for key in RANGE_CASES.values():
+                    self.assertAlmostEqual(ranges[key][i, j], scalar[key], delta=0.01)
+
+        # A fração de combustível para percorrer o alcance é o próprio zeta
+        fractions = calc_cruise_fuel_fractions(aircraft_parameters=self.aircraft_parameters, altitudes=11000,
+                                               velocities=230, W_1=self.W_1,
+                                               distance=ranges["RANGE_CONSTANT_HEIGHT_VELOCITY"][1, 1])
+        self.assertAlmostEqual(float(fractions["RANGE_CONSTANT_HEIGHT_VELOCITY"]), self.zeta, places=9)
+
+    def test_optimum_beats_fine_grid(self):
+
+        altitudes = np.arange(0, 20001, 1000.0)
+        velocities = np.arange(50, 601, 25.0)
+
+        result = optimize_cruise(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters,
+                                 altitudes=altitudes, velocities=velocities)
+
+        fine_altitudes = np.linspace(0, 20000, 401)[:, np.newaxis]
+        fine_velocities = np.linspace(50, 600, 1101)[np.newaxis, :]
+
+        ranges = calc_cruise_ranges(aircraft_parameters=self.aircraft_parameters, altitudes=fine_altitudes,
+                                    velocities=fine_velocities, W_1=self.W_1, zeta=self.zeta)
+        inside = calc_cruise_envelope(aircraft_parameters=self.aircraft_parameters, altitudes=fine_altitudes,
+                                      velocities=fine_velocities, W=self.W_1)
+
+        for case, key in RANGE_CASES.items():
+
+            optimum = result[case]
+
+            self.assertGreaterEqual(optimum['RANGE'], np.max(np.where(inside, ranges[key], -np.inf)) - 1)
+            self.assertTrue(calc_cruise_envelope(aircraft_parameters=self.aircraft_parameters,
+                                                 altitudes=optimum['ALTITUDE'], velocities=optimum['VELOCITY'],
+                                                 W=self.W_1))
+
+            scalar = calc_cruising_jet_range(aircraft_parameters=self.aircraft_parameters,
+                                             flight_parameters=dict(self.flight_parameters,
+                                                                    CRUISE_ALTITUDE=optimum['ALTITUDE'],
+                                                                    CRUISE_VELOCITY=optimum['VELOCITY']))
+            self.assertAlmostEqual(optimum['RANGE'], scalar[key], delta=0.01)
+
+    def test_optimum_on_grid_boundary(self):
+
+        # Com TSFC constante o alcance cresce com a altitude: o melhor ponto da grade padrão é o canto (15000 m, 350 m/s)
+        with self.assertLogs("aero.CRUISE_OPTIMIZER", level="WARNING") as logs:
+            result = optimize_cruise(aircraft_parameters=self.aircraft_parameters,
+                                     flight_parameters=self.flight_parameters)
+
+        self.assertEqual(len(logs.output), len(RANGE_CASES))
+
+        for case in RANGE_CASES:
+            self.assertTrue(result[case]['ON_GRID_BOUNDARY'])
+            self.assertEqual(result[case]['ALTITUDE'], 15000)
+
+    def test_minimum_fuel(self):
+
+        result = optimize_cruise(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters,
+                                 objective="FUEL", distance=3e6)
+
+        for case, key in RANGE_CASES.items():
+            optimum = result[case]
+            fraction = calc_cruise_fuel_fractions(aircraft_parameters=self.aircraft_parameters,
+                                                  altitudes=optimum['ALTITUDE'], velocities=optimum['VELOCITY'],
+                                                  W_1=self.W_1, distance=3e6)[key]
+            self.assertAlmostEqual(optimum['FUEL'], float(fraction) * self.W_1, places=3)
+            self.assertLess(optimum['FUEL'], self.zeta * self.W_1)
+
+        unreachable = optimize_cruise(aircraft_parameters=self.aircraft_parameters,
+                                      flight_parameters=self.flight_parameters, objective="FUEL", distance=1e8)
+        self.assertEqual(unreachable, {case: None for case in RANGE_CASES})
+
+        with self.assertRaises(ValueError):
+            optimize_cruise(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters,
+                            objective="FUEL")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,9 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
 import unittest
-from app.functions.cruising_jet import calc_cruise_velocity, calc_cruising_jet_range, calc_cruising_jet_endurance
+from app.functions.cruising_jet import (calc_cruise_velocity, calc_cruising_jet_range, calc_cruising_jet_endurance,
+                                       calc_payload_range_diagram, calc_payload_range_diagrams, stack_aircraft_parameters)
+from app.functions.aero import Aero
 import math
 class TestCruising(unittest.TestCase):
 
@@ -134,3 +136,104 @@ class TestCruising(unittest.TestCase):
 
 
 
+
+    def test_calc_cruise_velocity_cache(self):
+
+        K = 0.052
+        CD0 = 0.016
+
+        aircraft_parameters = {
+            "S": 9,
+            "CD0": CD0,
+            "K": K,
+            "T0": 2600,
+            "CL_MAX": 1.2,
+            "TSFC": 0.8,
+            "OEW": 30000,
+            "NE": 1,
+            'E_m': 1 / (2 * math.sqrt(K * CD0)),
+        }
+
+        flight_parameters = {
+            "NUMBER_OF_PASSENGERS": 0,
+            "FUEL_WEIGHT": 3200,
+            "PAYLOAD_WEIGHT": 0,
+            "DISPATCHED_CARGO_WEIGHT": 0,
+            "CRUISE_ALTITUDE": 9000,
+            "CRUISE_VELOCITY": 0,
+            "takeoff_parameters": {"ALTITUDE_TAKEOFF": 760}
+
+        }
+
+        calc_cruise_velocity.cache_clear()
+
+        first = calc_cruise_velocity(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+        first['CRUISE_VELOCITIES'].append(0)
+
+        second = calc_cruise_velocity(aircraft_parameters=dict(aircraft_parameters), flight_parameters=flight_parameters)
+
+        info = calc_cruise_velocity.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertEqual(len(second['CRUISE_VELOCITIES']), 2)
+        self.assertEqual(first['CRUISE_VELOCITY'], second['CRUISE_VELOCITY'])
+
+        calc_cruise_velocity(aircraft_parameters=aircraft_parameters, flight_parameters=dict(flight_parameters, CRUISE_ALTITUDE=10000))
+        self.assertEqual(calc_cruise_velocity.cache_info().misses, 2)
+
+        calc_cruise_velocity.cache_clear()
+        self.assertEqual(calc_cruise_velocity.cache_info().currsize, 0)
+
+        # Ativar ou desativar a tabela de atmosfera muda o resultado: o cache não pode devolver o valor do outro modo
+        exact = calc_cruise_velocity(aircraft_parameters=aircraft_parameters,
+                                     flight_parameters=flight_parameters)['CRUISE_VELOCITY']
+
+        aero = Aero()
+        aero.enable_atmosphere_table(step=2000)
+        self.addCleanup(aero.disable_atmosphere_table)
+
+        tabulated = calc_cruise_velocity(aircraft_parameters=aircraft_parameters,
+                                         flight_parameters=flight_parameters)['CRUISE_VELOCITY']
+        self.assertNotEqual(tabulated, exact)
+
+        aero.disable_atmosphere_table()
+        self.assertEqual(calc_cruise_velocity(aircraft_parameters=aircraft_parameters,
+                                              flight_parameters=flight_parameters)['CRUISE_VELOCITY'], exact)
+
+        aero.enable_atmosphere_table(step=2000)
+        self.assertEqual(calc_cruise_velocity(aircraft_parameters=aircraft_parameters,
+                                              flight_parameters=flight_parameters)['CRUISE_VELOCITY'], tabulated)
+        aero.disable_atmosphere_table()
+
+    def test_calc_payload_range_diagrams(self):
+
+        g = 9.81
+
+        def aircraft(S, CD0, K, TSFC, OEW, MTOW, MFW, MPW):
+            return {"S": S, "CD0": CD0, "K": K, "TSFC": TSFC, "OEW": OEW * g, "MTOW": MTOW * g,
+                    "MAXIMUM_FUEL_WEIGHT": MFW * g, "MAXIMUM_PAYLOAD_WEIGHT": MPW * g,
+                    'E_m': 1 / (2 * math.sqrt(K * CD0))}
+
+        fleet = [aircraft(S=124.6, CD0=0.0185, K=0.045, TSFC=0.6, OEW=41000, MTOW=78000, MFW=19000, MPW=20000),
+                 aircraft(S=360, CD0=0.017, K=0.042, TSFC=0.55, OEW=130000, MTOW=250000, MFW=110000, MPW=50000)]
+
+        altitudes = [9000, 10000, 11000]
+        velocities = [[220, 230, 240], [240, 245, 250]]
+
+        diagrams = calc_payload_range_diagrams(aircraft_parameters=stack_aircraft_parameters(fleet),
+                                               altitudes=altitudes, velocities=velocities)
+
+        self.assertEqual(diagrams['RANGE'].shape, (2, 3, 4))
+        self.assertEqual(diagrams['PAYLOAD'].shape, (2, 3, 4))
+
+        for i, aircraft_parameters in enumerate(fleet):
+            for j, altitude in enumerate(altitudes):
+                diagram = calc_payload_range_diagram(aircraft_parameters=aircraft_parameters,
+                                                     flight_parameters={"CRUISE_ALTITUDE": altitude,
+                                                                        "CRUISE_VELOCITY": velocities[i][j]})
+
+                for k in range(4):
+                    self.assertAlmostEqual(diagrams['RANGE'][i, j, k], diagram['RANGE'][k], delta=1e-6)
+                    self.assertAlmostEqual(diagrams['PAYLOAD'][i, j, k], diagram['PAYLOAD'][k], delta=1e-9)
+
+        with self.assertRaises(ValueError):
+            calc_payload_range_diagrams(aircraft_parameters=fleet[0], altitudes=altitudes, velocities=0)
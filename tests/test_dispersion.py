@@ -0,0 +1,159 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import math
+import numpy as np
+
+from app.functions.aero import Aero
+from app.functions.takeoff import calc_total_takeoff_distance
+from app.functions.landing import calc_total_landing_distance
+from app.functions.dispersion import (run_dispersion, run_airports_dispersion, sample_distribution,
+                                      calc_dispersion_distances, get_ground_friction_distributions, DistanceHistogram,
+                                      DISPERSION_VARIABLES)
+
+
+class TestDispersion(unittest.TestCase):
+
+    def setUp(self):
+
+        K = 0.045
+        CD0 = 0.0185
+
+        self.aircraft_parameters = {
+            "S": 124.6,
+            "CD0": CD0,
+            "K": K,
+            "T0": 120000,
+            "CL_MAX": 1.6,
+            "TSFC": 0.6,
+            "OEW": 41000 * 9.81,
+            "NE": 2,
+            'E_m': 1 / (2 * math.sqrt(K * CD0)),
+        }
+
+        self.flight_parameters = {
+            "takeoff_parameters": {
+                "WIND_VELOCITY_TAKEOFF": 2,
+                "RUNWAY_SLOPE_TAKEOFF": 0.5,
+                "ALTITUDE_TAKEOFF": 760,
+                "MU_TAKEOFF": 0.04
+            },
+            "landing_parameters": {
+                "WIND_VELOCITY_LANDING": 2,
+                "RUNWAY_SLOPE_LANDING": 0,
+                "ALTITUDE_LANDING": 760,
+                "MU_LANDING": 0.3
+            },
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * 9.81,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+        }
+
+        aero = Aero()
+        self.TOW = 150 * aero.person_weight + 41000 * 9.81 + 15000 * 9.81 + 2000 * 9.81
+
+        self.distributions = {
+            "TOW": ("UNIFORM", 0.9 * self.TOW, self.TOW),
+            "W_LANDING": ("NORMAL", self.TOW - 0.95 * 15000 * 9.81, 2e4),
+            "ALTITUDE": ("UNIFORM", 0, 1500),
+            "WIND_VELOCITY": ("NORMAL", 0, 3),
+            "RUNWAY_SLOPE": ("TRIANGULAR", -1, 0, 1),
+            "MU_TAKEOFF": ("UNIFORM", 0.03, 0.05),
+            "MU_LANDING": ("UNIFORM", 0.3, 0.6),
+        }
+
+    def test_constant_inputs_match_scalar_distances(self):
+
+        distributions = {
+            "TOW": ("CONSTANT", self.TOW),
+            "W_LANDING": ("CONSTANT", self.TOW - 0.95 * 15000 * 9.81),
+            "ALTITUDE": ("CONSTANT", 760),
+            "WIND_VELOCITY": ("CONSTANT", 2),
+            "RUNWAY_SLOPE": ("CONSTANT", 0.5),
+            "MU_TAKEOFF": ("CONSTANT", 0.04),
+            "MU_LANDING": ("CONSTANT", 0.3),
+        }
+
+        result = run_dispersion(aircraft_parameters=self.aircraft_parameters, distributions=distributions,
+                                n_samples=1000, chunk_size=300, seed=0)
+
+        takeoff = calc_total_takeoff_distance(flight_parameters=self.flight_parameters,
+                                              aircraft_parameters=self.aircraft_parameters)['TAKEOFF_DISTANCE']
+        landing = calc_total_landing_distance(aircraft_parameters=self.aircraft_parameters,
+                                              flight_parameters=self.flight_parameters)['LANDING_DISTANCE']
+
+        for phase, expected in (("TAKEOFF", takeoff), ("LANDING", landing)):
+            for key in ("P50", "P95", "P99", "MEAN", "MIN", "MAX"):
+                self.assertAlmostEqual(result[phase][key], expected, delta=1e-6 * expected, msg=(phase, key))
+            self.assertEqual(result[phase]["SAMPLES"], 1000)
+            self.assertEqual(result[phase]["INVALID"], 0)
+
+    def test_percentiles_match_exact_values(self):
+
+        seed = np.random.SeedSequence(7)
+        result = run_dispersion(aircraft_parameters=self.aircraft_parameters, distributions=self.distributions,
+                                n_samples=50000, chunk_size=50000, seed=seed, percentiles=(50, 95, 99, 99.9))
+
+        # Um único bloco: as amostras são as da primeira semente derivada
+        rng = np.random.default_rng(np.random.SeedSequence(7).spawn(1)[0])
+        samples = {name: sample_distribution(rng, self.distributions[name], 50000) for name in DISPERSION_VARIABLES}
+        distances = calc_dispersion_distances(aircraft_parameters=self.aircraft_parameters, samples=samples)
+
+        for phase, values in distances.items():
+            for q in (50, 95, 99, 99.9):
+                # Menor valor com frequência acumulada >= q
+                exact = np.sort(values)[int(math.ceil(q / 100 * len(values))) - 1]
+                self.assertGreaterEqual(result[phase][f"P{q:g}"], exact * (1 - 1e-9))
+                self.assertLessEqual(result[phase][f"P{q:g}"], exact * (1 + 2e-4))
+            self.assertAlmostEqual(result[phase]["MEAN"], float(np.mean(values)), delta=1e-9 * float(np.mean(values)))
+            self.assertEqual(result[phase]["MAX"], float(np.max(values)))
+
+    def test_reproducible_with_processes(self):
+
+        kwargs = dict(aircraft_parameters=self.aircraft_parameters, distributions=self.distributions,
+                      n_samples=40000, chunk_size=10000, seed=3)
+
+        single = run_dispersion(workers=1, **kwargs)
+        parallel = run_dispersion(workers=2, **kwargs)
+        other_seed = run_dispersion(workers=1, **dict(kwargs, seed=4))
+
+        self.assertEqual(single, parallel)
+        self.assertNotEqual(single["TAKEOFF"]["P50"], other_seed["TAKEOFF"]["P50"])
+
+        airports = [{"iata": "GRU", "elevacao": 750}, {"iata": "BSB", "elevacao": 1066}]
+        by_airport = run_airports_dispersion(aircraft_parameters=self.aircraft_parameters, airports=airports,
+                                             distributions=self.distributions, n_samples=20000, seed=5,
+                                             phases=("TAKEOFF",))
+
+        self.assertEqual(list(by_airport), ["GRU", "BSB"])
+        self.assertGreater(by_airport["BSB"]["TAKEOFF"]["P50"], by_airport["GRU"]["TAKEOFF"]["P50"])
+
+    def test_histogram_and_inputs(self):
+
+        histogram = DistanceHistogram(resolution=1e-3).add([100.0, np.nan, 200.0, 2e7, 0.5])
+        histogram.merge(DistanceHistogram(resolution=1e-3).add([300.0]))
+
+        self.assertEqual(histogram.samples, 5)
+        self.assertEqual(histogram.invalid, 1)
+        self.assertEqual(histogram.percentile(100), 2e7)
+        self.assertEqual(histogram.percentile(0), 0.5)
+        self.assertAlmostEqual(histogram.percentile(50), 200.0, delta=0.2)
+
+        friction = get_ground_friction_distributions(
+            {"Grama curta seca": {"MU_TAKEOFF": (0.05, 0.06), "MU_LANDING": (0.25, 0.35)}}, "Grama curta seca")
+        self.assertEqual(friction, {"MU_TAKEOFF": ("UNIFORM", 0.05, 0.06), "MU_LANDING": ("UNIFORM", 0.25, 0.35)})
+
+        with self.assertRaises(ValueError):
+            run_dispersion(aircraft_parameters=self.aircraft_parameters, distributions={"TOW": ("CONSTANT", 1e5)})
+
+        with self.assertRaises(ValueError):
+            sample_distribution(np.random.default_rng(0), ("WEIBULL", 1), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import tempfile
+import numpy as np
+
+from app.functions.aero import Aero
+from app.functions.distance_matrix import get_distance_matrix, iter_distance_matrix
+
+
+class TestDistanceMatrix(unittest.TestCase):
+
+    def setUp(self):
+
+        rng = np.random.default_rng(17)
+        self.latitudes = rng.uniform(-90, 90, 40)
+        self.longitudes = rng.uniform(-180, 180, 40)
+        self.aero = Aero()
+
+    def reference(self, latitudes_1, longitudes_1, latitudes_2, longitudes_2):
+        return np.array([[self.aero.get_haversine_distance({"LATITUDE": lat1, "LONGITUDE": lon1},
+                                                           {"LATITUDE": lat2, "LONGITUDE": lon2})
+                          for lat2, lon2 in zip(latitudes_2, longitudes_2)]
+                         for lat1, lon1 in zip(latitudes_1, longitudes_1)])
+
+    def test_matrix_matches_scalar_distance(self):
+
+        origins = slice(0, 15)
+        reference = self.reference(self.latitudes[origins], self.longitudes[origins], self.latitudes, self.longitudes)
+
+        matrix = self.aero.get_haversine_distance_matrix(self.latitudes[origins], self.longitudes[origins],
+                                                         self.latitudes, self.longitudes)
+        matrix_32 = self.aero.get_haversine_distance_matrix(self.latitudes[origins], self.longitudes[origins],
+                                                            self.latitudes, self.longitudes, dtype=np.float32)
+
+        self.assertEqual(matrix.shape, (15, 40))
+        self.assertEqual(matrix_32.dtype, np.float32)
+        np.testing.assert_allclose(matrix, reference, rtol=1e-9, atol=1e-6)
+        np.testing.assert_allclose(matrix_32, reference, rtol=1e-5, atol=1)
+
+        square = self.aero.get_haversine_distance_matrix(self.latitudes, self.longitudes)
+        np.testing.assert_allclose(square, square.T)
+        np.testing.assert_array_equal(np.diag(square), 0)
+
+    def test_float32_near_antipodes(self):
+
+        # Destinos a menos de 0.5 grau do ponto antípoda de cada origem (distâncias acima de 19900 km)
+        rng = np.random.default_rng(7)
+        latitudes = rng.uniform(-60, 60, 20)
+        longitudes = rng.uniform(-180, 180, 20)
+        antipode_latitudes = -latitudes + rng.uniform(-0.5, 0.5, 20)
+        antipode_longitudes = (longitudes + 360) % 360 - 180 + rng.uniform(-0.5, 0.5, 20)
+
+        reference = self.reference(latitudes, longitudes, antipode_latitudes, antipode_longitudes)
+        matrix_32 = self.aero.get_haversine_distance_matrix(latitudes, longitudes, antipode_latitudes,
+                                                            antipode_longitudes, dtype=np.float32)
+
+        self.assertGreater(np.max(reference), 19_900_000)
+        np.testing.assert_allclose(matrix_32, reference, rtol=0, atol=5)
+
+    def test_chunks_match_full_matrix(self):
+
+        full = get_distance_matrix(self.latitudes, self.longitudes)
+        chunks = list(iter_distance_matrix(self.latitudes, self.longitudes, chunk_size=7))
+
+        self.assertEqual([start for start, _ in chunks], list(range(0, 40, 7)))
+        np.testing.assert_array_equal(np.vstack([block for _, block in chunks]), full)
+
+    def test_memory_mapped_cache(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            cache_path = os.path.join(directory, "distances.npy")
+
+            matrix = get_distance_matrix(self.latitudes, self.longitudes, dtype=np.float32, cache_path=cache_path,
+                                         chunk_size=8)
+            self.assertIsInstance(matrix, np.memmap)
+            np.testing.assert_array_equal(matrix, get_distance_matrix(self.latitudes, self.longitudes, dtype=np.float32))
+
+            modified = os.path.getmtime(cache_path)
+            again = get_distance_matrix(self.latitudes, self.longitudes, dtype=np.float32, cache_path=cache_path)
+            self.assertEqual(os.path.getmtime(cache_path), modified)
+            np.testing.assert_array_equal(again, matrix)
+
+            # Coordenadas diferentes invalidam o cache
+            moved = get_distance_matrix(self.latitudes[:10], self.longitudes[:10], dtype=np.float32, cache_path=cache_path)
+            self.assertEqual(moved.shape, (10, 10))
+            del matrix, again, moved
+
+
+if __name__ == '__main__':
+    unittest.main()
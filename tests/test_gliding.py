@@ -6,8 +6,10 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
 import unittest
-from app.functions.gliding import gliding_range_endurance, gliding_angle_rate_of_descent
+from app.functions.gliding import (gliding_range_endurance, gliding_angle_rate_of_descent, plot_gliding_angle_rate_of_descent,
+                                   plot_gliding_range_endurance_constant_lift, calc_gliding_envelope)
 import math
+import numpy as np
 class TestGliding(unittest.TestCase):
 
 
@@ -80,6 +82,93 @@ class TestGliding(unittest.TestCase):
         assert math.floor(results_1['GLIDING_ANGLE']) == math.floor(-15.07)
         assert math.floor(results_1['GLIDING_RATE_OF_DESCENT']) == math.floor(7.89)
 
+    def test_series_without_figures(self):
+
+        aircraft_parameters = {
+            "S": 15,
+            "CL_MAX": 1.2,
+            "CD0": 0.015,
+            "K": 0.03,
+            "OEW": 0
+        }
+
+        flight_parameters = {
+            "NUMBER_OF_PASSENGERS": 0,
+            "FUEL_WEIGHT": 0,
+            "PAYLOAD_WEIGHT": 0,
+            "DISPATCHED_CARGO_WEIGHT": 0,
+            "landing_parameters": {'ALTITUDE_LANDING': 0},
+            "CRUISE_ALTITUDE": 2000,
+            "GLIDING_VELOCITY": 30
+        }
+
+        results = gliding_angle_rate_of_descent(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                                W=390, series=True)
+
+        # Com series=True só as curvas são calculadas; as figuras ficam para quem for exibi-las
+        self.assertIsNone(results['GLIDING_ANGLE_GRAPH'])
+        self.assertEqual(len(results['GLIDING_ANGLE_SERIES']['GLIDING_ANGLE']), len(results['GLIDING_ANGLE_SERIES']['ALTITUDE']))
+
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        fig_gliding_angle, fig_rate_of_descent = plot_gliding_angle_rate_of_descent(result=results)
+        self.assertEqual(len(fig_gliding_angle.axes[0].lines), len(results['GLIDING_ANGLE_SERIES']['ALTITUDE']) + 1)
+
+        results = gliding_range_endurance(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                          W=390, series=True)
+
+        self.assertIsNone(results['GLIDING_CONSTANT_LIFT']['GLIDING_RANGE_ENDURANCE_CONSTANT_LIFT_GRAPH'])
+        fig_constant_lift = plot_gliding_range_endurance_constant_lift(result=results['GLIDING_CONSTANT_LIFT'])
+
+        plt.close(fig_gliding_angle)
+        plt.close(fig_rate_of_descent)
+        plt.close(fig_constant_lift)
+
+    def test_gliding_envelope(self):
+
+        aircraft_parameters = {"S": 15, "CD0": 0.015, "K": 0.03, "OEW": 0}
+        flight_parameters = {"NUMBER_OF_PASSENGERS": 0, "FUEL_WEIGHT": 0, "DISPATCHED_CARGO_WEIGHT": 0}
+
+        altitudes = [0, 2000, 6000]
+        velocities = [20, 30, 45]
+
+        envelope = calc_gliding_envelope(aircraft_parameters=aircraft_parameters, W=390, altitudes=altitudes,
+                                         velocities=velocities)
+
+        self.assertEqual(envelope['GLIDING_ANGLE'].shape, (3, 3))
+
+        for i, altitude in enumerate(altitudes):
+            for j, velocity in enumerate(velocities):
+                scalar = gliding_angle_rate_of_descent(aircraft_parameters=aircraft_parameters,
+                                                       flight_parameters=dict(flight_parameters,
+                                                                              GLIDING_VELOCITY=velocity),
+                                                       W=390, altitude=altitude)
+                self.assertAlmostEqual(envelope['GLIDING_ANGLE'][i, j], scalar['GLIDING_ANGLE'], delta=0.006)
+                self.assertAlmostEqual(envelope['RATE_OF_DESCENT'][i, j], scalar['GLIDING_RATE_OF_DESCENT'],
+                                       delta=0.006)
+
+        # Os pontos de melhor planeio e de menor descida são os extremos de uma grade fina
+        fine = calc_gliding_envelope(aircraft_parameters=aircraft_parameters, W=390, altitudes=altitudes,
+                                     velocities=np.linspace(5, 100, 20001))
+
+        self.assertTrue(np.all(fine['BEST_GLIDE_ANGLE'] >= fine['GLIDING_ANGLE'].max(axis=-1)))
+        self.assertTrue(np.all(fine['MINIMUM_SINK_RATE_OF_DESCENT'] <= fine['RATE_OF_DESCENT'].min(axis=-1)))
+        np.testing.assert_allclose(fine['BEST_GLIDE_ANGLE'], fine['GLIDING_ANGLE'].max(axis=-1), rtol=1e-6)
+        np.testing.assert_allclose(fine['MINIMUM_SINK_RATE_OF_DESCENT'], fine['RATE_OF_DESCENT'].min(axis=-1),
+                                   rtol=1e-6)
+        np.testing.assert_allclose(fine['BEST_GLIDE_ANGLE'], math.degrees(-2 * math.sqrt(0.03 * 0.015)))
+        self.assertTrue(np.all(fine['MINIMUM_SINK_VELOCITY'] < fine['BEST_GLIDE_VELOCITY']))
+
+        # Frota: um eixo a mais na frente
+        fleet = calc_gliding_envelope(aircraft_parameters=dict(aircraft_parameters, S=np.array([15.0, 20.0])),
+                                      W=np.array([390.0, 500.0]), altitudes=altitudes, velocities=velocities)
+
+        self.assertEqual(fleet['RATE_OF_DESCENT'].shape, (2, 3, 3))
+        self.assertEqual(fleet['MINIMUM_SINK_VELOCITY'].shape, (2, 3))
+        np.testing.assert_allclose(fleet['RATE_OF_DESCENT'][0], envelope['RATE_OF_DESCENT'])
+
 
 if __name__ == '__main__':
     unittest.main()
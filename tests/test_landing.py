@@ -1,6 +1,8 @@
 import unittest
+import numpy as np
 
-from app.functions.landing import calc_total_landing_time, calc_total_landing_distance
+from app.functions.landing import calc_total_landing_time, calc_total_landing_distance, calc_landing_batch, \
+    calc_landing_distance_time_per_altitude
 
 #TODO: ajustar cenários de teste
 class TestLanding(unittest.TestCase):
@@ -42,6 +44,18 @@ class TestLanding(unittest.TestCase):
 
         result = calc_total_landing_distance(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
 
+        expected = {
+            "LANDING_DISTANCE": 313.49008750139615,
+            "LANDING_APPROACH_DISTANCE": 289.4344580111813,
+            "LANDING_ROTATION_DISTANCE": 16.96750709987498,
+            "LANDING_ROLL_DISTANCE": 4.362122946144363,
+            "LANDING_FLARE_DISTANCE": 2.7259994441954905}
+
+        self.assertEqual(result.keys(), expected.keys())
+        for key, value in expected.items():
+            self.assertIsInstance(result[key], float)
+            self.assertAlmostEqual(result[key], value, places=6)
+
     def test_total_landing_time(self):
 
         aircraft_parameters = {
@@ -80,5 +94,93 @@ class TestLanding(unittest.TestCase):
 
         result = calc_total_landing_time(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
 
+        expected = {
+            "LANDING_TIME": 50.400888090774586,
+            "LANDING_APPROACH_TIME": 45.33185915572846,
+            "LANDING_ROTATION_TIME": 3,
+            "LANDING_ROLL_TIME": 1.6424671700183904,
+            "LANDING_FLARE_TIME": 0.4265617650277364}
+
+        self.assertEqual(result.keys(), expected.keys())
+        for key, value in expected.items():
+            self.assertAlmostEqual(result[key], value, places=6)
+
+    def test_calc_landing_batch(self):
+
+        aircraft_parameters = {
+            "S": 9,
+            "CD0": 0.016,
+            "K": 0.052,
+            "T0": 2600,
+            "CL_MAX": 1.2,
+            "TSFC": 0.8 / 3600,
+            "OEW": 0,
+            "NE": 1
+        }
+
+        fuel_weights = np.array([2000, 3200, 4500])
+        altitudes = np.array([0, 800, 2200])
+        winds = np.array([-3, 0, 4])
+        mus = np.array([0.02, 0.04, 0.1])
+
+        result = calc_landing_batch(aircraft_parameters=aircraft_parameters, W_landing=0.05 * fuel_weights,
+                                    altitude=altitudes, mu=mus, V_wind=winds)
+
+        for i in range(len(fuel_weights)):
+
+            flight_parameters = {
+                "landing_parameters": {
+                    "WIND_VELOCITY_LANDING": winds[i],
+                    "ALTITUDE_LANDING": altitudes[i],
+                    "MU_LANDING": mus[i]
+                },
+                "NUMBER_OF_PASSENGERS": 0,
+                "FUEL_WEIGHT": fuel_weights[i],
+                "DISPATCHED_CARGO_WEIGHT": 0,
+            }
+
+            distance = calc_total_landing_distance(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+            time = calc_total_landing_time(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+
+            for key, value in {**distance, **time}.items():
+                self.assertAlmostEqual(result[key][i], value, places=6)
+
+    def test_calc_landing_distance_time_per_altitude_custom_grid(self):
+
+        aircraft_parameters = {
+            "S": 9,
+            "CD0": 0.016,
+            "K": 0.052,
+            "T0": 2600,
+            "CL_MAX": 1.2,
+            "TSFC": 0.8 / 3600,
+            "OEW": 0,
+            "NE": 1
+        }
+
+        flight_parameters = {
+            "landing_parameters": {
+                "WIND_VELOCITY_LANDING": -3,
+                "ALTITUDE_LANDING": 0,
+                "MU_LANDING": 0.02
+            },
+            "NUMBER_OF_PASSENGERS": 0,
+            "FUEL_WEIGHT": 3200,
+            "DISPATCHED_CARGO_WEIGHT": 0,
+        }
+
+        altitude_range = np.linspace(0, 4000, 401)
+
+        df = calc_landing_distance_time_per_altitude(flight_parameters=flight_parameters, aircraft_parameters=aircraft_parameters,
+                                                     altitude_range=altitude_range)
+
+        self.assertEqual(len(df), 401)
+        np.testing.assert_array_equal(df.index.values, altitude_range)
+
+        expected = calc_total_landing_distance(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                               altitude=altitude_range[123])['LANDING_DISTANCE']
+        self.assertAlmostEqual(df['Landing Distance [m]'].iloc[123], expected, places=2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,108 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+from unittest import mock
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+from app.functions import mission as mission_module
+from app.functions.mission import Mission
+from app.functions.takeoff import calc_total_takeoff_distance, calc_total_takeoff_time
+from app.functions.landing import calc_total_landing_distance, calc_total_landing_time
+from app.functions.cruising_jet import calc_cruising_jet_range, calc_cruising_jet_endurance
+
+
+class TestMission(unittest.TestCase):
+
+    def setUp(self):
+
+        K = 0.045
+        CD0 = 0.0185
+
+        self.aircraft_parameters = {
+            "S": 124.6,
+            "CD0": CD0,
+            "K": K,
+            "T0": 120000,
+            "CL_MAX": 1.6,
+            "TSFC": 0.6,
+            "OEW": 41000 * 9.81,
+            "NE": 2,
+            'E_m': 1 / (2 * math.sqrt(K * CD0)),
+        }
+
+        self.flight_parameters = {
+            "takeoff_parameters": {
+                "WIND_VELOCITY_TAKEOFF": 2,
+                "RUNWAY_SLOPE_TAKEOFF": 0,
+                "ALTITUDE_TAKEOFF": 760,
+                "MU_TAKEOFF": 0.04
+            },
+            "landing_parameters": {
+                "WIND_VELOCITY_LANDING": -3,
+                "RUNWAY_SLOPE_LANDING": 0,
+                "ALTITUDE_LANDING": 10,
+                "MU_LANDING": 0.3
+            },
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * 9.81,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+            "CRUISE_ALTITUDE": 11000,
+            "CRUISE_VELOCITY": 0,
+        }
+
+    def test_mission_matches_phase_functions(self):
+
+        mission = Mission(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
+
+        takeoff = {**calc_total_takeoff_distance(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters),
+                   **calc_total_takeoff_time(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)}
+        landing = {**calc_total_landing_distance(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters),
+                   **calc_total_landing_time(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)}
+
+        for key, value in takeoff.items():
+            self.assertAlmostEqual(mission.takeoff[key], value, places=6)
+
+        for key, value in landing.items():
+            self.assertAlmostEqual(mission.landing[key], value, places=6)
+
+        self.assertEqual(mission.cruise_range, calc_cruising_jet_range(aircraft_parameters=self.aircraft_parameters,
+                                                                       flight_parameters=self.flight_parameters))
+        self.assertEqual(mission.cruise_endurance, calc_cruising_jet_endurance(aircraft_parameters=self.aircraft_parameters,
+                                                                               flight_parameters=self.flight_parameters))
+
+    def test_mission_memoizes_derived_quantities(self):
+
+        mission = Mission(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
+
+        with mock.patch.object(mission_module, "calc_cruise_velocity",
+                               wraps=mission_module.calc_cruise_velocity) as cruise_velocity:
+            mission.cruise_range
+            mission.cruise_endurance
+            mission.climb
+            mission.fastest_turn
+
+        self.assertEqual(cruise_velocity.call_count, 1)
+        self.assertEqual(mission.W_2, mission.TOW - 0.95 * self.flight_parameters['FUEL_WEIGHT'])
+
+    def test_mission_shared_between_threads(self):
+
+        mission = Mission(aircraft_parameters=self.aircraft_parameters, flight_parameters=self.flight_parameters)
+        phases = ['takeoff', 'landing', 'climb', 'cruise_range', 'cruise_endurance', 'fastest_turn', 'stall_turn']
+
+        with mock.patch.object(mission_module, "calc_cruise_velocity",
+                               wraps=mission_module.calc_cruise_velocity) as cruise_velocity:
+            with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+                results = list(executor.map(lambda phase: getattr(mission, phase), phases))
+
+        self.assertEqual(cruise_velocity.call_count, 1)
+        self.assertEqual(results[3], mission.cruise_range)
+
+
+if __name__ == '__main__':
+    unittest.main()
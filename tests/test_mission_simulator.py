@@ -0,0 +1,175 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import math
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+
+from app.functions.aero import Aero
+from app.functions.mission import Mission
+from app.functions.takeoff import calc_takeoff_batch
+from app.functions.mission_simulator import (simulate_missions, draw_mission_trajectory, MISSION_PHASES,
+                                             MISSION_DTYPE)
+
+
+class TestMissionSimulator(unittest.TestCase):
+
+    def setUp(self):
+
+        K = 0.045
+        CD0 = 0.0185
+
+        self.aircraft_parameters = {
+            "S": 124.6,
+            "CD0": CD0,
+            "K": K,
+            "T0": 120000,
+            "CL_MAX": 1.6,
+            "TSFC": 0.6,
+            "OEW": 41000 * 9.81,
+            "NE": 2,
+            'E_m': 1 / (2 * math.sqrt(K * CD0)),
+        }
+
+        self.flight_parameters = {
+            "takeoff_parameters": {
+                "WIND_VELOCITY_TAKEOFF": 0,
+                "RUNWAY_SLOPE_TAKEOFF": 0,
+                "ALTITUDE_TAKEOFF": 760,
+                "MU_TAKEOFF": 0.04,
+                "LATITUDE_TAKEOFF": -23.43,
+                "LONGITUDE_TAKEOFF": -46.47,
+            },
+            "landing_parameters": {
+                "WIND_VELOCITY_LANDING": 0,
+                "RUNWAY_SLOPE_LANDING": 0,
+                "ALTITUDE_LANDING": 10,
+                "MU_LANDING": 0.3,
+                "LATITUDE_LANDING": -3.04,
+                "LONGITUDE_LANDING": -60.05,
+            },
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * 9.81,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+            "CRUISE_ALTITUDE": 11000,
+            "CRUISE_VELOCITY": 0,
+            "GLIDING_VELOCITY": 0,
+        }
+
+        aero = Aero()
+        self.FW = 15000 * 9.81
+        self.TOW = 150 * aero.person_weight + 41000 * 9.81 + self.FW + 2000 * 9.81
+
+    def simulate(self, **kwargs):
+        arguments = dict(aircraft_parameters=self.aircraft_parameters, TOW=self.TOW, fuel_weight=self.FW,
+                         distance=1.5e6, cruise_altitude=11000, cruise_velocity=230)
+        arguments.update(kwargs)
+        return simulate_missions(**arguments)
+
+    def test_single_mission_profile(self):
+
+        result = self.simulate()
+        series = result['SERIES']
+
+        self.assertEqual(series.dtype, MISSION_DTYPE)
+        self.assertTrue(result['VALID'])
+
+        # Fases em ordem, tempo, distância e combustível nunca decrescem
+        self.assertTrue(np.all(np.diff(series['PHASE']) >= 0))
+        self.assertEqual(sorted(set(series['PHASE'])), list(range(len(MISSION_PHASES))))
+        for key in ("TIME", "DISTANCE", "FUEL"):
+            self.assertTrue(np.all(np.diff(series[key]) >= 0), msg=key)
+
+        self.assertEqual(series['ALTITUDE'][0], 0)
+        self.assertEqual(series['ALTITUDE'][-1], 0)
+        self.assertEqual(series['VELOCITY'][-1], 0)
+        self.assertEqual(series['ALTITUDE'].max(), 11000)
+
+        self.assertAlmostEqual(result['FLIGHT_DISTANCE'], 1.5e6, delta=1e-3 * 1.5e6)
+        self.assertAlmostEqual(float(series['TIME'][-1]), float(result['FLIGHT_TIME']), delta=0.01)
+        self.assertAlmostEqual(float(series['FUEL'][-1]), float(result['FUEL_CONSUMED']), delta=1)
+
+        takeoff = calc_takeoff_batch(aircraft_parameters=self.aircraft_parameters, TOW=self.TOW, altitude=0, mu=0.04)
+        takeoff_end = series['TIME'][series['PHASE'] == 0][-1]
+        self.assertAlmostEqual(float(takeoff_end), float(takeoff['TAKEOFF_TIME']), places=3)
+
+        # Cruzeiro a velocidade constante: tempo = distância / velocidade
+        cruise = series[series['PHASE'] == 2]
+        np.testing.assert_allclose(np.diff(cruise['TIME']) * 230, np.diff(cruise['DISTANCE']), rtol=1e-4)
+
+    def test_vectorized_matches_single_missions(self):
+
+        distances = np.array([8e5, 1.5e6, 2.5e6])
+        altitudes = np.array([[9000.0], [11000.0]])
+
+        result = self.simulate(distance=distances, cruise_altitude=altitudes)
+
+        self.assertEqual(result['SERIES'].shape[:2], (2, 3))
+
+        for i, altitude in enumerate(altitudes[:, 0]):
+            for j, distance in enumerate(distances):
+                single = self.simulate(distance=distance, cruise_altitude=altitude)
+                self.assertEqual(bool(result['VALID'][i, j]), bool(single['VALID']))
+                self.assertAlmostEqual(float(result['FLIGHT_TIME'][i, j]), float(single['FLIGHT_TIME']), delta=0.01)
+                self.assertAlmostEqual(float(result['FUEL_CONSUMED'][i, j]), float(single['FUEL_CONSUMED']),
+                                       delta=1e-5 * float(single['FUEL_CONSUMED']))
+
+    def test_invalid_missions(self):
+
+        result = self.simulate(distance=[1e5, 1.5e6, 1e7], cruise_velocity=[230, 230, 230])
+        self.assertEqual(result['VALID'].tolist(), [False, True, False])
+
+        # Sem empuxo para subir até o cruzeiro
+        weak = self.simulate(aircraft_parameters=dict(self.aircraft_parameters, T0=20000))
+        self.assertFalse(weak['VALID'])
+
+    def test_fuel_exhaustion_in_climb(self):
+
+        # Com empuxo proporcional a sigma, a subida até 16500 m consome mais que o combustível a bordo
+        result = self.simulate(cruise_altitude=[11000, 16500], thrust_exponent=1.0)
+
+        self.assertEqual(result['VALID'].tolist(), [True, False])
+        climb = result['SERIES'][1][result['SERIES'][1]['PHASE'] == 1]
+        self.assertTrue(np.all(np.isnan(climb['WEIGHT'])))
+
+    def test_default_thrust_exponent(self):
+
+        default = self.simulate(cruise_altitude=[9000, 11000])
+        explicit = self.simulate(cruise_altitude=[9000, 11000], thrust_exponent=self.aircraft_parameters['TSFC'] / 3600)
+
+        np.testing.assert_array_equal(default['FLIGHT_TIME'], explicit['FLIGHT_TIME'])
+        np.testing.assert_array_equal(default['FUEL_CONSUMED'], explicit['FUEL_CONSUMED'])
+
+    def test_mission_trajectory(self):
+
+        flight_parameters = dict(self.flight_parameters, CRUISE_VELOCITY=230)
+        mission = Mission(aircraft_parameters=self.aircraft_parameters, flight_parameters=flight_parameters)
+        trajectory = mission.trajectory
+        series = trajectory['SERIES']
+
+        self.assertTrue(trajectory['VALID'])
+        self.assertEqual(series.ndim, 1)
+        self.assertEqual(series['ALTITUDE'][0], 760)
+        self.assertEqual(series['ALTITUDE'][-1], 10)
+        self.assertTrue(np.all(series['VELOCITY'][series['PHASE'] == 2] == 230))
+        self.assertIsInstance(trajectory['FLIGHT_TIME'], float)
+
+        # Sem CRUISE_VELOCITY, o cruzeiro usa a velocidade de calc_cruise_velocity
+        default = Mission(aircraft_parameters=self.aircraft_parameters,
+                          flight_parameters=self.flight_parameters)
+        cruise_velocities = default.trajectory['SERIES']['VELOCITY'][default.trajectory['SERIES']['PHASE'] == 2]
+        np.testing.assert_allclose(cruise_velocities, default.V_cru, rtol=1e-6)
+
+        fig = draw_mission_trajectory(trajectory)
+        self.assertEqual(len(fig.axes[0].lines), len(MISSION_PHASES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+from functools import partial
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from app.functions.plot_panels import compose_panels
+from app.functions.gliding import gliding_angle_rate_of_descent, plot_gliding_angle, plot_rate_of_descent
+from app.functions.plot_phases import plot_phases, calc_flight_phases
+
+
+class TestPlotPanels(unittest.TestCase):
+
+    def test_compose_panels(self):
+
+        aircraft_parameters = {
+            "S": 15,
+            "CD0": 0.015,
+            "K": 0.03,
+            "OEW": 0
+        }
+
+        flight_parameters = {
+            "NUMBER_OF_PASSENGERS": 0,
+            "FUEL_WEIGHT": 0,
+            "DISPATCHED_CARGO_WEIGHT": 0,
+            "CRUISE_ALTITUDE": 2000,
+            "GLIDING_VELOCITY": 30
+        }
+
+        result = gliding_angle_rate_of_descent(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                               W=390, series=True)
+
+        n_figures = len(plt.get_fignums())
+
+        fig = compose_panels(panels=[partial(plot_rate_of_descent, result=result),
+                                     partial(plot_gliding_angle, result=result),
+                                     partial(plot_rate_of_descent, result=result)], ncols=2)
+
+        # Uma única figura, com os gráficos desenhados diretamente nos painéis
+        self.assertEqual(len(plt.get_fignums()), n_figures + 1)
+        self.assertEqual(len(fig.axes), 4)
+        self.assertEqual(fig.axes[1].get_title(), "Gliding angle")
+        self.assertFalse(fig.axes[3].axison)
+
+        plt.close(fig)
+
+    def test_flight_phases(self):
+
+        flight_parameters = {
+            "takeoff_parameters": {"ALTITUDE_TAKEOFF": 760, "LATITUDE_TAKEOFF": -23.43, "LONGITUDE_TAKEOFF": -46.47},
+            "landing_parameters": {"ALTITUDE_LANDING": 10, "LATITUDE_LANDING": -22.81, "LONGITUDE_LANDING": -43.25},
+            "CRUISE_ALTITUDE": 11000
+        }
+
+        kwargs = {
+            "flight_parameters": flight_parameters,
+            "results_takeoff_time": {"TAKEOFF_GROUND_TIME": 30, "TAKEOFF_ROTATION_TIME": 3, "TAKEOFF_TRANSITION_TIME": 4,
+                                     "TAKEOFF_CLIMB_TIME": 2},
+            "results_climb_time": {"FASTEST_CLIMB_TIME": 900},
+            "results_cruise_time": {"RESULT_CRUISE_VELOCITY": {"CRUISE_VELOCITY": 230}, "DELTA_FUEL": 2.5, "VALID_FUEL": True},
+            "results_descending_time": {"RESULT_DESCENDING_TIME": 1200},
+            "results_landing_time": {"LANDING_APPROACH_TIME": 20, "LANDING_FLARE_TIME": 3, "LANDING_ROTATION_TIME": 2,
+                                     "LANDING_ROLL_TIME": 25}
+        }
+
+        phases = calc_flight_phases(**kwargs)
+        fig, parameters = plot_phases(**kwargs)
+
+        self.assertEqual(parameters['ESTIMATED_TOTAL_FLIGHT_TIME_SECONDS'], phases['ESTIMATED_TOTAL_FLIGHT_TIME_SECONDS'])
+        self.assertEqual(parameters['NECESSARY_FUEL_KILOS'], 2500)
+        self.assertEqual(list(fig.axes[0].lines[0].get_ydata()), phases['ALTITUDE'])
+
+        plt.close(fig)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import tempfile
+import threading
+import sqlite3
+
+from app.db.utils.repository import Repository, get_repository, migrate_database
+
+
+class TestRepository(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "aero.db")
+
+        con = sqlite3.connect(self.db_path)
+        con.executescript("""
+            create table Airplanes (nome_aeronave TEXT, id INTEGER, cd0 REAL, area REAL, cl_max REAL, oew REAL, tsfc REAL,
+                                    b REAL, e REAL, t0 REAL, ne INTEGER, mtow REAL, fuel_weight REAL,
+                                    maximum_payload_weight REAL);
+            create table Airports (iata TEXT, icao TEXT, aeroporto TEXT, pista NUMERIC, elevacao NUMERIC,
+                                   latitude NUMERIC, longitude NUMERIC);
+            create table GroundTypes (superficie TEXT, cof_friction_breaking_off REAL, cof_friction_breaking_on REAL);
+            insert into Airports values ('GRU', 'SBGR', 'Guarulhos', 3700, 750, -23.43, -46.47);
+            insert into GroundTypes values ('Asfalto seco', 0.04, 0.4);
+            create table groundtype (id INTEGER, superficie TEXT, min_mu_decolagem REAL, max_mu_decolagem REAL,
+                                     min_mu_pouso REAL, max_mu_pouso REAL);
+            insert into groundtype values (1, 'Concreto/asfalto seco', 0.03, 0.05, 0.3, 0.6);
+        """)
+        con.commit()
+        con.close()
+
+        self.repository = Repository(db_path=self.db_path)
+
+        self.aircraft = {
+            "AIRCRAFT_NAME": "Boeing 737-800 'NG'", "CD0": 0.02, "S": 124.6, "CL_MAX": 1.6, "OEW": 41000, "TSFC": 0.6,
+            "b": 34.3, "e": 0.8, "T0": 120000, "NE": 2, "MTOW": 79000, "MAXIMUM_FUEL_WEIGHT": 20000,
+            "MAXIMUM_PAYLOAD_WEIGHT": 18000
+        }
+
+    def tearDown(self):
+        self.repository.close()
+        self.tmp_dir.cleanup()
+
+    def test_cache_invalidated_on_write(self):
+
+        statements = []
+        self.repository.pool.connection().set_trace_callback(statements.append)
+
+        self.assertEqual(self.repository.get_aircrafts(), {})
+        self.assertEqual(self.repository.get_aircrafts(), {})
+        self.assertEqual(self.repository.get_airport("GRU")['pista'], 3700)
+        self.assertEqual(self.repository.get_airport("GRU")['aeroporto'], "Guarulhos")
+
+        # Cada consulta vai ao banco uma única vez
+        self.assertEqual(len([s for s in statements if s.startswith("select")]), 2)
+
+        # Nome com aspas: valores são parâmetros, não parte do SQL
+        self.repository.insert_aircraft(self.aircraft)
+        self.assertEqual(self.repository.get_aircrafts()["Boeing 737-800 'NG'"]['mtow'], 79000)
+
+        self.repository.update_aircraft({**self.aircraft, "MTOW": 80000})
+        self.assertEqual(len(self.repository.get_aircrafts()), 1)
+        self.assertEqual(self.repository.get_aircrafts()["Boeing 737-800 'NG'"]['mtow'], 80000)
+
+        # Alterar Airplanes não descarta o cache de Airports
+        n_selects = len([s for s in statements if s.startswith("select")])
+        self.repository.get_airport("GRU")
+        self.assertEqual(len([s for s in statements if s.startswith("select")]), n_selects)
+
+        self.repository.delete_aircraft("Boeing 737-800 'NG'")
+        self.assertEqual(self.repository.get_aircrafts(), {})
+
+        self.repository.insert_airport({"iata": "SDU", "icao": "SBRJ", "aeroporto": "Santos Dumont", "pista": "1323",
+                                        "elevacao": "3", "latitude": "-22.91", "longitude": "-43.16"})
+        self.assertEqual(self.repository.get_airport_codes(), {"GRU", "SDU"})
+        self.assertEqual([airport[0] for airport in self.repository.get_airports()], ["GRU", "SDU"])
+        self.assertEqual(self.repository.get_ground_type("Asfalto seco")['cof_friction_breaking_on'], 0.4)
+        self.assertEqual(self.repository.get_ground_friction_ranges(),
+                         {"Concreto/asfalto seco": {"MU_TAKEOFF": (0.03, 0.05), "MU_LANDING": (0.3, 0.6)}})
+
+    def test_connection_per_thread(self):
+
+        connections = []
+
+        def query():
+            connections.append(self.repository.pool.connection())
+            self.repository.fetch_all(table=None, query="select * from Airports;")
+
+        threads = [threading.Thread(target=query) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        main_connection = self.repository.pool.connection()
+
+        self.assertIs(main_connection, self.repository.pool.connection())
+        self.assertEqual(len({id(con) for con in connections + [main_connection]}), 5)
+
+    def test_migrate_database(self):
+
+        def indexes():
+            con = sqlite3.connect(self.db_path)
+            names = {row[0] for row in con.execute("select name from sqlite_master where type = 'index';")}
+            con.close()
+            return names
+
+        # Abrir o repositório não altera o esquema do banco
+        get_repository(db_path=self.db_path).get_airport("GRU")
+        self.assertEqual(indexes(), set())
+
+        migrate_database(db_path=self.db_path)
+        self.assertEqual(indexes(), {"airports_iata", "airports_icao"})
+
+        get_repository(db_path=self.db_path).close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+sys.path.append(os.path.join(parent_dir, "app"))
+
+import threading
+import time
+import unittest
+from functools import partial
+from unittest import mock
+
+try:
+    from PySide2.QtCore import QCoreApplication, QThreadPool
+    from guis.results_worker import PhaseSignals, PhaseRunnable
+    from guis.ui_results import GUI_RESULTS, PHASE_PROPERTIES
+    from functions.mission import Mission
+    from functions.utils import lazy_property
+except ImportError:
+    QCoreApplication = None
+
+
+@unittest.skipIf(QCoreApplication is None, "PySide2 is not available")
+class TestResultsWorker(unittest.TestCase):
+
+    def setUp(self):
+
+        self.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_independent_phases_overlap(self):
+
+        intervals = {}
+        lock = threading.Lock()
+
+        def slow_property(name):
+            def compute(mission):
+                start = time.perf_counter()
+                time.sleep(0.3)
+                with lock:
+                    intervals[name] = (start, time.perf_counter())
+                return name
+            compute.__name__ = name
+            return lazy_property(compute)
+
+        phases = ("TAKEOFF", "MANEVOUR")
+        properties = [name for phase in phases for name in PHASE_PROPERTIES[phase]]
+
+        thread_pool = QThreadPool()
+        thread_pool.setMaxThreadCount(len(phases))
+        signals = PhaseSignals()
+
+        with mock.patch.multiple(Mission, **{name: slow_property(name) for name in properties}):
+
+            mission = Mission(aircraft_parameters={}, flight_parameters={})
+
+            for phase in phases:
+                thread_pool.start(PhaseRunnable(run_id=1, phase=phase,
+                                                function=partial(GUI_RESULTS.calculate_phase, mission,
+                                                                 PHASE_PROPERTIES[phase]),
+                                                signals=signals, is_current=lambda run_id: True))
+
+            thread_pool.waitForDone()
+
+        self.assertEqual(set(intervals), set(properties))
+
+        # As duas fases rodam ao mesmo tempo: cada uma começa antes de a outra terminar
+        takeoff, manevour = (intervals[PHASE_PROPERTIES[phase][0]] for phase in phases)
+        self.assertLess(takeoff[0], manevour[1])
+        self.assertLess(manevour[0], takeoff[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import unittest
+import tempfile
+import math
+import numpy as np
+
+from app.functions.aero import Aero
+from app.functions.cruising_jet import calc_cruise_fuel_weight, calc_payload_range_diagram
+from app.functions.route_feasibility import (calc_route_feasibility, calc_cruise_fuel_weights, get_cruise_conditions,
+                                             RouteFeasibility)
+
+
+def aircraft(S, CD0, K, T0, TSFC, OEW, **weights):
+    return {"S": S, "CD0": CD0, "K": K, "T0": T0, "CL_MAX": 1.6, "TSFC": TSFC, "OEW": OEW, "NE": 2,
+            'E_m': 1 / (2 * math.sqrt(K * CD0)), **weights}
+
+
+class TestRouteFeasibility(unittest.TestCase):
+
+    def setUp(self):
+
+        g = 9.81
+
+        self.aircrafts = {
+            "NARROWBODY": aircraft(S=124.6, CD0=0.0185, K=0.045, T0=120000, TSFC=0.6, OEW=41000 * g),
+            "WIDEBODY": aircraft(S=360, CD0=0.017, K=0.042, T0=300000, TSFC=0.55, OEW=130000 * g,
+                                 MTOW=250000 * g, MAXIMUM_FUEL_WEIGHT=110000 * g, MAXIMUM_PAYLOAD_WEIGHT=50000 * g),
+        }
+
+        self.flight_parameters = {
+            "NUMBER_OF_PASSENGERS": 150,
+            "FUEL_WEIGHT": 15000 * g,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * g,
+            "CRUISE_ALTITUDE": 11000,
+            "CRUISE_VELOCITY": 0,
+        }
+
+        self.airports = [
+            {"iata": "GRU", "latitude": -23.43, "longitude": -46.47},
+            {"iata": "GIG", "latitude": -22.81, "longitude": -43.25},
+            {"iata": "BSB", "latitude": -15.87, "longitude": -47.92},
+            {"iata": "MAO", "latitude": -3.04, "longitude": -60.05},
+            {"iata": "JFK", "latitude": 40.64, "longitude": -73.78},
+            {"iata": "LIS", "latitude": 38.77, "longitude": -9.13},
+            {"iata": "NRT", "latitude": 35.77, "longitude": 140.39},
+            {"iata": "SYD", "latitude": -33.95, "longitude": 151.18},
+            {"iata": "NUL", "latitude": None, "longitude": None},
+        ]
+
+        self.aero = Aero()
+
+    def route_parameters(self, origin, destination):
+        return dict(self.flight_parameters,
+                    takeoff_parameters={"LATITUDE_TAKEOFF": origin['latitude'], "LONGITUDE_TAKEOFF": origin['longitude']},
+                    landing_parameters={"LATITUDE_LANDING": destination['latitude'],
+                                        "LONGITUDE_LANDING": destination['longitude']})
+
+    def test_vectorized_fuel_matches_calc_cruise_fuel_weight(self):
+
+        aircraft_parameters = self.aircrafts["NARROWBODY"]
+        conditions = get_cruise_conditions(aircraft_parameters=aircraft_parameters, flight_parameters=self.flight_parameters)
+
+        origin = self.airports[0]
+
+        for destination in self.airports[1:5]:
+
+            flight_parameters = self.route_parameters(origin, destination)
+            distance = self.aero.get_haversine_distance(
+                {"LATITUDE": origin['latitude'], "LONGITUDE": origin['longitude']},
+                {"LATITUDE": destination['latitude'], "LONGITUDE": destination['longitude']})
+
+            scalar = calc_cruise_fuel_weight(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+            vectorized = calc_cruise_fuel_weights(aircraft_parameters=aircraft_parameters, cruise_conditions=conditions,
+                                                  distances=[distance])
+
+            self.assertAlmostEqual(vectorized['ZETA'][0], scalar['ZETA'], places=9)
+            self.assertAlmostEqual(vectorized['DELTA_FUEL'][0], scalar['DELTA_FUEL'], delta=1e-6 * scalar['DELTA_FUEL'])
+
+        far = calc_cruise_fuel_weights(aircraft_parameters=aircraft_parameters, cruise_conditions=conditions,
+                                       distances=[1e9])
+        self.assertEqual(far['DELTA_FUEL'][0], np.inf)
+
+    def test_feasibility_matches_scalar_calls(self):
+
+        feasibility = calc_route_feasibility(aircrafts=self.aircrafts, airports=self.airports,
+                                             flight_parameters=self.flight_parameters, chunk_size=3)
+
+        airports = self.airports[:-1]
+        self.assertEqual(feasibility.airport_codes, [airport['iata'] for airport in airports])
+
+        payload = (150 * self.aero.person_weight + 2000 * 9.81) / 9.81
+        diagram = calc_payload_range_diagram(aircraft_parameters=self.aircrafts["WIDEBODY"],
+                                             flight_parameters=self.flight_parameters)
+
+        for name, aircraft_parameters in self.aircrafts.items():
+
+            conditions = get_cruise_conditions(aircraft_parameters=aircraft_parameters,
+                                               flight_parameters=self.flight_parameters)
+            matrix = feasibility.matrix(name)
+
+            for i, origin in enumerate(airports):
+                for j, destination in enumerate(airports):
+
+                    expected = False
+
+                    if i != j:
+                        fuel = calc_cruise_fuel_weight(aircraft_parameters=aircraft_parameters,
+                                                       flight_parameters=self.route_parameters(origin, destination))
+                        expected = 0 <= fuel['ZETA'] and fuel['DELTA_FUEL'] <= conditions['FUEL_AT_CRUISE']
+
+                        if name == "WIDEBODY":
+                            expected = expected and feasibility.max_payload(name, origin['iata'],
+                                                                            destination['iata']) >= payload
+
+                    self.assertEqual(matrix[i, j], expected, msg=(name, origin['iata'], destination['iata']))
+                    self.assertEqual(feasibility.can_fly(name, origin['iata'], destination['iata']), expected)
+
+        self.assertIn(("GRU", "GIG"), feasibility.routes("NARROWBODY"))
+        self.assertNotIn(("GRU", "SYD"), feasibility.routes("NARROWBODY"))
+        self.assertEqual(feasibility.aircrafts("GRU", "GIG"), ["NARROWBODY", "WIDEBODY"])
+        self.assertLessEqual(feasibility.max_payload("WIDEBODY", "GRU", "GIG"), diagram['PAYLOAD'][1])
+        self.assertIsNone(feasibility.max_payload("NARROWBODY", "GRU", "GIG"))
+
+    def test_aircraft_that_cannot_be_evaluated(self):
+
+        aircrafts = dict(self.aircrafts,
+                         GLIDER=aircraft(S=11, CD0=0.01, K=0.02, T0=0, TSFC=0.6, OEW=250 * 9.81),
+                         UNDERPOWERED=aircraft(S=124.6, CD0=0.0185, K=0.045, T0=5000, TSFC=0.6, OEW=41000 * 9.81))
+
+        with self.assertLogs("aero.ROUTE_FEASIBILITY", level="ERROR"):
+            feasibility = calc_route_feasibility(aircrafts=aircrafts, airports=self.airports,
+                                                 flight_parameters=self.flight_parameters)
+
+        self.assertEqual(sorted(feasibility.errors), ["GLIDER", "UNDERPOWERED"])
+        self.assertIn("ZeroDivisionError", feasibility.errors["GLIDER"])
+        self.assertIn("ValueError", feasibility.errors["UNDERPOWERED"])
+        self.assertFalse(feasibility.is_valid("GLIDER"))
+        self.assertTrue(feasibility.is_valid("NARROWBODY"))
+
+        counts = feasibility.count()
+        self.assertEqual(counts["GLIDER"], 0)
+        self.assertEqual(counts["UNDERPOWERED"], 0)
+
+        # As demais aeronaves têm o mesmo resultado de uma frota sem as aeronaves com erro
+        expected = calc_route_feasibility(aircrafts=self.aircrafts, airports=self.airports,
+                                          flight_parameters=self.flight_parameters)
+        for name in self.aircrafts:
+            np.testing.assert_array_equal(feasibility.matrix(name), expected.matrix(name))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "feasibility.npz")
+            feasibility.save(path)
+            self.assertEqual(RouteFeasibility.load(path).errors, feasibility.errors)
+
+    def test_save_and_load(self):
+
+        feasibility = calc_route_feasibility(aircrafts=self.aircrafts, airports=self.airports,
+                                             flight_parameters=self.flight_parameters)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "feasibility.npz")
+            feasibility.save(path)
+            loaded = RouteFeasibility.load(path)
+
+        self.assertEqual(loaded.aircraft_names, feasibility.aircraft_names)
+        self.assertEqual(loaded.airport_codes, feasibility.airport_codes)
+        np.testing.assert_array_equal(loaded.bits, feasibility.bits)
+        self.assertEqual(loaded.count(), feasibility.count())
+        self.assertEqual(loaded.max_payload("WIDEBODY", "GRU", "LIS"), feasibility.max_payload("WIDEBODY", "GRU", "LIS"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import csv
+import math
+import tempfile
+import unittest
+
+from app.sweep import expand_sweep, iter_parallel_results, run_sweep
+from app import batch
+from app.batch import iter_results
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+
+        self.base_case = {
+            "S": 124.6,
+            "CD0": 0.0185,
+            "K": 0.045,
+            "T0": 120000,
+            "CL_MAX": 1.6,
+            "TSFC": 0.6,
+            "OEW": 41000 * 9.81,
+            "NE": 2,
+            "NUMBER_OF_PASSENGERS": 150,
+            "DISPATCHED_CARGO_WEIGHT": 2000 * 9.81,
+            "MU_TAKEOFF": 0.04,
+            "MU_LANDING": 0.3,
+        }
+
+        self.axes = {
+            "FUEL_WEIGHT": [10000 * 9.81, 15000 * 9.81],
+            "CRUISE_ALTITUDE": [9000, 10000, 11000],
+            "AIRPORTS": [{"ALTITUDE_TAKEOFF": 760, "ALTITUDE_LANDING": 10},
+                         {"ALTITUDE_TAKEOFF": 0, "ALTITUDE_LANDING": 1500}],
+        }
+
+    def test_expand_sweep(self):
+
+        cases = list(expand_sweep(base_case=self.base_case, axes=self.axes))
+
+        self.assertEqual(len(cases), 12)
+        self.assertEqual([case['CASE_ID'] for case in cases], list(range(12)))
+        self.assertEqual(cases[1]['ALTITUDE_LANDING'], 1500)
+        self.assertEqual(cases[-1]['CRUISE_ALTITUDE'], 11000)
+        self.assertNotIn('AIRPORTS', cases[0])
+
+    def test_parallel_results_in_order(self):
+
+        cases = list(expand_sweep(base_case=self.base_case, axes=self.axes))
+        cases[4]['MU_TAKEOFF'] = None
+
+        expected = list(iter_results(cases=cases))
+        results = list(iter_parallel_results(cases=iter(cases), workers=2, chunk_size=5))
+
+        self.assertEqual([row['CASE_ID'] for row in results], list(range(12)))
+        self.assertTrue(results[4]['ERROR'])
+
+        for row, expected_row in zip(results, expected):
+            self.assertEqual(row.keys(), expected_row.keys())
+            for key, value in expected_row.items():
+                if isinstance(value, float) and math.isnan(value):
+                    # Fases não calculadas (sem coordenadas e sem planeio)
+                    self.assertTrue(math.isnan(row[key]), msg=key)
+                elif isinstance(value, float):
+                    self.assertAlmostEqual(row[key], value, places=6)
+                else:
+                    self.assertEqual(row[key], value)
+
+    def test_atmosphere_table(self):
+
+        cases = list(expand_sweep(base_case=self.base_case, axes=self.axes))[:4]
+        keys = ('TAKEOFF_DISTANCE', 'LANDING_DISTANCE', 'SERVICE_CEILING')
+
+        exact = list(iter_results(cases=cases))
+
+        # Com uma grade grossa a densidade tabelada difere da exata: os processos precisam ler a mesma tabela que o
+        # cálculo serial com a tabela ativa
+        aero = batch.Aero()
+        aero.enable_atmosphere_table(step=2000)
+        self.addCleanup(aero.disable_atmosphere_table)
+        expected = list(iter_results(cases=cases))
+        aero.disable_atmosphere_table()
+
+        results = list(iter_parallel_results(cases=iter(cases), workers=2, chunk_size=2, atmosphere_table_step=2000))
+
+        # Decolagem a 760 m: fora dos nós da grade
+        self.assertTrue(any(abs(expected_row['TAKEOFF_DISTANCE'] - exact_row['TAKEOFF_DISTANCE']) >
+                            1e-3 * exact_row['TAKEOFF_DISTANCE'] for expected_row, exact_row in zip(expected, exact)))
+
+        for row, expected_row in zip(results, expected):
+            for key in keys:
+                self.assertAlmostEqual(row[key], expected_row[key], places=6, msg=key)
+
+    def test_run_sweep(self):
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+
+            output_path = os.path.join(tmp_dir, "sweep.csv")
+            cases = [{key: value for key, value in case.items() if key != 'CASE_ID'}
+                     for case in expand_sweep(base_case=self.base_case, axes=self.axes)]
+
+            summary = run_sweep(cases=cases, output_path=output_path, workers=2, chunk_size=4)
+
+            with open(output_path, newline="") as file:
+                rows = list(csv.DictReader(file))
+
+        self.assertEqual(summary['CASES'], 12)
+        self.assertEqual(summary['ERRORS'], 0)
+        self.assertGreater(summary['CASES_PER_SECOND'], 0)
+        self.assertEqual([row['CASE_ID'] for row in rows], [str(i) for i in range(12)])
+
+        # Os casos do chamador não recebem CASE_ID
+        self.assertTrue(all('CASE_ID' not in case for case in cases))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
 import unittest
 import math
+import numpy as np
 
-from app.functions.takeoff import climb_angle, calc_total_takeoff_distance, calc_total_takeoff_time
+from app.functions import takeoff
+from app.functions.aero import Aero
+from app.functions.takeoff import climb_angle, calc_total_takeoff_distance, calc_total_takeoff_time, calc_takeoff_batch, \
+    calc_takeoff_distance_time_per_altitude
 
 
 class TestTakeoff(unittest.TestCase):
@@ -11,6 +15,9 @@ class TestTakeoff(unittest.TestCase):
         b = climb_angle(T=1500, D=600, W=800)
         self.assertAlmostEqual(b, math.radians(3), places=1)
 
+        angles = climb_angle(T=np.array([0.5, 10, 200]), D=0, W=100)
+        np.testing.assert_allclose(angles, np.radians([1.5, 3.5, 3]))
+
     def test_calc_total_takeoff_distance(self):
         aircraft_parameters = {
             "S": 9,
@@ -47,7 +54,18 @@ class TestTakeoff(unittest.TestCase):
         }
 
         result = calc_total_takeoff_distance(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
-        print(result)
+
+        expected = {
+            "TAKEOFF_DISTANCE": 404.04082574704586,
+            "TAKEOFF_GROUND_DISTANCE": 58.394938284901656,
+            "TAKEOFF_ROTATION_DISTANCE": 81.24584030950473,
+            "TAKEOFF_TRANSITION_DISTANCE": 30.428095638395014,
+            "TAKEOFF_CLIMB_DISTANCE": 233.97195151424447}
+
+        self.assertEqual(result.keys(), expected.keys())
+        for key, value in expected.items():
+            self.assertIsInstance(result[key], float)
+            self.assertAlmostEqual(result[key], value, places=6)
 
     def test_calc_total_takeoff_time(self):
 
@@ -86,8 +104,131 @@ class TestTakeoff(unittest.TestCase):
         }
 
         result = calc_total_takeoff_time(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
-        print(result)
 
+        expected = {
+            "TAKEOFF_TIME": 15.939984407967387,
+            "TAKEOFF_GROUND_TIME": 4.158895304767714,
+            "TAKEOFF_ROTATION_TIME": 3,
+            "TAKEOFF_TRANSITION_TIME": 1.124255512362975,
+            "TAKEOFF_CLIMB_TIME": 7.656833590836698}
+
+        self.assertEqual(result.keys(), expected.keys())
+        for key, value in expected.items():
+            self.assertAlmostEqual(result[key], value, places=6)
+
+    def test_calc_takeoff_batch(self):
+
+        aircraft_parameters = {
+            "S": 9,
+            "CD0": 0.016,
+            "K": 0.052,
+            "T0": 2600,
+            "CL_MAX": 1.2,
+            "TSFC": 0.8 / 3600,
+            "OEW": 0,
+            "NE": 1
+        }
+
+        weights = np.array([2500, 3200, 4000])
+        altitudes = np.array([0, 1400, 2500])
+        winds = np.array([-3, 1, 5])
+        slopes = np.array([0, 1, -1])
+        mus = np.array([0.02, 0.04, 0.08])
+
+        result = calc_takeoff_batch(aircraft_parameters=aircraft_parameters, TOW=weights, altitude=altitudes, mu=mus,
+                                    V_wind=winds, runway_slope=slopes)
+
+        for i in range(len(weights)):
+
+            flight_parameters = {
+                "takeoff_parameters": {
+                    "WIND_VELOCITY_TAKEOFF": winds[i],
+                    "RUNWAY_SLOPE_TAKEOFF": slopes[i],
+                    "ALTITUDE_TAKEOFF": altitudes[i],
+                    "MU_TAKEOFF": mus[i]
+                },
+                "NUMBER_OF_PASSENGERS": 0,
+                "FUEL_WEIGHT": weights[i],
+                "DISPATCHED_CARGO_WEIGHT": 0,
+            }
+
+            distance = calc_total_takeoff_distance(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+            time = calc_total_takeoff_time(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters)
+
+            for key, value in {**distance, **time}.items():
+                self.assertAlmostEqual(result[key][i], value, places=6)
+
+    def test_calc_takeoff_batch_uses_atmosphere_table(self):
+
+        aircraft_parameters = {
+            "S": 9,
+            "CD0": 0.016,
+            "K": 0.052,
+            "T0": 2600,
+            "CL_MAX": 1.2,
+            "TSFC": 0.8 / 3600,
+            "OEW": 0,
+            "NE": 1
+        }
+
+        altitudes = np.array([700, 1400, 2500])
+
+        exact_density = takeoff.aero.get_density(altitude=altitudes)
+        exact = calc_takeoff_batch(aircraft_parameters=aircraft_parameters, TOW=3200, altitude=altitudes, mu=0.04)
+
+        # A tabela ativada por qualquer instância de Aero é a mesma lida pelo módulo de decolagem
+        table = Aero().enable_atmosphere_table(step=2000)
+        self.addCleanup(Aero().disable_atmosphere_table)
+        self.assertIs(takeoff.aero.atmosphere_table, table)
+
+        tabulated_density = Aero._interpolate_atmosphere_table(table['DENSITY'], 2000, altitudes)
+        np.testing.assert_allclose(takeoff.aero.get_density(altitude=altitudes), tabulated_density)
+        self.assertTrue(np.all(np.abs(tabulated_density - exact_density) > 1e-3 * exact_density))
+
+        tabulated = calc_takeoff_batch(aircraft_parameters=aircraft_parameters, TOW=3200, altitude=altitudes, mu=0.04)
+        Aero().disable_atmosphere_table()
+
+        self.assertTrue(np.all(tabulated['TAKEOFF_DISTANCE'] != exact['TAKEOFF_DISTANCE']))
+        np.testing.assert_array_equal(
+            calc_takeoff_batch(aircraft_parameters=aircraft_parameters, TOW=3200, altitude=altitudes,
+                               mu=0.04)['TAKEOFF_DISTANCE'], exact['TAKEOFF_DISTANCE'])
+
+    def test_calc_takeoff_distance_time_per_altitude_custom_grid(self):
+
+        aircraft_parameters = {
+            "S": 9,
+            "CD0": 0.016,
+            "K": 0.052,
+            "T0": 2600,
+            "CL_MAX": 1.2,
+            "TSFC": 0.8 / 3600,
+            "OEW": 0,
+            "NE": 1
+        }
+
+        flight_parameters = {
+            "takeoff_parameters": {
+                "WIND_VELOCITY_TAKEOFF": 1,
+                "RUNWAY_SLOPE_TAKEOFF": 0,
+                "ALTITUDE_TAKEOFF": 1400,
+                "MU_TAKEOFF": 0.04
+            },
+            "NUMBER_OF_PASSENGERS": 0,
+            "FUEL_WEIGHT": 3200,
+            "DISPATCHED_CARGO_WEIGHT": 0,
+        }
+
+        altitude_range = np.linspace(0, 4000, 401)
+
+        df = calc_takeoff_distance_time_per_altitude(flight_parameters=flight_parameters, aircraft_parameters=aircraft_parameters,
+                                                     altitude_range=altitude_range)
+
+        self.assertEqual(len(df), 401)
+        np.testing.assert_array_equal(df.index.values, altitude_range)
+
+        expected = calc_total_takeoff_distance(aircraft_parameters=aircraft_parameters, flight_parameters=flight_parameters,
+                                               altitude=altitude_range[123])['TAKEOFF_DISTANCE']
+        self.assertAlmostEqual(df['Takeoff Distance [m]'].iloc[123], expected, places=2)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,107 @@
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import logging
+import pickle
+import threading
+import time
+import unittest
+from unittest import mock
+
+from app.functions import utils
+from app.functions.utils import get_logger, configure_logging, lazy_property
+
+
+class TestUtils(unittest.TestCase):
+
+    def test_get_logger_is_cached(self):
+
+        logger = get_logger(log_name="Cruise")
+
+        self.assertIs(get_logger(log_name="Cruise"), logger)
+        self.assertEqual(logger.name, "aero.Cruise")
+        self.assertEqual(get_logger().name, "aero")
+
+    def test_get_logger_configures_once(self):
+
+        get_logger(log_name="CLIMB")
+
+        with mock.patch.object(utils, "dictConfig") as dict_config:
+            get_logger(log_name="CLIMB")
+            get_logger(log_name="UI_RESULTS")
+
+        dict_config.assert_not_called()
+
+    def test_configure_logging_level(self):
+
+        configure_logging(level="WARNING")
+        self.assertFalse(get_logger(log_name="Cruise").isEnabledFor(logging.DEBUG))
+
+        configure_logging(level="DEBUG")
+        self.assertTrue(get_logger(log_name="Cruise").isEnabledFor(logging.DEBUG))
+
+
+class Slow:
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+
+    @lazy_property
+    def first(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return 1
+
+    @lazy_property
+    def second(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return 2
+
+
+class TestLazyProperty(unittest.TestCase):
+
+    def read_in_threads(self, instance, names):
+
+        threads = [threading.Thread(target=getattr, args=(instance, name)) for name in names]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return time.perf_counter() - start
+
+    def test_different_properties_compute_in_parallel(self):
+
+        instance = Slow(delay=0.5)
+        elapsed = self.read_in_threads(instance, ["first", "second"])
+
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual((instance.first, instance.second), (1, 2))
+
+    def test_same_property_computed_once(self):
+
+        instance = Slow(delay=0.1)
+        self.read_in_threads(instance, ["first"] * 4)
+
+        self.assertEqual(instance.calls, 1)
+
+    def test_instance_is_picklable(self):
+
+        instance = Slow(delay=0)
+        self.assertEqual(instance.first, 1)
+
+        copy = pickle.loads(pickle.dumps(instance))
+        self.assertEqual((copy.first, copy.second), (1, 2))
+        self.assertEqual(copy.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()